@@ -3,7 +3,7 @@ import warnings
 
 from .async_webcrawler import AsyncWebCrawler, CacheMode
 # MODIFIED: Add SeedingConfig and VirtualScrollConfig here
-from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, LLMConfig, ProxyConfig, GeolocationConfig, SeedingConfig, VirtualScrollConfig, LinkPreviewConfig, MatchMode
+from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, LLMConfig, ProxyConfig, GeolocationConfig, SeedingConfig, VirtualScrollConfig, LinkPreviewConfig, NetworkCaptureConfig, PageReadyConfig, MatchMode
 
 from .content_scraping_strategy import (
     ContentScrapingStrategy,
@@ -71,12 +71,18 @@ from .deep_crawling import (
     PathDepthScorer,
     BestFirstCrawlingStrategy,
     DFSDeepCrawlStrategy,
+    MemoryFrontier,
+    SQLiteFrontier,
+    CrawlBudget,
+    CrawlSeed,
     DeepCrawlDecorator,
     ContentRelevanceFilter,
     ContentTypeScorer,
 )
 # NEW: Import AsyncUrlSeeder
 from .async_url_seeder import AsyncUrlSeeder
+from .url_canonicalizer import URLCanonicalizer
+from .near_duplicates import NearDuplicateDetector
 # Adaptive Crawler
 from .adaptive_crawler import (
     AdaptiveCrawler,
@@ -131,6 +137,12 @@ __all__ = [
     "BFSDeepCrawlStrategy",
     "BestFirstCrawlingStrategy",
     "DFSDeepCrawlStrategy",
+    "MemoryFrontier",
+    "SQLiteFrontier",
+    "CrawlBudget",
+    "CrawlSeed",
+    "URLCanonicalizer",
+    "NearDuplicateDetector",
     "FilterChain",
     "URLPatternFilter",
     "ContentTypeFilter",
@@ -198,7 +210,9 @@ __all__ = [
     "BrowserAdapter",
     "PlaywrightAdapter", 
     "UndetectedAdapter",
-    "LinkPreviewConfig"
+    "LinkPreviewConfig",
+    "NetworkCaptureConfig",
+    "PageReadyConfig",
 ]
 
 
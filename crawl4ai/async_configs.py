@@ -22,6 +22,7 @@ from .chunking_strategy import ChunkingStrategy, RegexChunking
 from .markdown_generation_strategy import MarkdownGenerationStrategy, DefaultMarkdownGenerator
 from .content_scraping_strategy import ContentScrapingStrategy, LXMLWebScrapingStrategy
 from .deep_crawling import DeepCrawlStrategy
+from .near_duplicates import NearDuplicateDetector
 from .table_extraction import TableExtractionStrategy, DefaultTableExtraction
 
 from .cache_context import CacheMode
@@ -747,6 +748,7 @@ class VirtualScrollConfig:
         scroll_count: int = 10,
         scroll_by: Union[str, int] = "container_height",
         wait_after_scroll: float = 0.5,
+        max_idle_scrolls: Optional[int] = None,
     ):
         """
         Initialize virtual scroll configuration.
@@ -758,12 +760,17 @@ class VirtualScrollConfig:
                 - "container_height": scroll by container's height
                 - "page_height": scroll by viewport height  
                 - int: fixed pixel amount
-            wait_after_scroll: Seconds to wait after each scroll for content to load
+            wait_after_scroll: Maximum seconds to wait after each scroll for content to load
+                (the wait ends early once DOM mutations have settled)
+            max_idle_scrolls: Stop after this many consecutive scrolls that add no new items.
+                None (default) scrolls until scroll_count or the end of the container, as
+                feeds that load slowly can return nothing new for a few scrolls.
         """
         self.container_selector = container_selector
         self.scroll_count = scroll_count
         self.scroll_by = scroll_by
         self.wait_after_scroll = wait_after_scroll
+        self.max_idle_scrolls = max_idle_scrolls
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -772,6 +779,7 @@ class VirtualScrollConfig:
             "scroll_count": self.scroll_count,
             "scroll_by": self.scroll_by,
             "wait_after_scroll": self.wait_after_scroll,
+            "max_idle_scrolls": self.max_idle_scrolls,
         }
     
     @classmethod
@@ -779,6 +787,145 @@ class VirtualScrollConfig:
         """Create instance from dictionary."""
         return cls(**data)
 
+class PageReadyConfig:
+    """Configuration for the page readiness probe.
+
+    When set on CrawlerRunConfig, the separate post-navigation waits (body
+    attached, body visibility, DOMContentLoaded, image loading and page
+    dimensions) are replaced by a single page-side promise that resolves once
+    network activity and DOM mutations have been quiet for the given windows.
+    """
+
+    def __init__(
+        self,
+        network_idle_ms: int = 500,
+        dom_quiet_ms: int = 300,
+        wait_for_lcp: bool = False,
+        timeout_ms: int = 10000,
+        poll_interval_ms: int = 50,
+    ):
+        """
+        Initialize page readiness configuration.
+
+        Args:
+            network_idle_ms: Milliseconds with no request in flight before the page counts as network-idle
+            dom_quiet_ms: Milliseconds without DOM mutations before the DOM counts as settled
+            wait_for_lcp: Also require a largest-contentful-paint entry (Chromium only; ignored elsewhere)
+            timeout_ms: Upper bound for the probe; the crawl continues with whatever has loaded
+            poll_interval_ms: How often the page-side probe re-checks its conditions
+        """
+        self.network_idle_ms = network_idle_ms
+        self.dom_quiet_ms = dom_quiet_ms
+        self.wait_for_lcp = wait_for_lcp
+        self.timeout_ms = timeout_ms
+        self.poll_interval_ms = poll_interval_ms
+
+        # Validation
+        if network_idle_ms < 0 or dom_quiet_ms < 0:
+            raise ValueError("network_idle_ms and dom_quiet_ms must be non-negative")
+        if timeout_ms <= 0:
+            raise ValueError("timeout_ms must be positive")
+        if poll_interval_ms <= 0:
+            raise ValueError("poll_interval_ms must be positive")
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "network_idle_ms": self.network_idle_ms,
+            "dom_quiet_ms": self.dom_quiet_ms,
+            "wait_for_lcp": self.wait_for_lcp,
+            "timeout_ms": self.timeout_ms,
+            "poll_interval_ms": self.poll_interval_ms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PageReadyConfig":
+        """Create instance from dictionary."""
+        return cls(**data)
+
+class NetworkCaptureConfig:
+    """Configuration for network request capturing.
+
+    Controls how much of each request/response is retained when
+    `capture_network_requests` is enabled. Events are kept in a bounded
+    ring buffer and response bodies are only retrieved, after the page has
+    settled, for responses that match the body policy.
+    """
+
+    BODY_POLICIES = ("none", "text", "hash", "sample")
+
+    def __init__(
+        self,
+        body_policy: str = "text",
+        max_body_size: int = 64 * 1024,
+        sample_rate: float = 0.1,
+        text_content_types: Optional[List[str]] = None,
+        resource_types: Optional[List[str]] = None,
+        capture_headers: bool = True,
+        max_events: int = 5000,
+        body_concurrency: int = 8,
+    ):
+        """
+        Initialize network capture configuration.
+
+        Args:
+            body_policy: How response bodies are captured:
+                - "none": no bodies, metadata only
+                - "text": text bodies up to `max_body_size` bytes
+                - "hash": body size and xxhash digest only; of text responses only, unless
+                  `resource_types` selects what to hash
+                - "sample": like "text", for a deterministic `sample_rate` fraction of URLs
+            max_body_size: Maximum body size in bytes for the "text"/"sample" policies
+            sample_rate: Fraction (0.0-1.0) of responses whose bodies are kept in "sample" mode
+            text_content_types: Content-type fragments considered textual
+                (default: html, json, xml, javascript, css, text/*)
+            resource_types: Playwright resource types eligible for body capture
+                (e.g. ["document", "xhr", "fetch"]). None means all.
+            capture_headers: Whether to keep request/response headers
+            max_events: Ring buffer capacity; oldest events are dropped beyond it
+            body_concurrency: Maximum concurrent body retrievals when finalizing
+        """
+        self.body_policy = body_policy
+        self.max_body_size = max_body_size
+        self.sample_rate = sample_rate
+        self.text_content_types = text_content_types or [
+            "text/", "json", "xml", "javascript", "ecmascript", "html", "css",
+        ]
+        self.resource_types = resource_types
+        self.capture_headers = capture_headers
+        self.max_events = max_events
+        self.body_concurrency = body_concurrency
+
+        # Validation
+        if body_policy not in self.BODY_POLICIES:
+            raise ValueError(f"body_policy must be one of {self.BODY_POLICIES}")
+        if max_body_size < 0:
+            raise ValueError("max_body_size must be non-negative")
+        if not (0.0 <= sample_rate <= 1.0):
+            raise ValueError("sample_rate must be between 0.0 and 1.0")
+        if max_events <= 0:
+            raise ValueError("max_events must be positive")
+        if body_concurrency <= 0:
+            raise ValueError("body_concurrency must be positive")
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "body_policy": self.body_policy,
+            "max_body_size": self.max_body_size,
+            "sample_rate": self.sample_rate,
+            "text_content_types": self.text_content_types,
+            "resource_types": self.resource_types,
+            "capture_headers": self.capture_headers,
+            "max_events": self.max_events,
+            "body_concurrency": self.body_concurrency,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NetworkCaptureConfig":
+        """Create instance from dictionary."""
+        return cls(**data)
+
 class LinkPreviewConfig:
     """Configuration for link head extraction and scoring."""
     
@@ -875,7 +1022,29 @@ class LinkPreviewConfig:
 
 
 class HTTPCrawlerConfig:
-    """HTTP-specific crawler configuration"""
+    """HTTP-specific crawler configuration
+
+    Attributes:
+        max_body_size (int or None): Maximum number of response body bytes to read. Larger
+                                     responses are aborted with `ResponseTooLargeError`.
+                                     None disables the limit. Default: 10 MB.
+        allowed_content_types (list of str or None): Content types accepted for crawling,
+                                                     matched as prefixes of the Content-Type
+                                                     header. Other responses are aborted before
+                                                     the body is read. None accepts everything.
+                                                     Default: HTML, XML, JSON and text types.
+    """
+
+    DEFAULT_MAX_BODY_SIZE = 10 * 1024 * 1024
+    DEFAULT_CONTENT_TYPES = (
+        "text/",
+        "application/xhtml+xml",
+        "application/xml",
+        "application/rss+xml",
+        "application/atom+xml",
+        "application/json",
+        "application/ld+json",
+    )
 
     method: str = "GET"
     headers: Optional[Dict[str, str]] = None
@@ -883,6 +1052,8 @@ class HTTPCrawlerConfig:
     json: Optional[Dict[str, Any]] = None
     follow_redirects: bool = True
     verify_ssl: bool = True
+    max_body_size: Optional[int] = DEFAULT_MAX_BODY_SIZE
+    allowed_content_types: Optional[List[str]] = list(DEFAULT_CONTENT_TYPES)
 
     def __init__(
         self,
@@ -892,6 +1063,8 @@ class HTTPCrawlerConfig:
         json: Optional[Dict[str, Any]] = None,
         follow_redirects: bool = True,
         verify_ssl: bool = True,
+        max_body_size: Optional[int] = DEFAULT_MAX_BODY_SIZE,
+        allowed_content_types: Optional[List[str]] = DEFAULT_CONTENT_TYPES,
     ):
         self.method = method
         self.headers = headers
@@ -899,6 +1072,10 @@ class HTTPCrawlerConfig:
         self.json = json
         self.follow_redirects = follow_redirects
         self.verify_ssl = verify_ssl
+        self.max_body_size = max_body_size
+        self.allowed_content_types = (
+            list(allowed_content_types) if allowed_content_types is not None else None
+        )
 
     @staticmethod
     def from_kwargs(kwargs: dict) -> "HTTPCrawlerConfig":
@@ -909,6 +1086,10 @@ class HTTPCrawlerConfig:
             json=kwargs.get("json"),
             follow_redirects=kwargs.get("follow_redirects", True),
             verify_ssl=kwargs.get("verify_ssl", True),
+            max_body_size=kwargs.get("max_body_size", HTTPCrawlerConfig.DEFAULT_MAX_BODY_SIZE),
+            allowed_content_types=kwargs.get(
+                "allowed_content_types", HTTPCrawlerConfig.DEFAULT_CONTENT_TYPES
+            ),
         )
 
     def to_dict(self):
@@ -919,6 +1100,8 @@ class HTTPCrawlerConfig:
             "json": self.json,
             "follow_redirects": self.follow_redirects,
             "verify_ssl": self.verify_ssl,
+            "max_body_size": self.max_body_size,
+            "allowed_content_types": self.allowed_content_types,
         }
 
     def clone(self, **kwargs):
@@ -957,6 +1140,10 @@ class CrawlerRunConfig():
     Attributes:
         # Deep Crawl Parameters
         deep_crawl_strategy (DeepCrawlStrategy or None): Strategy to use for deep crawling.
+        duplicate_detector (NearDuplicateDetector or None): Marks pages whose content nearly matches an
+                                                    earlier page with metadata["duplicate_of"]; such pages
+                                                    are not cached and deep crawls do not expand them.
+                                                    Default: None.
 
         # Content Processing Parameters
         word_count_threshold (int): Minimum word count threshold before processing content.
@@ -1039,6 +1226,9 @@ class CrawlerRunConfig():
                                        Default: None.
         wait_for_images (bool): If True, wait for images to load before extracting content.
                                 Default: False.
+        page_ready_config (PageReadyConfig or dict or None): If set, replaces the chained post-navigation
+                                waits with a single network-idle / DOM-quiet / LCP readiness probe.
+                                Default: None.
         delay_before_return_html (float): Delay in seconds before retrieving final HTML.
                                           Default: 0.1.
         mean_delay (float): Mean base delay between requests when calling arun_many.
@@ -1061,6 +1251,10 @@ class CrawlerRunConfig():
                               Default: 0.2.
         max_scroll_steps (Optional[int]): Maximum number of scroll steps to perform during full page scan.
                                          If None, scrolls until the entire page is loaded. Default: None.
+        adaptive_scan (bool): If True, scan_full_page runs in the page: viewport steps only dwell briefly,
+                              scroll_delay is spent waiting for new content at the bottom (ended early by
+                              a MutationObserver), and the scan stops after two idle rounds.
+                              Default: False.
         process_iframes (bool): If True, attempts to process and inline iframe content.
                                 Default: False.
         remove_overlay_elements (bool): If True, remove overlays/popups before extracting HTML.
@@ -1081,6 +1275,15 @@ class CrawlerRunConfig():
                                              Default: None.
         screenshot_height_threshold (int): Threshold for page height to decide screenshot strategy.
                                            Default: SCREENSHOT_HEIGHT_TRESHOLD (from config, e.g. 20000).
+        screenshot_format (str): Image format of the screenshot: "png", "jpeg" or "webp".
+                                 Default: "png".
+        screenshot_quality (int): Quality (0-100) for "jpeg" and "webp" screenshots.
+                                  Default: 85.
+        screenshot_output (str): How the screenshot is returned in result.screenshot:
+                                 "base64" (str), "bytes" (raw image bytes) or "file" (path of the written image).
+                                 Default: "base64".
+        screenshot_path (str or None): Directory or file path for screenshot_output="file".
+                                       Default: None (~/.crawl4ai/screenshots).
         pdf (bool): Whether to generate a PDF of the page.
                     Default: False.
         image_description_min_word_threshold (int): Minimum words for image description extraction.
@@ -1123,6 +1326,15 @@ class CrawlerRunConfig():
         log_console (bool): If True, log console messages from the page.
                             Default: False.
 
+        # Network and Console Capturing Parameters
+        capture_network_requests (bool): If True, capture network requests, responses and failures.
+                                         Default: False.
+        network_capture_config (NetworkCaptureConfig or dict or None): Body policy, size limits and ring
+                                         buffer capacity used when capture_network_requests is True.
+                                         Default: None (NetworkCaptureConfig defaults).
+        capture_console_messages (bool): If True, capture browser console messages.
+                                         Default: False.
+
         # HTTP Crwler Strategy Parameters
         method (str): HTTP method to use for the request, when using AsyncHTTPCrwalerStrategy.
                         Default: "GET".
@@ -1198,6 +1410,7 @@ class CrawlerRunConfig():
         wait_for: str = None,
         wait_for_timeout: int = None,
         wait_for_images: bool = False,
+        page_ready_config: Union[PageReadyConfig, Dict[str, Any]] = None,
         delay_before_return_html: float = 0.1,
         mean_delay: float = 0.1,
         max_range: float = 0.3,
@@ -1210,6 +1423,7 @@ class CrawlerRunConfig():
         scan_full_page: bool = False,
         scroll_delay: float = 0.2,
         max_scroll_steps: Optional[int] = None,
+        adaptive_scan: bool = False,
         process_iframes: bool = False,
         remove_overlay_elements: bool = False,
         simulate_user: bool = False,
@@ -1220,6 +1434,10 @@ class CrawlerRunConfig():
         screenshot: bool = False,
         screenshot_wait_for: float = None,
         screenshot_height_threshold: int = SCREENSHOT_HEIGHT_TRESHOLD,
+        screenshot_format: str = "png",
+        screenshot_quality: int = 85,
+        screenshot_output: str = "base64",
+        screenshot_path: Optional[str] = None,
         pdf: bool = False,
         capture_mhtml: bool = False,
         image_description_min_word_threshold: int = IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD,
@@ -1241,6 +1459,7 @@ class CrawlerRunConfig():
         log_console: bool = False,
         # Network and Console Capturing Parameters
         capture_network_requests: bool = False,
+        network_capture_config: Union[NetworkCaptureConfig, Dict[str, Any]] = None,
         capture_console_messages: bool = False,
         # Connection Parameters
         method: str = "GET",
@@ -1252,6 +1471,7 @@ class CrawlerRunConfig():
         user_agent_generator_config: dict = {},
         # Deep Crawl Parameters
         deep_crawl_strategy: Optional[DeepCrawlStrategy] = None,
+        duplicate_detector: Optional[NearDuplicateDetector] = None,
         # Link Extraction Parameters
         link_preview_config: Union[LinkPreviewConfig, Dict[str, Any]] = None,
         # Virtual Scroll Parameters
@@ -1312,6 +1532,14 @@ class CrawlerRunConfig():
         self.wait_for = wait_for
         self.wait_for_timeout = wait_for_timeout
         self.wait_for_images = wait_for_images
+        if page_ready_config is None:
+            self.page_ready_config = None
+        elif isinstance(page_ready_config, PageReadyConfig):
+            self.page_ready_config = page_ready_config
+        elif isinstance(page_ready_config, dict):
+            self.page_ready_config = PageReadyConfig.from_dict(page_ready_config)
+        else:
+            raise ValueError("page_ready_config must be PageReadyConfig object or dict")
         self.delay_before_return_html = delay_before_return_html
         self.mean_delay = mean_delay
         self.max_range = max_range
@@ -1325,6 +1553,7 @@ class CrawlerRunConfig():
         self.scan_full_page = scan_full_page
         self.scroll_delay = scroll_delay
         self.max_scroll_steps = max_scroll_steps
+        self.adaptive_scan = adaptive_scan
         self.process_iframes = process_iframes
         self.remove_overlay_elements = remove_overlay_elements
         self.simulate_user = simulate_user
@@ -1336,6 +1565,14 @@ class CrawlerRunConfig():
         self.screenshot = screenshot
         self.screenshot_wait_for = screenshot_wait_for
         self.screenshot_height_threshold = screenshot_height_threshold
+        self.screenshot_format = screenshot_format
+        self.screenshot_quality = screenshot_quality
+        self.screenshot_output = screenshot_output
+        self.screenshot_path = screenshot_path
+        if screenshot_format not in ("png", "jpeg", "webp"):
+            raise ValueError("screenshot_format must be 'png', 'jpeg' or 'webp'")
+        if screenshot_output not in ("base64", "bytes", "file"):
+            raise ValueError("screenshot_output must be 'base64', 'bytes' or 'file'")
         self.pdf = pdf
         self.capture_mhtml = capture_mhtml
         self.image_description_min_word_threshold = image_description_min_word_threshold
@@ -1367,6 +1604,14 @@ class CrawlerRunConfig():
         
         # Network and Console Capturing Parameters
         self.capture_network_requests = capture_network_requests
+        if network_capture_config is None:
+            self.network_capture_config = None
+        elif isinstance(network_capture_config, NetworkCaptureConfig):
+            self.network_capture_config = network_capture_config
+        elif isinstance(network_capture_config, dict):
+            self.network_capture_config = NetworkCaptureConfig.from_dict(network_capture_config)
+        else:
+            raise ValueError("network_capture_config must be NetworkCaptureConfig object or dict")
         self.capture_console_messages = capture_console_messages
 
         # Connection Parameters
@@ -1401,6 +1646,7 @@ class CrawlerRunConfig():
 
         # Deep Crawl Parameters
         self.deep_crawl_strategy = deep_crawl_strategy
+        self.duplicate_detector = duplicate_detector
         
         # Link Extraction Parameters
         if link_preview_config is None:
@@ -1588,6 +1834,7 @@ class CrawlerRunConfig():
             wait_for=kwargs.get("wait_for"),
             wait_for_timeout=kwargs.get("wait_for_timeout"),
             wait_for_images=kwargs.get("wait_for_images", False),
+            page_ready_config=kwargs.get("page_ready_config"),
             delay_before_return_html=kwargs.get("delay_before_return_html", 0.1),
             mean_delay=kwargs.get("mean_delay", 0.1),
             max_range=kwargs.get("max_range", 0.3),
@@ -1599,6 +1846,7 @@ class CrawlerRunConfig():
             scan_full_page=kwargs.get("scan_full_page", False),
             scroll_delay=kwargs.get("scroll_delay", 0.2),
             max_scroll_steps=kwargs.get("max_scroll_steps"),
+            adaptive_scan=kwargs.get("adaptive_scan", False),
             process_iframes=kwargs.get("process_iframes", False),
             remove_overlay_elements=kwargs.get("remove_overlay_elements", False),
             simulate_user=kwargs.get("simulate_user", False),
@@ -1611,6 +1859,10 @@ class CrawlerRunConfig():
             screenshot_height_threshold=kwargs.get(
                 "screenshot_height_threshold", SCREENSHOT_HEIGHT_TRESHOLD
             ),
+            screenshot_format=kwargs.get("screenshot_format", "png"),
+            screenshot_quality=kwargs.get("screenshot_quality", 85),
+            screenshot_output=kwargs.get("screenshot_output", "base64"),
+            screenshot_path=kwargs.get("screenshot_path"),
             pdf=kwargs.get("pdf", False),
             capture_mhtml=kwargs.get("capture_mhtml", False),
             image_description_min_word_threshold=kwargs.get(
@@ -1639,6 +1891,7 @@ class CrawlerRunConfig():
             log_console=kwargs.get("log_console", False),
             # Network and Console Capturing Parameters
             capture_network_requests=kwargs.get("capture_network_requests", False),
+            network_capture_config=kwargs.get("network_capture_config"),
             capture_console_messages=kwargs.get("capture_console_messages", False),
             # Connection Parameters
             method=kwargs.get("method", "GET"),
@@ -1649,6 +1902,7 @@ class CrawlerRunConfig():
             user_agent_generator_config=kwargs.get("user_agent_generator_config", {}),
             # Deep Crawl Parameters
             deep_crawl_strategy=kwargs.get("deep_crawl_strategy"),
+            duplicate_detector=kwargs.get("duplicate_detector"),
             # Link Extraction Parameters
             link_preview_config=kwargs.get("link_preview_config"),
             url=kwargs.get("url"),
@@ -1707,6 +1961,7 @@ class CrawlerRunConfig():
             "wait_for": self.wait_for,
             "wait_for_timeout": self.wait_for_timeout,
             "wait_for_images": self.wait_for_images,
+            "page_ready_config": self.page_ready_config.to_dict() if self.page_ready_config else None,
             "delay_before_return_html": self.delay_before_return_html,
             "mean_delay": self.mean_delay,
             "max_range": self.max_range,
@@ -1717,6 +1972,7 @@ class CrawlerRunConfig():
             "scan_full_page": self.scan_full_page,
             "scroll_delay": self.scroll_delay,
             "max_scroll_steps": self.max_scroll_steps,
+            "adaptive_scan": self.adaptive_scan,
             "process_iframes": self.process_iframes,
             "remove_overlay_elements": self.remove_overlay_elements,
             "simulate_user": self.simulate_user,
@@ -1726,6 +1982,10 @@ class CrawlerRunConfig():
             "screenshot": self.screenshot,
             "screenshot_wait_for": self.screenshot_wait_for,
             "screenshot_height_threshold": self.screenshot_height_threshold,
+            "screenshot_format": self.screenshot_format,
+            "screenshot_quality": self.screenshot_quality,
+            "screenshot_output": self.screenshot_output,
+            "screenshot_path": self.screenshot_path,
             "pdf": self.pdf,
             "capture_mhtml": self.capture_mhtml,
             "image_description_min_word_threshold": self.image_description_min_word_threshold,
@@ -1744,6 +2004,7 @@ class CrawlerRunConfig():
             "verbose": self.verbose,
             "log_console": self.log_console,
             "capture_network_requests": self.capture_network_requests,
+            "network_capture_config": self.network_capture_config.to_dict() if self.network_capture_config else None,
             "capture_console_messages": self.capture_console_messages,
             "method": self.method,
             "stream": self.stream,
@@ -1752,6 +2013,7 @@ class CrawlerRunConfig():
             "user_agent_mode": self.user_agent_mode,
             "user_agent_generator_config": self.user_agent_generator_config,
             "deep_crawl_strategy": self.deep_crawl_strategy,
+            "duplicate_detector": self.duplicate_detector,
             "link_preview_config": self.link_preview_config.to_dict() if self.link_preview_config else None,
             "url": self.url,
             "url_matcher": self.url_matcher,
@@ -1893,7 +2155,10 @@ class SeedingConfig:
         extract_head: bool = False,
         max_urls: int = -1,
         concurrency: int = 1000,
-        hits_per_sec: int = 5,
+        hits_per_sec: Optional[float] = 5,
+        per_host_hits_per_sec: Optional[float] = None,
+        per_host_concurrency: Optional[int] = None,
+        max_sitemap_concurrency: int = 8,
         force: bool = False,
         base_directory: Optional[str] = None,
         llm_config: Optional[LLMConfig] = None,
@@ -1902,6 +2167,8 @@ class SeedingConfig:
         score_threshold: Optional[float] = None,
         scoring_method: str = "bm25",
         filter_nonsense_urls: bool = True,
+        since: Optional[Any] = None,
+        changed_only: bool = False,
     ):
         """
         Initialize URL seeding configuration.
@@ -1920,10 +2187,17 @@ class SeedingConfig:
             concurrency: Maximum concurrent requests for live checks/head extraction. 
                         Default: 1000
             hits_per_sec: Rate limit in requests per second to avoid overwhelming servers. 
-                         Default: 5
-            force: If True, bypasses the AsyncUrlSeeder's internal .jsonl cache and 
+                         Enforced with a token bucket shared by all requests of the seeder;
+                         None disables it. Default: 5
+            per_host_hits_per_sec: Additional token-bucket rate limit applied to each host
+                                  separately. Default: None (no per-host limit)
+            per_host_concurrency: Maximum number of in-flight requests to one host.
+                                 Default: None (bounded only by `concurrency`)
+            max_sitemap_concurrency: Maximum number of sub-sitemaps of a sitemap index
+                                    fetched in parallel. Default: 8
+            force: If True, bypasses the AsyncUrlSeeder's internal cache and 
                   re-fetches URLs. Default: False
-            base_directory: Base directory for UrlSeeder's cache files (.jsonl). 
+            base_directory: Base directory for UrlSeeder's cache database (seeder.db). 
                            If None, uses default ~/.crawl4ai/. Default: None
             llm_config: LLM configuration for future features (e.g., semantic scoring). 
                        Currently unused. Default: None
@@ -1937,6 +2211,14 @@ class SeedingConfig:
                           Future: "semantic". Default: "bm25"
             filter_nonsense_urls: Filter out utility URLs like robots.txt, sitemap.xml, 
                                  ads.txt, favicon.ico, etc. Default: True
+            since: Only return URLs whose sitemap lastmod (or, without one, the time the
+                  seeder first saw them) is at or after this point. Accepts a datetime,
+                  date, ISO-8601 string, epoch seconds or a timedelta ("that long ago").
+                  Default: None
+            changed_only: Only return URLs that are new or changed since they were last
+                         returned, using the seeder's persisted URL state: sitemap lastmod
+                         first, then a hash of the <head> when extract_head is on.
+                         Combine with force=True to re-read the sitemap. Default: False
         """
         self.source = source
         self.pattern = pattern
@@ -1945,6 +2227,9 @@ class SeedingConfig:
         self.max_urls = max_urls
         self.concurrency = concurrency
         self.hits_per_sec = hits_per_sec
+        self.per_host_hits_per_sec = per_host_hits_per_sec
+        self.per_host_concurrency = per_host_concurrency
+        self.max_sitemap_concurrency = max_sitemap_concurrency
         self.force = force
         self.base_directory = base_directory
         self.llm_config = llm_config
@@ -1953,6 +2238,8 @@ class SeedingConfig:
         self.score_threshold = score_threshold
         self.scoring_method = scoring_method
         self.filter_nonsense_urls = filter_nonsense_urls
+        self.since = since
+        self.changed_only = changed_only
 
     # Add to_dict, from_kwargs, and clone methods for consistency
     def to_dict(self) -> Dict[str, Any]:
@@ -14,11 +14,14 @@ from PIL import Image, ImageDraw, ImageFont
 import hashlib
 import uuid
 from .js_snippet import load_js_script
+from .utils import format_screenshot
 from .models import AsyncCrawlResponse
 from .config import SCREENSHOT_HEIGHT_TRESHOLD
-from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig
+from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, PageReadyConfig
 from .async_logger import AsyncLogger
 from .ssl_certificate import SSLCertificate
+from .network_capture import InflightRequests, NetworkCapture
+from .extraction_strategy import JsonCssExtractionStrategy
 from .user_agent_generator import ValidUAGenerator
 from .browser_manager import BrowserManager
 from .browser_adapter import BrowserAdapter, PlaywrightAdapter, UndetectedAdapter
@@ -30,7 +33,44 @@ from aiohttp.client import ClientTimeout
 from urllib.parse import urlparse
 from types import MappingProxyType
 import contextlib
+import codecs
+import re
+import ssl
+import httpx
 from functools import partial
+from collections import OrderedDict
+
+def _transcode_image(data: bytes, image_format: str, quality: int) -> bytes:
+    """Re-encode image bytes into `image_format` (runs in a worker thread)."""
+    img = Image.open(BytesIO(data)).convert("RGB")
+    buffered = BytesIO()
+    img.save(buffered, format=image_format.upper(), quality=quality)
+    return buffered.getvalue()
+
+
+def _stitch_segments(segments: List[bytes], image_format: str, quality: int) -> bytes:
+    """Stitch vertically captured segments into one image (runs in a worker thread)."""
+    images = [Image.open(BytesIO(seg)).convert("RGB") for seg in segments]
+    stitched = Image.new("RGB", (images[0].width, sum(img.height for img in images)))
+    offset = 0
+    for img in images:
+        stitched.paste(img, (0, offset))
+        offset += img.height
+    buffered = BytesIO()
+    stitched.save(buffered, format=image_format.upper(), quality=quality)
+    return buffered.getvalue()
+
+
+def _render_error_image(error_message: str, image_format: str, quality: int) -> bytes:
+    """Render an error message into an image used in place of a failed screenshot."""
+    img = Image.new("RGB", (800, 600), color="black")
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default()
+    draw.text((10, 10), error_message, fill=(255, 255, 255), font=font)
+    buffered = BytesIO()
+    img.save(buffered, format=image_format.upper(), quality=quality)
+    return buffered.getvalue()
+
 
 class AsyncCrawlerStrategy(ABC):
     """
@@ -338,6 +378,76 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # For timeout or other cases, just return False
             return False
 
+    async def wait_for_page_ready(
+        self,
+        page: Page,
+        ready_config: PageReadyConfig,
+        wait_for_images: bool = False,
+        requests: Optional[InflightRequests] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait until the page is ready using one page-side probe instead of several CDP round-trips.
+
+        The probe resolves when the body is attached, the network has been idle for
+        `network_idle_ms`, no DOM mutation happened for `dom_quiet_ms`, an LCP entry was
+        reported (if `wait_for_lcp`) and all images are complete (if `wait_for_images`),
+        or when `timeout_ms` elapses. With `requests`, the network is idle once no request
+        has been pending for `network_idle_ms`; the probe is re-run after the network
+        settles, since late responses usually change the DOM. Without it, the page's
+        resource timing stands in, which cannot see requests that are still running.
+
+        Args:
+            page: Playwright page object
+            ready_config: PageReadyConfig with the quiet windows and timeout
+            wait_for_images: Whether images must be complete for the page to count as ready
+            requests: Tracker of the page's pending requests, attached before navigation
+
+        Returns:
+            Dict with `ready`, `elapsed_ms`, `visible`, `images_loaded`, `lcp_seen`, `width`
+            and `height`, or None if the probe could not run (callers fall back to the
+            individual waits).
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        timeout_ms = ready_config.timeout_ms
+        poll = ready_config.poll_interval_ms / 1000
+        try:
+            while True:
+                readiness = await self.adapter.evaluate(
+                    page,
+                    load_js_script("page_ready"),
+                    {
+                        "networkIdleMs": 0 if requests is not None else ready_config.network_idle_ms,
+                        "domQuietMs": ready_config.dom_quiet_ms,
+                        "waitForLcp": ready_config.wait_for_lcp,
+                        "waitForImages": wait_for_images,
+                        "timeout": max(1, timeout_ms - (loop.time() - started) * 1000),
+                        "pollInterval": ready_config.poll_interval_ms,
+                    },
+                )
+                if requests is None or not readiness["ready"]:
+                    break
+                if requests.idle_ms() >= ready_config.network_idle_ms:
+                    break
+                # Requests were still running when the DOM looked settled
+                while requests.idle_ms() < ready_config.network_idle_ms:
+                    if (loop.time() - started) * 1000 >= timeout_ms:
+                        break
+                    await asyncio.sleep(poll)
+                if requests.idle_ms() < ready_config.network_idle_ms:
+                    readiness["ready"] = False
+                    break
+            readiness["elapsed_ms"] = round((loop.time() - started) * 1000)
+            return readiness
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(
+                    message="Page readiness probe failed: {error}",
+                    tag="READY",
+                    params={"error": str(e)},
+                )
+            return None
+
     async def process_iframes(self, page):
         """
         Process iframes on a page. This function will extract the content of each iframe and replace it with a div containing the extracted content.
@@ -525,7 +635,6 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         self._downloaded_files = []
         
         # Initialize capture lists
-        captured_requests = []
         captured_console = []
 
         # Handle user agent with magic mode
@@ -555,85 +664,16 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         await self.execute_hook("on_page_context_created", page, context=context, config=config)
 
         # Network Request Capturing
+        network_capture = None
         if config.capture_network_requests:
-            async def handle_request_capture(request):
-                try:
-                    post_data_str = None
-                    try:
-                        # Be cautious with large post data
-                        post_data = request.post_data_buffer
-                        if post_data:
-                             # Attempt to decode, fallback to base64 or size indication
-                             try:
-                                 post_data_str = post_data.decode('utf-8', errors='replace')
-                             except UnicodeDecodeError:
-                                 post_data_str = f"[Binary data: {len(post_data)} bytes]"
-                    except Exception:
-                        post_data_str = "[Error retrieving post data]"
-
-                    captured_requests.append({
-                        "event_type": "request",
-                        "url": request.url,
-                        "method": request.method,
-                        "headers": dict(request.headers), # Convert Header dict
-                        "post_data": post_data_str,
-                        "resource_type": request.resource_type,
-                        "is_navigation_request": request.is_navigation_request(),
-                        "timestamp": time.time()
-                    })
-                except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"Error capturing request details for {request.url}: {e}", tag="CAPTURE")
-                    captured_requests.append({"event_type": "request_capture_error", "url": request.url, "error": str(e), "timestamp": time.time()})
-
-            async def handle_response_capture(response):
-                try:
-                    try:
-                        # body = await response.body()
-                        # json_body = await response.json()
-                        text_body = await response.text()
-                    except Exception as e:
-                        body = None
-                        # json_body = None
-                        # text_body = None
-                    captured_requests.append({
-                        "event_type": "response",
-                        "url": response.url,
-                        "status": response.status,
-                        "status_text": response.status_text,
-                        "headers": dict(response.headers), # Convert Header dict
-                        "from_service_worker": response.from_service_worker,
-                        "request_timing": response.request.timing, # Detailed timing info
-                        "timestamp": time.time(),
-                        "body" : {
-                            # "raw": body,
-                            # "json": json_body,
-                            "text": text_body
-                        }
-                    })
-                except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"Error capturing response details for {response.url}: {e}", tag="CAPTURE")
-                    captured_requests.append({"event_type": "response_capture_error", "url": response.url, "error": str(e), "timestamp": time.time()})
-
-            async def handle_request_failed_capture(request):
-                 try:
-                    captured_requests.append({
-                        "event_type": "request_failed",
-                        "url": request.url,
-                        "method": request.method,
-                        "resource_type": request.resource_type,
-                        "failure_text": str(request.failure) if request.failure else "Unknown failure",
-                        "timestamp": time.time()
-                    })
-                 except Exception as e:
-                    if self.logger:
-                        self.logger.warning(f"Error capturing request failed details for {request.url}: {e}", tag="CAPTURE")
-                    captured_requests.append({"event_type": "request_failed_capture_error", "url": request.url, "error": str(e), "timestamp": time.time()})
+            network_capture = NetworkCapture(config.network_capture_config, logger=self.logger)
+            network_capture.attach(page)
 
-            page.on("request", handle_request_capture)
-            page.on("response", handle_response_capture)
-            page.on("requestfailed", handle_request_failed_capture)
+        # Pending requests for the network-idle check of the readiness probe
+        inflight_requests = None
+        if config.page_ready_config:
+            inflight_requests = InflightRequests()
+            inflight_requests.attach(page)
 
         # Console Message Capturing
         handle_console = None
@@ -648,10 +688,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # but captured messages can still be logged after retrieval
 
         try:
-            # Get SSL certificate information if requested and URL is HTTPS
             ssl_cert = None
-            if config.fetch_ssl_certificate:
-                ssl_cert = SSLCertificate.from_url(url)
 
             # Set up download handling
             if self.browser_config.accept_downloads:
@@ -731,41 +768,72 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 status_code = 200
                 response_headers = {}
 
-            # Wait for body element and visibility
-            try:
-                await page.wait_for_selector("body", state="attached", timeout=30000)
+            # Get SSL certificate information if requested, reusing the browser's
+            # connection via CDP and falling back to a non-blocking handshake
+            if config.fetch_ssl_certificate:
+                ssl_cert = await SSLCertificate.from_url_async(url, page=page)
 
-                # Use the new check_visibility function with csp_compliant_wait
-                is_visible = await self.csp_compliant_wait(
+            # A single page-side readiness probe replaces the chained waits below
+            readiness = None
+            if config.page_ready_config:
+                readiness = await self.wait_for_page_ready(
                     page,
-                    """() => {
-                        const element = document.body;
-                        if (!element) return false;
-                        const style = window.getComputedStyle(element);
-                        const isVisible = style.display !== 'none' && 
-                                        style.visibility !== 'hidden' && 
-                                        style.opacity !== '0';
-                        return isVisible;
-                    }""",
-                    timeout=30000,
+                    config.page_ready_config,
+                    wait_for_images=not self.browser_config.text_mode and config.wait_for_images,
+                    requests=inflight_requests,
                 )
 
-                if not is_visible and not config.ignore_body_visibility:
+            if readiness is not None:
+                if not readiness["visible"] and not config.ignore_body_visibility:
                     visibility_info = await self.check_visibility(page)
                     raise Error(f"Body element is hidden: {visibility_info}")
+                if not readiness["ready"] and self.logger:
+                    self.logger.warning(
+                        message="Page not settled after {elapsed}ms, continuing with current content",
+                        tag="READY",
+                        params={"elapsed": readiness["elapsed_ms"]},
+                    )
+                elif config.wait_for_images and not readiness["images_loaded"] and self.logger:
+                    self.logger.warning(
+                        message="Some images failed to load within timeout",
+                        tag="SCRAPE",
+                    )
+            else:
+                # Wait for body element and visibility
+                try:
+                    await page.wait_for_selector("body", state="attached", timeout=30000)
+
+                    # Use the new check_visibility function with csp_compliant_wait
+                    is_visible = await self.csp_compliant_wait(
+                        page,
+                        """() => {
+                            const element = document.body;
+                            if (!element) return false;
+                            const style = window.getComputedStyle(element);
+                            const isVisible = style.display !== 'none' && 
+                                            style.visibility !== 'hidden' && 
+                                            style.opacity !== '0';
+                            return isVisible;
+                        }""",
+                        timeout=30000,
+                    )
 
-            except Error:
-                visibility_info = await self.check_visibility(page)
+                    if not is_visible and not config.ignore_body_visibility:
+                        visibility_info = await self.check_visibility(page)
+                        raise Error(f"Body element is hidden: {visibility_info}")
 
-                if self.browser_config.verbose:
-                    self.logger.debug(
-                        message="Body visibility info: {info}",
-                        tag="DEBUG",
-                        params={"info": visibility_info},
-                    )
+                except Error:
+                    visibility_info = await self.check_visibility(page)
 
-                if not config.ignore_body_visibility:
-                    raise Error(f"Body element is hidden: {visibility_info}")
+                    if self.browser_config.verbose:
+                        self.logger.debug(
+                            message="Body visibility info: {info}",
+                            tag="DEBUG",
+                            params={"info": visibility_info},
+                        )
+
+                    if not config.ignore_body_visibility:
+                        raise Error(f"Body element is hidden: {visibility_info}")
 
             # try:
             #     await page.wait_for_selector("body", state="attached", timeout=30000)
@@ -810,7 +878,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             #         raise Error(f"Body element is hidden: {visibility_info}")
 
             # Handle content loading and viewport adjustment
-            if not self.browser_config.text_mode and (
+            if readiness is None and not self.browser_config.text_mode and (
                 config.wait_for_images or config.adjust_viewport_to_content
             ):
                 await page.wait_for_load_state("domcontentloaded")
@@ -832,7 +900,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # Adjust viewport if needed
             if not self.browser_config.text_mode and config.adjust_viewport_to_content:
                 try:
-                    dimensions = await self.get_page_dimensions(page)
+                    dimensions = readiness or await self.get_page_dimensions(page)
                     page_height = dimensions["height"]
                     page_width = dimensions["width"]
                     # page_width = await page.evaluate(
@@ -870,7 +938,12 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # Handle full page scanning
             if config.scan_full_page:
                 # await self._handle_full_page_scan(page, config.scroll_delay)
-                await self._handle_full_page_scan(page, config.scroll_delay, config.max_scroll_steps)
+                if config.adaptive_scan:
+                    await self._handle_adaptive_page_scan(
+                        page, config.scroll_delay, config.max_scroll_steps, config.page_timeout
+                    )
+                else:
+                    await self._handle_full_page_scan(page, config.scroll_delay, config.max_scroll_steps)
 
             # Handle virtual scroll if configured
             if config.virtual_scroll_config:
@@ -998,7 +1071,12 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 if config.screenshot_wait_for:
                     await asyncio.sleep(config.screenshot_wait_for)
                 screenshot_data = await self.take_screenshot(
-                    page, screenshot_height_threshold=config.screenshot_height_threshold
+                    page,
+                    screenshot_height_threshold=config.screenshot_height_threshold,
+                    screenshot_format=config.screenshot_format,
+                    screenshot_quality=config.screenshot_quality,
+                    screenshot_output=config.screenshot_output,
+                    screenshot_path=config.screenshot_path,
                 )
 
             if screenshot_data or pdf_data or mhtml_data:
@@ -1018,6 +1096,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 await asyncio.sleep(delay)
                 return await page.content()
 
+            # Resolve lazily captured response bodies while the page is still open
+            if network_capture:
+                await network_capture.finalize()
+
             # For undetected browsers, retrieve console messages before returning
             if config.capture_console_messages and hasattr(self.adapter, 'retrieve_console_messages'):
                 final_messages = await self.adapter.retrieve_console_messages(page)
@@ -1045,7 +1127,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 ),
                 redirected_url=redirected_url,
                 # Include captured data if enabled
-                network_requests=captured_requests if config.capture_network_requests else None,
+                network_requests=network_capture.to_list() if network_capture else None,
                 console_messages=captured_console if config.capture_console_messages else None,
             )
 
@@ -1053,6 +1135,12 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             raise e
 
         finally:
+            # Detach capture listeners so reused session pages don't accumulate them
+            if network_capture:
+                network_capture.detach(page)
+            if inflight_requests:
+                inflight_requests.detach(page)
+
             # If no session_id is given we should close the page
             all_contexts = page.context.browser.contexts
             total_pages = sum(len(context.pages) for context in all_contexts)                
@@ -1061,11 +1149,6 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             elif total_pages <= 1 and (self.browser_config.use_managed_browser or self.browser_config.headless):
                 pass
             else:
-                # Detach listeners before closing to prevent potential errors during close
-                if config.capture_network_requests:
-                    page.remove_listener("request", handle_request_capture)
-                    page.remove_listener("response", handle_response_capture)
-                    page.remove_listener("requestfailed", handle_request_failed_capture)
                 if config.capture_console_messages:
                     # Retrieve any final console messages for undetected browsers
                     if hasattr(self.adapter, 'retrieve_console_messages'):
@@ -1157,20 +1240,73 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             await self.safe_scroll(page, 0, total_height)
 
+    async def _handle_adaptive_page_scan(
+        self,
+        page: Page,
+        scroll_delay: float = 0.2,
+        max_scroll_steps: Optional[int] = None,
+        timeout: float = 60000,
+        idle_rounds: int = 2,
+    ):
+        """
+        Full page scan driven by a page-side scroller (js_snippet/full_page_scan.js).
+
+        Unlike `_handle_full_page_scan`, which sleeps `scroll_delay` and re-queries the page
+        dimensions after every viewport step, the whole loop runs in one evaluate call.
+        Mid-page steps dwell briefly; `scroll_delay` is only spent at the bottom waiting for
+        new content, and the wait ends as soon as a MutationObserver sees the page grow. The
+        scan stops after `idle_rounds` waits without growth, so its cost follows the amount
+        of newly loaded content rather than page height times steps.
+
+        Args:
+            page (Page): The Playwright page object
+            scroll_delay (float): Seconds to wait for new content once the bottom is reached
+            max_scroll_steps (Optional[int]): Maximum number of viewport steps. If None, scrolls until end.
+            timeout (float): Upper bound for the scan in milliseconds
+            idle_rounds (int): Consecutive waits without growth before the scan stops
+        """
+        try:
+            viewport_size = page.viewport_size or {}
+            stats = await self.adapter.evaluate(
+                page,
+                load_js_script("full_page_scan"),
+                {
+                    "scrollDelay": scroll_delay * 1000,
+                    "dwell": min(scroll_delay * 1000, 50),
+                    "maxSteps": max_scroll_steps,
+                    "idleRounds": idle_rounds,
+                    "timeout": timeout,
+                    "viewportHeight": viewport_size.get("height", self.browser_config.viewport_height),
+                },
+            )
+            self.logger.debug(
+                message="Adaptive scan: {steps} steps, {added} new nodes in {elapsed}ms",
+                tag="PAGE_SCAN",
+                params={"steps": stats["steps"], "added": stats["added_nodes"], "elapsed": stats["elapsed_ms"]},
+            )
+        except Exception as e:
+            self.logger.warning(
+                message="Failed to perform adaptive page scan: {error}",
+                tag="PAGE_SCAN",
+                params={"error": str(e)},
+            )
+        else:
+            await self.safe_scroll(page, 0, stats["height"])
+
     async def _handle_virtual_scroll(self, page: Page, config: "VirtualScrollConfig"):
         """
         Handle virtual scroll containers (e.g., Twitter-like feeds) by capturing
         content at different scroll positions and merging unique elements.
         
-        Following the design:
-        1. Get container HTML
-        2. Scroll by container height
-        3. Wait and check if container HTML changed
-        4. Three cases:
-           - No change: continue scrolling
-           - New items added (appended): continue (items already in page)
-           - Items replaced: capture HTML chunk and add to list
-        5. After N scrolls, merge chunks if any were captured
+        The collector runs in the page (js_snippet/virtual_scroll_collector.js):
+        1. A MutationObserver marks container children that were added or changed
+        2. Scroll by the configured amount and wait until mutations settle
+           (at most `wait_after_scroll`)
+        3. Snapshot only the marked children, deduplicated by normalized text
+        4. Stop after `scroll_count` scrolls, at the end of the container, or after
+           `max_idle_scrolls` scrolls without new items
+        5. If recycled items are no longer in the DOM, rebuild the container from
+           the unique snapshots
         
         Args:
             page: The Playwright page object
@@ -1190,128 +1326,18 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 params={"selector": config.container_selector}
             )
             
-            # JavaScript function to handle virtual scroll capture
-            virtual_scroll_js = """
-            async (config) => {
-                const container = document.querySelector(config.container_selector);
-                if (!container) {
-                    throw new Error(`Container not found: ${config.container_selector}`);
-                }
-                
-                // List to store HTML chunks when content is replaced
-                const htmlChunks = [];
-                let previousHTML = container.innerHTML;
-                let scrollCount = 0;
-                
-                // Determine scroll amount
-                let scrollAmount;
-                if (typeof config.scroll_by === 'number') {
-                    scrollAmount = config.scroll_by;
-                } else if (config.scroll_by === 'page_height') {
-                    scrollAmount = window.innerHeight;
-                } else { // container_height
-                    scrollAmount = container.offsetHeight;
-                }
-                
-                // Perform scrolling
-                while (scrollCount < config.scroll_count) {
-                    // Scroll the container
-                    container.scrollTop += scrollAmount;
-                    
-                    // Wait for content to potentially load
-                    await new Promise(resolve => setTimeout(resolve, config.wait_after_scroll * 1000));
-                    
-                    // Get current HTML
-                    const currentHTML = container.innerHTML;
-                    
-                    // Determine what changed
-                    if (currentHTML === previousHTML) {
-                        // Case 0: No change - continue scrolling
-                        console.log(`Scroll ${scrollCount + 1}: No change in content`);
-                    } else if (currentHTML.startsWith(previousHTML)) {
-                        // Case 1: New items appended - content already in page
-                        console.log(`Scroll ${scrollCount + 1}: New items appended`);
-                    } else {
-                        // Case 2: Items replaced - capture the previous HTML
-                        console.log(`Scroll ${scrollCount + 1}: Content replaced, capturing chunk`);
-                        htmlChunks.push(previousHTML);
-                    }
-                    
-                    // Update previous HTML for next iteration
-                    previousHTML = currentHTML;
-                    scrollCount++;
-                    
-                    // Check if we've reached the end
-                    if (container.scrollTop + container.clientHeight >= container.scrollHeight - 10) {
-                        console.log(`Reached end of scrollable content at scroll ${scrollCount}`);
-                        // Capture final chunk if content was replaced
-                        if (htmlChunks.length > 0) {
-                            htmlChunks.push(currentHTML);
-                        }
-                        break;
-                    }
-                }
-                
-                // If we have chunks (case 2 occurred), merge them
-                if (htmlChunks.length > 0) {
-                    console.log(`Merging ${htmlChunks.length} HTML chunks`);
-                    
-                    // Parse all chunks to extract unique elements
-                    const tempDiv = document.createElement('div');
-                    const seenTexts = new Set();
-                    const uniqueElements = [];
-                    
-                    // Process each chunk
-                    for (const chunk of htmlChunks) {
-                        tempDiv.innerHTML = chunk;
-                        const elements = tempDiv.children;
-                        
-                        for (let i = 0; i < elements.length; i++) {
-                            const element = elements[i];
-                            // Normalize text for deduplication
-                            const normalizedText = element.innerText
-                                .toLowerCase()
-                                .replace(/[\\s\\W]/g, ''); // Remove spaces and symbols
-                            
-                            if (!seenTexts.has(normalizedText)) {
-                                seenTexts.add(normalizedText);
-                                uniqueElements.push(element.outerHTML);
-                            }
-                        }
-                    }
-                    
-                    // Replace container content with merged unique elements
-                    container.innerHTML = uniqueElements.join('\\n');
-                    console.log(`Merged ${uniqueElements.length} unique elements from ${htmlChunks.length} chunks`);
-                    
-                    return {
-                        success: true,
-                        chunksCount: htmlChunks.length,
-                        uniqueCount: uniqueElements.length,
-                        replaced: true
-                    };
-                } else {
-                    console.log('No content replacement detected, all content remains in page');
-                    return {
-                        success: true,
-                        chunksCount: 0,
-                        uniqueCount: 0,
-                        replaced: false
-                    };
-                }
-            }
-            """
-            
             # Execute virtual scroll capture
-            result = await self.adapter.evaluate(page, virtual_scroll_js, config.to_dict())
+            result = await self.adapter.evaluate(
+                page, load_js_script("virtual_scroll_collector"), config.to_dict()
+            )
             
             if result.get("replaced", False):
                 self.logger.success(
-                    message="Virtual scroll completed. Merged {unique} unique elements from {chunks} chunks",
+                    message="Virtual scroll completed. Merged {unique} unique elements over {scrolls} scrolls",
                     tag="VSCROLL",
                     params={
                         "unique": result.get("uniqueCount", 0),
-                        "chunks": result.get("chunksCount", 0)
+                        "scrolls": result.get("scrollCount", 0)
                     }
                 )
             else:
@@ -1525,26 +1551,84 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
         return captured_console
         
-    async def take_screenshot(self, page, **kwargs) -> str:
+    async def take_screenshot(self, page, **kwargs) -> Union[str, bytes]:
         """
         Take a screenshot of the current page.
 
+        Pages up to `screenshot_height_threshold` pixels are captured in one call
+        (Playwright's full-page capture uses CDP `captureBeyondViewport` on Chromium).
+        Taller pages are captured as clipped segments and stitched. Stitching, WebP
+        encoding and base64 encoding all run in a worker thread, never on the event loop.
+
         Args:
             page (Page): The Playwright page object
-            kwargs: Additional keyword arguments
+            kwargs: Additional keyword arguments:
+                - screenshot_height_threshold (int): Max height of a single capture
+                - screenshot_format (str): "png", "jpeg" or "webp"
+                - screenshot_quality (int): Quality for "jpeg"/"webp"
+                - screenshot_output (str): "base64", "bytes" or "file"
+                - screenshot_path (str): Directory or file path for "file" output
 
         Returns:
-            str: The base64-encoded screenshot data
+            Union[str, bytes]: Base64 string, raw image bytes or the written file path,
+            depending on `screenshot_output`
         """
-        need_scroll = await self.page_need_scroll(page)
+        image_format = kwargs.get("screenshot_format", "png")
+        quality = kwargs.get("screenshot_quality", 85)
+        try:
+            data = await self._capture_screenshot_bytes(
+                page,
+                image_format,
+                quality,
+                kwargs.get("screenshot_height_threshold", SCREENSHOT_HEIGHT_TRESHOLD),
+            )
+        except Exception as e:
+            error_message = f"Failed to take screenshot: {str(e)}"
+            self.logger.error(
+                message="Screenshot failed: {error}",
+                tag="ERROR",
+                params={"error": error_message},
+            )
+            data = await asyncio.to_thread(_render_error_image, error_message, image_format, quality)
+
+        return await format_screenshot(
+            data, kwargs.get("screenshot_output", "base64"), kwargs.get("screenshot_path"), image_format
+        )
+
+    async def _capture_screenshot_bytes(
+        self, page: Page, image_format: str, quality: int, height_threshold: int
+    ) -> bytes:
+        """Capture the page as encoded image bytes, without base64 round-trips."""
+        # Playwright encodes png/jpeg natively; webp is transcoded from a lossless png
+        capture_type = "jpeg" if image_format == "jpeg" else "png"
+        capture_quality = quality if capture_type == "jpeg" else None
 
-        if not need_scroll:
-            # Page is short enough, just take a screenshot
-            return await self.take_screenshot_naive(page)
+        if not await self.page_need_scroll(page):
+            data = await page.screenshot(full_page=False, type=capture_type, quality=capture_quality)
         else:
-            # Page is too long, try to take a full-page screenshot
-            return await self.take_screenshot_scroller(page, **kwargs)
-            # return await self.take_screenshot_from_pdf(await self.export_pdf(page))
+            dimensions = await self.get_page_dimensions(page)
+            page_width, page_height = dimensions["width"], dimensions["height"]
+            if page_height <= height_threshold:
+                data = await page.screenshot(full_page=True, type=capture_type, quality=capture_quality)
+            else:
+                segments = []
+                for y_offset in range(0, page_height, height_threshold):
+                    segments.append(await page.screenshot(
+                        full_page=True,
+                        clip={
+                            "x": 0,
+                            "y": y_offset,
+                            "width": page_width,
+                            "height": min(height_threshold, page_height - y_offset),
+                        },
+                        type=capture_type,
+                        quality=capture_quality,
+                    ))
+                return await asyncio.to_thread(_stitch_segments, segments, image_format, quality)
+
+        if image_format == "webp":
+            data = await asyncio.to_thread(_transcode_image, data, image_format, quality)
+        return data
 
     async def take_screenshot_from_pdf(self, pdf_data: bytes) -> str:
         """
@@ -2157,18 +2241,57 @@ class HTTPStatusError(HTTPCrawlerError):
         super().__init__(f"HTTP {status_code}: {message}")
 
 
+class ResponseTooLargeError(HTTPCrawlerError):
+    """Raised when a response body exceeds the configured max_body_size"""
+    pass
+
+
+class UnsupportedContentTypeError(HTTPCrawlerError):
+    """Raised when a response content type is not in allowed_content_types"""
+    pass
+
+
 class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     """
     Fast, lightweight HTTP-only crawler strategy optimized for memory efficiency.
+
+    Two transports are available:
+        - "aiohttp" (default): HTTP/1.1 with a keep-alive connection pool.
+        - "httpx": HTTP/2 capable (negotiated via ALPN), so concurrent requests to
+          the same host are multiplexed over one TLS connection. Prefer it only
+          with http2=True; its HTTP/1.1 pool is slower than aiohttp's at high
+          concurrency.
+
+    Both share one SSL context across connections and report connection reuse
+    through `get_connection_stats()`.
     """
     
-    __slots__ = ('logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config')
+    __slots__ = (
+        'logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config',
+        'transport', 'http2', 'limit_per_host', 'keepalive_timeout', '_ssl_context', '_host_slots', '_stats',
+    )
 
     DEFAULT_TIMEOUT: Final[int] = 30
+    CONNECT_TIMEOUT: Final[int] = 10
+    SOCK_READ_TIMEOUT: Final[int] = 30
     DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024  
     DEFAULT_MAX_CONNECTIONS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
     DEFAULT_DNS_CACHE_TTL: Final[int] = 300
+    DEFAULT_KEEPALIVE_TIMEOUT: Final[float] = 30.0
     VALID_SCHEMES: Final = frozenset({'http', 'https', 'file', 'raw'})
+    TRANSPORTS: Final = frozenset({'aiohttp', 'httpx'})
+
+    # Encoding sniffing only ever looks at the head of the body
+    SNIFF_SIZE: Final[int] = 8 * 1024
+    DETECT_SIZE: Final[int] = 64 * 1024
+    _META_CHARSET_RE: Final = re.compile(
+        rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_:.\-]+)""", re.IGNORECASE
+    )
+    _BOMS: Final = (
+        (codecs.BOM_UTF8, "utf-8-sig"),
+        (codecs.BOM_UTF16_LE, "utf-16"),
+        (codecs.BOM_UTF16_BE, "utf-16"),
+    )
 
     _BASE_HEADERS: Final = MappingProxyType({
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -2185,15 +2308,41 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         logger: Optional[AsyncLogger] = None,
         max_connections: int = DEFAULT_MAX_CONNECTIONS,
         dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
-        chunk_size: int = DEFAULT_CHUNK_SIZE
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        transport: str = "aiohttp",
+        http2: bool = True,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
     ):
-        """Initialize the HTTP crawler with config"""
+        """
+        Initialize the HTTP crawler with config
+
+        Args:
+            browser_config: Request-level settings (method, headers, SSL, body limits)
+            logger: Optional logger
+            max_connections: Maximum number of open connections
+            dns_cache_ttl: DNS cache TTL in seconds (aiohttp transport)
+            chunk_size: Read size when streaming bodies
+            transport: "aiohttp" or "httpx"
+            http2: Negotiate HTTP/2 when the transport is "httpx"
+            limit_per_host: Maximum concurrent requests per host, 0 for no limit
+            keepalive_timeout: Seconds an idle connection is kept for reuse
+        """
+        if transport not in self.TRANSPORTS:
+            raise ValueError(f"transport must be one of {sorted(self.TRANSPORTS)}, got {transport!r}")
         self.browser_config = browser_config or HTTPCrawlerConfig()
         self.logger = logger
         self.max_connections = max_connections
         self.dns_cache_ttl = dns_cache_ttl
         self.chunk_size = chunk_size
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.transport = transport
+        self.http2 = http2
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[Union[aiohttp.ClientSession, httpx.AsyncClient]] = None
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._stats = self._empty_stats()
         
         self.hooks = {
             k: partial(self._execute_hook, k) 
@@ -2239,32 +2388,96 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             return await hook_func(*args, **kwargs)
         return hook_func(*args, **kwargs)
 
+    @staticmethod
+    def _empty_stats() -> Dict[str, int]:
+        return {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "http2_requests": 0,
+        }
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Connection pool statistics since the last `start()`."""
+        stats = dict(self._stats)
+        stats["transport"] = self.transport
+        stats["reuse_ratio"] = (
+            stats["connections_reused"] / stats["requests"] if stats["requests"] else 0.0
+        )
+        return stats
+
+    def _get_ssl_context(self) -> Union[ssl.SSLContext, bool]:
+        """One SSL context for every connection, so CA certificates are loaded once."""
+        if not self.browser_config.verify_ssl:
+            return False
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+            if self.transport == "httpx" and self.http2:
+                self._ssl_context.set_alpn_protocols(["h2", "http/1.1"])
+        return self._ssl_context
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_connection_create_end(session, ctx, params):
+            self._stats["connections_created"] += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self._stats["connections_reused"] += 1
+
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
     async def start(self) -> None:
-        if not self._session:
+        if self._session:
+            return
+        self._stats = self._empty_stats()
+        if self.transport == "httpx":
+            self._session = httpx.AsyncClient(
+                http2=self.http2,
+                verify=self._get_ssl_context(),
+                headers=dict(self._BASE_HEADERS),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_timeout,
+                ),
+                timeout=httpx.Timeout(self.DEFAULT_TIMEOUT, connect=self.CONNECT_TIMEOUT),
+            )
+        else:
             connector = aiohttp.TCPConnector(
                 limit=self.max_connections,
+                limit_per_host=self.limit_per_host,
                 ttl_dns_cache=self.dns_cache_ttl,
                 use_dns_cache=True,
+                keepalive_timeout=self.keepalive_timeout,
                 force_close=False
             )
             self._session = aiohttp.ClientSession(
                 headers=dict(self._BASE_HEADERS),
                 connector=connector,
-                timeout=ClientTimeout(total=self.DEFAULT_TIMEOUT)
+                timeout=ClientTimeout(total=self.DEFAULT_TIMEOUT),
+                trace_configs=[self._trace_config()],
             )
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
-            try:
-                await asyncio.wait_for(self._session.close(), timeout=5.0)
-            except asyncio.TimeoutError:
-                if self.logger:
-                    self.logger.warning(
-                        message="Session cleanup timed out",
-                        tag="CLEANUP"
-                    )
-            finally:
-                self._session = None
+        if not self._session:
+            return
+        closed = self._session.is_closed if self.transport == "httpx" else self._session.closed
+        try:
+            if not closed:
+                close = self._session.aclose() if self.transport == "httpx" else self._session.close()
+                await asyncio.wait_for(close, timeout=5.0)
+        except asyncio.TimeoutError:
+            if self.logger:
+                self.logger.warning(
+                    message="Session cleanup timed out",
+                    tag="CLEANUP"
+                )
+        finally:
+            self._session = None
+            self._host_slots.clear()
 
     async def _stream_file(self, path: str) -> AsyncGenerator[memoryview, None]:
         async with aiofiles.open(path, mode='rb') as f:
@@ -2293,28 +2506,215 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         )
 
 
+    def _check_content_type(self, url: str, content_type: Optional[str]) -> None:
+        """Abort before reading the body if the content type is not crawlable."""
+        allowed = self.browser_config.allowed_content_types
+        if allowed is None or not content_type:
+            return
+        content_type = content_type.split(";", 1)[0].strip().lower()
+        if not any(content_type.startswith(prefix) for prefix in allowed):
+            raise UnsupportedContentTypeError(
+                f"Unsupported content type '{content_type}' for {url}"
+            )
+
+    async def _read_body(
+        self, url: str, chunks: AsyncGenerator[bytes, None], declared: Optional[int]
+    ) -> tuple:
+        """Stream the body into one buffer, aborting as soon as max_body_size is exceeded."""
+        max_size = self.browser_config.max_body_size
+        if max_size is not None and declared is not None and declared > max_size:
+            raise ResponseTooLargeError(
+                f"Response for {url} declares {declared} bytes (max_body_size={max_size})"
+            )
+
+        buffer = bytearray()
+        count = 0
+        async for chunk in chunks:
+            buffer += chunk
+            count += 1
+            if max_size is not None and len(buffer) > max_size:
+                raise ResponseTooLargeError(
+                    f"Response for {url} exceeds max_body_size={max_size} bytes"
+                )
+        return buffer, count
+
+    def _sniff_encoding(self, content: bytearray) -> tuple:
+        """Find an encoding declared in the head of the body (BOM or <meta charset>)."""
+        for bom, encoding in self._BOMS:
+            if content.startswith(bom):
+                return encoding, "bom"
+        match = self._META_CHARSET_RE.search(content, 0, self.SNIFF_SIZE)
+        if match:
+            try:
+                return codecs.lookup(match.group(1).decode("ascii")).name, "meta"
+            except LookupError:
+                pass
+        return None, None
+
+    def _decode_body(self, content: bytearray, charset: Optional[str]) -> tuple:
+        """
+        Decode the body with a single pass over the full buffer.
+
+        The Content-Type charset wins, then a BOM or `<meta charset>` in the first
+        SNIFF_SIZE bytes. Otherwise a strict UTF-8 decode is attempted and, only if that
+        fails, chardet looks at the first DETECT_SIZE bytes instead of the whole body.
+
+        Returns:
+            tuple: (text, encoding, source of the encoding)
+        """
+        source = "header"
+        encoding = None
+        if charset:
+            try:
+                encoding = codecs.lookup(charset).name
+            except LookupError:
+                pass
+        if not encoding:
+            encoding, source = self._sniff_encoding(content)
+        if not encoding:
+            try:
+                return content.decode("utf-8"), "utf-8", "utf-8"
+            except UnicodeDecodeError:
+                pass
+            encoding = chardet.detect(bytes(content[:self.DETECT_SIZE]))["encoding"] or "utf-8"
+            source = "detected"
+        try:
+            return content.decode(encoding, errors="replace"), encoding, source
+        except LookupError:
+            return content.decode("utf-8", errors="replace"), "utf-8", source
+
+    def _host_slot(self, url: str):
+        """Per-host concurrency limit for httpx (aiohttp enforces it in the connector)."""
+        if self.limit_per_host <= 0 or self.transport != "httpx":
+            return contextlib.nullcontext()
+        host = urlparse(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.limit_per_host)
+        return slot
+
+    async def _process_response(
+        self,
+        url: str,
+        started: float,
+        status: int,
+        headers,
+        final_url: str,
+        charset: Optional[str],
+        declared: Optional[int],
+        chunks: AsyncGenerator[bytes, None],
+    ) -> AsyncCrawlResponse:
+        """Validate, read and decode a response independently of the transport."""
+        headers_at = time.perf_counter()
+        if not (200 <= status < 300):
+            raise HTTPStatusError(
+                status,
+                f"Unexpected status code for {url}"
+            )
+        self._check_content_type(url, headers.get("Content-Type"))
+
+        content, count = await self._read_body(url, chunks, declared)
+        read_at = time.perf_counter()
+
+        html, encoding, encoding_source = self._decode_body(content, charset)
+        decoded_at = time.perf_counter()
+
+        return AsyncCrawlResponse(
+            html=html,
+            response_headers=dict(headers),
+            status_code=status,
+            redirected_url=final_url,
+            transfer_stats={
+                "bytes": len(content),
+                "content_length": declared,
+                "chunks": count,
+                "encoding": encoding,
+                "encoding_source": encoding_source,
+                "ttfb_ms": round((headers_at - started) * 1000, 2),
+                "read_ms": round((read_at - headers_at) * 1000, 2),
+                "decode_ms": round((decoded_at - read_at) * 1000, 2),
+                "total_ms": round((decoded_at - started) * 1000, 2),
+            },
+        )
+
+    async def _send_aiohttp(
+        self, session: aiohttp.ClientSession, url: str, request_kwargs: Dict[str, Any]
+    ) -> AsyncCrawlResponse:
+        started = time.perf_counter()
+        async with session.request(self.browser_config.method, url, **request_kwargs) as response:
+            return await self._process_response(
+                url,
+                started,
+                response.status,
+                response.headers,
+                str(response.url),
+                response.charset,
+                response.content_length,
+                response.content.iter_chunked(self.chunk_size),
+            )
+
+    async def _send_httpx(
+        self, session: httpx.AsyncClient, url: str, request_kwargs: Dict[str, Any]
+    ) -> AsyncCrawlResponse:
+        new_connections = 0
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            nonlocal new_connections
+            if event_name == "connection.connect_tcp.complete":
+                new_connections += 1
+
+        started = time.perf_counter()
+        async with session.stream(
+            self.browser_config.method, url, extensions={"trace": trace}, **request_kwargs
+        ) as response:
+            self._stats["connections_created"] += new_connections
+            if not new_connections:
+                self._stats["connections_reused"] += 1
+            if response.http_version == "HTTP/2":
+                self._stats["http2_requests"] += 1
+            content_length = response.headers.get("Content-Length")
+            return await self._process_response(
+                url,
+                started,
+                response.status_code,
+                response.headers,
+                str(response.url),
+                response.charset_encoding,
+                int(content_length) if content_length and content_length.isdigit() else None,
+                response.aiter_bytes(self.chunk_size),
+            )
+
     async def _handle_http(
         self, 
         url: str, 
         config: CrawlerRunConfig
     ) -> AsyncCrawlResponse:
         async with self._session_context() as session:
-            timeout = ClientTimeout(
-                total=config.page_timeout or self.DEFAULT_TIMEOUT,
-                connect=10,
-                sock_read=30
-            )
-            
             headers = dict(self._BASE_HEADERS)
             if self.browser_config.headers:
                 headers.update(self.browser_config.headers)
 
-            request_kwargs = {
-                'timeout': timeout,
-                'allow_redirects': self.browser_config.follow_redirects,
-                'ssl': self.browser_config.verify_ssl,
-                'headers': headers
-            }
+            # page_timeout is in milliseconds, like for the browser strategy
+            timeout = config.page_timeout / 1000 if config.page_timeout else self.DEFAULT_TIMEOUT
+            if self.transport == "httpx":
+                request_kwargs = {
+                    'timeout': httpx.Timeout(timeout, connect=min(timeout, self.CONNECT_TIMEOUT)),
+                    'follow_redirects': self.browser_config.follow_redirects,
+                    'headers': headers
+                }
+                send = self._send_httpx
+            else:
+                request_kwargs = {
+                    'timeout': ClientTimeout(
+                        total=timeout,
+                        connect=min(timeout, self.CONNECT_TIMEOUT),
+                        sock_read=min(timeout, self.SOCK_READ_TIMEOUT)
+                    ),
+                    'allow_redirects': self.browser_config.follow_redirects,
+                    'ssl': self._get_ssl_context(),
+                    'headers': headers
+                }
+                send = self._send_aiohttp
 
             if self.browser_config.method == "POST":
                 if self.browser_config.data:
@@ -2325,38 +2725,25 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             await self.hooks['before_request'](url, request_kwargs)
 
             try:
-                async with session.request(self.browser_config.method, url, **request_kwargs) as response:
-                    content = memoryview(await response.read())
-                    
-                    if not (200 <= response.status < 300):
-                        raise HTTPStatusError(
-                            response.status,
-                            f"Unexpected status code for {url}"
-                        )
-                    
-                    encoding = response.charset
-                    if not encoding:
-                        encoding = chardet.detect(content.tobytes())['encoding'] or 'utf-8'                    
-                    
-                    result = AsyncCrawlResponse(
-                        html=content.tobytes().decode(encoding, errors='replace'),
-                        response_headers=dict(response.headers),
-                        status_code=response.status,
-                        redirected_url=str(response.url)
-                    )
-                    
-                    await self.hooks['after_request'](result)
-                    return result
+                self._stats["requests"] += 1
+                async with self._host_slot(url):
+                    result = await send(session, url, request_kwargs)
+                await self.hooks['after_request'](result)
+                return result
 
-            except aiohttp.ServerTimeoutError as e:
+            except HTTPCrawlerError as e:
+                await self.hooks['on_error'](e)
+                raise
+
+            except (aiohttp.ServerTimeoutError, httpx.TimeoutException) as e:
                 await self.hooks['on_error'](e)
                 raise ConnectionTimeoutError(f"Request timed out: {str(e)}")
                 
-            except aiohttp.ClientConnectorError as e:
+            except (aiohttp.ClientConnectorError, httpx.ConnectError) as e:
                 await self.hooks['on_error'](e)
                 raise ConnectionError(f"Connection failed: {str(e)}")
                 
-            except aiohttp.ClientError as e:
+            except (aiohttp.ClientError, httpx.HTTPError) as e:
                 await self.hooks['on_error'](e)
                 raise HTTPCrawlerError(f"HTTP client error: {str(e)}")
             
@@ -2398,3 +2785,275 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                     params={"error": str(e), "url": url}
                 )
             raise
+
+
+####################################################################################################
+# Hybrid (HTTP first, browser on demand) Crawler Strategy
+####################################################################################################
+
+class EscalationHeuristic(ABC):
+    """
+    Decides whether a page fetched over plain HTTP must be re-crawled with a browser.
+
+    `needs_browser` returns a short reason string when the browser is needed, or None
+    when the HTTP response is good enough.
+    """
+
+    @abstractmethod
+    def needs_browser(
+        self, url: str, response: AsyncCrawlResponse, config: CrawlerRunConfig
+    ) -> Optional[str]:
+        pass
+
+
+class DefaultEscalationHeuristic(EscalationHeuristic):
+    """
+    Escalates pages that look client-rendered:
+        - less than `min_text_length` characters of visible text,
+        - an empty SPA mount point (`<div id="root"></div>`, `<app-root>`, ...),
+        - a `<noscript>` block asking the user to enable JavaScript,
+        - no match for the `baseSelector` of a JsonCssExtractionStrategy.
+    """
+
+    _SCRIPT_STYLE_RE: Final = re.compile(r"<(script|style|template)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+    _TAG_RE: Final = re.compile(r"<[^>]+>")
+    _SPACE_RE: Final = re.compile(r"\s+")
+    _EMPTY_MOUNT_RE: Final = re.compile(
+        r"""<div[^>]+id\s*=\s*["'](?:root|app|__next|__nuxt|svelte|main-app)["'][^>]*>\s*</div>"""
+        r"""|<app-root[^>]*>\s*</app-root>""",
+        re.IGNORECASE,
+    )
+    _NOSCRIPT_RE: Final = re.compile(r"<noscript[^>]*>(.*?)</noscript>", re.IGNORECASE | re.DOTALL)
+    _JS_REQUIRED_RE: Final = re.compile(
+        r"(enable|turn on|requires?|need)\b[^.]{0,40}javascript|javascript[^.]{0,40}(required|disabled|enable)",
+        re.IGNORECASE,
+    )
+
+    def __init__(
+        self,
+        min_text_length: int = 200,
+        check_spa_markers: bool = True,
+        check_noscript: bool = True,
+        check_extraction_selectors: bool = True,
+    ):
+        self.min_text_length = min_text_length
+        self.check_spa_markers = check_spa_markers
+        self.check_noscript = check_noscript
+        self.check_extraction_selectors = check_extraction_selectors
+
+    def visible_text_length(self, html: str) -> int:
+        text = self._TAG_RE.sub(" ", self._SCRIPT_STYLE_RE.sub(" ", html))
+        return len(self._SPACE_RE.sub(" ", text).strip())
+
+    def needs_browser(
+        self, url: str, response: AsyncCrawlResponse, config: CrawlerRunConfig
+    ) -> Optional[str]:
+        html = response.html or ""
+        if self.check_spa_markers and self._EMPTY_MOUNT_RE.search(html):
+            return "spa_root"
+        if self.check_noscript:
+            for block in self._NOSCRIPT_RE.findall(html):
+                if self._JS_REQUIRED_RE.search(block):
+                    return "noscript"
+        if self.visible_text_length(html) < self.min_text_length:
+            return "short_text"
+        extraction = config.extraction_strategy
+        if self.check_extraction_selectors and isinstance(extraction, JsonCssExtractionStrategy):
+            base_selector = extraction.schema.get("baseSelector")
+            if base_selector and not extraction._get_base_elements(extraction._parse_html(html), base_selector):
+                return "selector_miss"
+        return None
+
+
+class AsyncHybridCrawlerStrategy(AsyncCrawlerStrategy):
+    """
+    Tiered crawler strategy: every URL is fetched with AsyncHTTPCrawlerStrategy first
+    and only escalated to AsyncPlaywrightCrawlerStrategy when the HTTP fetch fails, the
+    run config needs a browser (JS, screenshots, sessions, ...) or the escalation
+    heuristic rejects the response.
+
+    Outcomes are remembered per domain: once a domain keeps escalating, its URLs go to
+    the browser directly, with an HTTP re-probe every `reprobe_every` requests so the
+    decision can flip back. The browser is only launched on the first escalation.
+
+    Each response is tagged in `transfer_stats` with `fetch_tier` ("http" or "browser")
+    and, for escalations, `escalation_reason`.
+    """
+
+    # Run config attributes that only make sense in a browser
+    BROWSER_ONLY_OPTIONS: Final = (
+        "js_code", "c4a_script", "wait_for", "screenshot", "pdf", "capture_mhtml", "scan_full_page",
+        "adaptive_scan", "virtual_scroll_config", "capture_network_requests", "capture_console_messages",
+        "session_id", "js_only", "simulate_user", "magic", "process_iframes", "remove_overlay_elements",
+    )
+
+    def __init__(
+        self,
+        browser_config: Optional[BrowserConfig] = None,
+        http_config: Optional[HTTPCrawlerConfig] = None,
+        logger: Optional[AsyncLogger] = None,
+        heuristic: Optional[Union[EscalationHeuristic, Callable]] = None,
+        http_strategy: Optional[AsyncHTTPCrawlerStrategy] = None,
+        browser_strategy: Optional[AsyncPlaywrightCrawlerStrategy] = None,
+        min_samples: int = 3,
+        escalation_ratio: float = 0.8,
+        reprobe_every: int = 25,
+        max_domains: int = 10000,
+    ):
+        """
+        Args:
+            browser_config: Config for the Playwright strategy
+            http_config: Config for the HTTP strategy
+            logger: Logger shared by both tiers
+            heuristic: EscalationHeuristic, or a callable (url, response, config) returning
+                       a reason string (or None); may be async. Default: DefaultEscalationHeuristic()
+            http_strategy: Pre-built HTTP strategy (overrides http_config)
+            browser_strategy: Pre-built browser strategy (overrides browser_config)
+            min_samples: Escalations needed before a domain is sent to the browser directly
+            escalation_ratio: Share of escalated requests that sends a domain to the browser directly
+            reprobe_every: Browser-direct requests between HTTP re-probes of a domain
+            max_domains: Size of the per-domain decision cache (LRU)
+        """
+        self.logger = logger
+        self.http_strategy = http_strategy or AsyncHTTPCrawlerStrategy(
+            browser_config=http_config, logger=logger
+        )
+        self.browser_strategy = browser_strategy or AsyncPlaywrightCrawlerStrategy(
+            browser_config=browser_config, logger=logger
+        )
+        self.heuristic = heuristic or DefaultEscalationHeuristic()
+        self.min_samples = min_samples
+        self.escalation_ratio = escalation_ratio
+        self.reprobe_every = reprobe_every
+        self.max_domains = max_domains
+        # domain -> [http_ok, escalated, browser_direct_since_probe]
+        self._domains: "OrderedDict[str, List[int]]" = OrderedDict()
+        self._browser_started = False
+        self._browser_lock = asyncio.Lock()
+        self.stats = {"http": 0, "escalated": 0, "browser_direct": 0, "reasons": {}}
+
+    async def __aenter__(self) -> "AsyncHybridCrawlerStrategy":
+        await self.http_strategy.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.http_strategy.__aexit__(exc_type, exc_val, exc_tb)
+        if self._browser_started:
+            await self.browser_strategy.__aexit__(exc_type, exc_val, exc_tb)
+            self._browser_started = False
+
+    def update_user_agent(self, user_agent: str):
+        self.browser_strategy.update_user_agent(user_agent)
+        http_config = self.http_strategy.browser_config
+        http_config.headers = {**(http_config.headers or {}), "User-Agent": user_agent}
+
+    def set_hook(self, hook_type: str, hook: Callable):
+        """Hooks are browser hooks; they run only for browser-tier crawls."""
+        self.browser_strategy.set_hook(hook_type, hook)
+
+    def _domain_state(self, domain: str) -> List[int]:
+        state = self._domains.get(domain)
+        if state is None:
+            state = self._domains[domain] = [0, 0, 0]
+            if len(self._domains) > self.max_domains:
+                self._domains.popitem(last=False)
+        else:
+            self._domains.move_to_end(domain)
+        return state
+
+    def _prefers_browser(self, state: List[int]) -> bool:
+        http_ok, escalated, _ = state
+        if escalated < self.min_samples:
+            return False
+        return escalated / (http_ok + escalated) >= self.escalation_ratio
+
+    def domain_decision(self, url: str) -> str:
+        """Current decision for the URL's domain: "http" or "browser"."""
+        state = self._domains.get(urlparse(url).netloc)
+        return "browser" if state and self._prefers_browser(state) else "http"
+
+    def _browser_only_reason(self, config: CrawlerRunConfig) -> Optional[str]:
+        for option in self.BROWSER_ONLY_OPTIONS:
+            if getattr(config, option, None):
+                return f"config:{option}"
+        return None
+
+    async def _check(self, url: str, response: AsyncCrawlResponse, config: CrawlerRunConfig) -> Optional[str]:
+        if isinstance(self.heuristic, EscalationHeuristic):
+            return self.heuristic.needs_browser(url, response, config)
+        reason = self.heuristic(url, response, config)
+        if asyncio.iscoroutine(reason):
+            reason = await reason
+        return reason
+
+    async def _crawl_with_browser(self, url: str, config: CrawlerRunConfig, reason: str) -> AsyncCrawlResponse:
+        if not self._browser_started:
+            async with self._browser_lock:
+                if not self._browser_started:
+                    await self.browser_strategy.__aenter__()
+                    self._browser_started = True
+        response = await self.browser_strategy.crawl(url, config=config)
+        response.transfer_stats = {
+            **(response.transfer_stats or {}),
+            "fetch_tier": "browser",
+            "escalation_reason": reason,
+        }
+        return response
+
+    def _record(self, state: Optional[List[int]], reason: Optional[str]) -> None:
+        if reason is None:
+            self.stats["http"] += 1
+        else:
+            self.stats["escalated"] += 1
+            self.stats["reasons"][reason] = self.stats["reasons"].get(reason, 0) + 1
+        if state is not None:
+            state[0 if reason is None else 1] += 1
+
+    async def crawl(
+        self, url: str, config: Optional[CrawlerRunConfig] = None, **kwargs
+    ) -> AsyncCrawlResponse:
+        config = config or CrawlerRunConfig.from_kwargs(kwargs)
+
+        reason = self._browser_only_reason(config)
+        if reason:
+            return await self._crawl_with_browser(url, config, reason)
+
+        parsed = urlparse(url)
+        state = self._domain_state(parsed.netloc) if parsed.scheme in ("http", "https") else None
+        reprobe = state is not None and self._prefers_browser(state)
+        if reprobe:
+            state[2] += 1
+            if state[2] % self.reprobe_every:
+                self.stats["browser_direct"] += 1
+                return await self._crawl_with_browser(url, config, "domain_cache")
+
+        try:
+            response = await self.http_strategy.crawl(url, config=config)
+        except Exception as e:
+            if isinstance(e, HTTPStatusError) and 400 <= e.status_code < 500 and e.status_code not in (403, 429):
+                raise  # A browser won't find a page that does not exist
+            reason = f"http_error:{type(e).__name__}"
+        else:
+            reason = await self._check(url, response, config)
+
+        self._record(state, reason)
+        if reason is None:
+            if reprobe:
+                # The domain served a usable page over HTTP again; let it earn its way back
+                state[1] //= 2
+                state[2] = 0
+            response.transfer_stats = {**(response.transfer_stats or {}), "fetch_tier": "http"}
+            if config.fetch_ssl_certificate and response.ssl_certificate is None:
+                # The HTTP tier does not read the certificate; a cached handshake per host does
+                target = response.redirected_url or url
+                if urlparse(target).scheme == "https":
+                    response.ssl_certificate = await SSLCertificate.from_url_async(target)
+            return response
+
+        if self.logger:
+            self.logger.debug(
+                message="Escalating {url} to browser: {reason}",
+                tag="HYBRID",
+                params={"url": url, "reason": reason},
+            )
+        return await self._crawl_with_browser(url, config, reason)
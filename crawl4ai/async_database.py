@@ -2,14 +2,15 @@ import os
 from pathlib import Path
 import aiosqlite
 import asyncio
-from typing import Optional, Dict
+from typing import Optional, Dict, Union
 from contextlib import asynccontextmanager
 import json  
+import xxhash
 from .models import CrawlResult, MarkdownGenerationResult, StringCompatibleMarkdown
 import aiofiles
 from .async_logger import AsyncLogger
 
-from .utils import ensure_content_dirs, generate_content_hash
+from .utils import ensure_content_dirs, generate_content_hash, screenshot_to_bytes
 from .utils import VersionManager
 from .utils import get_error_context, create_box_message
 
@@ -524,30 +525,47 @@ class AsyncDatabaseManager:
                 params={"error": str(e)},
             )
 
-    async def _store_content(self, content: str, content_type: str) -> str:
-        """Store content in filesystem and return hash"""
+    async def _store_content(self, content: Union[str, bytes], content_type: str) -> str:
+        """
+        Store content in filesystem and return hash. Screenshots are always stored as
+        raw image bytes, whichever form (base64, bytes, file path) the crawl returned.
+        """
+        if content and content_type.startswith("screenshot"):
+            content = await asyncio.to_thread(screenshot_to_bytes, content)
         if not content:
             return ""
 
-        content_hash = generate_content_hash(content)
+        if isinstance(content, bytes):
+            content_hash = xxhash.xxh64(content).hexdigest()
+        else:
+            content_hash = generate_content_hash(content)
         file_path = os.path.join(self.content_paths[content_type], content_hash)
 
         # Only write if file doesn't exist
         if not os.path.exists(file_path):
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-                await f.write(content)
+            if isinstance(content, bytes):
+                async with aiofiles.open(file_path, "wb") as f:
+                    await f.write(content)
+            else:
+                async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
+                    await f.write(content)
 
         return content_hash
 
     async def _load_content(
         self, content_hash: str, content_type: str
-    ) -> Optional[str]:
-        """Load content from filesystem by hash"""
+    ) -> Optional[Union[str, bytes]]:
+        """Load content from filesystem by hash. Screenshots are returned as raw image bytes."""
         if not content_hash:
             return None
 
         file_path = os.path.join(self.content_paths[content_type], content_hash)
         try:
+            if content_type.startswith("screenshot"):
+                async with aiofiles.open(file_path, "rb") as f:
+                    data = await f.read()
+                # Entries written before screenshots were cached as bytes hold base64 text
+                return screenshot_to_bytes(data) or screenshot_to_bytes(data.decode("ascii", "ignore"), read_files=False)
             async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
                 return await f.read()
         except:
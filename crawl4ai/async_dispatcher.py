@@ -42,17 +42,24 @@ class RateLimiter:
     def get_domain(self, url: str) -> str:
         return urlparse(url).netloc
 
-    async def wait_if_needed(self, url: str) -> None:
+    def _get_state(self, url: str) -> DomainState:
         domain = self.get_domain(url)
         state = self.domains.get(domain)
-
         if not state:
-            self.domains[domain] = DomainState()
-            state = self.domains[domain]
+            state = self.domains[domain] = DomainState()
+        return state
+
+    def set_crawl_delay(self, url: str, delay: Optional[float]) -> None:
+        """Never wait less than `delay` seconds between requests to the URL's domain (robots.txt Crawl-delay)."""
+        self._get_state(url).min_delay = min(delay or 0, self.max_delay)
+
+    async def wait_if_needed(self, url: str) -> None:
+        state = self._get_state(url)
 
         now = time.time()
         if state.last_request_time:
-            wait_time = max(0, state.current_delay - (now - state.last_request_time))
+            delay = max(state.current_delay, state.min_delay)
+            wait_time = max(0, delay - (now - state.last_request_time))
             if wait_time > 0:
                 await asyncio.sleep(wait_time)
 
@@ -124,6 +131,17 @@ class BaseDispatcher(ABC):
         # No match found - return None to indicate URL should be skipped
         return None
 
+    async def apply_crawl_delay(self, url: str, config: CrawlerRunConfig) -> None:
+        """Feed the robots.txt Crawl-delay of the URL's host into the rate limiter."""
+        if not (self.rate_limiter and config.check_robots_txt):
+            return
+        robots_parser = getattr(self.crawler, "robots_parser", None)
+        if robots_parser is None:
+            return
+        user_agent = config.user_agent or self.crawler.browser_config.user_agent
+        delay = await robots_parser.get_crawl_delay(url, user_agent)
+        self.rate_limiter.set_crawl_delay(url, delay)
+
     @abstractmethod
     async def crawl_url(
         self,
@@ -171,6 +189,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         self.memory_pressure_mode = False  # Flag to indicate when we're in memory pressure mode
         self.current_memory_percent = 0.0  # Track current memory usage
         self._high_memory_start_time: Optional[float] = None
+        self._last_priority_update = 0.0
         
     async def _memory_monitor_task(self):
         """Background task to continuously monitor memory usage and update state"""
@@ -283,6 +302,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             self.concurrent_sessions += 1
             
             if self.rate_limiter:
+                await self.apply_crawl_delay(url, selected_config)
                 await self.rate_limiter.wait_if_needed(url)
                 
             # Check if we're in critical memory state
@@ -472,23 +492,24 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         # Skip if queue is empty
         if self.task_queue.empty():
             return
+        # Rescoring drains the whole queue; doing it after every completion is
+        # quadratic on wide batches, and wait times only matter at this granularity
+        now = time.time()
+        if now - self._last_priority_update < self.check_interval:
+            return
+        self._last_priority_update = now
             
         # Use a drain-and-refill approach to update all priorities
         temp_items = []
         
-        # Drain the queue (with a safety timeout to prevent blocking)
+        # Drain the queue without yielding, so nothing is added or taken meanwhile
         try:
-            drain_start = time.time()
-            while not self.task_queue.empty() and time.time() - drain_start < 5.0:  # 5 second safety timeout
+            while not self.task_queue.empty():
                 try:
-                    # Get item from queue with timeout
-                    priority, (url, task_id, retry_count, enqueue_time) = await asyncio.wait_for(
-                        self.task_queue.get(), timeout=0.1
-                    )
+                    priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
                     
                     # Calculate new priority based on current wait time
-                    current_time = time.time()
-                    wait_time = current_time - enqueue_time
+                    wait_time = now - enqueue_time
                     new_priority = self._get_priority_score(wait_time, retry_count)
                     
                     # Store with updated priority
@@ -498,8 +519,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     if self.monitor and task_id in self.monitor.stats:
                         self.monitor.update_task(task_id, wait_time=wait_time)
                         
-                except asyncio.TimeoutError:
-                    # Queue might be empty or very slow
+                except asyncio.QueueEmpty:
                     break
         except Exception as e:
             # If anything goes wrong, make sure we refill the queue with what we've got
@@ -524,7 +544,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         
         # Refill the queue with updated priorities
         for item in temp_items:
-            await self.task_queue.put(item)
+            self.task_queue.put_nowait(item)
                 
     async def run_urls_stream(
         self,
@@ -679,6 +699,7 @@ class SemaphoreDispatcher(BaseDispatcher):
                 )
 
             if self.rate_limiter:
+                await self.apply_crawl_delay(url, selected_config)
                 await self.rate_limiter.wait_if_needed(url)
 
             async with semaphore:
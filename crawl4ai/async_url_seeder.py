@@ -6,28 +6,36 @@ Features
 --------
 * Common-Crawl streaming via httpx.AsyncClient (HTTP/2, keep-alive)
 * robots.txt → sitemap chain (.gz + nested indexes) via async httpx
-* Per-domain CDX result cache on disk (~/.crawl4ai/<index>_<domain>_<hash>.jsonl)
+* Streaming sitemap parsing (incremental gunzip + pull parser) with lastmod/changefreq/priority
+* One SQLite (WAL) cache for discovered URL lists and per-URL results (compressed, TTL)
 * Optional HEAD-only liveness check
 * Optional partial <head> download + meta parsing
-* Global hits-per-second rate-limit via asyncio.Semaphore
+* Incremental seeding (since= / changed_only=) from a persisted per-domain URL state
+* Streaming API (aiter_urls) with backpressure and a bounded top-K mode
+* Token-bucket rate limiting (global + per host) with per-host concurrency caps
 * Concurrency in the thousands — fine on a single event-loop
 """
 
 from __future__ import annotations
-import aiofiles
 import asyncio
 import gzip
 import hashlib
+import heapq
 import io
 import json
+import math
 import os
 import pathlib
 import re
 import time
-from datetime import timedelta
+import zlib
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timedelta, timezone
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
-from urllib.parse import quote, urljoin
+from urllib.parse import quote, urljoin, urlparse
 
 import httpx
 import fnmatch
@@ -53,6 +61,7 @@ except ImportError:
 # You might need to adjust this import based on your exact file structure
 # Import AsyncLogger for default if needed
 from .async_logger import AsyncLoggerBase, AsyncLogger
+from .seeder_cache import SeederCache
 
 # Import SeedingConfig for type hints
 from typing import TYPE_CHECKING
@@ -86,6 +95,96 @@ def _match(url: str, pattern: str) -> bool:
             or (canon.startswith("www.") and fnmatch.fnmatch(canon[4:], pattern)))
 
 
+def _sitemap_meta(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: entry.get(k) for k in ("lastmod", "changefreq", "priority")}
+
+
+def _to_timestamp(value: Any) -> Optional[float]:
+    """
+    Epoch seconds of a sitemap lastmod or a `since` value: datetime, date, ISO-8601
+    string, epoch number, or a timedelta meaning "that long ago". Naive values are UTC.
+    """
+    if value is None:
+        return None
+    if isinstance(value, timedelta):
+        return time.time() - value.total_seconds()
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, date):
+        dt = datetime(value.year, value.month, value.day)
+    else:
+        text = str(value).strip()
+        if text.endswith(("Z", "z")):
+            text = text[:-1] + "+00:00"
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _classify_change(state: Optional[Dict[str, Any]], lastmod: Optional[str]) -> str:
+    """'new', 'modified' or 'unchanged' by sitemap lastmod; 'unknown' when there is nothing to compare."""
+    if state is None:
+        return "new"
+    if lastmod and state.get("lastmod"):
+        return "unchanged" if lastmod == state["lastmod"] else "modified"
+    return "unknown"
+
+
+def _head_hash(head_data: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(head_data, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class _StreamingBM25:
+    """
+    Okapi BM25 over a stream of documents. Collection statistics (document count,
+    average length and the document frequency of the query terms only) grow as
+    documents are added, so memory does not depend on the number of documents.
+    Scores are divided by the best score any document could reach and fall in 0-1.
+    """
+
+    def __init__(self, query: str, k1: float = 1.5, b: float = 0.75):
+        self.terms = query.lower().split()
+        self.k1 = k1
+        self.b = b
+        self.n_docs = 0
+        self.total_len = 0
+        self.df = {t: 0 for t in self.terms}
+
+    def add(self, text: str) -> tuple:
+        """Account for a document; returns its (query-term frequencies, length)."""
+        tokens = text.lower().split()
+        tf: Dict[str, int] = {}
+        wanted = self.df.keys()
+        for tok in tokens:
+            if tok in wanted:
+                tf[tok] = tf.get(tok, 0) + 1
+        self.n_docs += 1
+        self.total_len += len(tokens)
+        for t in tf:
+            self.df[t] += 1
+        return tf, len(tokens)
+
+    def score(self, tf: Dict[str, int], length: int) -> float:
+        if not self.terms or not self.n_docs:
+            return 0.0
+        avgdl = self.total_len / self.n_docs or 1.0
+        norm = self.k1 * (1 - self.b + self.b * length / avgdl)
+        score = best = 0.0
+        for t in self.terms:
+            idf = math.log((self.n_docs - self.df[t] + 0.5) / (self.df[t] + 0.5) + 1)
+            best += idf * (self.k1 + 1)
+            f = tf.get(t, 0)
+            if f:
+                score += idf * f * (self.k1 + 1) / (f + norm)
+        return score / best if best else 0.0
+
+
 def _parse_head(src: str) -> Dict[str, Any]:
     if LXML:
         try:
@@ -158,6 +257,193 @@ def _parse_head(src: str) -> Dict[str, Any]:
         info["lang"] = lang_match.group(1)
     return info
 
+# ────────────────────────────────────────────────────────────────────────── rate limiting
+class AsyncTokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, holding at most `burst` tokens.
+
+    Waiters are served in FIFO order; the bucket refills lazily from the loop clock,
+    so there is no background task to manage.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else 1)
+        self._tokens = self.burst
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self._updated is not None:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1) -> float:
+        """Take `tokens`, sleeping until they are available. Returns the seconds waited."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with self._lock:
+            while True:
+                self._refill(loop.time())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return loop.time() - start
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+class SeederRateLimiter:
+    """
+    Request gate shared by every outgoing seeder request to a crawled site.
+
+    A request first takes a per-host concurrency slot, then a token from the host's
+    bucket and finally one from the global bucket, so a slow or throttled host never
+    holds global tokens it cannot use yet. Counters are exposed through `stats()`.
+    """
+
+    MAX_HOSTS = 4096
+
+    def __init__(
+        self,
+        hits_per_sec: Optional[float] = None,
+        per_host_hits_per_sec: Optional[float] = None,
+        per_host_concurrency: Optional[int] = None,
+        burst: Optional[float] = None,
+    ):
+        self.hits_per_sec = hits_per_sec
+        self.per_host_hits_per_sec = per_host_hits_per_sec
+        self.per_host_concurrency = per_host_concurrency
+        self.burst = burst
+        self._global = AsyncTokenBucket(hits_per_sec, burst) if hits_per_sec else None
+        # host -> [bucket | None, semaphore | None, in_flight]
+        self._hosts: "OrderedDict[str, list]" = OrderedDict()
+        self._stats = {
+            "requests": 0,
+            "throttled": 0,
+            "wait_time": 0.0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+            "started_at": None,
+        }
+        self._host_requests: Dict[str, int] = {}
+
+    def matches(self, hits_per_sec, per_host_hits_per_sec, per_host_concurrency, burst=None) -> bool:
+        return (self.hits_per_sec, self.per_host_hits_per_sec, self.per_host_concurrency, self.burst) == (
+            hits_per_sec, per_host_hits_per_sec, per_host_concurrency, burst)
+
+    def _host_state(self, host: str) -> list:
+        state = self._hosts.get(host)
+        if state is None:
+            state = [
+                AsyncTokenBucket(self.per_host_hits_per_sec, self.burst) if self.per_host_hits_per_sec else None,
+                asyncio.Semaphore(self.per_host_concurrency) if self.per_host_concurrency else None,
+                0,
+            ]
+            self._hosts[host] = state
+            if len(self._hosts) > self.MAX_HOSTS:
+                # Drop the oldest idle host; busy ones keep their state
+                for old, old_state in self._hosts.items():
+                    if old_state[2] == 0 and old != host:
+                        del self._hosts[old]
+                        break
+        else:
+            self._hosts.move_to_end(host)
+        return state
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Hold a rate-limited slot for one request to `url`."""
+        host = (urlparse(url).hostname or "").lower()
+        state = self._host_state(host)
+        bucket, sem, _ = state
+        loop = asyncio.get_running_loop()
+        if self._stats["started_at"] is None:
+            self._stats["started_at"] = loop.time()
+        start = loop.time()
+
+        if sem is not None:
+            await sem.acquire()
+        state[2] += 1
+        try:
+            if bucket is not None:
+                await bucket.acquire()
+            if self._global is not None:
+                await self._global.acquire()
+
+            waited = loop.time() - start
+            stats = self._stats
+            stats["requests"] += 1
+            stats["wait_time"] += waited
+            if waited > 0.001:
+                stats["throttled"] += 1
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            self._host_requests[host] = self._host_requests.get(host, 0) + 1
+            try:
+                yield
+            finally:
+                stats["in_flight"] -= 1
+        finally:
+            state[2] -= 1
+            if sem is not None:
+                sem.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of request counters, observed request rate and busiest hosts."""
+        stats = dict(self._stats)
+        started = stats.pop("started_at")
+        elapsed = 0.0
+        if started is not None:
+            try:
+                elapsed = asyncio.get_running_loop().time() - started
+            except RuntimeError:
+                elapsed = 0.0
+        stats["elapsed"] = elapsed
+        stats["observed_rps"] = stats["requests"] / elapsed if elapsed > 0 else 0.0
+        stats["hosts"] = dict(sorted(self._host_requests.items(), key=lambda kv: -kv[1])[:20])
+        return stats
+
+
+class _ListingWriter:
+    """Records a URL listing into the seeder cache while discovery streams it."""
+
+    def __init__(self, store: SeederCache, source: str, domain: str):
+        self.store = store
+        self.source = source
+        self.domain = domain
+        self.listing_id: Optional[int] = None
+        self.size = 0
+        self._rows: List[tuple] = []
+        self._done = False
+
+    async def add(self, url: str, meta: Optional[Dict[str, Any]] = None) -> None:
+        if self.listing_id is None:
+            self.listing_id = await asyncio.to_thread(self.store.begin_listing, self.source, self.domain)
+        self._rows.append((url, meta))
+        if len(self._rows) >= SeederCache.BATCH_SIZE:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        rows, self._rows = self._rows, []
+        if rows:
+            await asyncio.to_thread(self.store.append_listing, self.listing_id, self.size, rows)
+            self.size += len(rows)
+
+    async def finish(self) -> None:
+        """Commit the listing; only complete listings are ever served from cache."""
+        if self.listing_id is None:
+            return
+        await self._flush()
+        await asyncio.to_thread(self.store.finish_listing, self.listing_id, self.size)
+        self._done = True
+
+    async def abort(self) -> None:
+        if self.listing_id is not None and not self._done:
+            self._done = True
+            await asyncio.to_thread(self.store.abort_listing, self.listing_id)
+
+
 # ────────────────────────────────────────────────────────────────────────── class
 
 
@@ -220,13 +506,15 @@ class AsyncUrlSeeder:
 
         # defer – grabbing the index inside an active loop blows up
         self.index_id: Optional[str] = None
-        self._rate_sem: Optional[asyncio.Semaphore] = None
+        self._limiter: Optional[SeederRateLimiter] = None
+        self._sitemap_concurrency = 8
 
-        # ───────── cache dirs ─────────
-        self.cache_root = Path(os.path.expanduser(
-            cache_root or "~/.cache/url_seeder"))
-        (self.cache_root / "live").mkdir(parents=True, exist_ok=True)
-        (self.cache_root / "head").mkdir(exist_ok=True)
+        # ───────── cache store ─────────
+        # URL listings and live/head results share one SQLite file
+        self.cache_root = Path(os.path.expanduser(cache_root)) if cache_root else self.cache_dir
+        self._store = SeederCache(self.cache_root / "seeder.db", ttl.total_seconds())
+        self._pending_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._warm_cache: Dict[tuple, Dict[str, Any]] = {}
 
     def _log(self, level: str, message: str, tag: str = "URL_SEED", **kwargs: Any):
         """Helper to log messages using the provided logger, if available."""
@@ -238,29 +526,84 @@ class AsyncUrlSeeder:
             # else: # Fallback for unknown level, should not happen with AsyncLoggerBase
             #     print(f"[{tag}] {level.upper()}: {message.format(**kwargs)}")
 
-    # ───────── cache helpers ─────────
-    def _cache_path(self, kind: str, url: str) -> Path:
-        h = hashlib.sha1(url.encode()).hexdigest()
-        return self.cache_root / kind / f"{h}.json"
+    # ───────── rate limiting ─────────
+    def _configure_rate_limit(self, config: "SeedingConfig") -> None:
+        """(Re)build the shared limiter when the config asks for different limits."""
+        hits = config.hits_per_sec
+        if hits is not None and hits <= 0:
+            self._log("warning", "hits_per_sec must be positive. Disabling rate limiting.", tag="URL_SEED")
+            hits = None
+        per_host = getattr(config, "per_host_hits_per_sec", None) or None
+        per_host_conc = getattr(config, "per_host_concurrency", None) or None
+        self._sitemap_concurrency = max(1, getattr(config, "max_sitemap_concurrency", 8) or 1)
+
+        if not (hits or per_host or per_host_conc):
+            self._limiter = None
+        elif self._limiter is None or not self._limiter.matches(hits, per_host, per_host_conc):
+            # Concurrent urls() calls with the same limits share one limiter
+            self._limiter = SeederRateLimiter(hits, per_host, per_host_conc)
+
+    @asynccontextmanager
+    async def _throttle(self, url: str):
+        limiter = self._limiter
+        if limiter is None:
+            yield
+        else:
+            async with limiter.slot(url):
+                yield
 
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """Request counters of the active rate limiter (empty when rate limiting is off)."""
+        return self._limiter.stats() if self._limiter else {}
+
+    # ───────── cache helpers ─────────
     async def _cache_get(self, kind: str, url: str) -> Optional[Dict[str, Any]]:
-        p = self._cache_path(kind, url)
-        if not p.exists():
-            return None
-        if time.time()-p.stat().st_mtime > self.ttl.total_seconds():
-            return None
+        hit = self._pending_cache.get((kind, url)) or self._warm_cache.pop((kind, url), None)
+        if hit is not None:
+            return dict(hit)
         try:
-            async with aiofiles.open(p, "r") as f:
-                return json.loads(await f.read())
+            return await asyncio.to_thread(self._store.get, kind, url)
         except Exception:
             return None
 
-    async def _cache_set(self, kind: str, url: str, data: Dict[str, Any]) -> None:
+    async def _cache_prefetch(self, kind: str, urls: Sequence[str]) -> None:
+        """Load cached results for many URLs with one batched query."""
         try:
-            async with aiofiles.open(self._cache_path(kind, url), "w") as f:
-                await f.write(json.dumps(data, separators=(",", ":")))
+            found = await asyncio.to_thread(self._store.get_many, kind, list(urls))
         except Exception:
-            pass
+            return
+        self._warm_cache.update(((kind, u), v) for u, v in found.items())
+
+    async def _cache_set(self, kind: str, url: str, data: Dict[str, Any]) -> None:
+        # Writes are buffered and committed in batches
+        self._pending_cache[(kind, url)] = dict(data)
+        if len(self._pending_cache) >= SeederCache.BATCH_SIZE:
+            await self._flush_cache()
+
+    async def _flush_cache(self) -> None:
+        if not self._pending_cache:
+            return
+        pending, self._pending_cache = self._pending_cache, {}
+        by_kind: Dict[str, List[tuple]] = {}
+        for (kind, url), data in pending.items():
+            by_kind.setdefault(kind, []).append((url, data))
+        try:
+            for kind, items in by_kind.items():
+                await asyncio.to_thread(self._store.set_many, kind, items)
+        except Exception as e:
+            self._log("warning", "Failed to write seeder cache: {error}",
+                      params={"error": str(e)}, tag="URL_SEED")
+
+    async def _read_listing(self, listing_id: int):
+        """Yield (url, meta) pairs of a cached listing page by page."""
+        after = -1
+        while True:
+            rows = await asyncio.to_thread(self._store.read_listing, listing_id, after)
+            if not rows:
+                return
+            for seq, url, meta in rows:
+                yield url, meta
+            after = rows[-1][0]
 
     # ─────────────────────────────── discovery entry
 
@@ -278,15 +621,171 @@ class AsyncUrlSeeder:
         config : SeedingConfig
             Configuration object containing all seeding parameters
         """
+        extract_head = config.extract_head
+        max_urls = config.max_urls if config.max_urls is not None else -1
+        query = config.query
+        score_threshold = config.score_threshold
+        scoring_method = config.scoring_method
+
+        results = [entry async for entry in self._seed_stream(domain, config)]
+
+        # Apply BM25 scoring if query was provided
+        if query and extract_head and scoring_method == "bm25":
+            # Apply collective BM25 scoring across all documents
+            results = await self._apply_bm25_scoring(results, config)
+            
+            # Filter by score threshold if specified
+            if score_threshold is not None:
+                original_count = len(results)
+                results = [r for r in results if r.get("relevance_score", 0) >= score_threshold]
+                if original_count > len(results):
+                    self._log("info", "Filtered {filtered} URLs below score threshold {threshold}",
+                              params={"filtered": original_count - len(results), "threshold": score_threshold}, tag="URL_SEED")
+            
+            # Sort by relevance score
+            results.sort(key=lambda x: x.get("relevance_score", 0.0), reverse=True)
+            self._log("info", "Sorted {count} URLs by relevance score for query: '{query}'",
+                      params={"count": len(results), "query": query}, tag="URL_SEED")
+        elif query and not extract_head:
+            self._log(
+                "warning", "Query provided but extract_head is False. Enable extract_head for relevance scoring.", tag="URL_SEED")
+
+        return results[:max_urls] if max_urls > 0 else results
+
+    async def aiter_urls(
+        self,
+        domain_or_domains: Union[str, Sequence[str]],
+        config: "SeedingConfig",
+        top_k: Optional[int] = None,
+        buffer_size: Optional[int] = None,
+    ):
+        """
+        Stream validated URL records as soon as they pass the filters.
+
+        Unlike `urls`, nothing is collected: discovery, validation and the consumer run
+        concurrently, and a slow consumer pauses validation and discovery through
+        bounded queues (`buffer_size` records). The generator can be handed straight
+        to `AsyncWebCrawler.arun_many` so crawling starts while seeding continues.
+
+        With a `config.query` (and `extract_head=True`) every record gets a
+        `relevance_score` from a streaming BM25 whose collection statistics grow as
+        records arrive. With `top_k`, only the best `top_k` records are kept in a
+        bounded heap; they are rescored with the final statistics and yielded, best
+        first, when seeding ends. Without a query `top_k` is just a limit.
+
+        Records of multi-domain runs carry a "domain" key.
+        """
+        domains = [domain_or_domains] if isinstance(domain_or_domains, str) else list(domain_or_domains)
+        if len(domains) == 1:
+            stream = self._seed_stream(domains[0], config, buffer_size)
+        else:
+            stream = self._merge_seed_streams(domains, config, buffer_size)
+
+        query = config.query if config.extract_head and config.scoring_method == "bm25" else None
+        if config.query and not config.extract_head:
+            self._log(
+                "warning", "Query provided but extract_head is False. Enable extract_head for relevance scoring.", tag="URL_SEED")
+        threshold = config.score_threshold if query else None
+        scorer = _StreamingBM25(query) if query else None
+
+        try:
+            if scorer is None:
+                count = 0
+                async for entry in stream:
+                    yield entry
+                    count += 1
+                    if top_k is not None and count >= top_k:
+                        return
+                return
+
+            heap: List[tuple] = []  # (score, seq, entry, doc stats), smallest score on top
+            seq = 0
+            async for entry in stream:
+                doc = self._score_document(scorer, entry, query)
+                if top_k is None:
+                    if threshold is None or entry.get("relevance_score", 0.0) >= threshold:
+                        yield entry
+                    continue
+                seq += 1
+                item = (entry.get("relevance_score", 0.0), seq, entry, doc)
+                if len(heap) < top_k:
+                    heapq.heappush(heap, item)
+                elif item[0] > heap[0][0]:
+                    heapq.heapreplace(heap, item)
+
+            # Early scores used partial statistics; rank the survivors with the final ones
+            for _, _, entry, doc in heap:
+                if doc is not None:
+                    entry["relevance_score"] = scorer.score(*doc)
+            ranked = sorted((item[2] for item in heap), key=lambda e: e.get("relevance_score", 0.0), reverse=True)
+            for entry in ranked:
+                if threshold is None or entry.get("relevance_score", 0.0) >= threshold:
+                    yield entry
+        finally:
+            await stream.aclose()
+
+    def _score_document(self, scorer: "_StreamingBM25", entry: Dict[str, Any], query: str):
+        """Attach a streaming relevance score; returns the BM25 doc stats when head text was scored."""
+        if entry.get("status") != "valid":
+            entry["relevance_score"] = 0.0
+            return None
+        text = self._extract_text_context(entry["head_data"]) if entry.get("head_data") else ""
+        if not text:
+            # Same URL-based fallback as the batch scorer
+            entry["relevance_score"] = float(self._calculate_url_relevance_score(query, entry["url"]))
+            return None
+        doc = scorer.add(text)
+        entry["relevance_score"] = scorer.score(*doc)
+        return doc
+
+    async def _merge_seed_streams(self, domains: Sequence[str], config: "SeedingConfig",
+                                  buffer_size: Optional[int] = None):
+        """Seed several domains concurrently into one bounded stream."""
+        out: asyncio.Queue = asyncio.Queue(maxsize=buffer_size or 256)
+
+        async def pump(domain: str):
+            try:
+                async for entry in self._seed_stream(domain, config, buffer_size):
+                    entry["domain"] = domain
+                    await out.put(entry)
+            except Exception as e:
+                self._log("error", "Seeding {domain} failed: {error}",
+                          params={"domain": domain, "error": str(e)}, tag="URL_SEED")
+            finally:
+                await out.put(None)
+
+        tasks = [asyncio.create_task(pump(d)) for d in domains]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                entry = await out.get()
+                if entry is None:
+                    remaining -= 1
+                else:
+                    yield entry
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _seed_stream(self, domain: str, config: "SeedingConfig", buffer_size: Optional[int] = None):
+        """
+        Discovery → state filter → validation pipeline for one domain, yielding each
+        record once it is validated and passed the incremental-seeding filter.
+        Stops after `config.max_urls` records.
+        """
         # Extract parameters from config
         pattern = config.pattern or "*"
         source = config.source
         live_check = config.live_check
         extract_head = config.extract_head
-        concurrency = config.concurrency
+        concurrency = max(1, config.concurrency)
         head_timeout = 5  # Default timeout for HEAD requests
-        hits_per_sec = config.hits_per_sec
-        self.force = config.force  # Store force flag as instance attribute
+        changed_only = getattr(config, "changed_only", False)
+        since_ts = _to_timestamp(getattr(config, "since", None))
+        # Store force flag as instance attribute. Change detection compares fresh
+        # heads, so cached per-URL results are bypassed in changed_only mode.
+        self.force = config.force or changed_only
         force = config.force
         verbose = config.verbose if config.verbose is not None else (
             self.logger.verbose if self.logger else False)
@@ -311,15 +810,7 @@ class AsyncUrlSeeder:
                 raise ValueError(
                     f"Invalid source '{s}'. Valid sources are: {', '.join(valid_sources)}")
 
-        if hits_per_sec:
-            if hits_per_sec <= 0:
-                self._log(
-                    "warning", "hits_per_sec must be positive. Disabling rate limiting.", tag="URL_SEED")
-                self._rate_sem = None
-            else:
-                self._rate_sem = asyncio.Semaphore(hits_per_sec)
-        else:
-            self._rate_sem = None  # Ensure it's None if no rate limiting
+        self._configure_rate_limit(config)
 
         self._log("info", "Starting URL seeding for {domain} with source={source}",
                   params={"domain": domain, "source": source}, tag="URL_SEED")
@@ -328,25 +819,52 @@ class AsyncUrlSeeder:
         async def gen():
             if "sitemap" in sources:
                 self._log("debug", "Fetching from sitemaps...", tag="URL_SEED")
-                async for u in self._from_sitemaps(domain, pattern, force):
-                    yield u
+                async for entry in self._from_sitemaps(domain, pattern, force):
+                    yield entry["url"], entry
             if "cc" in sources:
                 self._log("debug", "Fetching from Common Crawl...",
                           tag="URL_SEED")
                 async for u in self._from_cc(domain, pattern, force):
-                    yield u
+                    yield u, None
 
-        # Use bounded queue to prevent RAM spikes with large domains
+        # Use bounded queues to prevent RAM spikes with large domains; `out` is what
+        # propagates a slow consumer's backpressure back to validation and discovery
         queue_size = min(10000, max(1000, concurrency * 100))  # Dynamic size based on concurrency
         queue = asyncio.Queue(maxsize=queue_size)
-        producer_done = asyncio.Event()
+        out = asyncio.Queue(maxsize=buffer_size or max(16, min(concurrency, 256)))
         stop_event = asyncio.Event()
         seen: set[str] = set()
         filter_nonsense = config.filter_nonsense_urls  # Extract this for passing to workers
 
+        # ── incremental seeding: discovered URLs are classified against the stored state
+        state_domain = re.sub(r'^https?://', '', domain).rstrip('/').lower()
+        changes: Dict[str, tuple] = {}   # url -> (change, previous head hash, lastmod)
+
+        async def admit(batch: List[tuple]) -> None:
+            states = await asyncio.to_thread(self._store.get_states, state_domain, [u for u, _ in batch])
+            now = time.time()
+            for u, sm_entry in batch:
+                if stop_event.is_set():
+                    return
+                state = states.get(u)
+                lastmod = sm_entry.get("lastmod") if sm_entry else None
+                change = _classify_change(state, lastmod)
+                if since_ts is not None:
+                    ts = _to_timestamp(lastmod) if lastmod else None
+                    if ts is None:
+                        ts = state["first_seen"] if state else now
+                    if ts < since_ts:
+                        continue
+                # Without a head to compare, only lastmod or novelty can prove a change
+                if changed_only and (change == "unchanged" or (change == "unknown" and not extract_head)):
+                    continue
+                changes[u] = (change, state["head_hash"] if state else None, lastmod)
+                await queue.put((u, sm_entry))  # Will block if queue is full, providing backpressure
+
         async def producer():
+            batch: List[tuple] = []
             try:
-                async for u in gen():
+                async for u, sm_entry in gen():
                     if u in seen:
                         self._log("debug", "Skipping duplicate URL: {url}",
                                   params={"url": u}, tag="URL_SEED")
@@ -356,96 +874,120 @@ class AsyncUrlSeeder:
                             "info", "Producer stopping due to max_urls limit.", tag="URL_SEED")
                         break
                     seen.add(u)
-                    await queue.put(u)  # Will block if queue is full, providing backpressure
+                    batch.append((u, sm_entry))
+                    if len(batch) >= 256:
+                        await admit(batch)
+                        batch = []
+                if batch:
+                    await admit(batch)
             except Exception as e:
                 self._log("error", "Producer encountered an error: {error}", params={
                           "error": str(e)}, tag="URL_SEED")
             finally:
-                producer_done.set()
+                # One sentinel per worker, so idle workers exit right away. Once the
+                # consumer has stopped, the workers are cancelled and nothing drains
+                # the queue any more, so a sentinel must never block there.
+                for _ in range(concurrency):
+                    if stop_event.is_set():
+                        break
+                    await queue.put(None)
                 self._log("debug", "Producer finished.", tag="URL_SEED")
 
-        async def worker(res_list: List[Dict[str, Any]]):
+        async def worker():
             while True:
-                if queue.empty() and producer_done.is_set():
-                    # self._log("debug", "Worker exiting: queue empty and producer done.", tag="URL_SEED")
+                item = await queue.get()
+                if item is None:
                     break
+                url, sm_entry = item
+                # Rate limiting happens per outgoing request, so cache hits are free
+                found: List[Dict[str, Any]] = []
                 try:
-                    # Increased timeout slightly
-                    url = await asyncio.wait_for(queue.get(), 5)
-                except asyncio.TimeoutError:
-                    continue  # Keep checking queue and producer_done status
+                    await self._validate(url, found, live_check, extract_head,
+                                         head_timeout, verbose, query, score_threshold, scoring_method,
+                                         filter_nonsense, sitemap=sm_entry)
                 except Exception as e:
-                    self._log("error", "Worker failed to get URL from queue: {error}", params={
-                              "error": str(e)}, tag="URL_SEED")
-                    continue
-
-                if max_urls > 0 and len(res_list) >= max_urls:
-                    self._log(
-                        "info",
-                        "Worker stopping due to max_urls limit.",
-                        tag="URL_SEED",
-                    )
-                    stop_event.set()
-
-                    # mark the current item done
-                    queue.task_done()
-
-                    # flush whatever is still sitting in the queue so
-                    # queue.join() can finish cleanly
-                    while not queue.empty():
-                        try:
-                            queue.get_nowait()
-                            queue.task_done()
-                        except asyncio.QueueEmpty:
-                            break
-                    break
+                    self._log("error", "Failed to validate {url}: {error}",
+                              params={"url": url, "error": str(e)}, tag="URL_SEED")
+                for entry in found:
+                    # Results may carry the redirect target; state is kept per discovered URL
+                    await out.put((entry, url))
 
-                if self._rate_sem:  # global QPS control
-                    async with self._rate_sem:
-                        await self._validate(url, res_list, live_check, extract_head,
-                                             head_timeout, verbose, query, score_threshold, scoring_method,
-                                             filter_nonsense)
-                else:
-                    await self._validate(url, res_list, live_check, extract_head,
-                                         head_timeout, verbose, query, score_threshold, scoring_method,
-                                         filter_nonsense)
-                queue.task_done()  # Mark task as done for queue.join() if ever used
+        async def run():
+            await asyncio.gather(prod_task, *workers)
+            await out.put(None)
 
         # launch
-        results: List[Dict[str, Any]] = []
         prod_task = asyncio.create_task(producer())
-        workers = [asyncio.create_task(worker(results))
-                   for _ in range(concurrency)]
-
-        # Wait for all workers to finish
-        await asyncio.gather(prod_task, *workers)
-        await queue.join()  # Ensure all queued items are processed
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        runner = asyncio.create_task(run())
 
+        validated = live_check or extract_head
+        pending_states: List[Dict[str, Any]] = []
+        checked = emitted = 0
+        try:
+            while True:
+                item = await out.get()
+                if item is None:
+                    break
+                entry, url = item
+                checked += 1
+                keep, update = self._resolve_change(entry, url, changes, changed_only, validated)
+                pending_states.append(update)
+                if len(pending_states) >= SeederCache.BATCH_SIZE:
+                    await self._flush_url_states(state_domain, pending_states)
+                    pending_states = []
+                if not keep:
+                    continue
+                yield entry
+                emitted += 1
+                if max_urls > 0 and emitted >= max_urls:
+                    self._log("info", "Stopping due to max_urls limit.", tag="URL_SEED")
+                    break
+        finally:
+            stop_event.set()
+            for task in (runner, prod_task, *workers):
+                task.cancel()
+            await asyncio.gather(runner, prod_task, *workers, return_exceptions=True)
+            await self._flush_cache()
+            await self._flush_url_states(state_domain, pending_states)
+
+        if changed_only:
+            self._log("info", "Incremental seeding for {domain}: {kept} new or changed of {total} checked",
+                      params={"domain": state_domain, "kept": emitted, "total": checked}, tag="URL_SEED")
         self._log("info", "Finished URL seeding for {domain}. Total URLs: {count}",
-                  params={"domain": domain, "count": len(results)}, tag="URL_SEED")
+                  params={"domain": domain, "count": emitted}, tag="URL_SEED")
 
-        # Apply BM25 scoring if query was provided
-        if query and extract_head and scoring_method == "bm25":
-            # Apply collective BM25 scoring across all documents
-            results = await self._apply_bm25_scoring(results, config)
-            
-            # Filter by score threshold if specified
-            if score_threshold is not None:
-                original_count = len(results)
-                results = [r for r in results if r.get("relevance_score", 0) >= score_threshold]
-                if original_count > len(results):
-                    self._log("info", "Filtered {filtered} URLs below score threshold {threshold}",
-                              params={"filtered": original_count - len(results), "threshold": score_threshold}, tag="URL_SEED")
-            
-            # Sort by relevance score
-            results.sort(key=lambda x: x.get("relevance_score", 0.0), reverse=True)
-            self._log("info", "Sorted {count} URLs by relevance score for query: '{query}'",
-                      params={"count": len(results), "query": query}, tag="URL_SEED")
-        elif query and not extract_head:
-            self._log(
-                "warning", "Query provided but extract_head is False. Enable extract_head for relevance scoring.", tag="URL_SEED")
+    @staticmethod
+    def _resolve_change(entry: Dict[str, Any], url: str, changes: Dict[str, tuple],
+                        changed_only: bool, validated: bool) -> tuple:
+        """
+        Settle a record's `change` (head hashes decide the URLs lastmod could not) and
+        build its URL-state update. Returns (keep, update).
+        """
+        change, prev_hash, lastmod = changes.get(url, ("new", None, None))
+        head_hash = _head_hash(entry["head_data"]) if entry.get("head_data") else None
+        if change == "unknown" and head_hash and prev_hash:
+            change = "unchanged" if head_hash == prev_hash else "modified"
+        update = {
+            "url": url,
+            "lastmod": lastmod,
+            "validated": time.time() if validated else None,
+            "head_hash": head_hash,
+            "status": entry.get("status") if validated else None,
+        }
+        if changed_only and change == "unchanged":
+            return False, update
+        entry["change"] = change
+        return True, update
 
-        return results[:max_urls] if max_urls > 0 else results
+    async def _flush_url_states(self, state_domain: str, updates: List[Dict[str, Any]]) -> None:
+        if not updates:
+            return
+        try:
+            await asyncio.to_thread(self._store.update_states, state_domain, updates)
+        except Exception as e:
+            self._log("warning", "Failed to persist URL state for {domain}: {error}",
+                      params={"domain": state_domain, "error": str(e)}, tag="URL_SEED")
 
     async def many_urls(
         self,
@@ -529,14 +1071,11 @@ class AsyncUrlSeeder:
                   params={"count": len(urls)}, tag="URL_SEED")
         
         # Setup rate limiting if specified in config
-        if config.hits_per_sec:
-            if config.hits_per_sec <= 0:
-                self._log("warning", "hits_per_sec must be positive. Disabling rate limiting.", tag="URL_SEED")
-                self._rate_sem = None
-            else:
-                self._rate_sem = asyncio.Semaphore(config.hits_per_sec)
-        else:
-            self._rate_sem = None
+        self._configure_rate_limit(config)
+
+        # One batched lookup instead of a query per URL
+        if not config.force:
+            await self._cache_prefetch("head", urls)
         
         # Use bounded queue to prevent memory issues with large URL lists
         queue_size = min(10000, max(1000, concurrency * 100))
@@ -621,6 +1160,8 @@ class AsyncUrlSeeder:
         
         # Wait for workers to finish canceling
         await asyncio.gather(*worker_tasks, return_exceptions=True)
+        await self._flush_cache()
+        self._warm_cache.clear()
         
         # Apply BM25 scoring if query is provided
         if config.query and config.scoring_method == "bm25":
@@ -686,7 +1227,8 @@ class AsyncUrlSeeder:
             * None on any other status or network error.
         """
         try:
-            r = await self.client.head(url, timeout=10, follow_redirects=False)
+            async with self._throttle(url):
+                r = await self.client.head(url, timeout=10, follow_redirects=False)
 
             # direct hit
             if 200 <= r.status_code < 300:
@@ -708,24 +1250,20 @@ class AsyncUrlSeeder:
     # ─────────────────────────────── CC
     async def _from_cc(self, domain: str, pattern: str, force: bool):
         import re
-        digest = hashlib.md5(pattern.encode()).hexdigest()[:8]
 
         # ── normalise for CC   (strip scheme, query, fragment)
         raw = re.sub(r'^https?://', '', domain).split('#',
                                                       1)[0].split('?', 1)[0].lstrip('.')
 
-        # ── sanitize only for cache-file name
-        safe = re.sub('[/?#]+', '_', raw)
-        path = self.cache_dir / f"{self.index_id}_{safe}_{digest}.jsonl"
-
-        if path.exists() and not force:
-            self._log("info", "Loading CC URLs for {domain} from cache: {path}",
-                      params={"domain": domain, "path": path}, tag="URL_SEED")
-            async with aiofiles.open(path, "r") as fp:
-                async for line in fp:
-                    url = line.strip()
-                    if _match(url, pattern):
-                        yield url
+        # ── the cached listing is per index and domain; `pattern` filters on read
+        source = f"cc:{self.index_id}"
+        listing = None if force else await asyncio.to_thread(self._store.find_listing, source, raw)
+        if listing is not None:
+            self._log("info", "Loading CC URLs for {domain} from cache",
+                      params={"domain": domain}, tag="URL_SEED")
+            async for url, _ in self._read_listing(listing):
+                if _match(url, pattern):
+                    yield url
             return
 
         # build CC glob – if a path is present keep it, else add trailing /*
@@ -737,15 +1275,19 @@ class AsyncUrlSeeder:
                   params={"domain": domain, "url": url}, tag="URL_SEED")
         for i, d in enumerate(retries+(-1,)):  # last -1 means don't retry
             try:
-                async with self.client.stream("GET", url) as r:
-                    r.raise_for_status()
-                    async with aiofiles.open(path, "w") as fp:
+                writer = _ListingWriter(self._store, source, raw)
+                try:
+                    async with self.client.stream("GET", url) as r:
+                        r.raise_for_status()
                         async for line in r.aiter_lines():
                             rec = json.loads(line)
                             u = rec["url"]
-                            await fp.write(u+"\n")
+                            await writer.add(u)
                             if _match(u, pattern):
                                 yield u
+                    await writer.finish()
+                finally:
+                    await writer.abort()
                 return
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 503 and i < len(retries):
@@ -766,28 +1308,25 @@ class AsyncUrlSeeder:
         """
         1. Probe default sitemap locations.
         2. If none exist, parse robots.txt for alternative sitemap URLs.
-        3. Yield only URLs that match `pattern`.
+        3. Yield only entries whose URL matches `pattern`.
+
+        Entries are dicts with "url", "lastmod", "changefreq" and "priority".
         """
 
-       # ── cache file (same logic as _from_cc)
+        # strip any scheme so we can handle https → http fallback
         host = re.sub(r'^https?://', '', domain).rstrip('/')
-        host = re.sub('[/?#]+', '_', domain)
-        digest = hashlib.md5(pattern.encode()).hexdigest()[:8]
-        path = self.cache_dir / f"sitemap_{host}_{digest}.jsonl"
-
-        if path.exists() and not force:
-            self._log("info", "Loading sitemap URLs for {d} from cache: {p}",
-                      params={"d": host, "p": str(path)}, tag="URL_SEED")
-            async with aiofiles.open(path, "r") as fp:
-                async for line in fp:
-                    url = line.strip()
-                    if _match(url, pattern):
-                        yield url
+
+        # ── cached listing (same logic as _from_cc)
+        listing = None if force else await asyncio.to_thread(self._store.find_listing, "sitemap", host)
+        if listing is not None:
+            self._log("info", "Loading sitemap URLs for {d} from cache",
+                      params={"d": host}, tag="URL_SEED")
+            async for url, meta in self._read_listing(listing):
+                if _match(url, pattern):
+                    yield {"url": url, **_sitemap_meta(meta or {})}
             return
 
         # 1️⃣ direct sitemap probe
-        # strip any scheme so we can handle https → http fallback
-        host = re.sub(r'^https?://', '', domain).rstrip('/')
 
         schemes = ('https', 'http')  # prefer TLS, downgrade if needed
         for scheme in schemes:
@@ -797,17 +1336,22 @@ class AsyncUrlSeeder:
                 if sm:
                     self._log("info", "Found sitemap at {url}", params={
                               "url": sm}, tag="URL_SEED")
-                    async with aiofiles.open(path, "w") as fp:
-                        async for u in self._iter_sitemap(sm):
-                            await fp.write(u + "\n")
-                            if _match(u, pattern):
-                                yield u
+                    writer = _ListingWriter(self._store, "sitemap", host)
+                    try:
+                        async for entry in self._iter_sitemap_entries(sm):
+                            await writer.add(entry["url"], _sitemap_meta(entry))
+                            if _match(entry["url"], pattern):
+                                yield entry
+                        await writer.finish()
+                    finally:
+                        await writer.abort()
                     return
 
         # 2️⃣ robots.txt fallback
         robots = f"https://{domain.rstrip('/')}/robots.txt"
         try:
-            r = await self.client.get(robots, timeout=10, follow_redirects=True)
+            async with self._throttle(robots):
+                r = await self.client.get(robots, timeout=10, follow_redirects=True)
             if not 200 <= r.status_code < 300:
                 self._log("warning", "robots.txt unavailable for {d} HTTP{c}", params={
                           "d": domain, "c": r.status_code}, tag="URL_SEED")
@@ -820,17 +1364,73 @@ class AsyncUrlSeeder:
             return
 
         if sitemap_lines:
-            async with aiofiles.open(path, "w") as fp:
+            writer = _ListingWriter(self._store, "sitemap", host)
+            try:
                 for sm in sitemap_lines:
-                    async for u in self._iter_sitemap(sm):
-                        await fp.write(u + "\n")
-                        if _match(u, pattern):
-                            yield u
+                    async for entry in self._iter_sitemap_entries(sm):
+                        await writer.add(entry["url"], _sitemap_meta(entry))
+                        if _match(entry["url"], pattern):
+                            yield entry
+                await writer.finish()
+            finally:
+                await writer.abort()
 
     async def _iter_sitemap(self, url: str):
+        """Yield the page URLs of a sitemap (or sitemap index) as they are parsed."""
+        async for entry in self._iter_sitemap_entries(url):
+            yield entry["url"]
+
+    async def _iter_sitemap_entries(self, url: str):
+        """
+        Stream a sitemap and yield one dict per <url> entry as soon as it is parsed:
+        {"url", "lastmod", "changefreq", "priority"} (missing fields are None).
+
+        The body is downloaded in chunks, gunzipped incrementally when it is a .gz file
+        and fed to a pull parser; parsed elements are cleared right away so memory stays
+        flat regardless of sitemap size. Sitemap indexes are expanded recursively.
+        """
+        sub_sitemaps: List[str] = []
+        url_count = 0
         try:
-            r = await self.client.get(url, timeout=15, follow_redirects=True)
-            r.raise_for_status()
+            async with AsyncExitStack() as stack:
+                # The host slot covers the request up to the response headers only: the
+                # body is consumed at the caller's pace, and callers (validation workers)
+                # may need a slot for the same host before they ask for the next entry
+                async with self._throttle(url):
+                    r = await stack.enter_async_context(
+                        self.client.stream("GET", url, timeout=15, follow_redirects=True))
+                r.raise_for_status()
+                base_url = str(r.url)
+                # The stdlib parser cannot reach an element's parent, so it also reports
+                # start events and _drain_sitemap_events tracks the open elements
+                parser = (etree.XMLPullParser(events=("end",), recover=True) if LXML
+                          else ET.XMLPullParser(events=("start", "end")))
+                open_elements: List[Any] = []
+                gunzip = None
+                first = True
+
+                async for chunk in r.aiter_bytes():
+                    if first:
+                        first = False
+                        # .gz sitemaps are gzip files, not Content-Encoding: gzip
+                        if chunk[:2] == b"\x1f\x8b":
+                            gunzip = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    if gunzip is not None:
+                        chunk = gunzip.decompress(chunk)
+                    parser.feed(chunk)
+                    for entry in self._drain_sitemap_events(parser, base_url, sub_sitemaps, open_elements):
+                        url_count += 1
+                        yield entry
+
+                if gunzip is not None:
+                    parser.feed(gunzip.flush())
+                try:
+                    parser.close()
+                except Exception:
+                    pass  # Truncated document: keep what was parsed
+                for entry in self._drain_sitemap_events(parser, base_url, sub_sitemaps, open_elements):
+                    url_count += 1
+                    yield entry
         except httpx.HTTPStatusError as e:
             self._log("warning", "Failed to fetch sitemap {url}: HTTP {status_code}",
                       params={"url": url, "status_code": e.response.status_code}, tag="URL_SEED")
@@ -840,172 +1440,129 @@ class AsyncUrlSeeder:
                       params={"url": url, "error": str(e)}, tag="URL_SEED")
             return
         except Exception as e:
-            self._log("error", "Unexpected error fetching sitemap {url}: {error}",
+            self._log("error", "Error parsing sitemap {url}: {error}",
                       params={"url": url, "error": str(e)}, tag="URL_SEED")
             return
 
-        data = gzip.decompress(r.content) if url.endswith(".gz") else r.content
-        base_url = str(r.url)
-
-        def _normalize_loc(raw: Optional[str]) -> Optional[str]:
-            if not raw:
-                return None
-            normalized = urljoin(base_url, raw.strip())
-            if not normalized:
-                return None
-            return normalized
-
-        # Detect if this is a sitemap index by checking for <sitemapindex> or presence of <sitemap> elements
-        is_sitemap_index = False
-        sub_sitemaps = []
-        regular_urls = []
-
-        # Use lxml for XML parsing if available, as it's generally more robust
-        if LXML:
-            try:
-                # Use XML parser for sitemaps, not HTML parser
-                parser = etree.XMLParser(recover=True)
-                root = etree.fromstring(data, parser=parser)
-                # Namespace-agnostic lookups using local-name() so we honor custom or missing namespaces
-                sitemap_loc_nodes = root.xpath("//*[local-name()='sitemap']/*[local-name()='loc']")
-                url_loc_nodes = root.xpath("//*[local-name()='url']/*[local-name()='loc']")
-
+        self._log(
+            "debug",
+            "Parsed sitemap {url}: {sitemap_count} sitemap entries, {url_count} url entries discovered",
+            params={"url": url, "sitemap_count": len(sub_sitemaps), "url_count": url_count},
+            tag="URL_SEED",
+        )
+
+        if not sub_sitemaps:
+            if not url_count:
                 self._log(
-                    "debug",
-                    "Parsed sitemap {url}: {sitemap_count} sitemap entries, {url_count} url entries discovered",
-                    params={
-                        "url": url,
-                        "sitemap_count": len(sitemap_loc_nodes),
-                        "url_count": len(url_loc_nodes),
-                    },
+                    "warning",
+                    "No <loc> entries found inside <url> tags for sitemap {url}. The sitemap might be empty or use an unexpected structure.",
+                    params={"url": url},
                     tag="URL_SEED",
                 )
+            return
 
-                # Check for sitemap index entries
-                if sitemap_loc_nodes:
-                    is_sitemap_index = True
-                    for sitemap_elem in sitemap_loc_nodes:
-                        loc = _normalize_loc(sitemap_elem.text)
-                        if loc:
-                            sub_sitemaps.append(loc)
-
-                # If not a sitemap index, get regular URLs
-                if not is_sitemap_index:
-                    for loc_elem in url_loc_nodes:
-                        loc = _normalize_loc(loc_elem.text)
-                        if loc:
-                            regular_urls.append(loc)
-                    if not regular_urls:
-                        self._log(
-                            "warning",
-                            "No <loc> entries found inside <url> tags for sitemap {url}. The sitemap might be empty or use an unexpected structure.",
-                            params={"url": url},
-                            tag="URL_SEED",
-                        )
-            except Exception as e:
-                self._log("error", "LXML parsing error for sitemap {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return
-        else:  # Fallback to xml.etree.ElementTree
-            import xml.etree.ElementTree as ET
+        self._log("info", "Processing sitemap index with {count} sub-sitemaps ({workers} at a time)",
+                  params={"count": len(sub_sitemaps), "workers": min(self._sitemap_concurrency, len(sub_sitemaps))},
+                  tag="URL_SEED")
+
+        # Create a bounded queue for results to prevent RAM issues
+        # For sitemap indexes, use a larger queue as we expect many URLs
+        queue_size = min(50000, len(sub_sitemaps) * 1000)  # Estimate 1000 URLs per sitemap
+        result_queue = asyncio.Queue(maxsize=queue_size)
+        completed_count = 0
+        total_sitemaps = len(sub_sitemaps)
+        # Set once the consumer is gone: nobody will drain sentinels any more
+        stopped = asyncio.Event()
+
+        async def process_subsitemap(sitemap_url: str):
             try:
-                # Parse the XML
-                root = ET.fromstring(data)
-                # Remove namespace from tags for easier processing
-                for elem in root.iter():
-                    if '}' in elem.tag:
-                        elem.tag = elem.tag.split('}')[1]
-
-                # Check for sitemap index entries
-                sitemaps = root.findall('.//sitemap')
-                url_entries = root.findall('.//url')
                 self._log(
-                    "debug",
-                    "ElementTree parsed sitemap {url}: {sitemap_count} sitemap entries, {url_count} url entries discovered",
-                    params={
-                        "url": url,
-                        "sitemap_count": len(sitemaps),
-                        "url_count": len(url_entries),
-                    },
-                    tag="URL_SEED",
-                )
-                if sitemaps:
-                    is_sitemap_index = True
-                    for sitemap in sitemaps:
-                        loc_elem = sitemap.find('loc')
-                        loc = _normalize_loc(loc_elem.text if loc_elem is not None else None)
-                        if loc:
-                            sub_sitemaps.append(loc)
-
-                # If not a sitemap index, get regular URLs
-                if not is_sitemap_index:
-                    for url_elem in url_entries:
-                        loc_elem = url_elem.find('loc')
-                        loc = _normalize_loc(loc_elem.text if loc_elem is not None else None)
-                        if loc:
-                            regular_urls.append(loc)
-                    if not regular_urls:
-                        self._log(
-                            "warning",
-                            "No <loc> entries found inside <url> tags for sitemap {url}. The sitemap might be empty or use an unexpected structure.",
-                            params={"url": url},
-                            tag="URL_SEED",
-                        )
+                    "debug", "Processing sub-sitemap: {url}", params={"url": sitemap_url}, tag="URL_SEED")
+                # Recursively process sub-sitemap
+                async for entry in self._iter_sitemap_entries(sitemap_url):
+                    await result_queue.put(entry)  # Will block if queue is full
             except Exception as e:
-                self._log("error", "ElementTree parsing error for sitemap {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return
+                self._log("error", "Error processing sub-sitemap {url}: {error}",
+                          params={"url": sitemap_url, "error": str(e)}, tag="URL_SEED")
+            finally:
+                # Put sentinel to signal completion
+                if not stopped.is_set():
+                    await result_queue.put(None)
 
-        # Process based on type
-        if is_sitemap_index and sub_sitemaps:
-            self._log("info", "Processing sitemap index with {count} sub-sitemaps in parallel",
-                      params={"count": len(sub_sitemaps)}, tag="URL_SEED")
+        # A fixed pool of fetchers per index level keeps the fan-out bounded;
+        # every sub-sitemap still posts exactly one sentinel
+        pending = iter(sub_sitemaps)
 
-            # Create a bounded queue for results to prevent RAM issues
-            # For sitemap indexes, use a larger queue as we expect many URLs
-            queue_size = min(50000, len(sub_sitemaps) * 1000)  # Estimate 1000 URLs per sitemap
-            result_queue = asyncio.Queue(maxsize=queue_size)
-            completed_count = 0
-            total_sitemaps = len(sub_sitemaps)
+        async def fetcher():
+            for sm in pending:
+                await process_subsitemap(sm)
 
-            async def process_subsitemap(sitemap_url: str):
-                try:
-                    self._log(
-                        "debug", "Processing sub-sitemap: {url}", params={"url": sitemap_url}, tag="URL_SEED")
-                    # Recursively process sub-sitemap
-                    async for u in self._iter_sitemap(sitemap_url):
-                        await result_queue.put(u)  # Will block if queue is full
-                except Exception as e:
-                    self._log("error", "Error processing sub-sitemap {url}: {error}",
-                              params={"url": sitemap_url, "error": str(e)}, tag="URL_SEED")
-                finally:
-                    # Put sentinel to signal completion
-                    await result_queue.put(None)
-
-            # Start all tasks
-            tasks = [asyncio.create_task(process_subsitemap(sm))
-                     for sm in sub_sitemaps]
+        tasks = [asyncio.create_task(fetcher())
+                 for _ in range(min(self._sitemap_concurrency, total_sitemaps))]
 
-            # Yield results as they come in
+        # Yield results as they come in
+        try:
             while completed_count < total_sitemaps:
                 item = await result_queue.get()
                 if item is None:
                     completed_count += 1
                 else:
                     yield item
-
+        finally:
+            stopped.set()
+            for task in tasks:
+                task.cancel()
             # Ensure all tasks are done
             await asyncio.gather(*tasks, return_exceptions=True)
-        else:
-            # Regular sitemap - yield URLs directly
-            for u in regular_urls:
-                yield u
+
+    @staticmethod
+    def _drain_sitemap_events(parser, base_url: str, sub_sitemaps: List[str], open_elements: List[Any]):
+        """
+        Turn parsed <url>/<sitemap> elements into entries, removing them from the
+        tree as we go so memory stays flat. lxml reaches the parent directly; with
+        the stdlib parser, start events keep `open_elements` (the path from the
+        root to the current element) up to date.
+        """
+        for event, elem in parser.read_events():
+            if event == "start":
+                open_elements.append(elem)
+                continue
+            if open_elements:
+                open_elements.pop()
+            tag = elem.tag.rsplit("}", 1)[-1] if isinstance(elem.tag, str) else ""
+            if tag not in ("url", "sitemap"):
+                continue
+            fields = {}
+            for child in elem:
+                if isinstance(child.tag, str) and child.text:
+                    fields[child.tag.rsplit("}", 1)[-1]] = child.text.strip()
+            loc = urljoin(base_url, fields["loc"]) if fields.get("loc") else None
+
+            # Free the element and the already processed siblings before it
+            elem.clear()
+            if LXML:
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            elif open_elements:
+                open_elements[-1].remove(elem)
+
+            if not loc:
+                continue
+            if tag == "sitemap":
+                sub_sitemaps.append(loc)
+                continue
+            yield {
+                "url": loc,
+                "lastmod": fields.get("lastmod"),
+                "changefreq": fields.get("changefreq"),
+                "priority": fields.get("priority"),
+            }
 
     # ─────────────────────────────── validate helpers
     async def _validate(self, url: str, res_list: List[Dict[str, Any]], live: bool,
                         extract: bool, timeout: int, verbose: bool, query: Optional[str] = None,
                         score_threshold: Optional[float] = None, scoring_method: str = "bm25",
-                        filter_nonsense: bool = True):
+                        filter_nonsense: bool = True, sitemap: Optional[Dict[str, Any]] = None):
         # Local verbose parameter for this function is used to decide if intermediate logs should be printed
         # The main logger's verbose status should be controlled by the caller.
         
@@ -1021,6 +1578,8 @@ class AsyncUrlSeeder:
         if not (hasattr(self, 'force') and self.force):
             cached = await self._cache_get(cache_kind, url)
             if cached:
+                if sitemap:
+                    cached["sitemap"] = _sitemap_meta(sitemap)
                 res_list.append(cached)
                 return
 
@@ -1054,12 +1613,16 @@ class AsyncUrlSeeder:
         # Add entry to results (scoring will be done later)
         if live or extract:
             await self._cache_set(cache_kind, url, entry)
+        if sitemap:
+            # Not cached: sitemap metadata belongs to the listing, not the page
+            entry["sitemap"] = _sitemap_meta(sitemap)
         res_list.append(entry)
 
     async def _head_ok(self, url: str, timeout: int) -> bool:
         try:
-            r = await self.client.head(url, timeout=timeout,
-                                       headers={"Range": "bytes=0-0", "Accept-Encoding": "identity"})
+            async with self._throttle(url):
+                r = await self.client.head(url, timeout=timeout,
+                                           headers={"Range": "bytes=0-0", "Accept-Encoding": "identity"})
             r.raise_for_status()  # Raise for bad status codes (4xx, 5xx)
             return True
         except httpx.RequestError as e:
@@ -1087,7 +1650,7 @@ class AsyncUrlSeeder:
             try:
                 # ask the first `max_bytes` and force plain text to avoid
                 # partial-gzip decode headaches
-                async with self.client.stream(
+                async with self._throttle(url), self.client.stream(
                     "GET",
                     url,
                     timeout=timeout,
@@ -1471,7 +2034,9 @@ class AsyncUrlSeeder:
 
     # ─────────────────────────────── cleanup methods
     async def close(self):
-        """Close the HTTP client if we own it."""
+        """Flush pending cache writes, close the cache database and the HTTP client if we own it."""
+        await self._flush_cache()
+        await asyncio.to_thread(self._store.close)
         if self._owns_client and self.client:
             await self.client.aclose()
             self._log("debug", "Closed HTTP client", tag="URL_SEED")
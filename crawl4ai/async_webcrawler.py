@@ -3,9 +3,10 @@ import os
 import sys
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, AsyncGenerator, AsyncIterable
 import json
 import asyncio
+from collections import deque
 
 # from contextlib import nullcontext, asynccontextmanager
 from contextlib import asynccontextmanager
@@ -33,7 +34,8 @@ from .markdown_generation_strategy import (
     DefaultMarkdownGenerator,
     MarkdownGenerationStrategy,
 )
-from .deep_crawling import DeepCrawlDecorator
+from .deep_crawling import CrawlSeed, DeepCrawlDecorator
+from .deep_crawling.scheduler import CrawlScheduler
 from .async_logger import AsyncLogger, AsyncLoggerBase
 from .async_configs import BrowserConfig, CrawlerRunConfig, ProxyConfig, SeedingConfig
 from .async_dispatcher import *  # noqa: F403
@@ -47,6 +49,8 @@ from .utils import (
     get_error_context,
     RobotsParser,
     preprocess_html_for_schema,
+    format_screenshot,
+    HeadPeekr,
 )
 
 
@@ -160,6 +164,8 @@ class AsyncWebCrawler:
         self.robots_parser = RobotsParser()
 
         self.ready = False
+        # Whether this crawler holds a reference to HeadPeekr's shared client
+        self._head_peekr_user = False
 
         # Decorate arun method with deep crawling capabilities
         self._deep_handler = DeepCrawlDecorator(self)
@@ -175,6 +181,9 @@ class AsyncWebCrawler:
             AsyncWebCrawler: The initialized crawler instance
         """
         await self.crawler_strategy.__aenter__()
+        if not self._head_peekr_user:
+            HeadPeekr.acquire()
+            self._head_peekr_user = True
         self.logger.info(f"Crawl4AI {crawl4ai_version}", tag="INIT")
         self.ready = True
         return self
@@ -187,8 +196,17 @@ class AsyncWebCrawler:
         This method will:
         1. Clean up browser resources
         2. Close any open pages and contexts
+        3. Close the URL seeder used by aseed_urls, with its cache database
+        4. Close the head-fetching client of metadata filters once no crawler uses it
         """
         await self.crawler_strategy.__aexit__(None, None, None)
+        await self.robots_parser.close()
+        if self.url_seeder is not None:
+            await self.url_seeder.close()
+            self.url_seeder = None
+        if self._head_peekr_user:
+            self._head_peekr_user = False
+            await HeadPeekr.release()
 
     async def __aenter__(self):
         return await self.start()
@@ -277,8 +295,14 @@ class AsyncWebCrawler:
                         if not extracted_content or extracted_content == "[]"
                         else extracted_content
                     )
-                    # If screenshot is requested but its not in cache, then set cache_result to None
+                    # If screenshot is requested but its not in cache, then set cache_result to None.
+                    # The cache holds raw image bytes; return them in the form this config asks for.
                     screenshot_data = cached_result.screenshot
+                    if screenshot_data:
+                        screenshot_data = await format_screenshot(
+                            screenshot_data, config.screenshot_output, config.screenshot_path
+                        )
+                        cached_result.screenshot = screenshot_data
                     pdf_data = cached_result.pdf
                     # if config.screenshot and not screenshot or config.pdf and not pdf:
                     if config.screenshot and not screenshot_data:
@@ -379,6 +403,7 @@ class AsyncWebCrawler:
                     # Add captured network and console data if available
                     crawl_result.network_requests = async_response.network_requests
                     crawl_result.console_messages = async_response.console_messages
+                    crawl_result.transfer_stats = async_response.transfer_stats
 
                     crawl_result.success = bool(html)
                     crawl_result.session_id = getattr(
@@ -391,8 +416,12 @@ class AsyncWebCrawler:
                         tag="COMPLETE",
                     )
 
-                    # Update cache if appropriate
-                    if cache_context.should_write() and not bool(cached_result):
+                    duplicate_of = None
+                    if config.duplicate_detector is not None:
+                        duplicate_of = config.duplicate_detector.check(crawl_result)
+
+                    # Update cache if appropriate; near-duplicate pages are not worth storing
+                    if cache_context.should_write() and not bool(cached_result) and duplicate_of is None:
                         await async_db_manager.acache_url(crawl_result)
 
                     return CrawlResultContainer(crawl_result)
@@ -408,6 +437,8 @@ class AsyncWebCrawler:
                     cached_result.session_id = getattr(
                         config, "session_id", None)
                     cached_result.redirected_url = cached_result.redirected_url or url
+                    if config.duplicate_detector is not None:
+                        config.duplicate_detector.check(cached_result)
                     return CrawlResultContainer(cached_result)
 
             except Exception as e:
@@ -664,9 +695,10 @@ class AsyncWebCrawler:
 
     async def arun_many(
         self,
-        urls: List[str],
+        urls: Union[List[str], AsyncIterable],
         config: Optional[Union[CrawlerRunConfig, List[CrawlerRunConfig]]] = None,
         dispatcher: Optional[BaseDispatcher] = None,
+        read_ahead: int = 64,
         # Legacy parameters maintained for backwards compatibility
         # word_count_threshold=MIN_WORD_THRESHOLD,
         # extraction_strategy: ExtractionStrategy = None,
@@ -685,11 +717,14 @@ class AsyncWebCrawler:
         Runs the crawler for multiple URLs concurrently using a configurable dispatcher strategy.
 
         Args:
-        urls: List of URLs to crawl
+        urls: List of URLs to crawl, or an async iterable of URLs / seeder records
+              (e.g. `AsyncUrlSeeder.aiter_urls(...)`). URLs from async sources are
+              dispatched one by one as they arrive, whenever a crawl slot is free.
         config: Configuration object(s) controlling crawl behavior. Can be:
             - Single CrawlerRunConfig: Used for all URLs
             - List[CrawlerRunConfig]: Configs with url_matcher for URL-specific settings
         dispatcher: The dispatcher strategy instance to use. Defaults to MemoryAdaptiveDispatcher
+        read_ahead: URLs buffered from an async source while all slots are busy
         [other parameters maintained for backwards compatibility]
 
         Returns:
@@ -712,6 +747,12 @@ class AsyncWebCrawler:
             config=CrawlerRunConfig(cache_mode=CacheMode.BYPASS, stream=True),
         ):
             print(f"Processed {result.url}: {len(result.markdown)} chars")
+
+        # Crawl while seeding
+        async with AsyncUrlSeeder() as seeder:
+            records = seeder.aiter_urls("example.com", SeedingConfig(source="sitemap"))
+            async for result in await crawler.arun_many(records, config=CrawlerRunConfig(stream=True)):
+                print(result.url)
         """
         config = config or CrawlerRunConfig()
         # if config is None:
@@ -759,6 +800,12 @@ class AsyncWebCrawler:
         else:
             stream = config.stream
 
+        if not isinstance(urls, (list, tuple)) and hasattr(urls, "__aiter__"):
+            source_results = self._crawl_source(urls, config, dispatcher, read_ahead)
+            if stream:
+                return source_results
+            return [result async for result in source_results]
+
         if stream:
 
             async def result_transformer():
@@ -772,6 +819,105 @@ class AsyncWebCrawler:
             _results = await dispatcher.run_urls(crawler=self, urls=urls, config=config)
             return [transform_result(res) for res in _results]
 
+    async def _crawl_source(
+        self,
+        source: AsyncIterable,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+        dispatcher: BaseDispatcher,
+        read_ahead: int,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """
+        Crawl an async source of URLs (or seeder records with a "url" key) while it is
+        still producing.
+
+        A background task drains the source into a bounded buffer and a CrawlScheduler
+        refills each dispatcher slot from it as soon as the slot frees up, so a slow
+        page never holds back the URLs behind it.
+        """
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=max(1, read_ahead))
+        ready: deque = deque()
+        done = object()
+        finished = False
+        # Set once the consumer is gone: nobody will read the sentinel any more
+        stopped = False
+
+        async def drain():
+            try:
+                async for item in source:
+                    url = item.get("url") if isinstance(item, dict) else item
+                    if url:
+                        await buffer.put(url)
+            finally:
+                if not stopped:
+                    await buffer.put(done)
+
+        def pop():
+            nonlocal finished
+            if ready:
+                return ready.popleft(), None
+            if finished:
+                return None
+            try:
+                url = buffer.get_nowait()
+            except asyncio.QueueEmpty:
+                return None
+            if url is done:
+                finished = True
+                return None
+            return url, None
+
+        async def more() -> bool:
+            nonlocal finished
+            if not finished:
+                url = await buffer.get()
+                if url is not done:
+                    ready.append(url)
+                    return True
+                finished = True
+            # Surface errors raised by the source
+            await feeder
+            return False
+
+        feeder = asyncio.create_task(drain())
+        scheduler = CrawlScheduler(self, config, dispatcher)
+        try:
+            async for result, _ in scheduler.stream(
+                pop, lambda url, _: ready.appendleft(url), more=more
+            ):
+                yield result
+        finally:
+            stopped = True
+            feeder.cancel()
+            await asyncio.gather(feeder, return_exceptions=True)
+
+    async def deep_crawl_many(
+        self,
+        start_urls: List[Union[str, CrawlSeed]],
+        config: CrawlerRunConfig,
+    ) -> RunManyReturn:
+        """
+        Deep crawl many sites at once with config.deep_crawl_strategy.
+
+        All seeds share one frontier and one dispatcher: browser slots stay busy
+        across sites, and a URL reachable from several seeds is crawled once.
+        Pass CrawlSeed(url, max_pages=..., max_depth=...) to override the
+        strategy's limits for one seed; each result's metadata["seed"] names
+        the seed it was reached from.
+
+        Example:
+            ```python
+            strategy = BFSDeepCrawlStrategy(max_depth=2, max_pages=50)
+            config = CrawlerRunConfig(deep_crawl_strategy=strategy, stream=True)
+            async for result in await crawler.deep_crawl_many(
+                ["https://a.example", CrawlSeed("https://b.example", max_pages=200)], config
+            ):
+                print(result.metadata["seed"], result.url)
+            ```
+        """
+        if config is None or config.deep_crawl_strategy is None:
+            raise ValueError("deep_crawl_many needs a CrawlerRunConfig with a deep_crawl_strategy")
+        return await config.deep_crawl_strategy.deep_crawl_many(start_urls, self, config)
+
     async def aseed_urls(
         self,
         domain_or_domains: Union[str, List[str]],
@@ -19,13 +19,13 @@ from urllib.parse import urljoin
 from requests.exceptions import InvalidSchema
 from .utils import (
     extract_metadata,
-    normalize_url,
     is_external_url,
     get_base_domain,
     extract_metadata_using_lxml,
     extract_page_context,
     calculate_link_intrinsic_score,
 )
+from .url_canonicalizer import DEFAULT_CANONICALIZER
 from lxml import etree
 from lxml import html as lhtml
 from typing import List
@@ -252,17 +252,20 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
             self._log("error", f"Error extracting base URL: {str(e)}", "SCRAPE")
             pass
 
+        # Split the page URL once; every link on the page resolves against it
+        page_base = DEFAULT_CANONICALIZER.base(url)
+        preserve_https = (
+            kwargs.get('preserve_https_for_internal_links', False)
+            and kwargs.get('original_scheme') == 'https'
+        )
+
         for link in element.xpath(".//a[@href]"):
             href = link.get("href", "").strip()
             if not href:
                 continue
 
             try:
-                normalized_href = normalize_url(
-                    href, url,
-                    preserve_https=kwargs.get('preserve_https_for_internal_links', False),
-                    original_scheme=kwargs.get('original_scheme')
-                )
+                normalized_href = DEFAULT_CANONICALIZER.resolve(href, page_base, preserve_https=preserve_https)
                 link_data = {
                     "href": normalized_href,
                     "text": link.text_content().strip(),
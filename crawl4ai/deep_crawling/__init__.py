@@ -1,8 +1,10 @@
 # deep_crawling/__init__.py
-from .base_strategy import DeepCrawlDecorator, DeepCrawlStrategy
+from .base_strategy import CrawlSeed, DeepCrawlDecorator, DeepCrawlStrategy
 from .bfs_strategy import BFSDeepCrawlStrategy
 from .bff_strategy import BestFirstCrawlingStrategy
 from .dfs_strategy import DFSDeepCrawlStrategy
+from .frontier import URLFrontier, MemoryFrontier, SQLiteFrontier
+from .budget import CrawlBudget
 from .filters import (
     FilterChain,
     ContentTypeFilter,
@@ -26,9 +28,14 @@ from .scorers import (
 __all__ = [
     "DeepCrawlDecorator",
     "DeepCrawlStrategy",
+    "CrawlSeed",
     "BFSDeepCrawlStrategy",
     "BestFirstCrawlingStrategy",
     "DFSDeepCrawlStrategy",
+    "URLFrontier",
+    "MemoryFrontier",
+    "SQLiteFrontier",
+    "CrawlBudget",
     "FilterChain",
     "ContentTypeFilter",
     "DomainFilter",
@@ -1,10 +1,32 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Optional, Set, List, Dict
+from typing import AsyncGenerator, Iterable, NamedTuple, Optional, Set, List, Dict, Tuple, Union
 from functools import wraps
 from contextvars import ContextVar
 from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn
+from ..url_canonicalizer import canonicalize_url
+from .frontier import FrontierItem, MemoryFrontier, URLFrontier
+from .scheduler import CrawlScheduler
+
+
+class CrawlSeed(NamedTuple):
+    """A start URL for deep_crawl_many; limits left as None use the strategy's."""
+
+    url: str
+    max_pages: Optional[float] = None
+    max_depth: Optional[int] = None
+
+
+class _SeedState:
+    __slots__ = ("url", "max_pages", "max_depth", "pages_crawled", "in_flight")
+
+    def __init__(self, url: str, max_pages: float, max_depth: int):
+        self.url = url
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.pages_crawled = 0
+        self.in_flight = 0
 
 
 class DeepCrawlDecorator:
@@ -53,6 +75,18 @@ class DeepCrawlStrategy(ABC):
       - _process_links: Extract and process links from a CrawlResult.
     """
 
+    # config.duplicate_detector of the current run, see _prune_likely_duplicates
+    _duplicate_detector = None
+
+    # True for strategies that crawl from a URLFrontier through _crawl_seeds (and so
+    # support deep_crawl_many); they provide max_depth, max_pages, frontier,
+    # dispatcher, max_concurrency, stats, _pages_crawled and _cancel_event
+    frontier_crawl = False
+    # Pages in flight when max_concurrency is not set; None uses the dispatcher's limit
+    _default_concurrency: Optional[int] = None
+    # Queued items of a seed at its page limit that one pop steps over at most
+    SKIP_LIMIT = 64
+
     @abstractmethod
     async def _arun_batch(
         self,
@@ -98,6 +132,7 @@ class DeepCrawlStrategy(ABC):
         """
         if config is None:
             raise ValueError("CrawlerRunConfig must be provided")
+        self._duplicate_detector = config.duplicate_detector
 
         if config.stream:
             return self._arun_stream(start_url, crawler, config)
@@ -107,6 +142,210 @@ class DeepCrawlStrategy(ABC):
     def __call__(self, start_url: str, crawler: AsyncWebCrawler, config: CrawlerRunConfig):
         return self.arun(start_url, crawler, config)
 
+    async def deep_crawl_many(
+        self,
+        start_urls: Iterable[Union[str, CrawlSeed]],
+        crawler: AsyncWebCrawler,
+        config: Optional[CrawlerRunConfig] = None,
+    ) -> RunManyReturn:
+        """
+        Deep crawl several start URLs through one shared frontier and scheduler.
+
+        All seeds compete for the same dispatcher slots, so the slots stay busy
+        while any seed still has pages, and a URL reachable from several seeds
+        is crawled once, for the seed that queued it first. Every seed gets the
+        strategy's max_pages and max_depth unless a CrawlSeed sets its own, and
+        every result carries ``metadata["seed"]``. Returns a list, or an async
+        generator if ``config.stream``.
+
+        Supported by strategies that crawl from a frontier (BFS, DFS,
+        best-first). A checkpointed frontier cannot be resumed here.
+        """
+        if config is None:
+            raise ValueError("CrawlerRunConfig must be provided")
+        if not self.frontier_crawl:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not crawl from a frontier and does not support "
+                "deep_crawl_many; use BFS, DFS or best-first"
+            )
+        self._duplicate_detector = config.duplicate_detector
+        seeds = [seed if isinstance(seed, CrawlSeed) else CrawlSeed(seed) for seed in start_urls]
+        results = self._crawl_seeds(seeds, crawler, config)
+        if config.stream:
+            return results
+        return [result async for result in results]
+
+    async def _crawl_seeds(
+        self,
+        seeds: List[CrawlSeed],
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+        tag_seeds: bool = True,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """
+        The frontier loop behind arun (one seed) and deep_crawl_many.
+
+        Up to max_concurrency pages are in flight; each finished page immediately
+        frees its slot for the next queued URL, including links it just contributed.
+        max_pages counts a seed's successes plus its pages in flight, so no seed
+        overshoots it. A checkpointed frontier is resumed for a single seed only.
+        """
+        frontier = self.frontier if self.frontier is not None else MemoryFrontier()
+        self._prepare_frontier(frontier)
+
+        states: List[_SeedState] = []
+        # Seed of every queued URL, kept only when there are several seeds
+        seed_of: Dict[str, _SeedState] = {}
+        if frontier.resumed:
+            if len(seeds) != 1:
+                raise ValueError("deep_crawl_many cannot resume a checkpointed frontier")
+            self._pages_crawled = frontier.meta.get("pages_crawled", 0)
+            self._restore_state(frontier)
+            states.append(self._seed_state(seeds[0]))
+            states[0].pages_crawled = self._pages_crawled
+        else:
+            for seed in reversed(seeds) if frontier.lifo else seeds:
+                canonical = canonicalize_url(seed.url)
+                if seed.url in frontier.seen or canonical in frontier.seen:
+                    continue
+                state = self._seed_state(seed)
+                frontier.push(seed.url, None, 0, priority=self._link_priorities([seed.url], [0])[0])
+                frontier.seen.add(canonical)
+                seed_of[seed.url] = state
+                states.append(state)
+        only = states[0] if len(states) == 1 else None
+        if only is not None:
+            seed_of.clear()
+
+        def pop() -> Optional[Tuple[str, Tuple[FrontierItem, _SeedState]]]:
+            if only is not None and only.pages_crawled + only.in_flight >= only.max_pages:
+                return None
+            skipped: List[FrontierItem] = []
+            try:
+                while len(skipped) < self.SKIP_LIMIT:
+                    item = self._pop_next(frontier)
+                    if item is None:
+                        return None
+                    state = seed_of.get(item.url, only)
+                    if state is None or state.pages_crawled >= state.max_pages:
+                        seed_of.pop(item.url, None)
+                        frontier.done(item.url)
+                        continue
+                    if state.pages_crawled + state.in_flight >= state.max_pages:
+                        # Its pages in flight may still fill the seed's limit; leave it queued
+                        skipped.append(item)
+                        continue
+                    seed_of.pop(item.url, None)
+                    state.in_flight += 1
+                    self._page_started(item)
+                    return item.url, (item, state)
+                return None
+            finally:
+                for item in skipped:
+                    frontier.requeue(item)
+
+        def push_back(url: str, payload: Tuple[FrontierItem, _SeedState]) -> None:
+            item, state = payload
+            state.in_flight -= 1
+            if only is None:
+                seed_of[url] = state
+            frontier.requeue(item)
+            self._page_deferred(item)
+
+        scheduler = CrawlScheduler(
+            crawler,
+            config.clone(deep_crawl_strategy=None, stream=False),
+            dispatcher=self.dispatcher,
+            max_concurrency=self.max_concurrency or self._default_concurrency,
+        )
+        results = scheduler.stream(pop, push_back, should_stop=self._cancel_event.is_set)
+        try:
+            async for result, (item, state) in results:
+                state.in_flight -= 1
+                result.metadata = result.metadata or {}
+                result.metadata["depth"] = item.depth
+                result.metadata["parent_url"] = item.parent
+                if tag_seeds:
+                    result.metadata["seed"] = state.url
+                self._page_finished(item, result)
+                if result.success:
+                    state.pages_crawled += 1
+                    self._pages_crawled += 1
+                    self.stats.total_depth_reached = max(self.stats.total_depth_reached, item.depth)
+                else:
+                    self.stats.urls_failed += 1
+                self.stats.urls_processed += 1
+
+                if result.success and state.pages_crawled < state.max_pages:
+                    new_links: List[Tuple[str, Optional[str]]] = []
+                    depths: Dict[str, int] = {}
+                    await self.link_discovery(
+                        result, result.url, item.depth, frontier.seen, new_links, depths,
+                        max_depth=state.max_depth,
+                        remaining_capacity=state.max_pages - state.pages_crawled,
+                    )
+                    new_depths = [depths.get(url, item.depth + 1) for url, _ in new_links]
+                    entries = list(zip(new_links, new_depths, self._link_priorities([url for url, _ in new_links], new_depths)))
+                    for (url, parent), depth, priority in reversed(entries) if frontier.lifo else entries:
+                        if only is None:
+                            seed_of[url] = state
+                        frontier.push(url, parent, depth, priority=priority)
+                frontier.meta["pages_crawled"] = self._pages_crawled
+                if frontier.checkpoint_every:
+                    self._save_state(frontier)
+                frontier.done(item.url)
+                yield result
+        finally:
+            await results.aclose()
+            self._save_state(frontier)
+            frontier.checkpoint()
+            self.scheduler_stats = scheduler.stats
+
+    def _seed_state(self, seed: CrawlSeed) -> _SeedState:
+        return _SeedState(
+            seed.url,
+            self.max_pages if seed.max_pages is None else seed.max_pages,
+            self.max_depth if seed.max_depth is None else seed.max_depth,
+        )
+
+    # Hooks of the frontier loop; the defaults give breadth-first order
+    def _prepare_frontier(self, frontier: URLFrontier) -> None:
+        pass
+
+    def _restore_state(self, frontier: URLFrontier) -> None:
+        """Reload strategy state saved in a resumed frontier's meta."""
+
+    def _save_state(self, frontier: URLFrontier) -> None:
+        """Store strategy state in frontier.meta before it is checkpointed."""
+
+    def _link_priorities(self, urls: List[str], depths: List[int]) -> List[float]:
+        return [float(depth) for depth in depths]
+
+    def _pop_next(self, frontier: URLFrontier) -> Optional[FrontierItem]:
+        return frontier.pop()
+
+    def _page_started(self, item: FrontierItem) -> None:
+        pass
+
+    def _page_deferred(self, item: FrontierItem) -> None:
+        pass
+
+    def _page_finished(self, item: FrontierItem, result: CrawlResult) -> None:
+        pass
+
+    def _prune_likely_duplicates(self, candidates: Dict[str, str]) -> Dict[str, str]:
+        """
+        Drop candidate links whose URL pattern has mostly produced near-duplicate
+        pages so far. `candidates` maps normalized URL to raw href.
+        """
+        detector = self._duplicate_detector
+        if detector is None:
+            return candidates
+        kept = {url: href for url, href in candidates.items() if not detector.is_likely_duplicate(url)}
+        if len(kept) < len(candidates):
+            self.stats.urls_skipped += len(candidates) - len(kept)
+        return kept
+
     @abstractmethod
     async def shutdown(self) -> None:
         """
@@ -137,6 +376,8 @@ class DeepCrawlStrategy(ABC):
         visited: Set[str],
         next_level: List[tuple],
         depths: Dict[str, int],
+        max_depth: Optional[int] = None,
+        remaining_capacity: Optional[float] = None,
     ) -> None:
         """
         Extract and process links from the given crawl result.
@@ -154,6 +395,10 @@ class DeepCrawlStrategy(ABC):
             visited (Set[str]): Set of already visited URLs.
             next_level (List[tuple]): List of tuples (url, parent_url) for the next BFS level.
             depths (Dict[str, int]): Mapping of URLs to their current depth.
+            max_depth (Optional[int]): Depth limit for this page's seed; defaults to
+                the strategy's max_depth.
+            remaining_capacity (Optional[float]): Pages the seed may still crawl;
+                defaults to the strategy's max_pages minus pages crawled so far.
         """
         pass
 
@@ -1,5 +1,6 @@
 # best_first_crawling_strategy.py
 import asyncio
+from contextlib import aclosing
 import logging
 from datetime import datetime
 from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
@@ -8,15 +9,22 @@ from urllib.parse import urlparse
 from ..models import TraversalStats
 from .filters import FilterChain
 from .scorers import URLScorer
+from .budget import CrawlBudget
+from .frontier import FrontierItem, URLFrontier
 from . import DeepCrawlStrategy
+from .base_strategy import CrawlSeed
 
 from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn
-from ..utils import normalize_url_for_deep_crawl
+from ..url_canonicalizer import canonicalize_links
 
 from math import inf as infinity
 
-# Configurable batch size for processing items from the priority queue
+# Default number of pages in flight; small so the crawl stays close to best-first order
 BATCH_SIZE = 10
+# Stale items re-queued per pop at most when a budget re-prioritizes the queue
+REBALANCE_LIMIT = 256
+# Under a budget, every this many pops REBALANCE_LIMIT queued items are rescored
+RESCORE_EVERY = 16
 
 
 class BestFirstCrawlingStrategy(DeepCrawlStrategy):
@@ -29,10 +37,15 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
     
     Core methods:
       - arun: Returns either a list (batch mode) or an async generator (stream mode).
-      - _arun_best_first: Core generator that uses a priority queue to yield CrawlResults.
+      - _arun_best_first: Core generator; a slot is refilled with the best queued URL
+        as soon as a page finishes, so there is no per-batch barrier.
       - can_process_url: Validates URLs and applies filtering (inherited behavior).
       - link_discovery: Extracts and validates links from a CrawlResult.
     """
+
+    frontier_crawl = True
+    _default_concurrency = BATCH_SIZE
+
     def __init__(
         self,
         max_depth: int,
@@ -41,12 +54,33 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         include_external: bool = False,
         max_pages: int = infinity,
         logger: Optional[logging.Logger] = None,
+        frontier: Optional[URLFrontier] = None,
+        dispatcher=None,
+        max_concurrency: Optional[int] = None,
+        budget: Optional[CrawlBudget] = None,
     ):
+        """
+        Args:
+            frontier: Priority queue and seen-URL store (e.g. SQLiteFrontier for crawls
+                larger than memory, or to resume a checkpointed crawl); a fresh
+                MemoryFrontier per crawl by default.
+            dispatcher: Dispatcher used for the crawls; defaults to the one arun_many uses.
+            max_concurrency: Pages in flight (default BATCH_SIZE). Higher values crawl
+                faster but start more pages before better-scored links are known.
+            budget: Allocate max_pages across domains and path prefixes by how much
+                useful content each has yielded so far (see CrawlBudget), instead
+                of by URL score alone.
+        """
         self.max_depth = max_depth
         self.filter_chain = filter_chain
         self.url_scorer = url_scorer
         self.include_external = include_external
         self.max_pages = max_pages
+        self.frontier = frontier
+        self.dispatcher = dispatcher
+        self.max_concurrency = max_concurrency
+        self.budget = budget
+        self.scheduler_stats: Dict[str, float] = {}
         # self.logger = logger or logging.getLogger(__name__)
         # Ensure logger is always a Logger instance, not a dict from serialization
         if isinstance(logger, logging.Logger):
@@ -57,12 +91,9 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         self.stats = TraversalStats(start_time=datetime.now())
         self._cancel_event = asyncio.Event()
         self._pages_crawled = 0
+        self._pops = 0
 
-    async def can_process_url(self, url: str, depth: int) -> bool:
-        """
-        Validate the URL format and apply filtering.
-        For the starting URL (depth 0), filtering is bypassed.
-        """
+    def _is_valid_url(self, url: str) -> bool:
         try:
             parsed = urlparse(url)
             if not parsed.scheme or not parsed.netloc:
@@ -74,12 +105,35 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         except Exception as e:
             self.logger.warning(f"Invalid URL: {url}, error: {e}")
             return False
+        return True
+
+    async def can_process_url(self, url: str, depth: int) -> bool:
+        """
+        Validate the URL format and apply filtering.
+        For the starting URL (depth 0), filtering is bypassed.
+        """
+        if not self._is_valid_url(url):
+            return False
 
         if depth != 0 and not await self.filter_chain.apply(url):
             return False
 
         return True
 
+    async def filter_links(self, urls: List[str], depth: int) -> List[bool]:
+        """
+        Batch counterpart of can_process_url: one verdict per URL, with the filter
+        chain applied to the whole batch (async filters run concurrently).
+        """
+        if type(self).can_process_url is not BestFirstCrawlingStrategy.can_process_url:
+            return list(await asyncio.gather(*(self.can_process_url(u, depth) for u in urls)))
+        valid = [self._is_valid_url(url) for url in urls]
+        if depth == 0:
+            return valid
+        candidates = [url for url, ok in zip(urls, valid) if ok]
+        verdicts = iter(await self.filter_chain.apply_many(candidates))
+        return [ok and next(verdicts) for ok in valid]
+
     async def link_discovery(
         self,
         result: CrawlResult,
@@ -88,6 +142,8 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         visited: Set[str],
         next_links: List[Tuple[str, Optional[str]]],
         depths: Dict[str, int],
+        max_depth: Optional[int] = None,
+        remaining_capacity: Optional[float] = None,
     ) -> None:
         """
         Extract links from the crawl result, validate them, and append new URLs
@@ -95,32 +151,35 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         Also updates the depths dictionary.
         """
         new_depth = current_depth + 1
-        if new_depth > self.max_depth:
+        if new_depth > (self.max_depth if max_depth is None else max_depth):
+            return
+        if result.metadata and result.metadata.get("duplicate_of"):
+            # A near-duplicate repeats the links its original already contributed
             return
             
         # If we've reached the max pages limit, don't discover new links
-        remaining_capacity = self.max_pages - self._pages_crawled
+        if remaining_capacity is None:
+            remaining_capacity = self.max_pages - self._pages_crawled
         if remaining_capacity <= 0:
-            self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping link discovery")
+            self.logger.info("Max pages limit reached, stopping link discovery")
             return
 
         # Retrieve internal links; include external links if enabled.
         links = result.links.get("internal", [])
         if self.include_external:
-            links += result.links.get("external", [])
-
-        # If we have more links than remaining capacity, limit how many we'll process
-        valid_links = []
-        for link in links:
-            url = link.get("href")
-            base_url = normalize_url_for_deep_crawl(url, source_url)
-            if base_url in visited:
-                continue
-            if not await self.can_process_url(url, new_depth):
-                self.stats.urls_skipped += 1
-                continue
-                
-            valid_links.append(base_url)
+            links = links + result.links.get("external", [])
+
+        # One candidate per normalized URL, filtered as a batch
+        candidates: Dict[str, str] = {}
+        hrefs = [link.get("href") for link in links]
+        for url, base_url in zip(hrefs, canonicalize_links(hrefs, source_url)):
+            if base_url and base_url not in visited and base_url not in candidates:
+                candidates[base_url] = url
+        candidates = self._prune_likely_duplicates(candidates)
+
+        admitted = await self.filter_links(list(candidates.values()), new_depth)
+        valid_links = [base_url for base_url, ok in zip(candidates, admitted) if ok]
+        self.stats.urls_skipped += len(candidates) - len(valid_links)
             
         # Record the new depths and add to next_links
         for url in valid_links:
@@ -135,84 +194,74 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
     ) -> AsyncGenerator[CrawlResult, None]:
         """
         Core best-first crawl method using a priority queue.
-        
-        The queue items are tuples of (score, depth, url, parent_url). Lower scores
-        are treated as higher priority. URLs are processed in batches for efficiency.
+
+        The frontier is ordered by negated score, so higher-scoring URLs pop first;
+        URLs are marked seen when queued. Up to max_concurrency pages are in flight
+        and each finished page immediately frees its slot for the best queued URL,
+        including links that page just contributed.
         """
-        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
-        # Push the initial URL with score 0 and depth 0.
-        initial_score = self.url_scorer.score(start_url) if self.url_scorer else 0
-        await queue.put((-initial_score, 0, start_url, None))
-        visited: Set[str] = set()
-        depths: Dict[str, int] = {start_url: 0}
-
-        while not queue.empty() and not self._cancel_event.is_set():
-            # Stop if we've reached the max pages limit
-            if self._pages_crawled >= self.max_pages:
-                self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping crawl")
-                break
-                
-            # Calculate how many more URLs we can process in this batch
-            remaining = self.max_pages - self._pages_crawled
-            batch_size = min(BATCH_SIZE, remaining)
-            if batch_size <= 0:
-                # No more pages to crawl
-                self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping crawl")
-                break
-                
-            batch: List[Tuple[float, int, str, Optional[str]]] = []
-            # Retrieve up to BATCH_SIZE items from the priority queue.
-            for _ in range(BATCH_SIZE):
-                if queue.empty():
-                    break
-                item = await queue.get()
-                score, depth, url, parent_url = item
-                if url in visited:
-                    continue
-                visited.add(url)
-                batch.append(item)
-
-            if not batch:
-                continue
-
-            # Process the current batch of URLs.
-            urls = [item[2] for item in batch]
-            batch_config = config.clone(deep_crawl_strategy=None, stream=True)
-            stream_gen = await crawler.arun_many(urls=urls, config=batch_config)
-            async for result in stream_gen:
-                result_url = result.url
-                # Find the corresponding tuple from the batch.
-                corresponding = next((item for item in batch if item[2] == result_url), None)
-                if not corresponding:
-                    continue
-                score, depth, url, parent_url = corresponding
-                result.metadata = result.metadata or {}
-                result.metadata["depth"] = depth
-                result.metadata["parent_url"] = parent_url
-                result.metadata["score"] = -score
-                
-                # Count only successful crawls toward max_pages limit
-                if result.success:
-                    self._pages_crawled += 1
-                    # Check if we've reached the limit during batch processing
-                    if self._pages_crawled >= self.max_pages:
-                        self.logger.info(f"Max pages limit ({self.max_pages}) reached during batch, stopping crawl")
-                        break  # Exit the generator
-                
+        seeds = [CrawlSeed(start_url)]
+        async with aclosing(self._crawl_seeds(seeds, crawler, config, tag_seeds=False)) as results:
+            async for result in results:
                 yield result
-                
-                # Only discover links from successful crawls
-                if result.success:
-                    # Discover new links from this result
-                    new_links: List[Tuple[str, Optional[str]]] = []
-                    await self.link_discovery(result, result_url, depth, visited, new_links, depths)
-                    
-                    for new_url, new_parent in new_links:
-                        new_depth = depths.get(new_url, depth + 1)
-                        new_score = self.url_scorer.score(new_url) if self.url_scorer else 0
-                        await queue.put((-new_score, new_depth, new_url, new_parent))
-
-        # End of crawl.
+
+    def _restore_state(self, frontier: URLFrontier) -> None:
+        if self.budget is not None and "budget" in frontier.meta:
+            self.budget.load(frontier.meta["budget"])
+
+    def _save_state(self, frontier: URLFrontier) -> None:
+        if self.budget is not None:
+            frontier.meta["budget"] = self.budget.state()
+
+    def _queue_priority(self, url: str, score: float) -> float:
+        return self.budget.priority(url, score) if self.budget is not None else -score
+
+    def _link_priorities(self, urls: List[str], depths: List[int]) -> List[float]:
+        scores = self.url_scorer.score_many(urls).tolist() if self.url_scorer else [0] * len(urls)
+        return [self._queue_priority(url, score) for url, score in zip(urls, scores)]
+
+    def _current_priority(self, url: str) -> float:
+        return self.budget.priority(url, self.url_scorer.score(url) if self.url_scorer else 0)
+
+    def _pop_next(self, frontier: URLFrontier) -> Optional[FrontierItem]:
+        """
+        Pop the best URL. Under a budget, arm values move after a URL is queued, so
+        an item whose priority has since dropped goes back with its current one and
+        the next item is tried; the returned item carries the scorer score as its
+        priority. Items whose arm improved would stay buried under that check alone,
+        so every RESCORE_EVERY pops a slice of the queue is moved up to its current
+        priority, cycling through the whole queue over successive sweeps.
+        """
+        budget = self.budget
+        if budget is None:
+            return frontier.pop()
+        self._pops += 1
+        if self._pops % RESCORE_EVERY == 0:
+            frontier.rescore(self._current_priority, REBALANCE_LIMIT)
+        item = frontier.pop()
+        requeued = 0
+        while item is not None:
+            score = self.url_scorer.score(item.url) if self.url_scorer else 0
+            current = budget.priority(item.url, score)
+            if current <= item.priority + budget.tolerance or requeued >= REBALANCE_LIMIT:
+                return item._replace(priority=-score)
+            frontier.requeue(item, priority=current)
+            requeued += 1
+            item = frontier.pop()
+        return None
+
+    def _page_started(self, item: FrontierItem) -> None:
+        if self.budget is not None:
+            self.budget.start(item.url)
+
+    def _page_deferred(self, item: FrontierItem) -> None:
+        if self.budget is not None:
+            self.budget.cancel(item.url)
+
+    def _page_finished(self, item: FrontierItem, result: CrawlResult) -> None:
+        result.metadata["score"] = -item.priority
+        if self.budget is not None:
+            self.budget.record(item.url, result)
 
     async def _arun_batch(
         self,
@@ -241,8 +290,9 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         
         Yields CrawlResults as they become available.
         """
-        async for result in self._arun_best_first(start_url, crawler, config):
-            yield result
+        async with aclosing(self._arun_best_first(start_url, crawler, config)) as results:
+            async for result in results:
+                yield result
 
     async def arun(
         self,
@@ -258,6 +308,7 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         """
         if config is None:
             raise ValueError("CrawlerRunConfig must be provided")
+        self._duplicate_detector = config.duplicate_detector
         if config.stream:
             return self._arun_stream(start_url, crawler, config)
         else:
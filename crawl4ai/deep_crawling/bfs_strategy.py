@@ -1,5 +1,6 @@
 # bfs_deep_crawl_strategy.py
 import asyncio
+from contextlib import aclosing
 import logging
 from datetime import datetime
 from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
@@ -8,9 +9,11 @@ from urllib.parse import urlparse
 from ..models import TraversalStats
 from .filters import FilterChain
 from .scorers import URLScorer
+from .frontier import URLFrontier
 from . import DeepCrawlStrategy  
+from .base_strategy import CrawlSeed
 from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult
-from ..utils import normalize_url_for_deep_crawl, efficient_normalize_url_for_deep_crawl
+from ..url_canonicalizer import canonicalize_links, canonicalize_url
 from math import inf as infinity
 
 class BFSDeepCrawlStrategy(DeepCrawlStrategy):
@@ -19,9 +22,15 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
     
     Core functions:
       - arun: Main entry point; splits execution into batch or stream modes.
+      - _crawl_seeds (pipeline mode): Continuous frontier ordered by (depth, discovery
+        order); a slot is refilled as soon as a page finishes, and its links join the
+        frontier right away, so there is no barrier between levels.
       - link_discovery: Extracts, filters, and (if needed) scores the outgoing URLs.
       - can_process_url: Validates URL format and applies the filter chain.
     """
+
+    frontier_crawl = True
+
     def __init__(
         self,
         max_depth: int,
@@ -31,7 +40,22 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         score_threshold: float = -infinity,
         max_pages: int = infinity,
         logger: Optional[logging.Logger] = None,
+        pipeline: bool = True,
+        dispatcher=None,
+        max_concurrency: Optional[int] = None,
+        frontier: Optional[URLFrontier] = None,
     ):
+        """
+        Args:
+            pipeline: Keep the dispatcher's slots busy across levels instead of waiting
+                for each level to finish (False restores the level-by-level crawl).
+            dispatcher: Dispatcher used for the crawls; defaults to the one arun_many uses.
+            max_concurrency: Pages in flight in pipeline mode; defaults to the
+                dispatcher's max_session_permit.
+            frontier: Queue and seen-URL store (e.g. SQLiteFrontier for crawls larger
+                than memory, or to resume a checkpointed crawl); a fresh MemoryFrontier
+                per crawl by default. Used in pipeline mode.
+        """
         self.max_depth = max_depth
         self.filter_chain = filter_chain
         self.url_scorer = url_scorer
@@ -48,12 +72,13 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         self.stats = TraversalStats(start_time=datetime.now())
         self._cancel_event = asyncio.Event()
         self._pages_crawled = 0
+        self.pipeline = pipeline
+        self.dispatcher = dispatcher
+        self.max_concurrency = max_concurrency
+        self.frontier = frontier
+        self.scheduler_stats: Dict[str, float] = {}
 
-    async def can_process_url(self, url: str, depth: int) -> bool:
-        """
-        Validates the URL and applies the filter chain.
-        For the start URL (depth 0) filtering is bypassed.
-        """
+    def _is_valid_url(self, url: str) -> bool:
         try:
             parsed = urlparse(url)
             if not parsed.scheme or not parsed.netloc:
@@ -65,12 +90,36 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         except Exception as e:
             self.logger.warning(f"Invalid URL: {url}, error: {e}")
             return False
+        return True
+
+    async def can_process_url(self, url: str, depth: int) -> bool:
+        """
+        Validates the URL and applies the filter chain.
+        For the start URL (depth 0) filtering is bypassed.
+        """
+        if not self._is_valid_url(url):
+            return False
 
         if depth != 0 and not await self.filter_chain.apply(url):
             return False
 
         return True
 
+    async def filter_links(self, urls: List[str], depth: int) -> List[bool]:
+        """
+        Batch counterpart of can_process_url: one verdict per URL, with the filter
+        chain applied to the whole batch (async filters run concurrently).
+        """
+        if type(self).can_process_url is not BFSDeepCrawlStrategy.can_process_url:
+            # Respect subclasses that customise the per-URL check
+            return list(await asyncio.gather(*(self.can_process_url(u, depth) for u in urls)))
+        valid = [self._is_valid_url(url) for url in urls]
+        if depth == 0:
+            return valid
+        candidates = [url for url, ok in zip(urls, valid) if ok]
+        verdicts = iter(await self.filter_chain.apply_many(candidates))
+        return [ok and next(verdicts) for ok in valid]
+
     async def link_discovery(
         self,
         result: CrawlResult,
@@ -79,6 +128,8 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         visited: Set[str],
         next_level: List[Tuple[str, Optional[str]]],
         depths: Dict[str, int],
+        max_depth: Optional[int] = None,
+        remaining_capacity: Optional[float] = None,
     ) -> None:
         """
         Extracts links from the crawl result, validates and scores them, and
@@ -87,40 +138,43 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         and its depth is tracked.
         """            
         next_depth = current_depth + 1
-        if next_depth > self.max_depth:
+        if next_depth > (self.max_depth if max_depth is None else max_depth):
+            return
+        if result.metadata and result.metadata.get("duplicate_of"):
+            # A near-duplicate repeats the links its original already contributed
             return
 
         # If we've reached the max pages limit, don't discover new links
-        remaining_capacity = self.max_pages - self._pages_crawled
+        if remaining_capacity is None:
+            remaining_capacity = self.max_pages - self._pages_crawled
         if remaining_capacity <= 0:
-            self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping link discovery")
+            self.logger.info("Max pages limit reached, stopping link discovery")
             return
 
         # Get internal links and, if enabled, external links.
         links = result.links.get("internal", [])
         if self.include_external:
-            links += result.links.get("external", [])
+            links = links + result.links.get("external", [])
 
-        valid_links = []
-        
-        # First collect all valid links
-        for link in links:
-            url = link.get("href")
-            # Strip URL fragments to avoid duplicate crawling
-            # base_url = url.split('#')[0] if url else url
-            base_url = normalize_url_for_deep_crawl(url, source_url)
-            if base_url in visited:
-                continue
-            if not await self.can_process_url(url, next_depth):
-                self.stats.urls_skipped += 1
-                continue
+        # One candidate per normalized URL; the first href seen for it is the one filtered
+        candidates: Dict[str, str] = {}
+        hrefs = [link.get("href") for link in links]
+        for url, base_url in zip(hrefs, canonicalize_links(hrefs, source_url)):
+            if base_url and base_url not in visited and base_url not in candidates:
+                candidates[base_url] = url
+        candidates = self._prune_likely_duplicates(candidates)
 
-            # Score the URL if a scorer is provided
-            score = self.url_scorer.score(base_url) if self.url_scorer else 0
-            
+        # Filter and score the whole page's links at once
+        admitted = await self.filter_links(list(candidates.values()), next_depth)
+        accepted = [base_url for base_url, ok in zip(candidates, admitted) if ok]
+        self.stats.urls_skipped += len(candidates) - len(accepted)
+        scores = self.url_scorer.score_many(accepted).tolist() if self.url_scorer else [0] * len(accepted)
+
+        valid_links = []
+        for base_url, score in zip(accepted, scores):
             # Skip URLs with scores below the threshold
             if score < self.score_threshold:
-                self.logger.debug(f"URL {url} skipped: score {score} below threshold {self.score_threshold}")
+                self.logger.debug(f"URL {base_url} skipped: score {score} below threshold {self.score_threshold}")
                 self.stats.urls_skipped += 1
                 continue
 
@@ -133,7 +187,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 # Sort by score in descending order
                 valid_links.sort(key=lambda x: x[1], reverse=True)
             # Take only as many as we have capacity for
-            valid_links = valid_links[:remaining_capacity]
+            valid_links = valid_links[:int(remaining_capacity)]  # max_pages may be a float
             self.logger.info(f"Limiting to {remaining_capacity} URLs due to max_pages limit")
             
         # Process the final selected links
@@ -155,7 +209,11 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Batch (non-streaming) mode:
         Processes one BFS level at a time, then yields all the results.
         """
-        visited: Set[str] = set()
+        if self.pipeline:
+            seeds = [CrawlSeed(start_url)]
+            return [result async for result in self._crawl_seeds(seeds, crawler, config, tag_seeds=False)]
+
+        visited: Set[str] = {canonicalize_url(start_url)}
         # current_level holds tuples: (url, parent_url)
         current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
         depths: Dict[str, int] = {start_url: 0}
@@ -169,7 +227,8 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 break
             
             next_level: List[Tuple[str, Optional[str]]] = []
-            urls = [url for url, _ in current_level]
+            parents: Dict[str, Optional[str]] = dict(current_level)
+            urls = list(parents)
 
             # Clone the config to disable deep crawling recursion and enforce batch mode.
             batch_config = config.clone(deep_crawl_strategy=None, stream=False)
@@ -184,8 +243,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 depth = depths.get(url, 0)
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
+                result.metadata["parent_url"] = parents.get(url)
                 results.append(result)
                 
                 # Only discover links from successful crawls
@@ -207,13 +265,21 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Streaming mode:
         Processes one BFS level at a time and yields results immediately as they arrive.
         """
-        visited: Set[str] = set()
+        if self.pipeline:
+            seeds = [CrawlSeed(start_url)]
+            async with aclosing(self._crawl_seeds(seeds, crawler, config, tag_seeds=False)) as results:
+                async for result in results:
+                    yield result
+            return
+
+        visited: Set[str] = {canonicalize_url(start_url)}
         current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
         depths: Dict[str, int] = {start_url: 0}
 
         while current_level and not self._cancel_event.is_set():
             next_level: List[Tuple[str, Optional[str]]] = []
-            urls = [url for url, _ in current_level]
+            parents: Dict[str, Optional[str]] = dict(current_level)
+            urls = list(parents)
             visited.update(urls)
 
             stream_config = config.clone(deep_crawl_strategy=None, stream=True)
@@ -226,8 +292,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 depth = depths.get(url, 0)
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
+                result.metadata["parent_url"] = parents.get(url)
                 
                 # Count only successful crawls
                 if result.success:
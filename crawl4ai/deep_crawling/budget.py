@@ -0,0 +1,161 @@
+# budget.py
+"""
+Adaptive page budget for best-first crawls.
+
+A :class:`CrawlBudget` treats every domain and every path prefix within it as an
+arm of a multi-armed bandit. Each finished page pays a reward (its yield: new,
+non-duplicate content or successful extraction), and the queue priority of a URL
+is its scorer score plus the UCB index of its arm:
+
+    index = mean yield of the prefix + exploration * sqrt(ln N / pages of the domain)
+
+Prefix means are shrunk toward their domain's mean, and domain means toward the
+crawl's mean, so a new prefix of a productive domain starts out promising and one
+of an exhausted domain does not. A domain that keeps paying off keeps getting
+pages; one that stops being useful (duplicates, empty listings, failed
+extractions) loses them to the others, without a fixed per-domain quota.
+
+Priorities are computed when a URL is queued. Arm values keep moving afterwards, so
+the strategy re-evaluates each popped URL and puts it back with its current
+priority if that has dropped by more than ``tolerance`` (lazy re-prioritization).
+That alone never lifts a URL whose arm improved after it was queued, so the strategy
+also rescores a slice of the queue every few pops (``URLFrontier.rescore``), cycling
+through all of it; rebalancing never needs a full pass over the queue at once.
+"""
+
+import math
+from typing import Any, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+# Per-arm statistics: [pages finished, total reward, pages in flight]
+_Arm = List[float]
+
+
+class CrawlBudget:
+    """
+    UCB allocation of pages across domains and path prefixes.
+
+    Args:
+        exploration: UCB exploration constant; higher spreads pages more evenly.
+        weight: Scale of the arm index relative to the URL scorer's score.
+        prefix_depth: Path segments that form a prefix ("/docs/api/x" with 1 is
+            "/docs"); 0 allocates per domain only.
+        prior_strength: Pseudo-pages that pull a prefix's mean toward its domain's
+            and a domain's toward the whole crawl's.
+        target_words: Words of non-duplicate markdown that earn a full reward when
+            no extraction strategy is configured.
+        tolerance: Queue priorities at most this much too optimistic are
+            accepted when popped instead of being re-queued.
+    """
+
+    def __init__(
+        self,
+        exploration: float = 0.5,
+        weight: float = 1.0,
+        prefix_depth: int = 1,
+        prior_strength: float = 2.0,
+        target_words: int = 200,
+        tolerance: float = 0.02,
+    ):
+        self.exploration = exploration
+        self.weight = weight
+        self.prefix_depth = prefix_depth
+        self.prior_strength = prior_strength
+        self.target_words = target_words
+        self.tolerance = tolerance
+        self._total: _Arm = [0, 0.0, 0]
+        self._domains: Dict[str, _Arm] = {}
+        self._prefixes: Dict[Tuple[str, str], _Arm] = {}
+
+    def arm(self, url: str) -> Tuple[str, str]:
+        """(domain, path prefix) a URL is allocated under."""
+        parts = urlsplit(url)
+        domain = parts.netloc.lower()
+        if self.prefix_depth <= 0:
+            return domain, ""
+        segments = [segment for segment in parts.path.split("/") if segment][: self.prefix_depth]
+        return domain, "/" + "/".join(segments)
+
+    def _stats(self, url: str) -> Tuple[_Arm, _Arm]:
+        domain, prefix = self.arm(url)
+        domain_arm = self._domains.get(domain)
+        if domain_arm is None:
+            domain_arm = self._domains[domain] = [0, 0.0, 0]
+        prefix_arm = self._prefixes.get((domain, prefix))
+        if prefix_arm is None:
+            prefix_arm = self._prefixes[(domain, prefix)] = [0, 0.0, 0]
+        return domain_arm, prefix_arm
+
+    def index(self, url: str) -> float:
+        """Current UCB index of the URL's arm."""
+        domain_arm, prefix_arm = self._stats(url)
+        k = self.prior_strength
+        total_pages, total_reward, total_flight = self._total
+        crawl_mean = (total_reward + k * 0.5) / (total_pages + k)
+        domain_mean = (domain_arm[1] + k * crawl_mean) / (domain_arm[0] + k)
+        prefix_mean = (prefix_arm[1] + k * domain_mean) / (prefix_arm[0] + k)
+        # Pages in flight count as pulls, so concurrent pops spread over the arms
+        pulls = domain_arm[0] + domain_arm[2]
+        bonus = self.exploration * math.sqrt(math.log(total_pages + total_flight + 1) / (pulls + 1))
+        return prefix_mean + bonus
+
+    def priority(self, url: str, score: float) -> float:
+        """Frontier priority (lower pops first) of a URL with the given scorer score."""
+        return -(score + self.weight * self.index(url))
+
+    def start(self, url: str) -> None:
+        """A page of this URL's arm is being crawled."""
+        for arm in (self._total, *self._stats(url)):
+            arm[2] += 1
+
+    def cancel(self, url: str) -> None:
+        """A started page was put back in the queue without being crawled."""
+        for arm in (self._total, *self._stats(url)):
+            arm[2] = max(0, arm[2] - 1)
+
+    def record(self, url: str, result) -> float:
+        """Credit the reward of a finished page to the arm of the URL it was queued as."""
+        reward = self.reward(result)
+        for arm in (self._total, *self._stats(url)):
+            arm[0] += 1
+            arm[1] += reward
+            arm[2] = max(0, arm[2] - 1)
+        return reward
+
+    def reward(self, result) -> float:
+        """
+        Yield of a crawled page in [0, 1]: 0 for failures and near-duplicates,
+        otherwise extraction success, or markdown length up to `target_words`.
+        Override to reward something else.
+        """
+        if not result.success or (result.metadata or {}).get("duplicate_of"):
+            return 0.0
+        extracted = result.extracted_content
+        if extracted is not None:
+            return 0.0 if extracted.strip() in ("", "[]", "{}", "null") else 1.0
+        markdown = result.markdown.raw_markdown if result.markdown else ""
+        return min(1.0, len(markdown.split()) / max(1, self.target_words))
+
+    def allocation(self) -> Dict[str, Dict[str, float]]:
+        """Pages finished and mean reward per domain."""
+        return {
+            domain: {"pages": arm[0], "mean_reward": arm[1] / arm[0] if arm[0] else 0.0}
+            for domain, arm in self._domains.items()
+        }
+
+    def state(self) -> Dict[str, Any]:
+        """JSON-able statistics, saved in the frontier's checkpoint meta."""
+        return {
+            "total": self._total[:2],
+            "prefixes": [[domain, prefix, arm[0], arm[1]] for (domain, prefix), arm in self._prefixes.items()],
+        }
+
+    def load(self, state: Dict[str, Any]) -> None:
+        """Restore statistics saved by state(); pages in flight are not restored."""
+        self._total = [*state["total"], 0]
+        self._domains, self._prefixes = {}, {}
+        for domain, prefix, pages, reward in state["prefixes"]:
+            self._prefixes[(domain, prefix)] = [pages, reward, 0]
+            domain_arm = self._domains.setdefault(domain, [0, 0.0, 0])
+            domain_arm[0] += pages
+            domain_arm[1] += reward
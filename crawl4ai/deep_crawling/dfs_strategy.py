@@ -1,10 +1,12 @@
 # dfs_deep_crawl_strategy.py
+from contextlib import aclosing
 from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
 
 from ..models import CrawlResult
 from .bfs_strategy import BFSDeepCrawlStrategy  # noqa
+from .frontier import FrontierItem, MemoryFrontier, URLFrontier
 from ..types import AsyncWebCrawler, CrawlerRunConfig
-from ..utils import normalize_url_for_deep_crawl
+from ..url_canonicalizer import canonicalize_links, canonicalize_url
 
 class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
     """
@@ -20,66 +22,92 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
         super().__init__(*args, **kwargs)
         self._dfs_seen: Set[str] = set()
 
-    def _reset_seen(self, start_url: str) -> None:
-        """Start each crawl with a clean dedupe set seeded with the root URL."""
-        self._dfs_seen = {start_url}
-
-    async def _arun_batch(
+    async def _arun_dfs(
         self,
         start_url: str,
         crawler: AsyncWebCrawler,
         config: CrawlerRunConfig,
-    ) -> List[CrawlResult]:
+    ) -> AsyncGenerator[CrawlResult, None]:
         """
-        Crawl level-by-level but emit results at the end.
+        Walk the graph one page at a time, yielding each result as it is crawled.
 
-        We keep a stack of ``(url, parent, depth)`` tuples, pop one at a time, and
-        hand it to ``crawler.arun_many`` with deep crawling disabled so we remain
-        in control of traversal. Every successful page bumps ``_pages_crawled`` and
-        seeds new stack items discovered via :meth:`link_discovery`.
+        The frontier runs in LIFO mode, so it behaves as a stack of
+        ``(url, parent, depth)`` items: links are pushed in reverse so the first
+        discovered is processed next. Its seen set doubles as ``_dfs_seen``, so
+        duplicates are dropped at discovery time. Every successful page bumps
+        ``_pages_crawled`` and seeds new items via :meth:`link_discovery`.
         """
-        visited: Set[str] = set()
-        # Stack items: (url, parent_url, depth)
-        stack: List[Tuple[str, Optional[str], int]] = [(start_url, None, 0)]
-        depths: Dict[str, int] = {start_url: 0}
-        results: List[CrawlResult] = []
-        self._reset_seen(start_url)
-
-        while stack and not self._cancel_event.is_set():
-            url, parent, depth = stack.pop()
-            if url in visited or depth > self.max_depth:
-                continue
-            visited.add(url)
+        frontier = self.frontier if self.frontier is not None else MemoryFrontier()
+        self._prepare_frontier(frontier)
+        if frontier.resumed:
+            self._pages_crawled = frontier.meta.get("pages_crawled", 0)
+        else:
+            frontier.push(start_url, None, 0)
+            frontier.seen.add(canonicalize_url(start_url))
+
+        # Clone config to disable recursive deep crawling.
+        page_config = config.clone(deep_crawl_strategy=None, stream=False)
+        try:
+            while not self._cancel_event.is_set():
+                item = frontier.pop()
+                if item is None:
+                    break
+                url, parent, depth = item.url, item.parent, item.depth
+                if depth > self.max_depth:
+                    frontier.done(url)
+                    continue
+
+                url_results = await crawler.arun_many(urls=[url], config=page_config)
+                for result in url_results:
+                    result.metadata = result.metadata or {}
+                    result.metadata["depth"] = depth
+                    result.metadata["parent_url"] = parent
+                    if self.url_scorer:
+                        result.metadata["score"] = self.url_scorer.score(url)
+
+                    # Count only successful crawls toward max_pages limit
+                    # and only discover links from successful crawls
+                    stop = False
+                    if result.success:
+                        self._pages_crawled += 1
+                        if self._pages_crawled >= self.max_pages:
+                            self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping crawl")
+                            stop = True
+                        else:
+                            new_links: List[Tuple[str, Optional[str]]] = []
+                            depths: Dict[str, int] = {}
+                            await self.link_discovery(result, url, depth, frontier.seen, new_links, depths)
+                            # Push new links in reverse order so the first discovered is processed next.
+                            for new_url, new_parent in reversed(new_links):
+                                frontier.push(new_url, new_parent, depths.get(new_url, depth + 1))
+                    frontier.meta["pages_crawled"] = self._pages_crawled
+                    frontier.done(url)
+                    yield result
+                    if stop:
+                        return
+        finally:
+            frontier.checkpoint()
+
+    def _prepare_frontier(self, frontier: URLFrontier) -> None:
+        frontier.lifo = True
+        self._dfs_seen = frontier.seen
+
+    def _link_priorities(self, urls: List[str], depths: List[int]) -> List[float]:
+        # All equal: the LIFO frontier alone gives depth-first order
+        return [0.0] * len(urls)
+
+    def _page_finished(self, item: FrontierItem, result: CrawlResult) -> None:
+        if self.url_scorer:
+            result.metadata["score"] = self.url_scorer.score(item.url)
 
-            # Clone config to disable recursive deep crawling.
-            batch_config = config.clone(deep_crawl_strategy=None, stream=False)
-            url_results = await crawler.arun_many(urls=[url], config=batch_config)
-            
-            for result in url_results:
-                result.metadata = result.metadata or {}
-                result.metadata["depth"] = depth
-                result.metadata["parent_url"] = parent
-                if self.url_scorer:
-                    result.metadata["score"] = self.url_scorer.score(url)
-                results.append(result)
-                
-                # Count only successful crawls toward max_pages limit
-                if result.success:
-                    self._pages_crawled += 1
-                    # Check if we've reached the limit during batch processing
-                    if self._pages_crawled >= self.max_pages:
-                        self.logger.info(f"Max pages limit ({self.max_pages}) reached during batch, stopping crawl")
-                        break  # Exit the generator
-                    
-                    # Only discover links from successful crawls
-                    new_links: List[Tuple[str, Optional[str]]] = []
-                    await self.link_discovery(result, url, depth, visited, new_links, depths)
-                    
-                    # Push new links in reverse order so the first discovered is processed next.
-                    for new_url, new_parent in reversed(new_links):
-                        new_depth = depths.get(new_url, depth + 1)
-                        stack.append((new_url, new_parent, new_depth))
-        return results
+    async def _arun_batch(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> List[CrawlResult]:
+        """Depth-first crawl that returns every result at the end."""
+        return [result async for result in self._arun_dfs(start_url, crawler, config)]
 
     async def _arun_stream(
         self,
@@ -87,49 +115,11 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
         crawler: AsyncWebCrawler,
         config: CrawlerRunConfig,
     ) -> AsyncGenerator[CrawlResult, None]:
-        """
-        Same traversal as :meth:`_arun_batch`, but yield pages immediately.
-
-        Each popped URL is crawled, its metadata annotated, then the result gets
-        yielded before we even look at the next stack entry. Successful crawls
-        still feed :meth:`link_discovery`, keeping DFS order intact.
-        """
-        visited: Set[str] = set()
-        stack: List[Tuple[str, Optional[str], int]] = [(start_url, None, 0)]
-        depths: Dict[str, int] = {start_url: 0}
-        self._reset_seen(start_url)
-
-        while stack and not self._cancel_event.is_set():
-            url, parent, depth = stack.pop()
-            if url in visited or depth > self.max_depth:
-                continue
-            visited.add(url)
-
-            stream_config = config.clone(deep_crawl_strategy=None, stream=True)
-            stream_gen = await crawler.arun_many(urls=[url], config=stream_config)
-            async for result in stream_gen:
-                result.metadata = result.metadata or {}
-                result.metadata["depth"] = depth
-                result.metadata["parent_url"] = parent
-                if self.url_scorer:
-                    result.metadata["score"] = self.url_scorer.score(url)
+        """Same traversal as :meth:`_arun_batch`, but yield pages immediately."""
+        async with aclosing(self._arun_dfs(start_url, crawler, config)) as results:
+            async for result in results:
                 yield result
 
-                # Only count successful crawls toward max_pages limit
-                # and only discover links from successful crawls
-                if result.success:
-                    self._pages_crawled += 1
-                    # Check if we've reached the limit during batch processing
-                    if self._pages_crawled >= self.max_pages:
-                        self.logger.info(f"Max pages limit ({self.max_pages}) reached during batch, stopping crawl")
-                        break  # Exit the generator
-                    
-                    new_links: List[Tuple[str, Optional[str]]] = []
-                    await self.link_discovery(result, url, depth, visited, new_links, depths)
-                    for new_url, new_parent in reversed(new_links):
-                        new_depth = depths.get(new_url, depth + 1)
-                        stack.append((new_url, new_parent, new_depth))
-
     async def link_discovery(
         self,
         result: CrawlResult,
@@ -138,6 +128,8 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
         _visited: Set[str],
         next_level: List[Tuple[str, Optional[str]]],
         depths: Dict[str, int],
+        max_depth: Optional[int] = None,
+        remaining_capacity: Optional[float] = None,
     ) -> None:
         """
         Find the next URLs we should push onto the DFS stack.
@@ -156,6 +148,10 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
             The stack buffer supplied by the caller; we append new ``(url, parent)`` items here.
         depths : dict
             Shared depth map so future metadata tagging knows how deep each URL lives.
+        max_depth : int, optional
+            Depth limit of the page's seed; the strategy's ``max_depth`` by default.
+        remaining_capacity : float, optional
+            Pages the seed may still crawl; ``max_pages`` minus pages crawled by default.
 
         Notes
         -----
@@ -163,37 +159,37 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
         - Validation, scoring, and capacity trimming mirror the BFS version so behaviour stays consistent.
         """
         next_depth = current_depth + 1
-        if next_depth > self.max_depth:
+        if next_depth > (self.max_depth if max_depth is None else max_depth):
+            return
+        if result.metadata and result.metadata.get("duplicate_of"):
+            # A near-duplicate repeats the links its original already contributed
             return
 
-        remaining_capacity = self.max_pages - self._pages_crawled
+        if remaining_capacity is None:
+            remaining_capacity = self.max_pages - self._pages_crawled
         if remaining_capacity <= 0:
-            self.logger.info(
-                f"Max pages limit ({self.max_pages}) reached, stopping link discovery"
-            )
+            self.logger.info("Max pages limit reached, stopping link discovery")
             return
 
         links = result.links.get("internal", [])
         if self.include_external:
-            links += result.links.get("external", [])
+            links = links + result.links.get("external", [])
 
         seen = self._dfs_seen
-        valid_links: List[Tuple[str, float]] = []
+        candidates: Dict[str, str] = {}
+        hrefs = [link.get("href") for link in links]
+        for raw_url, normalized_url in zip(hrefs, canonicalize_links(hrefs, source_url)):
+            if normalized_url and normalized_url not in seen and normalized_url not in candidates:
+                candidates[normalized_url] = raw_url
+        candidates = self._prune_likely_duplicates(candidates)
+
+        admitted = await self.filter_links(list(candidates.values()), next_depth)
+        accepted = [url for url, ok in zip(candidates, admitted) if ok]
+        self.stats.urls_skipped += len(candidates) - len(accepted)
+        scores = self.url_scorer.score_many(accepted).tolist() if self.url_scorer else [0] * len(accepted)
 
-        for link in links:
-            raw_url = link.get("href")
-            if not raw_url:
-                continue
-
-            normalized_url = normalize_url_for_deep_crawl(raw_url, source_url)
-            if not normalized_url or normalized_url in seen:
-                continue
-
-            if not await self.can_process_url(raw_url, next_depth):
-                self.stats.urls_skipped += 1
-                continue
-
-            score = self.url_scorer.score(normalized_url) if self.url_scorer else 0
+        valid_links: List[Tuple[str, float]] = []
+        for normalized_url, score in zip(accepted, scores):
             if score < self.score_threshold:
                 self.logger.debug(
                     f"URL {normalized_url} skipped: score {score} below threshold {self.score_threshold}"
@@ -207,7 +203,7 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
         if len(valid_links) > remaining_capacity:
             if self.url_scorer:
                 valid_links.sort(key=lambda x: x[1], reverse=True)
-            valid_links = valid_links[:remaining_capacity]
+            valid_links = valid_links[:int(remaining_capacity)]  # max_pages may be a float
             self.logger.info(
                 f"Limiting to {remaining_capacity} URLs due to max_pages limit"
             )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Pattern, Set, Union
+from typing import List, Optional, Pattern, Sequence, Set, Tuple, Union
 from urllib.parse import urlparse
 from array import array
 import re
@@ -9,7 +9,7 @@ import fnmatch
 from dataclasses import dataclass
 import weakref
 import math
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict
 from typing import Dict
 from ..utils import HeadPeekr
 import asyncio
@@ -66,15 +66,27 @@ class URLFilter(ABC):
         self.stats._counters[2] += not passed  # rejected
 
 
+async def _async_verdict(filter_: "URLFilter", url: str) -> bool:
+    result = filter_.apply(url)
+    return await result if inspect.isawaitable(result) else result
+
+
 class FilterChain:
     """Optimized filter chain"""
 
-    __slots__ = ("filters", "stats", "_logger_ref")
+    __slots__ = ("filters", "stats", "_logger_ref", "_async_verdicts", "_plan")
+
+    # Async filters evaluated at once by apply_many
+    ASYNC_CONCURRENCY = 32
+    # URLs whose async verdict is remembered by apply_many
+    VERDICT_CACHE_SIZE = 10000
 
     def __init__(self, filters: List[URLFilter] = None):
         self.filters = tuple(filters or [])  # Immutable tuple for speed
         self.stats = FilterStats()
         self._logger_ref = None
+        self._async_verdicts: "OrderedDict[str, bool]" = OrderedDict()
+        self._plan: Optional["CompiledFilterPlan"] = None
 
     @property
     def logger(self):
@@ -85,25 +97,27 @@ class FilterChain:
 
     def add_filter(self, filter_: URLFilter) -> "FilterChain":
         """Add a filter to the chain"""
-        self.filters.append(filter_)
+        self.filters = self.filters + (filter_,)
+        self._plan = None
         return self  # Enable method chaining
 
+    def compile(self) -> "CompiledFilterPlan":
+        """Return the compiled plan for this chain, building it on first use."""
+        if self._plan is None:
+            self._plan = CompiledFilterPlan(self.filters)
+        return self._plan
+
     async def apply(self, url: str) -> bool:
         """Apply all filters concurrently when possible"""
         self.stats._counters[0] += 1  # Total processed URLs
 
-        tasks = []
-        for f in self.filters:
-            result = f.apply(url)
-
-            if inspect.isawaitable(result):
-                tasks.append(result)  # Collect async tasks
-            elif not result:  # Sync rejection
-                self.stats._counters[2] += 1  # Sync rejected
-                return False
+        plan = self.compile()
+        if not plan.check(url):  # Sync rejection
+            self.stats._counters[2] += 1  # Sync rejected
+            return False
 
-        if tasks:
-            results = await asyncio.gather(*tasks)
+        if plan.async_filters:
+            results = await asyncio.gather(*(_async_verdict(f, url) for f in plan.async_filters))
 
             # Count how many filters rejected
             rejections = results.count(False)
@@ -115,6 +129,58 @@ class FilterChain:
         self.stats._counters[1] += 1  # Passed
         return True
 
+    async def apply_many(self, urls: Sequence[str], concurrency: int = None) -> List[bool]:
+        """
+        Apply the chain to a batch of URLs, returning one verdict per URL.
+
+        Sync filters run first over the whole batch, through the compiled plan; only the
+        survivors reach the async filters (e.g. ContentRelevanceFilter, SEOFilter), which
+        are evaluated concurrently, at most `concurrency` URLs at a time. Async verdicts are
+        cached per URL, so a link that appears on many pages is judged once.
+        """
+        plan = self.compile()
+        async_filters = plan.async_filters
+        counters = self.stats._counters
+        verdicts: Dict[str, bool] = {}
+        pending: List[str] = []
+
+        for url in urls:
+            if url in verdicts:
+                continue
+            counters[0] += 1
+            if not plan.check(url):
+                counters[2] += 1
+                verdicts[url] = False
+            elif not async_filters:
+                counters[1] += 1
+                verdicts[url] = True
+            elif url in self._async_verdicts:
+                passed = self._async_verdicts[url]
+                self._async_verdicts.move_to_end(url)
+                counters[1 if passed else 2] += 1
+                verdicts[url] = passed
+            else:
+                verdicts[url] = False
+                pending.append(url)
+
+        if pending:
+            semaphore = asyncio.Semaphore(concurrency or self.ASYNC_CONCURRENCY)
+
+            async def judge(url: str) -> bool:
+                async with semaphore:
+                    results = await asyncio.gather(*(_async_verdict(f, url) for f in async_filters))
+                counters[2] += results.count(False)
+                return all(results)
+
+            for url, passed in zip(pending, await asyncio.gather(*(judge(u) for u in pending))):
+                verdicts[url] = passed
+                counters[1] += passed
+                self._async_verdicts[url] = passed
+            while len(self._async_verdicts) > self.VERDICT_CACHE_SIZE:
+                self._async_verdicts.popitem(last=False)
+
+        return [verdicts[url] for url in urls]
+
 
 class URLPatternFilter(URLFilter):
     """Pattern filter balancing speed and completeness"""
@@ -127,6 +193,7 @@ class URLPatternFilter(URLFilter):
         "_simple_prefixes",
         "_domain_patterns",
         "_path_patterns",
+        "_path_literals",
         "_reverse",
     )
 
@@ -157,6 +224,8 @@ class URLPatternFilter(URLFilter):
         self._simple_prefixes = set()
         self._domain_patterns = []
         self._path_patterns = []
+        # Literal runs every match of the parallel _path_patterns entry must contain
+        self._path_literals = []
 
         for pattern in patterns:
             pattern_type = self._categorize_pattern(pattern)
@@ -190,6 +259,7 @@ class URLPatternFilter(URLFilter):
                 pattern.startswith("^") or pattern.endswith("$") or "\\d" in pattern
             ):
                 self._path_patterns.append(re.compile(pattern))
+                self._path_literals.append(())
                 return
         elif pattern_type == self.PATTERN_TYPES["SUFFIX"]:
             self._simple_suffixes.add(pattern[2:])
@@ -209,10 +279,15 @@ class URLPatternFilter(URLFilter):
                         lambda m: f'({"|".join(m.group(1).split(","))})',
                         pattern,
                     )
+                # Text inside [...] classes is not literal; only trust what precedes one
+                literals = tuple(run for run in re.split(r"[*?]", pattern.split("[", 1)[0]) if run)
                 pattern = fnmatch.translate(pattern)
+            else:
+                literals = ()
             self._path_patterns.append(
                 pattern if isinstance(pattern, Pattern) else re.compile(pattern)
             )
+            self._path_literals.append(literals)
 
     @lru_cache(maxsize=10000)
     def apply(self, url: str) -> bool:
@@ -531,15 +606,15 @@ class ContentRelevanceFilter(URLFilter):
         self.avgdl = avgdl  # Average document length (empirical value)
 
     async def apply(self, url: str) -> bool:
-        head_content = await HeadPeekr.peek_html(url)
-        if not head_content:
+        head = await HeadPeekr.peek(url)
+        if not head:
             self._update_stats(False)
             return False
 
         # Field extraction with weighting
         fields = {
-            "title": HeadPeekr.get_title(head_content) or "",
-            "meta": HeadPeekr.extract_meta_tags(head_content),
+            "title": head["title"] or "",
+            "meta": head["meta"],
         }
         doc_text = self._build_document(fields)
 
@@ -619,13 +694,14 @@ class SEOFilter(URLFilter):
         )
 
     async def apply(self, url: str) -> bool:
-        head_content = await HeadPeekr.peek_html(url)
-        if not head_content:
+        head = await HeadPeekr.peek(url)
+        if not head:
             self._update_stats(False)
             return False
 
-        meta = HeadPeekr.extract_meta_tags(head_content)
-        title = HeadPeekr.get_title(head_content) or ""
+        head_content = head["head"]
+        meta = head["meta"]
+        title = head["title"] or ""
         parsed_url = urlparse(url)
 
         scores = {
@@ -696,3 +772,265 @@ class SEOFilter(URLFilter):
             score *= 0.9  # Underscores vs hyphens
 
         return score
+
+
+# Matches that can't be folded into one alternation: backreferences, named groups, conditionals
+_UNMERGEABLE_REGEX = re.compile(r"\\[1-9]|\(\?P[<=]|\(\?\(")
+# Characters that may follow a URLPatternFilter prefix (the query is already stripped)
+_PREFIX_BOUNDARY = re.compile(r"[/#]")
+
+
+def _merge_patterns(patterns: List[Pattern]) -> List[Pattern]:
+    """Fold plain regexes into a single alternation; keep the rest as they are."""
+    default_flags = re.compile("").flags
+    mergeable, separate = [], []
+    for pattern in patterns:
+        if (
+            isinstance(pattern.pattern, str)
+            and pattern.flags == default_flags
+            and not _UNMERGEABLE_REGEX.search(pattern.pattern)
+        ):
+            mergeable.append(pattern)
+        else:
+            separate.append(pattern)
+    if len(mergeable) > 1:
+        try:
+            merged = re.compile("|".join(f"(?:{p.pattern})" for p in mergeable))
+            return [merged] + separate
+        except (re.error, RecursionError, OverflowError):
+            pass
+    return mergeable + separate
+
+
+class _PathMatcher:
+    """
+    URLPatternFilter's path patterns behind a substring index.
+
+    Every glob-derived pattern is filed under one gram of its literal text: the rarest
+    gram of the longest length it allows, up to MAX_GRAM characters. A URL then only
+    runs the regexes filed under grams it actually contains, found with one dict lookup
+    per position and gram length. Patterns without a usable literal always run.
+    """
+
+    __slots__ = ("_index", "_lengths", "_always")
+
+    # Below this many patterns a plain scan beats the index
+    INDEX_THRESHOLD = 16
+    MIN_GRAM = 3
+    MAX_GRAM = 8
+
+    def __init__(self, patterns: List[Pattern], literals: List[Tuple[str, ...]]):
+        index: Dict[str, List[Pattern]] = defaultdict(list)
+        always: List[Pattern] = []
+        if len(patterns) < self.INDEX_THRESHOLD:
+            always = list(patterns)
+        else:
+            grams = []
+            for runs in literals:
+                size = min(max(map(len, runs), default=0), self.MAX_GRAM)
+                grams.append(
+                    {run[i : i + size] for run in runs for i in range(len(run) - size + 1)}
+                    if size >= self.MIN_GRAM
+                    else set()
+                )
+            frequency = Counter(gram for pattern_grams in grams for gram in pattern_grams)
+            for pattern, pattern_grams in zip(patterns, grams):
+                if pattern_grams:
+                    index[min(sorted(pattern_grams), key=frequency.__getitem__)].append(pattern)
+                else:
+                    always.append(pattern)
+        self._index = {gram: _merge_patterns(bucket) for gram, bucket in index.items()}
+        self._lengths = sorted({len(gram) for gram in self._index}, reverse=True)
+        self._always = _merge_patterns(always)
+
+    def search(self, url: str) -> bool:
+        for pattern in self._always:
+            if pattern.search(url):
+                return True
+        index = self._index
+        for size in self._lengths:
+            for i in range(len(url) - size + 1):
+                bucket = index.get(url[i : i + size])
+                if bucket is not None:
+                    for pattern in bucket:
+                        if pattern.search(url):
+                            return True
+        return False
+
+
+# Returned by a step whose sync apply() handed back an awaitable instead of a verdict
+_AWAITABLE = object()
+
+
+class _PlanStep:
+    """One sync filter inside a CompiledFilterPlan, with its observed rejection rate."""
+
+    __slots__ = ("filter", "seen", "rejected")
+
+    def __init__(self, filter_: URLFilter):
+        self.filter = filter_
+        self.seen = 0
+        self.rejected = 0
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.rejected / self.seen if self.seen else 0.0
+
+    def check(self, url: str, base: str, host: str, ext: str) -> bool:
+        result = self.filter.apply(url)
+        if inspect.isawaitable(result):
+            # A sync apply() returning a coroutine (e.g. a wrapped async filter): not a
+            # verdict. Drop it unawaited; the plan moves the filter to the async path,
+            # which calls it again for this URL.
+            if inspect.iscoroutine(result):
+                result.close()
+            return _AWAITABLE
+        return result
+
+
+class _PatternStep(_PlanStep):
+    __slots__ = ("_suffixes", "_prefixes", "_max_prefix", "_domain_patterns", "_paths")
+
+    def __init__(self, filter_: URLPatternFilter):
+        super().__init__(filter_)
+        self._suffixes = frozenset(filter_._simple_suffixes)
+        self._prefixes = frozenset(filter_._simple_prefixes)
+        self._max_prefix = max(map(len, self._prefixes), default=0)
+        self._domain_patterns = tuple(filter_._domain_patterns)
+        self._paths = _PathMatcher(filter_._path_patterns, filter_._path_literals)
+
+    def _matches(self, url: str, base: str) -> bool:
+        if self._suffixes and base.rpartition("/")[2].rpartition(".")[2] in self._suffixes:
+            return True
+        for pattern in self._domain_patterns:
+            if pattern.match(url):
+                return True
+        prefixes = self._prefixes
+        if prefixes:
+            # A prefix matches only on a path boundary, so only those cut points are looked up
+            if base in prefixes:
+                return True
+            for boundary in _PREFIX_BOUNDARY.finditer(base, 0, self._max_prefix + 1):
+                if base[: boundary.start()] in prefixes:
+                    return True
+        return self._paths.search(url)
+
+    def check(self, url: str, base: str, host: str, ext: str) -> bool:
+        result = self._matches(url, base)
+        self.filter._update_stats(result)
+        return not result if self.filter._reverse else result
+
+
+class _DomainStep(_PlanStep):
+    __slots__ = ("_allowed", "_blocked")
+
+    def __init__(self, filter_: DomainFilter):
+        super().__init__(filter_)
+        self._allowed = filter_._allowed_domains
+        self._blocked = filter_._blocked_domains
+
+    @staticmethod
+    def _suffixes(host: str) -> List[str]:
+        # The host and everything after each dot: equality plus the subdomain rule
+        suffixes = [host]
+        i = host.find(".")
+        while i != -1:
+            suffixes.append(host[i + 1 :])
+            i = host.find(".", i + 1)
+        return suffixes
+
+    def check(self, url: str, base: str, host: str, ext: str) -> bool:
+        if self._blocked or self._allowed is not None:
+            suffixes = self._suffixes(host)
+            if self._blocked and not self._blocked.isdisjoint(suffixes):
+                self.filter._update_stats(False)
+                return False
+            if self._allowed is not None and self._allowed.isdisjoint(suffixes):
+                self.filter._update_stats(False)
+                return False
+        self.filter._update_stats(True)
+        return True
+
+
+class _ContentTypeStep(_PlanStep):
+    __slots__ = ()
+
+    def check(self, url: str, base: str, host: str, ext: str) -> bool:
+        result = not ext or ext in self.filter._ext_map
+        self.filter._update_stats(result)
+        return result
+
+
+class CompiledFilterPlan:
+    """
+    The sync filters of a FilterChain, compiled for bulk link admission.
+
+    Each URL is split once into its query-less base, host and extension, and the
+    built-in filters run as specialised matchers over those parts: host label suffixes
+    against hashed domain sets, extension sets, boundary-only prefix lookups and a
+    trigram index over path patterns. Other sync filters, including subclasses of the
+    built-ins, are called as they are; one whose apply() turns out to return an
+    awaitable moves to `async_filters` on first use. Every REORDER_INTERVAL URLs the
+    steps are re-sorted so that the ones rejecting the most URLs run first.
+    """
+
+    __slots__ = ("steps", "async_filters", "_need_host", "_need_ext", "_evaluated", "_next_reorder")
+
+    REORDER_INTERVAL = 4096
+
+    _STEPS = {
+        URLPatternFilter: _PatternStep,
+        DomainFilter: _DomainStep,
+        ContentTypeFilter: _ContentTypeStep,
+    }
+
+    def __init__(self, filters: Sequence[URLFilter]):
+        self.steps: List[_PlanStep] = []
+        self.async_filters: List[URLFilter] = []
+        self._need_host = False
+        self._need_ext = False
+        for f in filters:
+            if inspect.iscoroutinefunction(f.apply):
+                self.async_filters.append(f)
+                continue
+            step = self._STEPS.get(type(f), _PlanStep)
+            if step is _ContentTypeStep and not f._check_extension:
+                step = _PlanStep
+            self._need_host |= step is _DomainStep
+            self._need_ext |= step is _ContentTypeStep
+            self.steps.append(step(f))
+        self._evaluated = 0
+        self._next_reorder = self.REORDER_INTERVAL
+
+    def check(self, url: str) -> bool:
+        """Run the sync filters on one URL, stopping at the first rejection."""
+        self._evaluated += 1
+        if self._evaluated >= self._next_reorder:
+            self.reorder()
+        base = url.partition("?")[0]
+        host = ""
+        if self._need_host:
+            match = DomainFilter._DOMAIN_REGEX.search(url)
+            host = match.group(1).lower() if match else ""
+        ext = ContentTypeFilter._extract_extension.__wrapped__(url) if self._need_ext else ""
+        deferred = None
+        passed = True
+        for step in self.steps:
+            step.seen += 1
+            verdict = step.check(url, base, host, ext)
+            if verdict is _AWAITABLE:
+                deferred = (deferred or []) + [step]
+            elif not verdict:
+                step.rejected += 1
+                passed = False
+                break
+        if deferred:
+            for step in deferred:
+                self.steps.remove(step)
+                self.async_filters.append(step.filter)
+        return passed
+
+    def reorder(self):
+        """Put the steps with the highest observed rejection rate first."""
+        self.steps.sort(key=lambda step: step.rejection_rate, reverse=True)
+        self._next_reorder = self._evaluated + self.REORDER_INTERVAL
@@ -0,0 +1,616 @@
+# frontier.py
+"""
+Frontier stores for deep crawls.
+
+A frontier holds the URLs waiting to be crawled (a priority queue) and the set of
+URLs already seen, and can checkpoint both so an interrupted crawl resumes where it
+stopped. Seen URLs are kept as 64-bit xxh3 fingerprints rather than strings.
+
+* :class:`MemoryFrontier` - fingerprints in an open-addressing ``array('Q')`` hash
+  set (13-27 bytes per URL), heap in memory, checkpoints to a file (a JSON header
+  followed by the raw fingerprint and Bloom filter arrays; nothing is unpickled).
+* :class:`SQLiteFrontier` - fingerprints and the queue live in SQLite; only a bounded
+  heap of the best entries stays in memory and the rest spills to disk. A Bloom
+  filter answers most "never seen" lookups without touching the database, and a
+  checkpoint writes only the rows that changed since the previous one.
+
+Both are synchronous: every operation is a few microseconds of local work, and
+``link_discovery`` uses the seen set as a plain ``in``/``add`` container.
+"""
+
+import heapq
+import json
+import math
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+import xxhash
+
+# Heap entries: (priority, seq, depth, url, parent); lower (priority, seq) pops first
+_Entry = Tuple[float, int, int, str, Optional[str]]
+
+
+def url_fingerprint(url: str) -> int:
+    """64-bit fingerprint of a URL; never 0, which marks an empty hash-set slot."""
+    return xxhash.xxh3_64_intdigest(url.encode()) or 1
+
+
+class FrontierItem(NamedTuple):
+    url: str
+    parent: Optional[str]
+    depth: int
+    priority: float
+
+
+class BloomFilter:
+    """Bloom filter over URL fingerprints, using double hashing on the 64-bit value."""
+
+    __slots__ = ("size", "hashes", "bits")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    @classmethod
+    def frombytes(cls, size: int, hashes: int, bits: bytes) -> "BloomFilter":
+        bloom = cls.__new__(cls)
+        bloom.size, bloom.hashes, bloom.bits = size, hashes, bytearray(bits)
+        return bloom
+
+    def _positions(self, fp: int) -> Iterator[int]:
+        h1, h2 = fp & 0xFFFFFFFF, (fp >> 32) | 1
+        size = self.size
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % size
+
+    def add_fingerprint(self, fp: int) -> None:
+        bits = self.bits
+        for pos in self._positions(fp):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def has_fingerprint(self, fp: int) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fp))
+
+    def add(self, url: str) -> None:
+        self.add_fingerprint(url_fingerprint(url))
+
+    def __contains__(self, url: str) -> bool:
+        return self.has_fingerprint(url_fingerprint(url))
+
+
+class FingerprintSet:
+    """Open-addressing (linear probing) hash set of URL fingerprints in a flat array."""
+
+    MAX_LOAD = 0.6
+
+    def __init__(self, capacity: int = 1024):
+        size = 1 << max(4, int(capacity / self.MAX_LOAD).bit_length())
+        self._table = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        self._len = 0
+
+    def _slot(self, fp: int) -> int:
+        table, mask = self._table, self._mask
+        i = fp & mask
+        while True:
+            value = table[i]
+            if value == 0 or value == fp:
+                return i
+            i = (i + 1) & mask
+
+    def add_fingerprint(self, fp: int) -> bool:
+        """Add a fingerprint; returns False if it was already present."""
+        i = self._slot(fp)
+        if self._table[i]:
+            return False
+        self._table[i] = fp
+        self._len += 1
+        if self._len > self.MAX_LOAD * (self._mask + 1):
+            self._grow()
+        return True
+
+    def has_fingerprint(self, fp: int) -> bool:
+        return self._table[self._slot(fp)] != 0
+
+    def _grow(self) -> None:
+        old = self._table
+        size = 2 * (self._mask + 1)
+        self._table = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        for fp in old:
+            if fp:
+                self._table[self._slot(fp)] = fp
+
+    def add(self, url: str) -> None:
+        self.add_fingerprint(url_fingerprint(url))
+
+    def __contains__(self, url: str) -> bool:
+        return self.has_fingerprint(url_fingerprint(url))
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._table) * self._table.itemsize
+
+    def tobytes(self) -> bytes:
+        return self._table.tobytes()
+
+    @classmethod
+    def frombytes(cls, table: bytes, length: int) -> "FingerprintSet":
+        fingerprints = cls.__new__(cls)
+        fingerprints._table = array("Q")
+        fingerprints._table.frombytes(table)
+        fingerprints._mask = len(fingerprints._table) - 1
+        fingerprints._len = length
+        return fingerprints
+
+
+class URLFrontier(ABC):
+    """
+    Priority queue of URLs to crawl plus the set of URLs already seen.
+
+    ``push`` marks the URL as seen; strategies check ``url in frontier.seen`` (or pass
+    ``frontier.seen`` as the visited set to ``link_discovery``) before pushing. Popped
+    items stay "in flight" until ``done`` (or ``requeue``), and a checkpoint stores them
+    as queued, so pages that were being crawled when the process died are retried.
+    ``meta`` is a small JSON-able dict saved with each checkpoint (strategies keep
+    their page count there). Every ``checkpoint_every`` completed pages a checkpoint
+    is taken automatically.
+    """
+
+    def __init__(self, checkpoint_every: int = 0):
+        self.checkpoint_every = checkpoint_every
+        self.meta: Dict[str, Any] = {}
+        # Pop the most recently pushed entry among equal priorities (DFS)
+        self.lifo = False
+        self.resumed = False
+        self._seq = 0
+        self._inflight: Dict[str, _Entry] = {}
+        self._since_checkpoint = 0
+
+    @property
+    @abstractmethod
+    def seen(self):
+        """Set-like view (``in``, ``add``, ``len``) of the URLs seen so far."""
+
+    @abstractmethod
+    def _push(self, entry: _Entry) -> None:
+        pass
+
+    @abstractmethod
+    def _pop(self) -> Optional[_Entry]:
+        pass
+
+    @abstractmethod
+    def _queued(self) -> int:
+        pass
+
+    @abstractmethod
+    def _rescore(self, priority: Callable[[str], float], limit: int) -> int:
+        pass
+
+    @abstractmethod
+    def checkpoint(self) -> None:
+        """Persist the queue, in-flight items, seen set and ``meta``."""
+
+    def close(self) -> None:
+        self.checkpoint()
+
+    def push(self, url: str, parent: Optional[str] = None, depth: int = 0, priority: float = 0.0) -> None:
+        self.seen.add(url)
+        self._seq += 1
+        self._push((priority, -self._seq if self.lifo else self._seq, depth, url, parent))
+
+    def pop(self) -> Optional[FrontierItem]:
+        entry = self._pop()
+        if entry is None:
+            return None
+        priority, _, depth, url, parent = entry
+        self._inflight[url] = entry
+        return FrontierItem(url, parent, depth, priority)
+
+    def requeue(self, item: FrontierItem, priority: Optional[float] = None) -> None:
+        """Put an in-flight item back (e.g. deferred under memory pressure), optionally re-prioritized."""
+        entry = self._inflight.pop(item.url, None)
+        if entry is not None:
+            if priority is not None:
+                entry = (priority,) + entry[1:]
+            self._push(entry)
+
+    def rescore(self, priority: Callable[[str], float], limit: int) -> int:
+        """
+        Move up queued entries whose current ``priority(url)`` is better than the one
+        they were queued with. Each call looks at up to ``limit`` entries, continuing
+        where the previous call stopped, so repeated calls cycle through the whole
+        queue. Entries whose priority got worse keep it. Returns how many moved.
+        """
+        return self._rescore(priority, limit) if limit > 0 else 0
+
+    def done(self, url: str) -> None:
+        """Mark an in-flight URL as finished."""
+        self._inflight.pop(url, None)
+        self._since_checkpoint += 1
+        if self.checkpoint_every and self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def __len__(self) -> int:
+        return self._queued()
+
+    def __bool__(self) -> bool:
+        return self._queued() > 0
+
+
+def _rescore_heap(heap: List[_Entry], start: int, limit: int, priority: Callable[[str], float]) -> Tuple[int, int]:
+    """Rescore heap[start:start + limit] in place; returns (entries moved up, next start)."""
+    if start >= len(heap):
+        start = 0
+    end = min(start + limit, len(heap))
+    improved = []
+    for i in range(start, end):
+        entry = heap[i]
+        current = priority(entry[3])
+        if current < entry[0]:
+            improved.append(i)
+            heap[i] = (current,) + entry[1:]
+    if improved:
+        heapq.heapify(heap)
+    return len(improved), end
+
+
+class _MemorySeen:
+    __slots__ = ("fingerprints", "bloom")
+
+    def __init__(self, bloom: Optional[BloomFilter]):
+        self.fingerprints = FingerprintSet()
+        self.bloom = bloom
+
+    def __contains__(self, url: str) -> bool:
+        fp = url_fingerprint(url)
+        if self.bloom is not None and not self.bloom.has_fingerprint(fp):
+            return False
+        return self.fingerprints.has_fingerprint(fp)
+
+    def add(self, url: str) -> None:
+        fp = url_fingerprint(url)
+        if self.bloom is not None:
+            self.bloom.add_fingerprint(fp)
+        self.fingerprints.add_fingerprint(fp)
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+
+class MemoryFrontier(URLFrontier):
+    """
+    In-memory frontier with a compact seen set.
+
+    Args:
+        bloom_capacity: Put a Bloom filter sized for this many URLs in front of the
+            fingerprint set (None disables it).
+        checkpoint_path: File the checkpoint is written to (atomically replaced). It
+            holds JSON and raw arrays only, so loading one never runs code.
+        checkpoint_every: Checkpoint after this many completed pages (0 = only on close).
+        resume: Load ``checkpoint_path`` if it exists.
+    """
+
+    def __init__(
+        self,
+        bloom_capacity: Optional[int] = None,
+        bloom_error_rate: float = 0.001,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        checkpoint_every: int = 0,
+        resume: bool = False,
+    ):
+        super().__init__(checkpoint_every)
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self._seen = _MemorySeen(BloomFilter(bloom_capacity, bloom_error_rate) if bloom_capacity else None)
+        self._heap: List[_Entry] = []
+        self._rescore_at = 0
+        if resume and self.checkpoint_path and self.checkpoint_path.exists():
+            self._load()
+
+    @property
+    def seen(self) -> _MemorySeen:
+        return self._seen
+
+    def _push(self, entry: _Entry) -> None:
+        heapq.heappush(self._heap, entry)
+
+    def _pop(self) -> Optional[_Entry]:
+        return heapq.heappop(self._heap) if self._heap else None
+
+    def _queued(self) -> int:
+        return len(self._heap)
+
+    def _rescore(self, priority: Callable[[str], float], limit: int) -> int:
+        moved, self._rescore_at = _rescore_heap(self._heap, self._rescore_at, limit, priority)
+        return moved
+
+    def checkpoint(self) -> None:
+        self._since_checkpoint = 0
+        if self.checkpoint_path is None:
+            return
+        fingerprints = self._seen.fingerprints.tobytes()
+        bloom = self._seen.bloom
+        header = {
+            "queue": self._heap + list(self._inflight.values()),
+            "seen": len(self._seen),
+            "table_bytes": len(fingerprints),
+            "bloom": [bloom.size, bloom.hashes] if bloom is not None else None,
+            "seq": self._seq,
+            "meta": self.meta,
+        }
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            f.write(fingerprints)
+            if bloom is not None:
+                f.write(bloom.bits)
+        os.replace(tmp, self.checkpoint_path)
+
+    def _load(self) -> None:
+        with open(self.checkpoint_path, "rb") as f:
+            header = json.loads(f.readline())
+            fingerprints = FingerprintSet.frombytes(f.read(header["table_bytes"]), header["seen"])
+            bits = f.read()
+        bloom = BloomFilter.frombytes(*header["bloom"], bits) if header["bloom"] else None
+        self._seen = _MemorySeen(bloom)
+        self._seen.fingerprints = fingerprints
+        self._seq = header["seq"]
+        self.meta = header["meta"]
+        self._heap = [tuple(entry) for entry in header["queue"]]
+        heapq.heapify(self._heap)
+        self.resumed = bool(self._heap)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (fp INTEGER PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS queue (
+    priority REAL NOT NULL,
+    seq INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    parent TEXT,
+    PRIMARY KEY (priority, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS heap (
+    priority REAL NOT NULL,
+    seq INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    parent TEXT,
+    PRIMARY KEY (priority, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS inflight (
+    priority REAL NOT NULL,
+    seq INTEGER NOT NULL,
+    depth INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    parent TEXT
+);
+CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def _signed(fp: int) -> int:
+    # SQLite integers are signed 64-bit
+    return fp - (1 << 64) if fp >= (1 << 63) else fp
+
+
+class _SQLiteSeen:
+    FLUSH_SIZE = 1000
+
+    def __init__(self, conn: sqlite3.Connection, bloom: Optional[BloomFilter]):
+        self._conn = conn
+        self.bloom = bloom
+        self._pending: set = set()
+        self._len = conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        if bloom is not None:
+            for (fp,) in conn.execute("SELECT fp FROM seen"):
+                bloom.add_fingerprint(fp & 0xFFFFFFFFFFFFFFFF)
+
+    def __contains__(self, url: str) -> bool:
+        fp = url_fingerprint(url)
+        if fp in self._pending:
+            return True
+        if self.bloom is not None and not self.bloom.has_fingerprint(fp):
+            return False
+        return self._conn.execute("SELECT 1 FROM seen WHERE fp = ?", (_signed(fp),)).fetchone() is not None
+
+    def add(self, url: str) -> None:
+        if url in self:
+            return
+        fp = url_fingerprint(url)
+        self._pending.add(fp)
+        self._len += 1
+        if self.bloom is not None:
+            self.bloom.add_fingerprint(fp)
+        if len(self._pending) >= self.FLUSH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen (fp) VALUES (?)", [(_signed(fp),) for fp in self._pending])
+            self._pending.clear()
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class SQLiteFrontier(URLFrontier):
+    """
+    Disk-backed frontier for crawls larger than memory.
+
+    Only the ``heap_size`` best queue entries are kept in memory; when the heap
+    overflows, its worse half is spilled to the ``queue`` table and read back in
+    priority order once the in-memory entries are no longer the best. Changes are
+    committed at checkpoints only, so after a crash the database is exactly the last
+    checkpoint. The ``heap`` table mirrors the in-memory heap as of that checkpoint,
+    so a checkpoint only writes the entries that entered or left the heap since the
+    previous one rather than the whole heap.
+
+    Args:
+        path: SQLite database file.
+        heap_size: Queue entries kept in memory.
+        bloom_capacity: Size of the Bloom prefilter for seen-URL lookups (None disables it).
+        checkpoint_every: Checkpoint after this many completed pages (0 = only on close).
+        resume: Continue from the state in ``path``; otherwise it is cleared.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        heap_size: int = 50_000,
+        bloom_capacity: Optional[int] = 1_000_000,
+        bloom_error_rate: float = 0.001,
+        checkpoint_every: int = 1000,
+        resume: bool = False,
+    ):
+        super().__init__(checkpoint_every)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.heap_size = max(2, heap_size)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        if not resume:
+            self._conn.executescript(
+                "DELETE FROM seen; DELETE FROM queue; DELETE FROM heap; DELETE FROM inflight; DELETE FROM state;")
+        self._conn.commit()
+
+        self._heap: List[_Entry] = []
+        # (priority, seq) of the heap entries stored in the heap table
+        self._saved: Set[Tuple[float, int]] = set()
+        # The heap as of the last checkpoint, and the entries that were in flight
+        # then (they are crawled again), go back to the queue
+        for table in ("heap", "inflight"):
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO queue SELECT priority, seq, depth, url, parent FROM {table}")
+            self._conn.execute(f"DELETE FROM {table}")
+        self._conn.commit()
+        row = self._conn.execute("SELECT value FROM state WHERE key = 'state'").fetchone()
+        if row:
+            state = json.loads(row[0])
+            self._seq = state["seq"]
+            self.meta = state["meta"]
+        self._disk_count = self._conn.execute("SELECT COUNT(*) FROM queue").fetchone()[0]
+        self._disk_min = self._read_disk_min()
+        self.resumed = self._disk_count > 0
+        # Where the next rescore continues: heap position and (priority, seq) on disk
+        self._rescore_at = 0
+        self._rescore_key: Tuple[float, int] = (-math.inf, 0)
+        self._seen = _SQLiteSeen(
+            self._conn, BloomFilter(bloom_capacity, bloom_error_rate) if bloom_capacity else None)
+
+    @property
+    def seen(self) -> _SQLiteSeen:
+        return self._seen
+
+    def _read_disk_min(self) -> Optional[Tuple[float, int]]:
+        row = self._conn.execute("SELECT priority, seq FROM queue ORDER BY priority, seq LIMIT 1").fetchone()
+        return tuple(row) if row else None
+
+    def _push(self, entry: _Entry) -> None:
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > self.heap_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        self._heap.sort()
+        keep = self.heap_size // 2
+        spilled = self._heap[keep:]
+        del self._heap[keep:]  # A sorted list is a valid heap
+        self._write_queue(spilled)
+
+    def _write_queue(self, entries: List[_Entry]) -> None:
+        if not entries:
+            return
+        self._conn.executemany("INSERT OR REPLACE INTO queue VALUES (?, ?, ?, ?, ?)", entries)
+        self._disk_count += len(entries)
+        first = min(entry[:2] for entry in entries)
+        if self._disk_min is None or first < self._disk_min:
+            self._disk_min = first
+
+    def _refill(self) -> None:
+        rows = self._conn.execute(
+            "SELECT priority, seq, depth, url, parent FROM queue ORDER BY priority, seq LIMIT ?",
+            (self.heap_size // 2,),
+        ).fetchall()
+        if not rows:
+            self._disk_count = 0
+            self._disk_min = None
+            return
+        last = rows[-1]
+        self._conn.execute("DELETE FROM queue WHERE (priority, seq) <= (?, ?)", (last[0], last[1]))
+        self._disk_count -= len(rows)
+        for row in rows:
+            heapq.heappush(self._heap, tuple(row))
+        self._disk_min = self._read_disk_min()
+
+    def _pop(self) -> Optional[_Entry]:
+        if self._disk_count and (not self._heap or self._disk_min < self._heap[0][:2]):
+            self._refill()
+        return heapq.heappop(self._heap) if self._heap else None
+
+    def _queued(self) -> int:
+        return len(self._heap) + self._disk_count
+
+    def _rescore(self, priority: Callable[[str], float], limit: int) -> int:
+        moved, self._rescore_at = _rescore_heap(self._heap, self._rescore_at, limit // 2, priority)
+        rows = self._conn.execute(
+            "SELECT priority, seq, depth, url, parent FROM queue WHERE (priority, seq) > (?, ?) "
+            "ORDER BY priority, seq LIMIT ?",
+            (*self._rescore_key, limit - limit // 2),
+        ).fetchall()
+        # Past the worst entry on disk the next call starts over from the best
+        self._rescore_key = tuple(rows[-1][:2]) if rows else (-math.inf, 0)
+        stale, improved = [], []
+        for row in rows:
+            current = priority(row[3])
+            if current < row[0]:
+                stale.append(row[:2])
+                improved.append((current,) + tuple(row[1:]))
+        if improved:
+            self._conn.executemany("DELETE FROM queue WHERE priority = ? AND seq = ?", stale)
+            self._disk_count -= len(stale)
+            self._write_queue(improved)
+        return moved + len(improved)
+
+    def checkpoint(self) -> None:
+        self._since_checkpoint = 0
+        self._seen.flush()
+        # Bring the heap table in line with the in-memory heap so the database alone
+        # describes the crawl; entries unchanged since the last checkpoint stay put
+        keys = {entry[:2] for entry in self._heap}
+        self._conn.executemany("DELETE FROM heap WHERE priority = ? AND seq = ?", self._saved - keys)
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO heap VALUES (?, ?, ?, ?, ?)",
+            [entry for entry in self._heap if entry[:2] not in self._saved])
+        self._saved = keys
+        self._conn.execute("DELETE FROM inflight")
+        self._conn.executemany("INSERT INTO inflight VALUES (?, ?, ?, ?, ?)", list(self._inflight.values()))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES ('state', ?)",
+            (json.dumps({"seq": self._seq, "meta": self.meta}),),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self.checkpoint()
+        self._conn.close()
@@ -0,0 +1,193 @@
+# scheduler.py
+"""
+Continuous scheduling for deep crawls.
+
+The strategies used to hand one level (or one batch) at a time to ``arun_many`` and
+wait for all of it before looking at the links it produced, so every level ended
+with a tail where most slots sat idle behind the slowest page. :class:`CrawlScheduler`
+instead keeps up to ``max_concurrency`` crawls in flight and refills a slot from the
+strategy's frontier the moment one finishes; the strategy processes each result
+(link discovery pushes into the frontier) before the scheduler refills, so new links
+are eligible while the rest of their level is still loading.
+
+Crawls still go through the dispatcher's ``crawl_url``, so rate limiting, robots.txt
+crawl delays, monitoring and memory-pressure gating keep working.
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..models import CrawlerTaskResult, DispatchResult
+from ..types import AsyncWebCrawler, CrawlerRunConfig
+
+# pop() returns (url, payload) or None when nothing is ready; payload is opaque to us
+PopFn = Callable[[], Optional[Tuple[str, Any]]]
+PushBackFn = Callable[[str, Any], None]
+# more() waits until pop() may have work again; False once nothing more will come
+MoreFn = Callable[[], Awaitable[bool]]
+
+
+def default_dispatcher():
+    """The dispatcher ``arun_many`` uses when none is given."""
+    from ..async_dispatcher import MemoryAdaptiveDispatcher, RateLimiter
+
+    return MemoryAdaptiveDispatcher(
+        rate_limiter=RateLimiter(base_delay=(1.0, 3.0), max_delay=60.0, max_retries=3),
+    )
+
+
+class CrawlScheduler:
+    """
+    Drives a dispatcher one URL at a time, keeping its slots busy.
+
+    ``stats`` reports slot utilization (busy slot-seconds over available slot-seconds)
+    for the last run.
+    """
+
+    def __init__(
+        self,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+        dispatcher=None,
+        max_concurrency: Optional[int] = None,
+    ):
+        self.crawler = crawler
+        self.config = config
+        self.dispatcher = dispatcher or default_dispatcher()
+        self.max_concurrency = max(
+            1, max_concurrency or getattr(self.dispatcher, "max_session_permit", 20)
+        )
+        self.stats: Dict[str, float] = {}
+
+    async def _crawl(self, url: str, semaphore: Optional[asyncio.Semaphore]) -> CrawlerTaskResult:
+        from ..async_dispatcher import SemaphoreDispatcher
+
+        task_id = str(uuid.uuid4())
+        monitor = self.dispatcher.monitor
+        if monitor:
+            monitor.add_task(task_id, url)
+        if isinstance(self.dispatcher, SemaphoreDispatcher):
+            return await self.dispatcher.crawl_url(url, self.config, task_id, semaphore=semaphore)
+        return await self.dispatcher.crawl_url(url, self.config, task_id)
+
+    @staticmethod
+    def _is_requeued(task_result: CrawlerTaskResult) -> bool:
+        return (task_result.result.metadata or {}).get("status") == "requeued"
+
+    def _drain_dispatcher_queue(self) -> None:
+        # MemoryAdaptiveDispatcher parks requeued URLs in its own queue; we own retries
+        # here, so drop them rather than leave them for a later run_urls call.
+        queue = getattr(self.dispatcher, "task_queue", None)
+        while queue is not None and not queue.empty():
+            queue.get_nowait()
+
+    async def stream(
+        self,
+        pop: PopFn,
+        push_back: PushBackFn,
+        should_stop: Callable[[], bool] = lambda: False,
+        more: Optional[MoreFn] = None,
+    ) -> AsyncGenerator[Tuple[Any, Any], None]:
+        """
+        Crawl URLs from ``pop`` until it is exhausted and nothing is in flight, yielding
+        ``(CrawlResult, payload)`` as each crawl finishes. ``pop`` is called again after
+        every yielded result, so it may return URLs the consumer pushed meanwhile.
+        ``push_back`` receives URLs the dispatcher deferred under memory pressure.
+
+        For sources that produce URLs on their own (not only from crawl results),
+        ``more`` is awaited alongside the running crawls whenever ``pop`` comes up
+        empty with a slot free; free slots are refilled as soon as it returns, and the
+        run ends once it has returned False and nothing is in flight.
+        """
+        dispatcher = self.dispatcher
+        dispatcher.crawler = self.crawler
+        semaphore = asyncio.Semaphore(getattr(dispatcher, "semaphore_count", self.max_concurrency))
+        memory_monitor = None
+        if hasattr(dispatcher, "_memory_monitor_task"):
+            memory_monitor = asyncio.create_task(dispatcher._memory_monitor_task())
+        if dispatcher.monitor:
+            dispatcher.monitor.start()
+
+        active: Dict[asyncio.Task, Tuple[str, Any, float]] = {}
+        waiter: Optional[asyncio.Future] = None
+        source_open = more is not None
+        started = time.perf_counter()
+        busy = 0.0
+        dispatched = 0
+        try:
+            while True:
+                if memory_monitor is not None and memory_monitor.done():
+                    exc = memory_monitor.exception()
+                    if exc:
+                        raise exc
+                throttled = getattr(dispatcher, "memory_pressure_mode", False)
+                while len(active) < self.max_concurrency and not throttled and not should_stop():
+                    item = pop()
+                    if item is None:
+                        break
+                    url, payload = item
+                    task = asyncio.create_task(self._crawl(url, semaphore))
+                    active[task] = (url, payload, time.perf_counter())
+                    dispatched += 1
+
+                if (
+                    source_open and waiter is None and not should_stop()
+                    and len(active) < self.max_concurrency and not throttled
+                ):
+                    waiter = asyncio.ensure_future(more())
+
+                if not active and waiter is None:
+                    if throttled and not should_stop():
+                        # Frontier may still hold work; wait for memory to recover
+                        await asyncio.sleep(getattr(dispatcher, "check_interval", 1.0))
+                        continue
+                    break
+
+                waiting = set(active)
+                if waiter is not None:
+                    waiting.add(waiter)
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                if waiter in done:
+                    done.discard(waiter)
+                    source_open = waiter.result()
+                    waiter = None
+                for task in done:
+                    url, payload, task_start = active.pop(task)
+                    busy += time.perf_counter() - task_start
+                    task_result = task.result()
+                    if self._is_requeued(task_result):
+                        self._drain_dispatcher_queue()
+                        push_back(url, payload)
+                        continue
+                    result = task_result.result
+                    result.dispatch_result = DispatchResult(
+                        task_id=task_result.task_id,
+                        memory_usage=task_result.memory_usage,
+                        peak_memory=task_result.peak_memory,
+                        start_time=task_result.start_time,
+                        end_time=task_result.end_time,
+                        error_message=task_result.error_message,
+                    )
+                    yield result, payload
+        finally:
+            if waiter is not None:
+                waiter.cancel()
+                await asyncio.gather(waiter, return_exceptions=True)
+            for task in active:
+                task.cancel()
+            if active:
+                await asyncio.gather(*active, return_exceptions=True)
+            if memory_monitor is not None:
+                memory_monitor.cancel()
+            if dispatcher.monitor:
+                dispatcher.monitor.stop()
+            wall = time.perf_counter() - started
+            self.stats = {
+                "slots": self.max_concurrency,
+                "dispatched": dispatched,
+                "busy_time": busy,
+                "wall_time": wall,
+                "utilization": busy / (wall * self.max_concurrency) if wall > 0 else 0.0,
+            }
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 from urllib.parse import urlparse, unquote
 import re
@@ -8,6 +8,7 @@ from functools import lru_cache
 from array import array
 import ctypes
 import platform
+import numpy as np
 PLATFORM = platform.system()
 
 # Pre-computed scores for common year differences
@@ -23,6 +24,99 @@ _FRESHNESS_SCORES = [
    0.5,    # 5 years ago
 ]
 
+# Dates in URLs: /2024, -2024-05, _2024_05_01, ... (see FreshnessScorer)
+_DATE_PATTERN = re.compile(
+    r'(?:/'  # Path separator
+    r'|[-_])'  # or date separators
+    r'((?:19|20)\d{2})'  # Year group (1900-2099)
+    r'(?:'  # Optional month/day group
+    r'(?:/|[-_])'  # Date separator  
+    r'(?:\d{2})'  # Month
+    r'(?:'  # Optional day
+    r'(?:/|[-_])'  # Date separator
+    r'(?:\d{2})'  # Day
+    r')?'  # Day is optional
+    r')?'  # Month/day group is optional
+)
+
+# Leading run of alphanumerics, i.e. str.isalnum() characters
+_ALNUM_RUN = re.compile(r'[^\W_]*')
+
+
+class ParsedURLs:
+    """A batch of URLs tokenized once for score_many().
+
+    Each column is computed on first access and shared by every scorer that
+    reads it, so a CompositeScorer parses a URL once however many scorers it
+    combines. Columns follow the per-URL helpers of the scorers using them.
+    """
+
+    __slots__ = ('urls', '_lower', '_depths', '_extensions', '_domains', '_years')
+
+    def __init__(self, urls: Sequence[str]):
+        self.urls = list(urls)
+        self._lower = None
+        self._depths = None
+        self._extensions = None
+        self._domains = None
+        self._years = None
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    @property
+    def lower(self) -> List[str]:
+        if self._lower is None:
+            self._lower = [url.lower() for url in self.urls]
+        return self._lower
+
+    @property
+    def depths(self) -> np.ndarray:
+        """Non-empty path segments, as PathDepthScorer counts them."""
+        if self._depths is None:
+            # Everything after the first '/' past the scheme; no '/' leaves [''], depth 0
+            paths = [url[url.find('://') + 3:].partition('/')[2].split('/') for url in self.urls]
+            self._depths = np.array([len(parts) - parts.count('') for parts in paths], dtype=np.int64)
+        return self._depths
+
+    @property
+    def extensions(self) -> List[str]:
+        """Lowercase extension after the last dot (ContentTypeScorer._quick_extension)."""
+        if self._extensions is None:
+            extensions = []
+            for url in self.urls:
+                pos = url.rfind('.')
+                extensions.append('' if pos == -1 else _ALNUM_RUN.match(url, pos + 1).group().lower())
+            self._extensions = extensions
+        return self._extensions
+
+    @property
+    def domains(self) -> List[str]:
+        """Lowercase host without port (DomainAuthorityScorer._extract_domain)."""
+        if self._domains is None:
+            self._domains = [DomainAuthorityScorer._extract_domain.__wrapped__(url) for url in self.urls]
+        return self._domains
+
+    @property
+    def years(self) -> List[Tuple[int, ...]]:
+        """Every year matched by the date pattern, in URL order."""
+        if self._years is None:
+            findall = _DATE_PATTERN.findall
+            self._years = [tuple(map(int, findall(url))) for url in self.urls]
+        return self._years
+
+
+@lru_cache(maxsize=None)
+def _batch_is_stale(cls: type) -> bool:
+    """Whether cls overrides _calculate_score below the class that vectorised it."""
+    for klass in cls.__mro__:
+        if '_calculate_scores' in vars(klass):
+            return False
+        if '_calculate_score' in vars(klass):
+            return True
+    return False
+
+
 class ScoringStats:
     __slots__ = ('_urls_scored', '_total_score', '_min_score', '_max_score')
     
@@ -44,6 +138,17 @@ class ScoringStats:
         if self._max_score is not None:
             if score > self._max_score:
                 self._max_score = score
+
+    def update_many(self, scores: np.ndarray) -> None:
+        """Batch update from an array of scores"""
+        if not len(scores):
+            return
+        self._urls_scored += len(scores)
+        self._total_score += float(scores.sum())
+        if self._min_score is not None:
+            self._min_score = min(self._min_score, float(scores.min()))
+        if self._max_score is not None:
+            self._max_score = max(self._max_score, float(scores.max()))
                 
     def get_average(self) -> float:
         """Direct calculation instead of property"""
@@ -78,6 +183,30 @@ class URLScorer(ABC):
         score = self._calculate_score(url) * self._weight
         self._stats.update(score)
         return score
+
+    def _calculate_scores(self, parsed: ParsedURLs) -> np.ndarray:
+        """Raw scores for a batch; scorers override this with array operations."""
+        calculate = self._calculate_score
+        return np.fromiter((calculate(url) for url in parsed.urls), dtype=np.float64, count=len(parsed))
+
+    def score_many(self, urls: Union[Sequence[str], ParsedURLs]) -> np.ndarray:
+        """Score a batch of URLs (e.g. every link admitted from one page).
+
+        Equivalent to calling score() on each URL, but the URLs are parsed
+        once and each scorer works on whole columns.
+        """
+        parsed = urls if isinstance(urls, ParsedURLs) else ParsedURLs(urls)
+        if type(self).score is not URLScorer.score:
+            # Subclass customised score(); keep its semantics
+            return np.fromiter((self.score(url) for url in parsed.urls), dtype=np.float64, count=len(parsed))
+        if _batch_is_stale(type(self)):
+            # Subclass customised _calculate_score(); the inherited batch version would ignore it
+            scores = URLScorer._calculate_scores(self, parsed)
+        else:
+            scores = self._calculate_scores(parsed)
+        scores = scores * self._weight
+        self._stats.update_many(scores)
+        return scores
     
     @property
     def stats(self):
@@ -157,6 +286,23 @@ class CompositeScorer(URLScorer):
         self.stats.update(score)
         return score
 
+    def _calculate_scores(self, parsed: ParsedURLs) -> np.ndarray:
+        """Combined scores for a batch; every sub-scorer reads the same parsed columns."""
+        total = np.zeros(len(parsed))
+        for scorer in self._scorers:
+            # Round through float32 like the per-URL score array does
+            total += scorer.score_many(parsed).astype(np.float32)
+        if self._normalize and self._scorers:
+            return total / len(self._scorers)
+        return total
+
+    def score_many(self, urls: Union[Sequence[str], ParsedURLs]) -> np.ndarray:
+        """Batch scoring; the composite score is not re-weighted."""
+        parsed = urls if isinstance(urls, ParsedURLs) else ParsedURLs(urls)
+        scores = self._calculate_scores(parsed)
+        self._stats.update_many(scores)
+        return scores
+
 class KeywordRelevanceScorer(URLScorer):
     __slots__ = ('_weight', '_stats', '_keywords', '_case_sensitive')
     
@@ -187,6 +333,15 @@ class KeywordRelevanceScorer(URLScorer):
             
         return matches / len(self._keywords)
 
+    def _calculate_scores(self, parsed: ParsedURLs) -> np.ndarray:
+        texts = parsed.urls if self._case_sensitive else parsed.lower
+        matches = np.zeros(len(parsed))
+        if not self._keywords:
+            return matches
+        for keyword in self._keywords:
+            matches += np.fromiter((keyword in text for text in texts), dtype=bool, count=len(texts))
+        return matches / len(self._keywords)
+
 class PathDepthScorer(URLScorer):
     __slots__ = ('_weight', '_stats', '_optimal_depth')  # Remove _url_cache
     
@@ -244,6 +399,10 @@ class PathDepthScorer(URLScorer):
             
         return 1.0 / (1.0 + distance)                                             
 
+    def _calculate_scores(self, parsed: ParsedURLs) -> np.ndarray:
+        # _SCORE_LOOKUP[d] is 1 / (1 + d) as well
+        return 1.0 / (1.0 + np.abs(parsed.depths - self._optimal_depth))
+
 class ContentTypeScorer(URLScorer):
     __slots__ = ('_weight', '_exact_types', '_regex_types')
 
@@ -323,12 +482,23 @@ class ContentTypeScorer(URLScorer):
                 return score
                 
         # Slow path: regex patterns
+        return self._regex_score(url)
+
+    def _regex_score(self, url: str) -> float:
         for pattern, score in self._regex_types:
             if pattern.search(url):
                 return score
-
         return 0.0
 
+    def _calculate_scores(self, parsed: ParsedURLs) -> np.ndarray:
+        exact = self._exact_types
+        regex_score = self._regex_score
+        scores = []
+        for url, ext in zip(parsed.urls, parsed.extensions):
+            score = exact.get(ext) if ext else None
+            scores.append(regex_score(url) if score is None else score)
+        return np.array(scores, dtype=np.float64)
+
 class FreshnessScorer(URLScorer):
     __slots__ = ('_weight', '_date_pattern', '_current_year')
 
@@ -349,20 +519,7 @@ class FreshnessScorer(URLScorer):
         self._current_year = current_year
         
         # Combined pattern for all date formats
-        # Uses non-capturing groups (?:) and alternation
-        self._date_pattern = re.compile(
-            r'(?:/'  # Path separator
-            r'|[-_])'  # or date separators
-            r'((?:19|20)\d{2})'  # Year group (1900-2099)
-            r'(?:'  # Optional month/day group
-            r'(?:/|[-_])'  # Date separator  
-            r'(?:\d{2})'  # Month
-            r'(?:'  # Optional day
-            r'(?:/|[-_])'  # Date separator
-            r'(?:\d{2})'  # Day
-            r')?'  # Day is optional
-            r')?'  # Month/day group is optional
-        )
+        self._date_pattern = _DATE_PATTERN
 
     @lru_cache(maxsize=10000)
     def _extract_year(self, url: str) -> Optional[int]:
@@ -411,6 +568,21 @@ class FreshnessScorer(URLScorer):
         # Fallback calculation for older content
         return max(0.1, 1.0 - year_diff * 0.1)
 
+    def _calculate_scores(self, parsed: ParsedURLs) -> np.ndarray:
+        current = self._current_year
+        # 0 stands for "no year"; the pattern only matches 1900-2099
+        latest = np.fromiter(
+            (max((year for year in years if year <= current), default=0) for years in parsed.years),
+            dtype=np.int64,
+            count=len(parsed),
+        )
+        year_diff = current - latest
+        scores = np.maximum(0.1, 1.0 - year_diff * 0.1)
+        recent = year_diff < len(_FRESHNESS_SCORES)
+        scores[recent] = np.asarray(_FRESHNESS_SCORES)[year_diff[recent]]
+        scores[latest == 0] = 0.5
+        return scores
+
 class DomainAuthorityScorer(URLScorer):
     __slots__ = ('_weight', '_domain_weights', '_default_weight', '_top_domains')
     
@@ -516,4 +688,13 @@ class DomainAuthorityScorer(URLScorer):
             return score
             
         # Regular path: check all domains
-        return self._domain_weights.get(domain, self._default_weight)
\ No newline at end of file
+        return self._domain_weights.get(domain, self._default_weight)
+
+    def _calculate_scores(self, parsed: ParsedURLs) -> np.ndarray:
+        top = self._top_domains
+        weights = self._domain_weights
+        default = self._default_weight
+        return np.array(
+            [top[domain] if domain in top else weights.get(domain, default) for domain in parsed.domains],
+            dtype=np.float64,
+        )
@@ -0,0 +1,62 @@
+async (opts) => {
+    // Page-side full page scan. Mid-page steps only dwell briefly (lazy loaders are
+    // triggered on intersection and finish on their own); the scroller only waits
+    // for new content at the bottom, woken early by a MutationObserver, and stops
+    // after `idleRounds` consecutive waits without growth.
+    const root = document.scrollingElement || document.documentElement;
+    const target = document.body || root;
+    const viewport = window.innerHeight || opts.viewportHeight;
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const start = performance.now();
+
+    let addedNodes = 0;
+    const counter = new MutationObserver((records) => {
+        for (const r of records) addedNodes += r.addedNodes.length;
+    });
+    counter.observe(target, { childList: true, subtree: true });
+
+    const waitForGrowth = (ms) => new Promise((resolve) => {
+        const height = root.scrollHeight;
+        let timer = null;
+        const observer = new MutationObserver(() => {
+            if (root.scrollHeight > height) done(true);
+        });
+        const done = (grew) => {
+            clearTimeout(timer);
+            observer.disconnect();
+            resolve(grew);
+        };
+        observer.observe(target, { childList: true, subtree: true });
+        timer = setTimeout(() => done(root.scrollHeight > height), ms);
+    });
+
+    let steps = 0;
+    let idle = 0;
+    let reachedEnd = false;
+    while (opts.maxSteps === null || steps < opts.maxSteps) {
+        if (performance.now() - start > opts.timeout) break;
+        const bottom = Math.max(0, root.scrollHeight - viewport);
+        if (window.scrollY >= bottom - 1) {
+            if (idle >= opts.idleRounds) {
+                reachedEnd = true;
+                break;
+            }
+            idle = (await waitForGrowth(opts.scrollDelay)) ? 0 : idle + 1;
+            continue;
+        }
+        const before = window.scrollY;
+        window.scrollTo(0, Math.min(before + viewport, bottom));
+        steps++;
+        await sleep(opts.dwell);
+        if (window.scrollY === before) break;  // Document does not scroll (e.g. inner scroll container)
+    }
+    counter.disconnect();
+
+    return {
+        steps,
+        added_nodes: addedNodes,
+        height: root.scrollHeight,
+        reached_end: reachedEnd,
+        elapsed_ms: Math.round(performance.now() - start),
+    };
+}
@@ -0,0 +1,85 @@
+async (opts) => {
+    // Single page-side readiness probe: resolves once the DOM is attached, network
+    // activity and DOM mutations have been quiet for the configured windows,
+    // (optionally) LCP has been reported and images are complete - or on timeout.
+    // Resource timing only reports completed loads; the crawler counts pending
+    // requests itself and passes networkIdleMs = 0 when it does.
+    const now = () => performance.now();
+    const start = now();
+    const observers = [];
+
+    const nav = performance.getEntriesByType("navigation")[0];
+    const settled = document.readyState === "complete";
+
+    // Mutations that happened before the probe started are unknown; only a fully
+    // loaded document is assumed quiet since its load event.
+    let lastMutation = settled && nav ? nav.loadEventEnd : start;
+    let lastResource = nav ? nav.responseEnd : 0;
+    for (const entry of performance.getEntriesByType("resource")) {
+        if (entry.responseEnd > lastResource) lastResource = entry.responseEnd;
+    }
+    let lcpSeen = !opts.waitForLcp;
+
+    try {
+        const mo = new MutationObserver(() => { lastMutation = now(); });
+        mo.observe(document.documentElement, { childList: true, subtree: true, characterData: true });
+        observers.push(mo);
+    } catch (e) {}
+
+    if (window.PerformanceObserver) {
+        try {
+            const po = new PerformanceObserver(() => { lastResource = now(); });
+            po.observe({ type: "resource" });
+            observers.push(po);
+        } catch (e) {}
+        if (!lcpSeen) {
+            try {
+                const lcp = new PerformanceObserver(() => { lcpSeen = true; });
+                lcp.observe({ type: "largest-contentful-paint", buffered: true });
+                observers.push(lcp);
+            } catch (e) {
+                lcpSeen = true;  // Not supported by this engine
+            }
+        }
+    }
+
+    const imagesLoaded = () => Array.from(document.images).every((img) => img.complete);
+
+    const isReady = () => {
+        const t = now();
+        return !!document.body
+            && document.readyState !== "loading"
+            && t - lastMutation >= opts.domQuietMs
+            && t - lastResource >= opts.networkIdleMs
+            && lcpSeen
+            && (!opts.waitForImages || imagesLoaded());
+    };
+
+    const ready = await new Promise((resolve) => {
+        const tick = () => {
+            if (isReady()) return resolve(true);
+            if (now() - start >= opts.timeout) return resolve(false);
+            setTimeout(tick, opts.pollInterval);
+        };
+        tick();
+    });
+    observers.forEach((o) => o.disconnect());
+
+    const body = document.body;
+    let visible = false;
+    if (body) {
+        const style = window.getComputedStyle(body);
+        visible = style.display !== "none" && style.visibility !== "hidden" && style.opacity !== "0";
+    }
+    const root = document.documentElement;
+
+    return {
+        ready,
+        elapsed_ms: Math.round(now() - start),
+        visible,
+        images_loaded: imagesLoaded(),
+        lcp_seen: lcpSeen,
+        width: root.scrollWidth,
+        height: root.scrollHeight,
+    };
+}
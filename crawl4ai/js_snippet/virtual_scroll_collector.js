@@ -0,0 +1,113 @@
+async (config) => {
+    // Page-side virtual scroll collector. A MutationObserver marks the direct
+    // children of the container that were added or changed; after each scroll only
+    // those are snapshotted, deduplicated by normalized text. Recycled items are
+    // restored into the container at the end, so nothing is shipped to Python.
+    const container = document.querySelector(config.container_selector);
+    if (!container) {
+        throw new Error(`Container not found: ${config.container_selector}`);
+    }
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+    const items = new Map();  // dedup key -> outerHTML, in first-seen order
+    const dirty = new Set(container.children);
+    const keyOf = (el) => {
+        const text = (el.innerText || el.textContent || "").toLowerCase().replace(/[\s\W]/g, "");
+        return text || el.outerHTML;
+    };
+
+    let mutated = false;
+    const observer = new MutationObserver((records) => {
+        mutated = true;
+        for (const r of records) {
+            if (r.target === container) {
+                for (const node of r.addedNodes) {
+                    if (node.nodeType === Node.ELEMENT_NODE) dirty.add(node);
+                }
+                continue;
+            }
+            let node = r.target;
+            while (node && node.parentNode !== container) node = node.parentNode;
+            if (node) dirty.add(node);
+        }
+    });
+    observer.observe(container, { childList: true, subtree: true, characterData: true });
+
+    // Snapshot only the children touched since the last flush
+    const flush = () => {
+        let fresh = 0;
+        for (const el of dirty) {
+            const key = keyOf(el);
+            if (!items.has(key)) {
+                items.set(key, el.outerHTML);
+                fresh++;
+            }
+        }
+        dirty.clear();
+        return fresh;
+    };
+
+    // Resolve early once mutations arrived and then stayed quiet for `quiet` ms
+    const settle = async (ms, quiet) => {
+        const start = performance.now();
+        let lastSeen = -1;
+        while (performance.now() - start < ms) {
+            await sleep(Math.min(quiet, ms));
+            if (mutated) {
+                mutated = false;
+                lastSeen = performance.now();
+            } else if (lastSeen >= 0 && performance.now() - lastSeen >= quiet) {
+                break;
+            }
+        }
+    };
+
+    let scrollAmount;
+    if (typeof config.scroll_by === "number") {
+        scrollAmount = config.scroll_by;
+    } else if (config.scroll_by === "page_height") {
+        scrollAmount = window.innerHeight;
+    } else {  // container_height
+        scrollAmount = container.offsetHeight;
+    }
+
+    flush();
+    let scrollCount = 0;
+    let idle = 0;
+    const maxIdle = config.max_idle_scrolls;
+    while (scrollCount < config.scroll_count) {
+        const before = container.scrollTop;
+        container.scrollTop += scrollAmount;
+        mutated = false;
+        await settle(config.wait_after_scroll * 1000, 100);
+        scrollCount++;
+
+        const fresh = flush();
+        idle = fresh > 0 ? 0 : idle + 1;
+        const atEnd = container.scrollTop + container.clientHeight >= container.scrollHeight - 10;
+        if (atEnd && container.scrollTop === before && fresh === 0) break;
+        if (maxIdle !== null && maxIdle !== undefined && idle >= maxIdle) break;
+    }
+    observer.disconnect();
+
+    // Restore recycled items only if some captured item is no longer in the container
+    const present = new Set();
+    for (const el of container.children) present.add(keyOf(el));
+    let replaced = false;
+    for (const key of items.keys()) {
+        if (!present.has(key)) {
+            replaced = true;
+            break;
+        }
+    }
+    if (replaced) {
+        container.innerHTML = Array.from(items.values()).join("\n");
+    }
+
+    return {
+        success: true,
+        scrollCount,
+        uniqueCount: items.size,
+        replaced,
+    };
+}
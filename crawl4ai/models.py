@@ -17,6 +17,7 @@ class DomainState:
     last_request_time: float = 0
     current_delay: float = 0
     fail_count: int = 0
+    min_delay: float = 0  # Floor from robots.txt Crawl-delay
 
 
 @dataclass
@@ -136,7 +137,7 @@ class CrawlResult(BaseModel):
     links: Dict[str, List[Dict]] = {}
     downloaded_files: Optional[List[str]] = None
     js_execution_result: Optional[Dict[str, Any]] = None
-    screenshot: Optional[str] = None
+    screenshot: Optional[Union[str, bytes]] = None
     pdf: Optional[bytes] = None
     mhtml: Optional[str] = None
     _markdown: Optional[MarkdownGenerationResult] = PrivateAttr(default=None)
@@ -151,6 +152,7 @@ class CrawlResult(BaseModel):
     redirected_url: Optional[str] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    transfer_stats: Optional[Dict[str, Any]] = None
     tables: List[Dict] = Field(default_factory=list)  # NEW – [{headers,rows,caption,summary}]
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -321,7 +323,7 @@ class AsyncCrawlResponse(BaseModel):
     response_headers: Dict[str, str]
     js_execution_result: Optional[Dict[str, Any]] = None
     status_code: int
-    screenshot: Optional[str] = None
+    screenshot: Optional[Union[str, bytes]] = None
     pdf_data: Optional[bytes] = None
     mhtml_data: Optional[str] = None
     get_delayed_content: Optional[Callable[[Optional[float]], Awaitable[str]]] = None
@@ -330,6 +332,7 @@ class AsyncCrawlResponse(BaseModel):
     redirected_url: Optional[str] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    transfer_stats: Optional[Dict[str, Any]] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -0,0 +1,226 @@
+"""
+Near-duplicate page detection for crawls.
+
+Faceted filters, sort orders and session parameters make many URLs serve
+(almost) the same page. NearDuplicateDetector fingerprints each page's
+markdown with a 64-bit SimHash over word shingles and indexes the fingerprints
+in a banded LSH table, so a new page is compared only with the few pages that
+share a band instead of with every page seen so far.
+
+Pass a detector as ``CrawlerRunConfig(duplicate_detector=...)``. For every
+crawled page whose fingerprint is within ``threshold`` bits of an earlier page,
+``result.metadata['duplicate_of']`` names that page and the result is not
+written to the cache. Deep-crawl strategies do not expand links of duplicate
+pages. With ``learn_patterns=True`` they also stop queueing most URLs whose
+pattern (host, path template and query keys) has recently produced mostly
+duplicates; a small share of them is still crawled, so a pattern that starts
+serving new content gets its links back.
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from .url_canonicalizer import canonicalize_url
+
+# Link and image targets differ between duplicates (session ids, sort params)
+_MARKDOWN_TARGET = re.compile(r"\]\([^)]*\)")
+_WORD = re.compile(r"\w+")
+_DIGITS = re.compile(r"\d+")
+_SHINGLE_BASE = np.uint64(0x100000001B3)
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    # splitmix64 finalizer: spreads every input bit over the whole word
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+class NearDuplicateDetector:
+    """
+    SimHash fingerprints of page markdown with an LSH index.
+
+    Args:
+        threshold: Maximum number of differing fingerprint bits (out of 64) for
+            two pages to count as near-duplicates. The index uses
+            ``threshold + 1`` bands, so every match within the threshold is found.
+            The default catches most pages differing by a few words, while
+            unrelated pages of one site (sharing navigation) stay further apart.
+        shingle_size: Number of consecutive words hashed together.
+        min_words: Pages with fewer words are not fingerprinted; short error
+            and placeholder pages would otherwise all look alike.
+        learn_patterns: Track which URL patterns produce duplicates, see
+            is_likely_duplicate(). Off by default: a pattern is judged on the
+            pages crawled so far, which may not represent the rest of it.
+        min_pattern_samples: Pages of a pattern to see before judging it.
+        pattern_duplicate_ratio: Share of duplicates that marks a pattern as
+            duplicate-producing.
+        pattern_window: Once a pattern has this many pages, its counts are
+            halved, so its verdict follows the most recent pages.
+        pattern_explore_ratio: Share of URLs of a duplicate-producing pattern
+            that is still let through, so the verdict can be revised.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        shingle_size: int = 4,
+        min_words: int = 50,
+        learn_patterns: bool = False,
+        min_pattern_samples: int = 8,
+        pattern_duplicate_ratio: float = 0.9,
+        pattern_window: int = 64,
+        pattern_explore_ratio: float = 0.05,
+    ):
+        if not 0 <= threshold < 32:
+            raise ValueError("threshold must be between 0 and 31 bits")
+        self.threshold = threshold
+        self.shingle_size = max(1, shingle_size)
+        self.min_words = min_words
+        self.learn_patterns = learn_patterns
+        self.min_pattern_samples = min_pattern_samples
+        self.pattern_duplicate_ratio = pattern_duplicate_ratio
+        self.pattern_window = max(2 * min_pattern_samples, pattern_window)
+        self.pattern_explore_ratio = pattern_explore_ratio
+
+        bands = threshold + 1
+        widths = [64 // bands + (1 if i < 64 % bands else 0) for i in range(bands)]
+        shifts = [sum(widths[i + 1 :]) for i in range(bands)]
+        self._bands = [(shift, (1 << width) - 1) for shift, width in zip(shifts, widths)]
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._fingerprints: List[int] = []
+        self._urls: List[str] = []
+        self._by_url: Dict[str, int] = {}
+        self._token_hashes: Dict[str, int] = {}
+        # pattern -> [pages seen, duplicates, URLs pruned since one was let through]
+        self._patterns: Dict[str, List[float]] = {}
+
+        self.pages_checked = 0
+        self.duplicates_found = 0
+
+    def _hash_tokens(self, tokens: List[str]) -> np.ndarray:
+        cache = self._token_hashes
+        if len(cache) > 1_000_000:
+            cache.clear()
+        hashes = []
+        for token in tokens:
+            value = cache.get(token)
+            if value is None:
+                value = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+                cache[token] = value
+            hashes.append(value)
+        return np.array(hashes, dtype=np.uint64)
+
+    def fingerprint(self, text: Optional[str]) -> Optional[int]:
+        """64-bit SimHash of a markdown text, or None if it is too short."""
+        if not text:
+            return None
+        tokens = _WORD.findall(_MARKDOWN_TARGET.sub("]", text).lower())
+        if len(tokens) < max(self.min_words, self.shingle_size):
+            return None
+        hashes = self._hash_tokens(tokens)
+        # Polynomial rolling combination of `shingle_size` token hashes (mod 2**64)
+        count = len(hashes) - self.shingle_size + 1
+        shingles = hashes[:count].copy()
+        for offset in range(1, self.shingle_size):
+            shingles = shingles * _SHINGLE_BASE + hashes[offset : offset + count]
+        bits = np.unpackbits(_mix(shingles).view(np.uint8)).reshape(count, 64)
+        majority = bits.sum(axis=0, dtype=np.int64) * 2 > count
+        return int.from_bytes(np.packbits(majority).tobytes(), "big")
+
+    def find(self, fingerprint: int) -> Optional[str]:
+        """URL of the first indexed page within `threshold` bits, if any."""
+        best = None
+        for (shift, mask), table in zip(self._bands, self._tables):
+            for index in table.get((fingerprint >> shift) & mask, ()):
+                if best is not None and index >= best:
+                    continue
+                if bin(self._fingerprints[index] ^ fingerprint).count("1") <= self.threshold:
+                    best = index
+        return self._urls[best] if best is not None else None
+
+    def add(self, url: str, fingerprint: int) -> None:
+        """Index a page's fingerprint."""
+        index = len(self._fingerprints)
+        self._fingerprints.append(fingerprint)
+        self._urls.append(url)
+        self._by_url[canonicalize_url(url) or url] = index
+        for (shift, mask), table in zip(self._bands, self._tables):
+            table.setdefault((fingerprint >> shift) & mask, []).append(index)
+
+    def check(self, result) -> Optional[str]:
+        """
+        Fingerprint a successful CrawlResult and index it.
+
+        Returns the URL of the page it duplicates and records it in
+        ``result.metadata['duplicate_of']``; returns None for new content.
+        Crawling the same URL again does not make it a duplicate of itself.
+        """
+        if not result.success or not result.markdown:
+            return None
+        fingerprint = self.fingerprint(result.markdown.raw_markdown)
+        if fingerprint is None:
+            return None
+        url = result.url
+        key = canonicalize_url(url) or url
+        self.pages_checked += 1
+
+        known = self._by_url.get(key)
+        if known is not None:
+            if bin(self._fingerprints[known] ^ fingerprint).count("1") <= self.threshold:
+                return None
+        original = self.find(fingerprint)
+        if original is not None and (canonicalize_url(original) or original) == key:
+            original = None
+
+        if original is None:
+            self.add(url, fingerprint)
+        else:
+            self.duplicates_found += 1
+            result.metadata = result.metadata or {}
+            result.metadata["duplicate_of"] = original
+        if self.learn_patterns:
+            counts = self._patterns.setdefault(self.url_pattern(url), [0, 0, 0])
+            if counts[0] >= self.pattern_window:
+                counts[0] /= 2
+                counts[1] /= 2
+            counts[0] += 1
+            counts[1] += original is not None
+        return original
+
+    @staticmethod
+    def url_pattern(url: str) -> str:
+        """Host, path with digit runs generalized, and sorted query keys."""
+        parts = urlsplit(url)
+        path = _DIGITS.sub("{n}", parts.path.rstrip("/") or "/")
+        keys = sorted({pair.partition("=")[0] for pair in parts.query.split("&") if pair})
+        return f"{parts.netloc.lower()}{path}" + ("?" + "&".join(keys) if keys else "")
+
+    def _judged_duplicate(self, counts: List[float]) -> bool:
+        return counts[0] >= self.min_pattern_samples and counts[1] >= counts[0] * self.pattern_duplicate_ratio
+
+    def is_likely_duplicate(self, url: str) -> bool:
+        """
+        True if pages matching this URL's pattern have recently been mostly
+        duplicates. Every ``1 / pattern_explore_ratio``-th URL of such a pattern
+        gets False anyway, so crawling some of them keeps its verdict current.
+        """
+        if not self._patterns:
+            return False
+        counts = self._patterns.get(self.url_pattern(url))
+        if counts is None or not self._judged_duplicate(counts):
+            return False
+        counts[2] += 1
+        if self.pattern_explore_ratio > 0 and counts[2] * self.pattern_explore_ratio >= 1:
+            counts[2] = 0
+            return False
+        return True
+
+    @property
+    def duplicate_patterns(self) -> List[str]:
+        """URL patterns currently judged duplicate-producing."""
+        return [pattern for pattern, counts in self._patterns.items() if self._judged_duplicate(counts)]
@@ -0,0 +1,326 @@
+"""
+Bounded network capture for AsyncPlaywrightCrawlerStrategy.
+
+Request/response/failure events are recorded synchronously as compact tuples
+in a fixed-capacity ring buffer, so Playwright event handlers never await.
+Response bodies are not read inside the handlers: responses that match the
+configured body policy are remembered and their bodies are fetched lazily,
+with bounded concurrency, once the page has settled (Playwright serves
+`Response.body()` from `Network.getResponseBody` on Chromium).
+"""
+
+import asyncio
+import time
+import zlib
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import xxhash
+
+from .async_configs import NetworkCaptureConfig
+from .async_logger import AsyncLoggerBase
+
+
+# Event kinds stored in the ring buffer. The tuple layout for each kind is
+# (kind, seq, url, timestamp, *fields) - see NetworkEventBuffer.to_list.
+_REQUEST = 0
+_RESPONSE = 1
+_REQUEST_FAILED = 2
+_ERROR = 3
+
+_ERROR_EVENT_TYPES = {
+    _REQUEST: "request_capture_error",
+    _RESPONSE: "response_capture_error",
+    _REQUEST_FAILED: "request_failed_capture_error",
+}
+
+
+class NetworkEventBuffer:
+    """Fixed-capacity ring buffer of compact network events."""
+
+    __slots__ = ("_events", "_bodies", "_seq", "dropped")
+
+    def __init__(self, capacity: int):
+        self._events: deque = deque(maxlen=capacity)
+        self._bodies: Dict[int, Dict[str, Any]] = {}
+        self._seq = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def append(self, kind: int, url: str, *fields) -> int:
+        """Append an event and return its sequence number."""
+        seq = self._seq
+        self._seq += 1
+        if len(self._events) == self._events.maxlen:
+            evicted = self._events[0]
+            self._bodies.pop(evicted[1], None)
+            self.dropped += 1
+        self._events.append((kind, seq, url, time.time()) + fields)
+        return seq
+
+    def holds(self, seq: int) -> bool:
+        """Whether the event with this sequence number has not been evicted yet."""
+        return bool(self._events) and seq >= self._events[0][1]
+
+    def set_body(self, seq: int, body: Dict[str, Any]) -> None:
+        """Attach a resolved body to a response event still in the buffer."""
+        if self.holds(seq):
+            self._bodies[seq] = body
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Expand the buffered events into the public list-of-dicts format."""
+        out = []
+        for event in self._events:
+            kind, seq, url, ts = event[:4]
+            if kind == _REQUEST:
+                method, headers, post_data, resource_type, is_nav = event[4:]
+                out.append({
+                    "event_type": "request",
+                    "url": url,
+                    "method": method,
+                    "headers": headers,
+                    "post_data": post_data,
+                    "resource_type": resource_type,
+                    "is_navigation_request": is_nav,
+                    "timestamp": ts,
+                })
+            elif kind == _RESPONSE:
+                status, status_text, headers, from_sw, timing = event[4:]
+                out.append({
+                    "event_type": "response",
+                    "url": url,
+                    "status": status,
+                    "status_text": status_text,
+                    "headers": headers,
+                    "from_service_worker": from_sw,
+                    "request_timing": timing,
+                    "timestamp": ts,
+                    "body": self._bodies.get(seq),
+                })
+            elif kind == _REQUEST_FAILED:
+                method, resource_type, failure_text = event[4:]
+                out.append({
+                    "event_type": "request_failed",
+                    "url": url,
+                    "method": method,
+                    "resource_type": resource_type,
+                    "failure_text": failure_text,
+                    "timestamp": ts,
+                })
+            else:
+                source_kind, error = event[4:]
+                out.append({
+                    "event_type": _ERROR_EVENT_TYPES[source_kind],
+                    "url": url,
+                    "error": error,
+                    "timestamp": ts,
+                })
+        if self.dropped:
+            out.append({
+                "event_type": "capture_overflow",
+                "dropped": self.dropped,
+                "timestamp": time.time(),
+            })
+        return out
+
+
+class NetworkCapture:
+    """
+    Records network activity of a Playwright page according to a NetworkCaptureConfig.
+
+    Usage:
+        capture = NetworkCapture(config, logger)
+        capture.attach(page)
+        ...                         # navigate, interact
+        await capture.finalize()    # resolve pending bodies
+        capture.detach(page)
+        events = capture.to_list()
+    """
+
+    def __init__(
+        self,
+        config: Optional[NetworkCaptureConfig] = None,
+        logger: Optional[AsyncLoggerBase] = None,
+    ):
+        self.config = config or NetworkCaptureConfig()
+        self.logger = logger
+        self.buffer = NetworkEventBuffer(self.config.max_events)
+        # Responses beyond the buffer's capacity would be evicted before finalize anyway
+        self._pending: deque = deque(maxlen=self.config.max_events)
+        self._resource_types = (
+            frozenset(self.config.resource_types) if self.config.resource_types else None
+        )
+        self._sample_threshold = int(self.config.sample_rate * 10000)
+
+    # ---------------------------------------------------------------- wiring
+    def attach(self, page) -> None:
+        page.on("request", self.on_request)
+        page.on("response", self.on_response)
+        page.on("requestfailed", self.on_request_failed)
+
+    def detach(self, page) -> None:
+        page.remove_listener("request", self.on_request)
+        page.remove_listener("response", self.on_response)
+        page.remove_listener("requestfailed", self.on_request_failed)
+
+    # -------------------------------------------------------------- handlers
+    def on_request(self, request) -> None:
+        try:
+            self.buffer.append(
+                _REQUEST,
+                request.url,
+                request.method,
+                request.headers if self.config.capture_headers else None,
+                self._post_data(request),
+                request.resource_type,
+                request.is_navigation_request(),
+            )
+        except Exception as e:
+            self._record_error(_REQUEST, request, e)
+
+    def on_response(self, response) -> None:
+        try:
+            headers = response.headers
+            seq = self.buffer.append(
+                _RESPONSE,
+                response.url,
+                response.status,
+                response.status_text,
+                headers if self.config.capture_headers else None,
+                response.from_service_worker,
+                response.request.timing,
+            )
+            self._select_body(seq, response, headers)
+        except Exception as e:
+            self._record_error(_RESPONSE, response, e)
+
+    def on_request_failed(self, request) -> None:
+        try:
+            self.buffer.append(
+                _REQUEST_FAILED,
+                request.url,
+                request.method,
+                request.resource_type,
+                str(request.failure) if request.failure else "Unknown failure",
+            )
+        except Exception as e:
+            self._record_error(_REQUEST_FAILED, request, e)
+
+    # ------------------------------------------------------------ body policy
+    def _post_data(self, request) -> Optional[str]:
+        try:
+            post_data = request.post_data_buffer
+        except Exception:
+            return "[Error retrieving post data]"
+        if not post_data:
+            return None
+        limit = self.config.max_body_size
+        if len(post_data) > limit:
+            return f"[Post data: {len(post_data)} bytes, exceeds {limit} byte limit]"
+        return post_data.decode("utf-8", errors="replace")
+
+    def _select_body(self, seq: int, response, headers: Dict[str, str]) -> None:
+        """Decide, from metadata only, whether this response's body should be fetched later."""
+        policy = self.config.body_policy
+        if policy == "none" or 300 <= response.status < 400:
+            return
+        if self._resource_types is not None and response.request.resource_type not in self._resource_types:
+            return
+        if policy == "sample" and zlib.crc32(response.url.encode()) % 10000 >= self._sample_threshold:
+            return
+        # Hashing reads the whole body too; without a resource_types filter only text is hashed
+        if policy != "hash" or self._resource_types is None:
+            content_type = headers.get("content-type", "").lower()
+            if not any(t in content_type for t in self.config.text_content_types):
+                return
+        if policy == "hash":
+            self._pending.append((seq, response))
+            return
+        content_length = headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.config.max_body_size:
+            self.buffer.set_body(seq, {"size": int(content_length), "skipped": "too_large"})
+            return
+        self._pending.append((seq, response))
+
+    async def finalize(self) -> None:
+        """Fetch bodies for the selected responses with bounded concurrency."""
+        pending = [(seq, response) for seq, response in self._pending if self.buffer.holds(seq)]
+        self._pending.clear()
+        if not pending:
+            return
+        semaphore = asyncio.Semaphore(self.config.body_concurrency)
+        hash_only = self.config.body_policy == "hash"
+        limit = self.config.max_body_size
+
+        async def resolve(seq: int, response) -> None:
+            async with semaphore:
+                try:
+                    body = await response.body()
+                except Exception as e:
+                    self.buffer.set_body(seq, {"error": str(e)})
+                    return
+            if hash_only:
+                self.buffer.set_body(seq, {"size": len(body), "xxhash": xxhash.xxh64(body).hexdigest()})
+            elif len(body) > limit:
+                self.buffer.set_body(seq, {"size": len(body), "skipped": "too_large"})
+            else:
+                self.buffer.set_body(seq, {"size": len(body), "text": body.decode("utf-8", errors="replace")})
+
+        await asyncio.gather(*(resolve(seq, response) for seq, response in pending))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return self.buffer.to_list()
+
+    def _record_error(self, kind: int, source, error: Exception) -> None:
+        url = getattr(source, "url", None)
+        if self.logger:
+            self.logger.warning(
+                message="Error capturing network event for {url}: {error}",
+                tag="CAPTURE",
+                params={"url": url, "error": str(error)},
+            )
+        self.buffer.append(_ERROR, url, kind, str(error))
+
+
+class InflightRequests:
+    """
+    Counts a Playwright page's requests that started but have not finished or
+    failed yet, for the network-idle check of the page readiness probe. Resource
+    timing in the page only reports loads once they complete, so a request that
+    is still running would otherwise look like an idle network.
+    """
+
+    def __init__(self):
+        self._pending: set = set()
+        self._idle_since: Optional[float] = time.monotonic()
+
+    def attach(self, page) -> None:
+        page.on("request", self.on_request)
+        page.on("requestfinished", self.on_done)
+        page.on("requestfailed", self.on_done)
+
+    def detach(self, page) -> None:
+        page.remove_listener("request", self.on_request)
+        page.remove_listener("requestfinished", self.on_done)
+        page.remove_listener("requestfailed", self.on_done)
+
+    def on_request(self, request) -> None:
+        self._pending.add(request)
+        self._idle_since = None
+
+    def on_done(self, request) -> None:
+        self._pending.discard(request)
+        if not self._pending and self._idle_since is None:
+            self._idle_since = time.monotonic()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def idle_ms(self) -> float:
+        """Milliseconds since the last pending request finished; 0 while any is pending."""
+        if self._idle_since is None:
+            return 0.0
+        return (time.monotonic() - self._idle_since) * 1000
@@ -0,0 +1,244 @@
+"""
+seeder_cache.py
+Single-file SQLite store behind AsyncUrlSeeder.
+
+* `entries`   - per-URL live-check / head-extraction results (zlib-compressed JSON),
+                keyed by (kind, url) with TTL eviction and batch get/set
+* `listings`  - discovered URL lists per (source, domain); any pattern is answered
+                from the same listing, so re-seeding a domain never re-downloads it
+* `url_state` - persistent per-domain URL history (first seen, last lastmod, last
+                validation, head hash, status) used for incremental seeding; not TTL'd
+
+All methods are blocking and meant to be run off the event loop (asyncio.to_thread);
+one connection in WAL mode is shared by the worker threads behind a lock.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    created REAL NOT NULL,
+    PRIMARY KEY (kind, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_entries_created ON entries(created);
+
+CREATE TABLE IF NOT EXISTS listings (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    created REAL NOT NULL,
+    complete INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_listings_domain ON listings(source, domain, complete);
+
+CREATE TABLE IF NOT EXISTS listing_urls (
+    listing_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    meta TEXT,
+    PRIMARY KEY (listing_id, seq)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS url_state (
+    domain TEXT NOT NULL,
+    url TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    lastmod TEXT,
+    validated REAL,
+    head_hash TEXT,
+    status TEXT,
+    PRIMARY KEY (domain, url)
+) WITHOUT ROWID;
+"""
+
+_STATE_FIELDS = ("first_seen", "lastmod", "validated", "head_hash", "status")
+
+
+class SeederCache:
+    """
+    Indexed replacement for the seeder's one-file-per-URL JSON cache and its
+    per-pattern JSONL listing files.
+    """
+
+    BATCH_SIZE = 500
+    COMPRESS_LEVEL = 6
+
+    def __init__(self, db_path: Union[str, Path], ttl: float):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = float(ttl)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self.purge_expired()
+
+    # ───────── value codec ─────────
+    def _encode(self, value: Any) -> bytes:
+        return zlib.compress(json.dumps(value, separators=(",", ":")).encode(), self.COMPRESS_LEVEL)
+
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        return json.loads(zlib.decompress(blob))
+
+    # ───────── per-URL entries ─────────
+    def get_many(self, kind: str, keys: Sequence[str]) -> Dict[str, Any]:
+        """Return {key: value} for the keys of `kind` that exist and are not expired."""
+        if not keys:
+            return {}
+        cutoff = time.time() - self.ttl
+        found: Dict[str, Any] = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(keys), self.BATCH_SIZE):
+                chunk = list(keys[i:i + self.BATCH_SIZE])
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM entries WHERE kind = ? AND created >= ? AND key IN ({marks})",
+                    (kind, cutoff, *chunk),
+                ).fetchall()
+                for key, blob in rows:
+                    try:
+                        found[key] = self._decode(blob)
+                    except (zlib.error, ValueError):
+                        continue
+        return found
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        return self.get_many(kind, [key]).get(key)
+
+    def set_many(self, kind: str, items: Iterable[Tuple[str, Any]]) -> None:
+        now = time.time()
+        rows = [(kind, key, self._encode(value), now) for key, value in items]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (kind, key, value, created) VALUES (?, ?, ?, ?)", rows)
+
+    def purge_expired(self) -> int:
+        """Drop expired entries and superseded or expired listings. Returns entries removed."""
+        cutoff = time.time() - self.ttl
+        with self._lock, self._conn:
+            removed = self._conn.execute("DELETE FROM entries WHERE created < ?", (cutoff,)).rowcount
+            stale = [row[0] for row in self._conn.execute(
+                "SELECT id FROM listings WHERE created < ?", (cutoff,))]
+            self._drop_listings(stale)
+        return removed
+
+    # ───────── URL listings ─────────
+    def _drop_listings(self, ids: List[int]) -> None:
+        for listing_id in ids:
+            self._conn.execute("DELETE FROM listing_urls WHERE listing_id = ?", (listing_id,))
+            self._conn.execute("DELETE FROM listings WHERE id = ?", (listing_id,))
+
+    def find_listing(self, source: str, domain: str) -> Optional[int]:
+        """Id of the newest complete, unexpired listing for (source, domain), if any."""
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM listings WHERE source = ? AND domain = ? AND complete = 1 AND created >= ? "
+                "ORDER BY created DESC LIMIT 1",
+                (source, domain, cutoff),
+            ).fetchone()
+        return row[0] if row else None
+
+    def read_listing(self, listing_id: int, after: int = -1, limit: int = BATCH_SIZE) -> List[Tuple[int, str, Optional[dict]]]:
+        """One page of (seq, url, meta) rows of a listing, in discovery order."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, url, meta FROM listing_urls WHERE listing_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (listing_id, after, limit),
+            ).fetchall()
+        return [(seq, url, json.loads(meta) if meta else None) for seq, url, meta in rows]
+
+    def begin_listing(self, source: str, domain: str) -> int:
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO listings (source, domain, created) VALUES (?, ?, ?)", (source, domain, time.time()))
+        return cur.lastrowid
+
+    def append_listing(self, listing_id: int, start: int, rows: Sequence[Tuple[str, Optional[dict]]]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO listing_urls (listing_id, seq, url, meta) VALUES (?, ?, ?, ?)",
+                [(listing_id, start + i, url, json.dumps(meta) if meta else None)
+                 for i, (url, meta) in enumerate(rows)],
+            )
+
+    def finish_listing(self, listing_id: int, size: int) -> None:
+        """Mark a listing complete and drop the older listings it supersedes."""
+        with self._lock, self._conn:
+            source, domain = self._conn.execute(
+                "SELECT source, domain FROM listings WHERE id = ?", (listing_id,)).fetchone()
+            self._conn.execute(
+                "UPDATE listings SET complete = 1, size = ? WHERE id = ?", (size, listing_id))
+            older = [row[0] for row in self._conn.execute(
+                "SELECT id FROM listings WHERE source = ? AND domain = ? AND id < ?",
+                (source, domain, listing_id))]
+            self._drop_listings(older)
+
+    def abort_listing(self, listing_id: int) -> None:
+        """Discard a listing whose discovery did not run to the end."""
+        with self._lock, self._conn:
+            self._drop_listings([listing_id])
+
+    # ───────── URL state ─────────
+    def get_states(self, domain: str, urls: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Return {url: state} for the URLs of `domain` that have been seen before."""
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for i in range(0, len(urls), self.BATCH_SIZE):
+                chunk = list(urls[i:i + self.BATCH_SIZE])
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT url, {', '.join(_STATE_FIELDS)} FROM url_state WHERE domain = ? AND url IN ({marks})",
+                    (domain, *chunk),
+                ).fetchall()
+                for row in rows:
+                    found[row[0]] = dict(zip(_STATE_FIELDS, row[1:]))
+        return found
+
+    def update_states(self, domain: str, states: Iterable[Dict[str, Any]]) -> None:
+        """
+        Upsert URL states. Each dict needs "url"; fields that are missing or None keep
+        their stored value, and first_seen is only set when the URL is new.
+        """
+        now = time.time()
+        rows = [
+            (domain, st["url"], st.get("first_seen") or now, st.get("lastmod"),
+             st.get("validated"), st.get("head_hash"), st.get("status"))
+            for st in states
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO url_state (domain, url, first_seen, lastmod, validated, head_hash, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(domain, url) DO UPDATE SET "
+                "lastmod = COALESCE(excluded.lastmod, lastmod), "
+                "validated = COALESCE(excluded.validated, validated), "
+                "head_hash = COALESCE(excluded.head_hash, head_hash), "
+                "status = COALESCE(excluded.status, status)",
+                rows,
+            )
+
+    def close(self) -> None:
+        # Closing an already closed connection is a no-op
+        with self._lock:
+            self._conn.close()
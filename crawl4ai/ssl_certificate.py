@@ -4,11 +4,23 @@ import ssl
 import socket
 import base64
 import json
-from typing import Dict, Any, Optional
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 import OpenSSL.crypto
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Per-host certificate cache shared by all crawls: (host, port) -> (expires_at, certificate)
+CERT_CACHE_TTL = 3600
+CERT_CACHE_MAX_SIZE = 1024
+_cert_cache: "OrderedDict[Tuple[str, int], Tuple[float, SSLCertificate]]" = OrderedDict()
+_cert_inflight: Dict[Tuple[str, int], "asyncio.Future"] = {}
+
 # === Inherit from dict ===
 class SSLCertificate(dict):
     """
@@ -62,9 +74,9 @@ class SSLCertificate(dict):
     def from_url(url: str, timeout: int = 10) -> Optional["SSLCertificate"]:
         """
         Create SSLCertificate instance from a URL. Fetches cert info and initializes.
-        (Fetching logic remains the same)
+
+        This performs a blocking handshake; inside an event loop prefer `from_url_async`.
         """
-        cert_info_raw = None # Variable to hold the fetched dict
         try:
             hostname = urlparse(url).netloc
             if ":" in hostname:
@@ -83,32 +95,7 @@ class SSLCertificate(dict):
                          print(f"Warning: No certificate returned for {hostname}")
                          return None
 
-                    x509 = OpenSSL.crypto.load_certificate(
-                        OpenSSL.crypto.FILETYPE_ASN1, cert_binary
-                    )
-
-                    # Create the dictionary directly
-                    cert_info_raw = {
-                        "subject": dict(x509.get_subject().get_components()),
-                        "issuer": dict(x509.get_issuer().get_components()),
-                        "version": x509.get_version(),
-                        "serial_number": hex(x509.get_serial_number()),
-                        "not_before": x509.get_notBefore(), # Keep as bytes initially, _decode handles it
-                        "not_after": x509.get_notAfter(),   # Keep as bytes initially
-                        "fingerprint": x509.digest("sha256").hex(), # hex() is already string
-                        "signature_algorithm": x509.get_signature_algorithm(), # Keep as bytes
-                        "raw_cert": base64.b64encode(cert_binary), # Base64 is bytes, _decode handles it
-                    }
-
-                    # Add extensions
-                    extensions = []
-                    for i in range(x509.get_extension_count()):
-                        ext = x509.get_extension(i)
-                        # get_short_name() returns bytes, str(ext) handles value conversion
-                        extensions.append(
-                            {"name": ext.get_short_name(), "value": str(ext)}
-                        )
-                    cert_info_raw["extensions"] = extensions
+                    return SSLCertificate.from_der(cert_binary)
 
         except ssl.SSLCertVerificationError as e:
              print(f"SSL Verification Error for {url}: {e}")
@@ -126,11 +113,163 @@ class SSLCertificate(dict):
             # Log the full error details if needed: logging.exception("Cert fetch error")
             return None
 
-        # If successful, create the SSLCertificate instance from the dictionary
-        if cert_info_raw:
-             return SSLCertificate(cert_info_raw)
-        else:
-             return None
+    @staticmethod
+    def from_der(cert_binary: bytes) -> "SSLCertificate":
+        """
+        Create SSLCertificate instance from a DER-encoded certificate.
+
+        Args:
+            cert_binary (bytes): The certificate in DER (ASN.1) form.
+
+        Returns:
+            SSLCertificate: The parsed certificate.
+        """
+        x509 = OpenSSL.crypto.load_certificate(
+            OpenSSL.crypto.FILETYPE_ASN1, cert_binary
+        )
+
+        # Create the dictionary directly
+        cert_info_raw = {
+            "subject": dict(x509.get_subject().get_components()),
+            "issuer": dict(x509.get_issuer().get_components()),
+            "version": x509.get_version(),
+            "serial_number": hex(x509.get_serial_number()),
+            "not_before": x509.get_notBefore(), # Keep as bytes initially, _decode handles it
+            "not_after": x509.get_notAfter(),   # Keep as bytes initially
+            "fingerprint": x509.digest("sha256").hex(), # hex() is already string
+            "signature_algorithm": x509.get_signature_algorithm(), # Keep as bytes
+            "raw_cert": base64.b64encode(cert_binary), # Base64 is bytes, _decode handles it
+        }
+
+        # Add extensions
+        extensions = []
+        for i in range(x509.get_extension_count()):
+            ext = x509.get_extension(i)
+            # get_short_name() returns bytes, str(ext) handles value conversion
+            extensions.append(
+                {"name": ext.get_short_name(), "value": str(ext)}
+            )
+        cert_info_raw["extensions"] = extensions
+
+        return SSLCertificate(cert_info_raw)
+
+    @staticmethod
+    async def from_url_async(
+        url: str, timeout: int = 10, page: Any = None, use_cache: bool = True
+    ) -> Optional["SSLCertificate"]:
+        """
+        Create SSLCertificate instance from a URL without blocking the event loop.
+
+        Resolution order:
+        1. The per-host cache (entries live for CERT_CACHE_TTL seconds).
+        2. If a Playwright `page` is given, CDP `Network.getCertificate` for the
+           connection the browser already established (Chromium only).
+        3. A TLS handshake through `asyncio.open_connection`.
+
+        Concurrent lookups for the same host share one fetch.
+
+        Args:
+            url (str): The URL whose host certificate should be fetched.
+            timeout (int): Handshake timeout in seconds for the fallback connection.
+            page: Optional Playwright page that has navigated to `url`.
+            use_cache (bool): Whether to read and populate the per-host cache.
+
+        Returns:
+            Optional[SSLCertificate]: The certificate, or None if it could not be retrieved.
+        """
+        parsed = urlparse(url)
+        hostname = parsed.hostname
+        if not hostname:
+            return None
+        port = parsed.port or 443
+        key = (hostname, port)
+
+        if use_cache:
+            cached = _cert_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                _cert_cache.move_to_end(key)
+                return cached[1]
+            inflight = _cert_inflight.get(key)
+            if inflight is not None:
+                return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        if use_cache:
+            _cert_inflight[key] = future
+        cert = None
+        try:
+            if page is not None:
+                cert = await SSLCertificate._from_cdp(page, f"https://{parsed.netloc}")
+            if cert is None:
+                cert = await SSLCertificate._from_handshake(hostname, port, timeout)
+            if cert is not None and use_cache:
+                _cert_cache[key] = (time.monotonic() + CERT_CACHE_TTL, cert)
+                _cert_cache.move_to_end(key)
+                while len(_cert_cache) > CERT_CACHE_MAX_SIZE:
+                    _cert_cache.popitem(last=False)
+        finally:
+            future.set_result(cert)
+            if use_cache:
+                _cert_inflight.pop(key, None)
+        return cert
+
+    @staticmethod
+    async def _from_cdp(page: Any, origin: str) -> Optional["SSLCertificate"]:
+        """Read the leaf certificate of an origin the browser is connected to via CDP."""
+        cdp = None
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            result = await cdp.send("Network.getCertificate", {"origin": origin})
+            chain = result.get("tableNames") or []
+            if not chain:
+                return None
+            return SSLCertificate.from_der(base64.b64decode(chain[0]))
+        except Exception:
+            # Non-Chromium browsers have no CDP; the caller falls back to a handshake
+            return None
+        finally:
+            if cdp is not None:
+                try:
+                    await cdp.detach()
+                except Exception:
+                    pass
+
+    @staticmethod
+    async def _from_handshake(hostname: str, port: int, timeout: int) -> Optional["SSLCertificate"]:
+        """Fetch the peer certificate with a non-blocking TLS handshake."""
+        writer = None
+        try:
+            context = ssl.create_default_context()
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    hostname, port, ssl=context, server_hostname=hostname
+                ),
+                timeout=timeout,
+            )
+            cert_binary = writer.get_extra_info("ssl_object").getpeercert(binary_form=True)
+            if not cert_binary:
+                logger.warning("No certificate returned for %s", hostname)
+                return None
+            return SSLCertificate.from_der(cert_binary)
+        except ssl.SSLCertVerificationError as e:
+            logger.warning("SSL verification error for %s: %s", hostname, e)
+            return None
+        except socket.gaierror:
+            logger.warning("Could not resolve hostname: %s", hostname)
+            return None
+        except asyncio.TimeoutError:
+            logger.warning("Connection timed out for %s", hostname)
+            return None
+        except Exception as e:
+            logger.warning("Error fetching/processing certificate for %s: %s", hostname, e)
+            return None
+        finally:
+            if writer is not None:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except Exception:
+                    pass
 
 
     # --- Properties now access the dictionary items directly via self[] ---
@@ -0,0 +1,299 @@
+"""
+URL canonicalization shared by link extraction and deep crawling.
+
+Every subsystem that dedupes URLs (the scraper's link dicts, the deep-crawl
+visited sets and frontiers) goes through the same canonical form:
+
+- scheme and host lowercased, IDNA hosts in punycode, default ports dropped;
+- percent-escapes upper-cased, escaped unreserved characters decoded, and
+  characters that must be escaped (spaces, non-ASCII, ...) encoded;
+- dot segments removed, empty path turned into "/", trailing slashes stripped;
+- tracking query parameters dropped and the query sorted by key;
+- the fragment dropped.
+
+Relative links are resolved against a PageBase that is computed once per page,
+so the hot path is string concatenation plus a cache lookup instead of
+urljoin/urlparse/parse_qsl/urlencode per link.
+"""
+
+import re
+import string
+from typing import FrozenSet, Iterable, List, Optional, Sequence, Union
+from urllib.parse import quote, unquote, urljoin
+
+DEFAULT_TRACKING_PARAMS: FrozenSet[str] = frozenset(
+    {
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "utm_term",
+        "utm_content",
+        "gclid",
+        "fbclid",
+        "ref",
+        "ref_src",
+    }
+)
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+_SCHEME = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*")
+_ABSOLUTE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*:")
+_ESCAPE = re.compile(r"%([0-9A-Fa-f]{2})")
+_UNRESERVED = frozenset(string.ascii_letters + string.digits + "-._~")
+# Characters allowed unescaped in a path and query (RFC 3986 pchar plus "/" and "?")
+_PATH_SAFE = "/!$&'()*+,;=:@"
+_QUERY_SAFE = _PATH_SAFE + "?"
+_CLEAN_TAIL = re.compile(r"[A-Za-z0-9\-._~!$&'()*+,;=:@/?]*")
+
+
+def _fix_escape(match: "re.Match") -> str:
+    char = chr(int(match.group(1), 16))
+    return char if char in _UNRESERVED else "%" + match.group(1).upper()
+
+
+def _normalize_escapes(text: str, safe: str) -> str:
+    # Existing escapes survive quote() because "%" is safe; they are fixed up below
+    text = quote(text, safe=safe + "%")
+    return _ESCAPE.sub(_fix_escape, text) if "%" in text else text
+
+
+def _remove_dot_segments(path: str) -> str:
+    output: List[str] = []
+    for segment in path.split("/"):
+        if segment == "..":
+            if len(output) > 1:
+                output.pop()
+        elif segment != ".":
+            output.append(segment)
+    if path.endswith(("/.", "/..")):
+        output.append("")
+    return "/".join(output) or "/"
+
+
+def _canonical_host(host: str) -> str:
+    host = host.lower()
+    if not host.isascii():
+        try:
+            host = host.encode("idna").decode("ascii")
+        except UnicodeError:
+            pass
+    return host
+
+
+class PageBase:
+    """
+    A page URL pre-split for resolving its links.
+
+    Built by URLCanonicalizer.base(); `origin` is already canonical, so links
+    resolved against it take the canonicalizer's same-host fast path.
+    """
+
+    __slots__ = ("url", "scheme", "origin", "path", "document", "directory")
+
+    def __init__(self, url: str, scheme: Optional[str], origin: str, path: str, query: str):
+        self.url = url
+        self.scheme = scheme
+        self.origin = origin
+        self.path = path
+        self.document = origin + path + query
+        self.directory = origin + path[: path.rfind("/") + 1]
+
+    def join(self, href: str) -> str:
+        """Resolve a stripped, non-empty href the way urljoin() would."""
+        if _ABSOLUTE.match(href):
+            return href
+        if self.scheme is None:
+            return urljoin(self.url, href)
+        first = href[0]
+        if first == "/":
+            if href.startswith("//"):
+                return self.scheme + ":" + href
+            return self.origin + href
+        if first == "?":
+            return self.origin + self.path + href
+        if first == "#":
+            return self.document + href
+        return self.directory + href
+
+
+class URLCanonicalizer:
+    """
+    Canonicalizes absolute URLs and resolves page links into canonical form.
+
+    Results are cached per absolute URL, so navigation links repeated on every
+    page of a site are canonicalized once. Use the module-level
+    DEFAULT_CANONICALIZER unless different rules are needed; dedup only works
+    if every participant uses the same rules.
+
+    Args:
+        tracking_params: Query keys to drop (case-insensitive).
+        extra_tracking_params: Keys to drop in addition to `tracking_params`.
+        sort_query: Sort query parameters by key (stable for repeated keys).
+        keep_fragment: Keep the "#fragment" instead of dropping it.
+        strip_trailing_slash: Turn "/docs/" into "/docs" ("/" is kept).
+        cache_size: Canonical forms remembered before the cache is reset.
+    """
+
+    def __init__(
+        self,
+        tracking_params: Iterable[str] = DEFAULT_TRACKING_PARAMS,
+        extra_tracking_params: Iterable[str] = (),
+        sort_query: bool = True,
+        keep_fragment: bool = False,
+        strip_trailing_slash: bool = True,
+        cache_size: int = 100_000,
+    ):
+        self.tracking_params = frozenset(p.lower() for p in tracking_params) | frozenset(
+            p.lower() for p in extra_tracking_params
+        )
+        self.sort_query = sort_query
+        self.keep_fragment = keep_fragment
+        self.strip_trailing_slash = strip_trailing_slash
+        self.cache_size = cache_size
+        self._cache = {}
+
+    def _authority(self, scheme: str, netloc: str) -> str:
+        userinfo, at, hostport = netloc.rpartition("@")
+        if hostport.startswith("["):
+            host, _, port = hostport.partition("]")
+            host += "]"
+            port = port[1:]
+        else:
+            host, _, port = hostport.partition(":")
+        host = _canonical_host(host)
+        if port == _DEFAULT_PORTS.get(scheme):
+            port = ""
+        return (userinfo + at if at else "") + host + (":" + port if port else "")
+
+    def _tail(self, tail: str) -> str:
+        """Canonical path, query and fragment; `tail` is everything after the authority."""
+        tail, hash_, fragment = tail.partition("#")
+        path, question, query = tail.partition("?")
+        if not path:
+            path = "/"
+        elif "%" in path or not _CLEAN_TAIL.fullmatch(path):
+            path = _normalize_escapes(path, _PATH_SAFE)
+        if "/." in path:
+            path = _remove_dot_segments(path)
+        if self.strip_trailing_slash and path.endswith("/") and len(path) > 1:
+            path = path.rstrip("/") or "/"
+
+        if query:
+            if "%" in query or not _CLEAN_TAIL.fullmatch(query):
+                query = _normalize_escapes(query, _QUERY_SAFE)
+            pairs = [pair for pair in query.split("&") if pair]
+            tracking = self.tracking_params
+            if tracking:
+                kept = []
+                for pair in pairs:
+                    key = pair.partition("=")[0]
+                    if "%" in key:
+                        key = unquote(key)
+                    if key.lower() not in tracking:
+                        kept.append(pair)
+                pairs = kept
+            if self.sort_query:
+                pairs.sort(key=lambda pair: pair.partition("=")[0])
+            query = "&".join(pairs)
+
+        canonical = path + ("?" + query if query else "")
+        if self.keep_fragment and fragment:
+            canonical += "#" + _normalize_escapes(fragment, _QUERY_SAFE)
+        return canonical
+
+    def _canonicalize(self, url: str) -> str:
+        scheme, sep, rest = url.partition("://")
+        if not sep or not _SCHEME.fullmatch(scheme):
+            # Relative or non-hierarchical (mailto:, javascript:, data:, ...): left alone
+            return url
+        scheme = scheme.lower()
+        end = len(rest)
+        for delimiter in "/?#":
+            pos = rest.find(delimiter)
+            if pos != -1 and pos < end:
+                end = pos
+        return f"{scheme}://{self._authority(scheme, rest[:end])}{self._tail(rest[end:])}"
+
+    def _remember(self, url: str, canonical: str) -> str:
+        cache = self._cache
+        if len(cache) >= self.cache_size:
+            cache.clear()
+        cache[url] = canonical
+        return canonical
+
+    def canonicalize(self, url: str) -> str:
+        """Canonical form of an absolute URL."""
+        canonical = self._cache.get(url)
+        if canonical is None:
+            canonical = self._remember(url, self._canonicalize(url.strip()))
+        return canonical
+
+    def base(self, url: str) -> PageBase:
+        """Pre-split a page URL once so all of its links resolve cheaply."""
+        url = url.strip()
+        scheme, sep, rest = url.partition("://")
+        if not sep or not _SCHEME.fullmatch(scheme):
+            return PageBase(url, None, "", "", "")
+        scheme = scheme.lower()
+        rest = rest.partition("#")[0]
+        end = len(rest)
+        for delimiter in "/?":
+            pos = rest.find(delimiter)
+            if pos != -1 and pos < end:
+                end = pos
+        path, question, query = rest[end:].partition("?")
+        origin = f"{scheme}://{self._authority(scheme, rest[:end])}"
+        return PageBase(url, scheme, origin, path or "/", question + query)
+
+    def resolve(self, href: Optional[str], base: Union[str, PageBase], preserve_https: bool = False) -> Optional[str]:
+        """
+        Resolve a link found on a page and return its canonical form.
+
+        Args:
+            href: The raw href; None or empty returns None.
+            base: The page URL, or its PageBase when resolving many links.
+            preserve_https: Upgrade same-host "http://" links to https (not
+                protocol-relative ones), for pages that were fetched over https.
+        """
+        if not href:
+            return None
+        if not isinstance(base, PageBase):
+            base = self.base(base)
+        href = href.strip()
+        url = base.join(href) if href else base.url
+        canonical = self._cache.get(url)
+        if canonical is None:
+            origin = base.origin
+            if origin and url.startswith(origin) and url[len(origin) : len(origin) + 1] in ("/", "?", "#", ""):
+                # Same host, already spelled canonically: only the tail needs work
+                canonical = self._remember(url, origin + self._tail(url[len(origin) :]))
+            else:
+                canonical = self._remember(url, self._canonicalize(url))
+        if preserve_https and canonical.startswith("http://") and not href.startswith("//"):
+            # Canonical http(s) URLs always have a path, so the host ends at the first "/"
+            if canonical[7:].partition("/")[0] == base.origin.partition("://")[2]:
+                canonical = "https://" + canonical[7:]
+        return canonical
+
+    def resolve_many(
+        self, hrefs: Sequence[Optional[str]], base_url: Union[str, PageBase], preserve_https: bool = False
+    ) -> List[Optional[str]]:
+        """Resolve all links of one page; the base URL is split once."""
+        base = base_url if isinstance(base_url, PageBase) else self.base(base_url)
+        resolve = self.resolve
+        return [resolve(href, base, preserve_https) for href in hrefs]
+
+
+DEFAULT_CANONICALIZER = URLCanonicalizer()
+
+
+def canonicalize_url(href: Optional[str], base_url: Optional[str] = None) -> Optional[str]:
+    """Canonical form of `href`, resolved against `base_url` when given."""
+    if base_url is None:
+        return DEFAULT_CANONICALIZER.canonicalize(href) if href else None
+    return DEFAULT_CANONICALIZER.resolve(href, base_url)
+
+
+def canonicalize_links(hrefs: Sequence[Optional[str]], base_url: Union[str, PageBase]) -> List[Optional[str]]:
+    """Bulk canonicalization of a page's links with the shared canonicalizer."""
+    return DEFAULT_CANONICALIZER.resolve_many(hrefs, base_url)
@@ -3,6 +3,8 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup, Comment, element, Tag, NavigableString
 import json
 import html
+import base64
+import binascii
 import lxml
 import re
 import os
@@ -16,7 +18,7 @@ from .config import MIN_WORD_THRESHOLD, IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD, IM
 import httpx
 from socket import gaierror
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable, Generator, Tuple, Iterable
+from typing import Dict, Any, List, Optional, Callable, Generator, Tuple, Iterable, Union
 from urllib.parse import urljoin
 import requests
 from requests.exceptions import InvalidSchema
@@ -29,6 +31,7 @@ import asyncio
 from lxml import etree, html as lhtml
 import sqlite3
 import hashlib
+import uuid
 
 from urllib.robotparser import RobotFileParser
 import aiohttp
@@ -36,17 +39,15 @@ from functools import lru_cache
 
 from packaging import version
 from . import __version__
+from .url_canonicalizer import DEFAULT_CANONICALIZER, DEFAULT_TRACKING_PARAMS, URLCanonicalizer
 from typing import Sequence
 
 from itertools import chain
-from collections import deque
+from collections import deque, OrderedDict
 import psutil
 import numpy as np
 
-from urllib.parse import (
-    urljoin, urlparse, urlunparse,
-    parse_qsl, urlencode, quote, unquote
-)
+from urllib.parse import urljoin, urlparse, quote, unquote
 import inspect
 
 
@@ -250,15 +251,34 @@ class VersionManager:
 
 
 class RobotsParser:
+    """
+    robots.txt checker shared by all crawls of an AsyncWebCrawler.
+
+    Parsed rules are kept in an in-process LRU keyed by host, so repeated checks never
+    touch SQLite or re-parse. Concurrent checks for a host that is not cached share a
+    single robots.txt fetch. The SQLite cache is read and written in a worker thread and
+    all fetches go through one shared aiohttp session.
+    """
+
     # Default 7 days cache TTL
     CACHE_TTL = 7 * 24 * 60 * 60
+    # Hosts whose robots.txt could not be fetched are retried after this many seconds
+    ERROR_TTL = 5 * 60
+    MAX_ENTRIES = 4096
+    FETCH_TIMEOUT = 2
 
-    def __init__(self, cache_dir=None, cache_ttl=None):
+    def __init__(self, cache_dir=None, cache_ttl=None, max_entries=None):
         self.cache_dir = cache_dir or os.path.join(get_home_folder(), ".crawl4ai", "robots")
         self.cache_ttl = cache_ttl or self.CACHE_TTL
+        self.max_entries = max_entries or self.MAX_ENTRIES
         os.makedirs(self.cache_dir, exist_ok=True)
         self.db_path = os.path.join(self.cache_dir, "robots_cache.db")
         self._init_db()
+        # host -> (parser or None to allow everything, crawl delays by agent, expires_at)
+        self._rules: "OrderedDict[str, Tuple[Optional[RobotFileParser], Dict[str, float], float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
 
     def _init_db(self):
         # Use WAL mode for better concurrency and performance
@@ -274,24 +294,18 @@ class RobotsParser:
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_domain ON robots_cache(domain)")
 
-    def _get_cached_rules(self, domain: str) -> tuple[str, bool]:
-        """Get cached rules. Returns (rules, is_fresh)"""
+    def _get_cached_rules(self, domain: str) -> tuple[str, int]:
+        """Get cached rules. Returns (rules, fetch_time); blocking, run off the event loop"""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute(
-                "SELECT rules, fetch_time, hash FROM robots_cache WHERE domain = ?", 
+                "SELECT rules, fetch_time FROM robots_cache WHERE domain = ?", 
                 (domain,)
             )
             result = cursor.fetchone()
-            
-            if not result:
-                return None, False
-                
-            rules, fetch_time, _ = result
-            # Check if cache is still fresh based on TTL
-            return rules, (time.time() - fetch_time) < self.cache_ttl
+            return result if result else (None, 0)
 
     def _cache_rules(self, domain: str, content: str):
-        """Cache robots.txt content with hash for change detection"""
+        """Cache robots.txt content with hash for change detection; blocking, run off the event loop"""
         hash_val = hashlib.md5(content.encode()).hexdigest()
         with sqlite3.connect(self.db_path) as conn:
             # Check if content actually changed
@@ -301,8 +315,13 @@ class RobotsParser:
             )
             result = cursor.fetchone()
             
-            # Only update if hash changed or no previous entry
-            if not result or result[0] != hash_val:
+            if result and result[0] == hash_val:
+                # Unchanged, only refresh the fetch time
+                conn.execute(
+                    "UPDATE robots_cache SET fetch_time = ? WHERE domain = ?",
+                    (int(time.time()), domain)
+                )
+            else:
                 conn.execute(
                     """INSERT OR REPLACE INTO robots_cache 
                        (domain, rules, fetch_time, hash) 
@@ -310,6 +329,112 @@ class RobotsParser:
                     (domain, content, int(time.time()), hash_val)
                 )
 
+    @staticmethod
+    def _parse_crawl_delays(lines: List[str]) -> Dict[str, float]:
+        """
+        Map user agents to their Crawl-delay. RobotFileParser only understands integer
+        delays, while fractional ones ("Crawl-delay: 0.5") are common.
+        """
+        delays = {}
+        agents, in_rules = [], False
+        for line in lines:
+            line = line.split("#", 1)[0].strip()
+            if ":" not in line:
+                continue
+            key, value = (part.strip() for part in line.split(":", 1))
+            key = key.lower()
+            if key == "user-agent":
+                if in_rules:
+                    agents, in_rules = [], False
+                agents.append(value.lower())
+            else:
+                in_rules = True
+                if key == "crawl-delay":
+                    try:
+                        delay = float(value)
+                    except ValueError:
+                        continue
+                    for agent in agents:
+                        delays.setdefault(agent, delay)
+        return delays
+
+    def _build_rules(self, content: str, expires_at: float):
+        lines = content.splitlines()
+        parser = RobotFileParser()
+        parser.parse(lines)
+        return parser, self._parse_crawl_delays(lines), expires_at
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.FETCH_TIMEOUT)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _load_rules(self, scheme: str, domain: str):
+        """Load rules for a host from SQLite, or fetch them when missing or stale."""
+        content, fetch_time = await asyncio.to_thread(self._get_cached_rules, domain)
+        now = time.time()
+        if content is not None and now - fetch_time < self.cache_ttl:
+            return self._build_rules(content, fetch_time + self.cache_ttl)
+
+        try:
+            # Ensure we use the same scheme as the input URL
+            robots_url = f"{scheme}://{domain}/robots.txt"
+            async with self._get_session().get(robots_url, ssl=False) as response:
+                if response.status == 200:
+                    fresh = await response.text()
+                    await asyncio.to_thread(self._cache_rules, domain, fresh)
+                    return self._build_rules(fresh, now + self.cache_ttl)
+                if 400 <= response.status < 500:
+                    # No robots.txt: everything is allowed
+                    return None, {}, now + self.cache_ttl
+        except Exception as _ex:
+            pass
+
+        # Fetch failed (timeout, connection failed, 5xx): fall back to stale rules, or allow access
+        if content is not None:
+            return self._build_rules(content, now + self.ERROR_TTL)
+        return None, {}, now + self.ERROR_TTL
+
+    async def _get_rules(self, parsed):
+        domain = parsed.netloc
+        entry = self._rules.get(domain)
+        if entry is not None and entry[2] > time.time():
+            self._rules.move_to_end(domain)
+            return entry
+
+        # Single flight: concurrent checks for the same host share one load
+        inflight = self._inflight.get(domain)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[domain] = future
+        try:
+            entry = await self._load_rules(parsed.scheme or "http", domain)
+        except BaseException:
+            # Waiters fall back to allowing access instead of inheriting the failure
+            future.set_result((None, {}, 0))
+            raise
+        finally:
+            self._inflight.pop(domain, None)
+        future.set_result(entry)
+
+        self._rules[domain] = entry
+        self._rules.move_to_end(domain)
+        while len(self._rules) > self.max_entries:
+            self._rules.popitem(last=False)
+        return entry
+
     async def can_fetch(self, url: str, user_agent: str = "*") -> bool:
         """
         Check if URL can be fetched according to robots.txt rules.
@@ -324,55 +449,57 @@ class RobotsParser:
         # Handle empty/invalid URLs
         try:
             parsed = urlparse(url)
-            domain = parsed.netloc
-            if not domain:
+            if not parsed.netloc:
                 return True
         except Exception as _ex:
             return True
 
-        # Fast path - check cache first
-        rules, is_fresh = self._get_cached_rules(domain)
-        
-        # If rules not found or stale, fetch new ones
-        if not is_fresh:
-            try:
-                # Ensure we use the same scheme as the input URL
-                scheme = parsed.scheme or 'http'
-                robots_url = f"{scheme}://{domain}/robots.txt"
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(robots_url, timeout=2, ssl=False) as response:
-                        if response.status == 200:
-                            rules = await response.text()
-                            self._cache_rules(domain, rules)
-                        else:
-                            return True
-            except Exception as _ex:
-                # On any error (timeout, connection failed, etc), allow access
-                return True
-
-        if not rules:
-            return True
-
-        # Create parser for this check
-        parser = RobotFileParser() 
-        parser.parse(rules.splitlines())
-        
-        # If parser can't read rules, allow access
-        if not parser.mtime():
+        parser, _, _ = await self._get_rules(parsed)
+        if parser is None:
             return True
-            
         return parser.can_fetch(user_agent, url)
 
+    async def get_crawl_delay(self, url: str, user_agent: str = "*") -> Optional[float]:
+        """
+        Get the delay in seconds robots.txt asks for between requests to the URL's host.
+
+        Uses `Crawl-delay` for the most specific matching user agent, falling back to
+        `Request-rate`. Returns None when robots.txt sets neither.
+        """
+        try:
+            parsed = urlparse(url)
+            if not parsed.netloc:
+                return None
+        except Exception as _ex:
+            return None
+
+        parser, delays, _ = await self._get_rules(parsed)
+        if parser is None:
+            return None
+        agent = (user_agent or "*").split("/")[0].lower()
+        for name, delay in delays.items():
+            if name != "*" and name in agent:
+                return delay
+        if "*" in delays:
+            return delays["*"]
+        rate = parser.request_rate(user_agent)
+        if rate and rate.requests:
+            return rate.seconds / rate.requests
+        return None
+
     def clear_cache(self):
         """Clear all cached robots.txt entries"""
+        self._rules.clear()
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("DELETE FROM robots_cache")
 
     def clear_expired(self):
         """Remove only expired entries from cache"""
+        now = time.time()
+        for domain in [d for d, entry in self._rules.items() if entry[2] <= now]:
+            del self._rules[domain]
         with sqlite3.connect(self.db_path) as conn:
-            expire_time = int(time.time()) - self.cache_ttl
+            expire_time = int(now) - self.cache_ttl
             conn.execute("DELETE FROM robots_cache WHERE fetch_time < ?", (expire_time,))
       
 
@@ -631,6 +758,63 @@ def get_home_folder():
     os.makedirs(f"{home_folder}/models", exist_ok=True)
     return home_folder
 
+
+def screenshot_image_format(data: bytes) -> str:
+    """Image format ("png", "jpeg" or "webp") of raw screenshot bytes."""
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+    if data[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    return "png"
+
+
+def is_image_bytes(data: bytes) -> bool:
+    """True if `data` starts like a PNG, JPEG or WebP file."""
+    return data[:4] == b"\x89PNG" or data[:3] == b"\xff\xd8\xff" or (data[:4] == b"RIFF" and data[8:12] == b"WEBP")
+
+
+def screenshot_to_bytes(screenshot: Union[str, bytes, None], read_files: bool = True) -> Optional[bytes]:
+    """
+    Raw image bytes of a screenshot in any form result.screenshot takes: bytes,
+    base64 text or, with `read_files`, the path of an image written by
+    screenshot_output="file". Returns None for anything else.
+    """
+    if not screenshot:
+        return None
+    if isinstance(screenshot, bytes):
+        return screenshot if is_image_bytes(screenshot) else None
+    if read_files and len(screenshot) < 4096 and os.path.isfile(screenshot):
+        with open(screenshot, "rb") as f:
+            data = f.read()
+        return data if is_image_bytes(data) else None
+    try:
+        data = base64.b64decode(screenshot, validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return data if is_image_bytes(data) else None
+
+
+async def format_screenshot(
+    data: bytes, output: str = "base64", path: Optional[str] = None, image_format: Optional[str] = None
+) -> Union[str, bytes]:
+    """
+    Screenshot bytes in the form `screenshot_output` asks for: base64 text, the raw
+    bytes, or the path of a file written to `path` (a file, or a directory for a
+    generated name). Encoding and writing run in a worker thread.
+    """
+    if output == "bytes":
+        return data
+    if output == "file":
+        image_format = image_format or screenshot_image_format(data)
+        if not path or os.path.isdir(path) or not os.path.splitext(path)[1]:
+            directory = path or os.path.join(get_home_folder(), "screenshots")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"{uuid.uuid4().hex}.{image_format}")
+        await asyncio.to_thread(Path(path).write_bytes, data)
+        return path
+    encoded = await asyncio.to_thread(base64.b64encode, data)
+    return encoded.decode("ascii")
+
 async def get_chromium_path(browser_type) -> str:
     """Returns the browser executable path using playwright's browser management.
     
@@ -2226,6 +2410,19 @@ def normalize_url(href, base_url):
 
 
 
+@lru_cache(maxsize=32)
+def _url_canonicalizer(drop_query_tracking: bool, sort_query: bool, keep_fragment: bool, extra_drop_params: frozenset):
+    """Canonicalizer for a normalize_url() option set; the defaults share DEFAULT_CANONICALIZER."""
+    if drop_query_tracking and sort_query and not keep_fragment and not extra_drop_params:
+        return DEFAULT_CANONICALIZER
+    return URLCanonicalizer(
+        tracking_params=DEFAULT_TRACKING_PARAMS if drop_query_tracking else (),
+        extra_tracking_params=extra_drop_params if drop_query_tracking else (),
+        sort_query=sort_query,
+        keep_fragment=keep_fragment,
+    )
+
+
 def normalize_url(
     href: str,
     base_url: str,
@@ -2259,170 +2456,22 @@ def normalize_url(
     -------
     str | None
         A clean, canonical URL or None if href is empty/None.
+        See crawl4ai.url_canonicalizer for the canonical form.
     """
-    if not href:
-        return None
-
-    # Resolve relative paths first
-    full_url = urljoin(base_url, href.strip())
-    
-    # Preserve HTTPS if requested and original scheme was HTTPS
-    if preserve_https and original_scheme == 'https':
-        parsed_full = urlparse(full_url)
-        parsed_base = urlparse(base_url)
-        # Only preserve HTTPS for same-domain links (not protocol-relative URLs)
-        # Protocol-relative URLs (//example.com) should follow the base URL's scheme
-        if (parsed_full.scheme == 'http' and 
-            parsed_full.netloc == parsed_base.netloc and
-            not href.strip().startswith('//')):
-            full_url = full_url.replace('http://', 'https://', 1)
-
-    # Parse once, edit parts, then rebuild
-    parsed = urlparse(full_url)
-
-    # ── netloc ──
-    netloc = parsed.netloc.lower()
-
-    # ── path ──
-    # Strip duplicate slashes and trailing "/" (except root)
-    # IMPORTANT: Don't use quote(unquote()) as it mangles + signs in URLs
-    # The path from urlparse is already properly encoded
-    path = parsed.path
-    if path.endswith('/') and path != '/':
-        path = path.rstrip('/')
-
-    # ── query ──
-    query = parsed.query
-    if query:
-        # explode, mutate, then rebuild
-        params = [(k.lower(), v) for k, v in parse_qsl(query, keep_blank_values=True)]
-
-        if drop_query_tracking:
-            default_tracking = {
-                'utm_source', 'utm_medium', 'utm_campaign', 'utm_term',
-                'utm_content', 'gclid', 'fbclid', 'ref', 'ref_src'
-            }
-            if extra_drop_params:
-                default_tracking |= {p.lower() for p in extra_drop_params}
-            params = [(k, v) for k, v in params if k not in default_tracking]
-
-        if sort_query:
-            params.sort(key=lambda kv: kv[0])
-
-        query = urlencode(params, doseq=True) if params else ''
-
-    # ── fragment ──
-    fragment = parsed.fragment if keep_fragment else ''
-
-    # Re-assemble
-    normalized = urlunparse((
-        parsed.scheme,
-        netloc,
-        path,
-        parsed.params,
-        query,
-        fragment
-    ))
-
-    return normalized
+    canonicalizer = _url_canonicalizer(
+        drop_query_tracking, sort_query, keep_fragment, frozenset(p.lower() for p in extra_drop_params or ())
+    )
+    return canonicalizer.resolve(href, base_url, preserve_https=preserve_https and original_scheme == 'https')
 
 
 def normalize_url_for_deep_crawl(href, base_url, preserve_https=False, original_scheme=None):
-    """Normalize URLs to ensure consistent format"""
-    from urllib.parse import urljoin, urlparse, urlunparse, parse_qs, urlencode
+    """Normalize URLs to ensure consistent format (the shared canonical form)"""
+    return DEFAULT_CANONICALIZER.resolve(href, base_url, preserve_https=preserve_https and original_scheme == 'https')
 
-    # Handle None or empty values
-    if not href:
-        return None
 
-    # Use urljoin to handle relative URLs
-    full_url = urljoin(base_url, href.strip())
-    
-    # Preserve HTTPS if requested and original scheme was HTTPS
-    if preserve_https and original_scheme == 'https':
-        parsed_full = urlparse(full_url)
-        parsed_base = urlparse(base_url)
-        # Only preserve HTTPS for same-domain links (not protocol-relative URLs)
-        # Protocol-relative URLs (//example.com) should follow the base URL's scheme
-        if (parsed_full.scheme == 'http' and 
-            parsed_full.netloc == parsed_base.netloc and
-            not href.strip().startswith('//')):
-            full_url = full_url.replace('http://', 'https://', 1)
-    
-    # Parse the URL for normalization
-    parsed = urlparse(full_url)
-    
-    # Convert hostname to lowercase
-    netloc = parsed.netloc.lower()
-    
-    # Remove fragment entirely
-    fragment = ''
-    
-    # Normalize query parameters if needed
-    query = parsed.query
-    if query:
-        # Parse query parameters
-        params = parse_qs(query)
-        
-        # Remove tracking parameters (example - customize as needed)
-        tracking_params = ['utm_source', 'utm_medium', 'utm_campaign', 'ref', 'fbclid']
-        for param in tracking_params:
-            if param in params:
-                del params[param]
-                
-        # Rebuild query string, sorted for consistency
-        query = urlencode(params, doseq=True) if params else ''
-    
-    # Build normalized URL
-    normalized = urlunparse((
-        parsed.scheme,
-        netloc,
-        parsed.path.rstrip('/'),  # Normalize trailing slash
-        parsed.params,
-        query,
-        fragment
-    ))
-    
-    return normalized
-
-@lru_cache(maxsize=10000)
 def efficient_normalize_url_for_deep_crawl(href, base_url, preserve_https=False, original_scheme=None):
-    """Efficient URL normalization with proper parsing"""
-    from urllib.parse import urljoin
-    
-    if not href:
-        return None
-    
-    # Resolve relative URLs
-    full_url = urljoin(base_url, href.strip())
-    
-    # Preserve HTTPS if requested and original scheme was HTTPS
-    if preserve_https and original_scheme == 'https':
-        parsed_full = urlparse(full_url)
-        parsed_base = urlparse(base_url)
-        # Only preserve HTTPS for same-domain links (not protocol-relative URLs)
-        # Protocol-relative URLs (//example.com) should follow the base URL's scheme
-        if (parsed_full.scheme == 'http' and 
-            parsed_full.netloc == parsed_base.netloc and
-            not href.strip().startswith('//')):
-            full_url = full_url.replace('http://', 'https://', 1)
-    
-    # Use proper URL parsing
-    parsed = urlparse(full_url)
-    
-    # Only perform the most critical normalizations
-    # 1. Lowercase hostname
-    # 2. Remove fragment
-    normalized = urlunparse((
-        parsed.scheme,
-        parsed.netloc.lower(),
-        parsed.path.rstrip('/'),
-        parsed.params,
-        parsed.query,
-        ''  # Remove fragment
-    ))
-    
-    return normalized
+    """Efficient URL normalization; same canonical form as normalize_url_for_deep_crawl"""
+    return DEFAULT_CANONICALIZER.resolve(href, base_url, preserve_https=preserve_https and original_scheme == 'https')
 
 
 def normalize_url_tmp(href, base_url):
@@ -2948,37 +2997,156 @@ def optimize_html(html_str, threshold=200):
     return lxml.html.tostring(root, encoding='unicode', pretty_print=False)
 
 class HeadPeekr:
+    """
+    Fetches only the <head> of pages, for filters that judge URLs by their metadata.
+
+    All lookups share one pooled httpx client, closed when the last AsyncWebCrawler
+    using it closes (see acquire/release). Concurrent lookups of the same URL share
+    a single request, and parsed results (head, title, meta tags) are kept in an LRU with
+    a TTL, so several filters evaluating the same URL hit the network once. Bodies are
+    requested with a Range header (servers that ignore it are cut off anyway) and read
+    into a bytearray, scanning only the newly arrived bytes for `</head>`.
+    """
+
+    MAX_BYTES = 64 * 1024
+    CACHE_SIZE = 4096
+    CACHE_TTL = 10 * 60
+    # Failed lookups are retried sooner
+    NEGATIVE_TTL = 60
+    MAX_CONNECTIONS = 64
+
+    _HEAD_END_RE = re.compile(rb"</head\s*>", re.IGNORECASE)
+    _HEADERS = {
+        "User-Agent": "Mozilla/5.0 (compatible; CrawlBot/1.0)",
+        "Accept": "text/html",
+    }
+
+    _client: Optional[httpx.AsyncClient] = None
+    _client_loop = None
+    _users = 0
+    _cache: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+    _inflight: Dict[str, asyncio.Future] = {}
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if cls._client is None or cls._client.is_closed or cls._client_loop is not loop:
+            cls._client = httpx.AsyncClient(
+                headers=cls._HEADERS,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=cls.MAX_CONNECTIONS,
+                    max_keepalive_connections=cls.MAX_CONNECTIONS,
+                ),
+            )
+            cls._client_loop = loop
+        return cls._client
+
+    @classmethod
+    async def aclose(cls):
+        """Close the shared client"""
+        client, cls._client = cls._client, None
+        if client is None or client.is_closed:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        # A client bound to another (possibly closed) loop can only be dropped
+        if cls._client_loop is running:
+            await client.aclose()
+
+    @classmethod
+    def acquire(cls):
+        """Register a user of the shared client (an AsyncWebCrawler being started)."""
+        cls._users += 1
+
+    @classmethod
+    async def release(cls):
+        """Unregister a user; the last one closes the shared client."""
+        cls._users = max(0, cls._users - 1)
+        if cls._users == 0:
+            await cls.aclose()
+
+    @classmethod
+    def clear_cache(cls):
+        cls._cache.clear()
+
     @staticmethod
-    async def fetch_head_section(url, timeout=0.3):
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; CrawlBot/1.0)",
-            "Accept": "text/html",
-            "Connection": "close"  # Force close after response
-        }
+    async def fetch_head_section(url, timeout=0.3, max_bytes=None):
+        max_bytes = max_bytes or HeadPeekr.MAX_BYTES
+        headers = {"Range": f"bytes=0-{max_bytes - 1}"}
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                
-                # Handle redirects explicitly by using the final URL
-                if response.url != url:
-                    url = str(response.url)
-                    response = await client.get(url, headers=headers)
-                
-                content = b""
+            client = HeadPeekr._get_client()
+            async with client.stream("GET", url, headers=headers, timeout=timeout) as response:
+                buffer = bytearray()
                 async for chunk in response.aiter_bytes():
-                    content += chunk
-                    if b"</head>" in content:
-                        break  # Stop after detecting </head>
-                return content.split(b"</head>")[0] + b"</head>"
+                    # Only the new bytes (plus a tag-sized overlap) need scanning
+                    start = max(0, len(buffer) - 8)
+                    buffer += chunk
+                    match = HeadPeekr._HEAD_END_RE.search(buffer, start)
+                    if match:
+                        return bytes(buffer[:match.start()]) + b"</head>"
+                    if len(buffer) >= max_bytes:
+                        break
+                return bytes(buffer[:max_bytes]) + b"</head>"
         except (httpx.HTTPError, gaierror) :
             return None
 
     @staticmethod
-    async def peek_html(url, timeout=0.3):
+    async def _load(url, timeout):
         head_section = await HeadPeekr.fetch_head_section(url, timeout=timeout)
-        if head_section:
-            return head_section.decode("utf-8", errors="ignore")
-        return None
+        if not head_section:
+            return None
+        head = head_section.decode("utf-8", errors="ignore")
+        return {
+            "head": head,
+            "title": HeadPeekr.get_title(head),
+            "meta": HeadPeekr.extract_meta_tags(head),
+        }
+
+    @staticmethod
+    async def peek(url, timeout=0.3) -> Optional[Dict[str, Any]]:
+        """
+        Get the parsed head of a page.
+
+        Returns:
+            dict with "head" (str), "title" (str or None) and "meta" (dict), or None if
+            the page could not be fetched.
+        """
+        cache = HeadPeekr._cache
+        entry = cache.get(url)
+        if entry is not None and entry[0] > time.monotonic():
+            cache.move_to_end(url)
+            return entry[1]
+
+        inflight = HeadPeekr._inflight.get(url)
+        if inflight is not None and inflight.get_loop() is asyncio.get_running_loop():
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        HeadPeekr._inflight[url] = future
+        try:
+            info = await HeadPeekr._load(url, timeout)
+        except BaseException:
+            future.set_result(None)
+            raise
+        finally:
+            if HeadPeekr._inflight.get(url) is future:
+                del HeadPeekr._inflight[url]
+        future.set_result(info)
+
+        ttl = HeadPeekr.CACHE_TTL if info is not None else HeadPeekr.NEGATIVE_TTL
+        cache[url] = (time.monotonic() + ttl, info)
+        cache.move_to_end(url)
+        while len(cache) > HeadPeekr.CACHE_SIZE:
+            cache.popitem(last=False)
+        return info
+
+    @staticmethod
+    async def peek_html(url, timeout=0.3):
+        info = await HeadPeekr.peek(url, timeout=timeout)
+        return info["head"] if info else None
 
     @staticmethod
     def extract_meta_tags(head_content: str):
@@ -3000,6 +3168,7 @@ class HeadPeekr:
                 
         return meta_tags
 
+    @staticmethod
     def get_title(head_content: str):
         title_match = re.search(r'<title>(.*?)</title>', head_content, re.IGNORECASE | re.DOTALL)
         return title_match.group(1) if title_match else None
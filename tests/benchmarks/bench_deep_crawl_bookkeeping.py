@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Measure deep-crawl bookkeeping overhead on one very wide level.
+
+A synthetic in-process site serves a hub page that links to `--links` leaf pages;
+every leaf links back to the hub and to a few siblings (all already seen). Pages
+are answered instantly, so the timings are the strategies' own per-result work:
+parent/depth lookups, link admission, frontier pushes and scheduling.
+
+    python tests/benchmarks/bench_deep_crawl_bookkeeping.py --links 100000
+"""
+
+import argparse
+import asyncio
+import time
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.deep_crawling import BestFirstCrawlingStrategy, BFSDeepCrawlStrategy
+from crawl4ai.models import CrawlResult
+
+HUB = "https://synthetic.test/"
+
+
+class SyntheticSite:
+    """Generates pages on demand; the link graph is a pure function of the URL."""
+
+    def __init__(self, links: int, sibling_links: int = 3):
+        self.links = links
+        self.sibling_links = sibling_links
+
+    def links_of(self, url: str):
+        if url == HUB:
+            return [{"href": f"{HUB}page/{i}"} for i in range(self.links)]
+        n = int(url.rsplit("/", 1)[1])
+        siblings = [{"href": f"{HUB}page/{(n + k) % self.links}"} for k in range(1, self.sibling_links + 1)]
+        return [{"href": HUB}] + siblings
+
+
+def make_dispatcher(concurrency: int) -> MemoryAdaptiveDispatcher:
+    # arun_many's default dispatcher, minus the rate limiter and memory throttling
+    return MemoryAdaptiveDispatcher(
+        memory_threshold_percent=101.0, critical_threshold_percent=101.0, max_session_permit=concurrency
+    )
+
+
+class InProcessCrawler:
+    def __init__(self, site: SyntheticSite, concurrency: int):
+        self.site = site
+        self.concurrency = concurrency
+
+    async def arun(self, url, config=None, **kwargs):
+        return CrawlResult(url=url, html="", success=True, links={"internal": self.site.links_of(url)})
+
+    async def arun_many(self, urls, config=None, **kwargs):
+        # Same dispatcher path as AsyncWebCrawler.arun_many, so every mode pays the same per-URL cost
+        dispatcher = make_dispatcher(self.concurrency)
+        if config.stream:
+            async def stream():
+                async for task_result in dispatcher.run_urls_stream(urls=urls, crawler=self, config=config):
+                    yield task_result.result
+            return stream()
+        return [r.result for r in await dispatcher.run_urls(urls=urls, crawler=self, config=config)]
+
+
+async def run(label: str, strategy, links: int, stream: bool, concurrency: int):
+    crawler = InProcessCrawler(SyntheticSite(links), concurrency)
+    config = CrawlerRunConfig(stream=stream)
+    start = time.perf_counter()
+    if stream:
+        count = 0
+        async for _ in await strategy.arun(HUB, crawler, config):
+            count += 1
+    else:
+        count = len(await strategy.arun(HUB, crawler, config))
+    elapsed = time.perf_counter() - start
+    print(f"{label:>28}: {count} results in {elapsed:6.2f}s ({count / elapsed:8.0f} results/s)")
+
+
+async def main(links: int, concurrency: int):
+    def dispatcher():
+        return make_dispatcher(concurrency)
+
+    level = BFSDeepCrawlStrategy
+    await run("BFS level-by-level (batch)", level(max_depth=1, pipeline=False), links, False, concurrency)
+    await run("BFS level-by-level (stream)", level(max_depth=1, pipeline=False), links, True, concurrency)
+    await run(
+        "BFS pipelined",
+        BFSDeepCrawlStrategy(max_depth=1, dispatcher=dispatcher(), max_concurrency=concurrency),
+        links,
+        True,
+        concurrency,
+    )
+    await run(
+        "Best-first",
+        BestFirstCrawlingStrategy(max_depth=1, dispatcher=dispatcher(), max_concurrency=concurrency),
+        links,
+        True,
+        concurrency,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--links", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+    asyncio.run(main(args.links, args.concurrency))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Compare FilterChain's compiled plan with calling each filter's apply() per URL.
+
+The chain mimics a customer blocklist: a DomainFilter with blocked domains, a
+reversed URLPatternFilter with path globs and section prefixes, plus a
+ContentTypeFilter. The total pattern count is `--patterns`. The plan is timed on all
+`--urls` URLs, in page-sized apply_many() batches. Calling every filter per URL is
+far too slow at that size, so that path is timed on `--legacy-sample` URLs and
+extrapolated. Both paths must return the same verdicts on the sample.
+
+    python tests/benchmarks/bench_filter_plan.py --urls 1000000 --patterns 10000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from crawl4ai.deep_crawling import ContentTypeFilter, DomainFilter, FilterChain, URLPatternFilter
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "zu", "pe", "xa", "qi", "do", "fe", "gu", "ho"]
+EXTENSIONS = [""] * 6 + [".html", ".php", ".pdf", ".jpg", ".zip"]
+
+
+def word(rng: random.Random, syllables: int = 3) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(syllables))
+
+
+def build_chain(rng: random.Random, patterns: int, sites: list) -> FilterChain:
+    domains = [f"{word(rng)}.example" for _ in range(patterns * 4 // 10)]
+    globs = [f"*/{word(rng)}/{word(rng)}*" for _ in range(patterns * 4 // 10)]
+    prefixes = [f"https://{rng.choice(sites)}/{word(rng, 2)}/*" for _ in range(patterns - len(domains) - len(globs))]
+    return FilterChain(
+        [
+            DomainFilter(blocked_domains=domains),
+            URLPatternFilter(globs + prefixes, reverse=True),
+            ContentTypeFilter(["text/html"]),
+        ]
+    )
+
+
+def make_urls(rng: random.Random, count: int, sites: list) -> list:
+    urls = []
+    for _ in range(count):
+        path = "/".join(word(rng, rng.randint(1, 3)) for _ in range(rng.randint(1, 5)))
+        urls.append(f"https://{rng.choice(sites)}/{path}{rng.choice(EXTENSIONS)}")
+    return urls
+
+
+def legacy(chain: FilterChain, urls: list) -> list:
+    return [all(f.apply(url) for f in chain.filters) for url in urls]
+
+
+async def compiled(chain: FilterChain, urls: list, batch: int) -> list:
+    verdicts = []
+    for i in range(0, len(urls), batch):
+        verdicts += await chain.apply_many(urls[i : i + batch])
+    return verdicts
+
+
+def main(url_count: int, patterns: int, legacy_sample: int, batch: int):
+    rng = random.Random(42)
+    sites = [f"{word(rng, 2)}.test" for _ in range(200)]
+    chain = build_chain(rng, patterns, sites)
+    start = time.perf_counter()
+    urls = make_urls(rng, url_count, sites)
+    print(f"generated {len(urls)} URLs in {time.perf_counter() - start:.1f}s; {patterns} patterns")
+
+    start = time.perf_counter()
+    chain.compile()
+    print(f"{'compile plan':>24}: {time.perf_counter() - start:8.2f}s")
+
+    sample = urls[:legacy_sample]
+    start = time.perf_counter()
+    expected = legacy(chain, sample)
+    elapsed = time.perf_counter() - start
+    per_url = elapsed / len(sample)
+    print(
+        f"{'per-filter apply()':>24}: {elapsed:8.2f}s for {len(sample)} URLs "
+        f"({per_url * 1e6:8.1f} us/URL, ~{per_url * len(urls):.0f}s for all)"
+    )
+
+    start = time.perf_counter()
+    verdicts = asyncio.run(compiled(chain, urls, batch))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{'compiled plan':>24}: {elapsed:8.2f}s for {len(urls)} URLs "
+        f"({elapsed / len(urls) * 1e6:8.1f} us/URL, {sum(verdicts)} admitted)"
+    )
+    assert verdicts[: len(sample)] == expected, "compiled plan disagrees with per-filter apply()"
+    order = ", ".join(f"{step.filter.name} {step.rejection_rate:.0%}" for step in chain.compile().steps)
+    print(f"{'step order':>24}: {order}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--urls", type=int, default=1_000_000)
+    parser.add_argument("--patterns", type=int, default=10_000)
+    parser.add_argument("--legacy-sample", type=int, default=2_000)
+    parser.add_argument("--batch", type=int, default=500, help="links per apply_many() call, like one page")
+    args = parser.parse_args()
+    main(args.urls, args.patterns, args.legacy_sample, args.batch)
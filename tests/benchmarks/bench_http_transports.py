@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark AsyncHTTPCrawlerStrategy transports against a local TLS server.
+
+The server speaks HTTP/1.1 and HTTP/2 (negotiated via ALPN) with a self-signed
+certificate, so the numbers are dominated by handshakes and multiplexing rather
+than by the network:
+
+    python tests/benchmarks/bench_http_transports.py --requests 500 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import datetime
+import ssl
+import tempfile
+import time
+
+import h2.config
+import h2.connection
+import h2.events
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from crawl4ai.async_configs import CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import AsyncHTTPCrawlerStrategy
+
+PAGE = b"<html><head><title>bench</title></head><body>" + b"<p>hello</p>" * 200 + b"</body></html>"
+
+
+def _server_ssl_context() -> ssl.SSLContext:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    with tempfile.NamedTemporaryFile("wb", suffix=".pem", delete=False) as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ))
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(f.name)
+    context.set_alpn_protocols(["h2", "http/1.1"])
+    return context
+
+
+async def _serve_http1(reader, writer):
+    headers = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+        b"Content-Length: " + str(len(PAGE)).encode() + b"\r\n\r\n"
+    )
+    while True:
+        request = await reader.readuntil(b"\r\n\r\n")
+        if not request:
+            break
+        writer.write(headers + PAGE)
+        await writer.drain()
+
+
+async def _serve_http2(reader, writer):
+    conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+    conn.initiate_connection()
+    writer.write(conn.data_to_send())
+    while data := await reader.read(65536):
+        for event in conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                conn.send_headers(event.stream_id, [
+                    (":status", "200"),
+                    ("content-type", "text/html; charset=utf-8"),
+                    ("content-length", str(len(PAGE))),
+                ])
+                conn.send_data(event.stream_id, PAGE, end_stream=True)
+        writer.write(conn.data_to_send())
+        await writer.drain()
+
+
+async def _handle(reader, writer):
+    try:
+        protocol = writer.get_extra_info("ssl_object").selected_alpn_protocol()
+        await (_serve_http2 if protocol == "h2" else _serve_http1)(reader, writer)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _run(label: str, url: str, requests: int, concurrency: int, **strategy_kwargs) -> None:
+    config = HTTPCrawlerConfig(verify_ssl=False)
+    run_config = CrawlerRunConfig()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncHTTPCrawlerStrategy(config, max_connections=concurrency, **strategy_kwargs) as crawler:
+        async def fetch(i):
+            async with semaphore:
+                await crawler.crawl(f"{url}/page/{i}", run_config)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(fetch(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+        stats = crawler.get_connection_stats()
+
+    print(
+        f"{label:<22} {requests / elapsed:>9.1f} req/s  "
+        f"connections={stats['connections_created']:<4} "
+        f"reuse={stats['reuse_ratio']:.2f}  http2={stats['http2_requests']}"
+    )
+
+
+async def main(requests: int, concurrency: int) -> None:
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0, ssl=_server_ssl_context())
+    url = f"https://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    async with server:
+        await _run("aiohttp (HTTP/1.1)", url, requests, concurrency, transport="aiohttp")
+        await _run("httpx (HTTP/1.1)", url, requests, concurrency, transport="httpx", http2=False)
+        await _run("httpx (HTTP/2)", url, requests, concurrency, transport="httpx", http2=True)
+        await _run(
+            "httpx (HTTP/2, 8/host)", url, requests, concurrency,
+            transport="httpx", http2=True, limit_per_host=8,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
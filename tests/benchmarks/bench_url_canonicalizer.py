@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Time link resolution for pages of `--links` hrefs: a fresh URLCanonicalizer (cold
+cache), the same canonicalizer again (warm cache) and one normalize_url() call per
+link. Every page mixes same-host links with tracking parameters, external links and
+a few empty, fragment-only and mailto hrefs; all three paths must agree.
+
+    python tests/benchmarks/bench_url_canonicalizer.py --links 2000 --pages 50
+"""
+
+import argparse
+import time
+
+from crawl4ai import URLCanonicalizer
+from crawl4ai.utils import normalize_url
+
+BASE = "https://example.com/a/b/page.html?x=1#top"
+
+
+def make_page(links: int, page: int) -> list:
+    same_host = links * 3 // 4
+    hrefs = [f"/docs/section-{i % 50}/page-{page}-{i}.html?utm_source=nav&id={i}" for i in range(same_host)]
+    hrefs += [f"https://other{i % 20}.example.org/{page}/{i}/" for i in range(links - same_host - 25)]
+    hrefs += ["#top", "", None, "../up", "mailto:a@b.c"] * 5
+    return hrefs
+
+
+def timed(label: str, resolve, pages: list, links: int) -> list:
+    start = time.perf_counter()
+    resolved = [resolve(hrefs) for hrefs in pages]
+    per_page = (time.perf_counter() - start) / len(pages)
+    print(f"{label:>24}: {per_page * 1e3:8.2f} ms/page ({per_page / links * 1e6:6.2f} us/link)")
+    return resolved
+
+
+def main(links: int, pages: int):
+    site = [make_page(links, page) for page in range(pages)]
+    canonicalizer = URLCanonicalizer()
+    cold = timed("canonicalizer (cold)", lambda hrefs: canonicalizer.resolve_many(hrefs, BASE), site, links)
+    warm = timed("canonicalizer (warm)", lambda hrefs: canonicalizer.resolve_many(hrefs, BASE), site, links)
+    per_link = timed(
+        "normalize_url per link",
+        lambda hrefs: [normalize_url(href, BASE) if href else None for href in hrefs],
+        site,
+        links,
+    )
+    assert cold == warm == per_link, "canonicalizer disagrees with normalize_url()"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--links", type=int, default=2_000, help="hrefs per page")
+    parser.add_argument("--pages", type=int, default=50)
+    args = parser.parse_args()
+    main(args.links, args.pages)
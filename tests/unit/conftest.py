@@ -0,0 +1,118 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from crawl4ai.models import CrawlResult
+
+
+class FakeCrawler:
+    """
+    Stand-in for AsyncWebCrawler in deep-crawl tests.
+
+    Records the crawl order (``crawled``, and ``events`` of ("start"|"end", url)) and
+    concurrency (``active``, ``peak``), sleeps ``delay`` seconds (a callable gets the
+    URL; None does not yield at all) and returns ``page(url, config)``. By default
+    every page links to ``fanout`` children of its URL.
+    """
+
+    def __init__(self, page=None, fanout=3, delay=None):
+        self.page = page or self.tree_page
+        self.fanout = fanout
+        self.delay = delay
+        self.crawled = []
+        self.events = []
+        self.active = 0
+        self.peak = 0
+
+    @staticmethod
+    def result(url, links=(), **fields):
+        """Successful result whose internal links are the hrefs in ``links``."""
+        fields.setdefault("links", {"internal": [{"href": href} for href in links]})
+        return CrawlResult(url=url, html="", success=True, **fields)
+
+    def tree_page(self, url, config=None):
+        base = url.rstrip("/")
+        return self.result(url, [f"{base}/{i}" for i in range(self.fanout)])
+
+    async def arun(self, url, config=None, **kwargs):
+        self.crawled.append(url)
+        self.events.append(("start", url))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            delay = self.delay(url) if callable(self.delay) else self.delay
+            if delay is not None:
+                await asyncio.sleep(delay)
+        finally:
+            self.active -= 1
+        self.events.append(("end", url))
+        return self.page(url, config)
+
+
+class FakeResponse:
+    def __init__(self, url, body, headers=None):
+        self.status_code = 200
+        self.url = url
+        self.headers = headers or {}
+        self._body = body.encode() if isinstance(body, str) else body
+
+    def raise_for_status(self):
+        return None
+
+    async def aiter_bytes(self, chunk_size=None):
+        yield self._body
+
+    async def aclose(self):
+        pass
+
+
+class FakeHTTPClient:
+    """
+    Stand-in for the seeder's httpx.AsyncClient.
+
+    ``responses`` maps URL -> body (it can be changed between runs); HEAD answers 200
+    for those URLs and 404 for the rest, with ``headers[url]`` if given. Every request
+    is logged in ``requests`` as (method, url); GETs are counted in ``fetches`` and
+    their concurrency in ``active``/``peak``, each taking ``delay`` seconds if set.
+    """
+
+    def __init__(self, responses, headers=None, delay=None):
+        self.responses = responses
+        self.headers = headers or {}
+        self.delay = delay
+        self.requests = []
+        self.fetches = 0
+        self.active = 0
+        self.peak = 0
+
+    async def head(self, url, **kwargs):
+        self.requests.append(("HEAD", url))
+        status = 200 if url in self.responses else 404
+        return SimpleNamespace(status_code=status, url=url, headers=self.headers.get(url, {}))
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        self.requests.append((method, url))
+        self.fetches += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if self.delay is not None:
+                await asyncio.sleep(self.delay)
+            yield FakeResponse(url, self.responses[url], self.headers.get(url))
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def fake_crawler():
+    """The FakeCrawler class, called with the site's parameters in each test."""
+    return FakeCrawler
+
+
+@pytest.fixture
+def fake_http_client():
+    """The FakeHTTPClient class, called with the responses of each test."""
+    return FakeHTTPClient
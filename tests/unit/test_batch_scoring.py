@@ -0,0 +1,68 @@
+import random
+
+import numpy as np
+import pytest
+
+from crawl4ai.deep_crawling import (
+    CompositeScorer,
+    ContentTypeScorer,
+    DomainAuthorityScorer,
+    FreshnessScorer,
+    KeywordRelevanceScorer,
+    PathDepthScorer,
+)
+from crawl4ai.deep_crawling.scorers import ParsedURLs
+
+HOSTS = ["python.org", "Docs.Python.org:8080", "github.com", "blog.test", "medium.com"]
+SEGMENTS = ["docs", "Blog", "2019", "2023-05", "2024_01_02", "1899", "tutorial", "api", "", "näme"]
+TAILS = ["", "/", ".html", ".PDF", ".php?id=1", ".tar.gz", ".jpg;w=100", "#top", "?q=2022", ".md_x"]
+
+
+def _random_url(rng):
+    path = "/".join(rng.choice(SEGMENTS) for _ in range(rng.randint(0, 5)))
+    scheme = rng.choice(["https://", "http://", ""])
+    return f"{scheme}{rng.choice(HOSTS)}/{path}{rng.choice(TAILS)}"
+
+
+def _scorers():
+    return [
+        KeywordRelevanceScorer(["python", "Tutorial", "api"], weight=0.7),
+        KeywordRelevanceScorer(["Blog"], case_sensitive=True),
+        KeywordRelevanceScorer([]),
+        PathDepthScorer(optimal_depth=2, weight=1.3),
+        ContentTypeScorer({r"\.html$": 1.0, r"\.pdf$": 0.8, r"\.php$": 0.4, r"tar": 0.3, r"^http://": 0.1}),
+        FreshnessScorer(current_year=2023, weight=0.9),
+        DomainAuthorityScorer({"python.org": 1.0, "docs.python.org": 0.9, "GitHub.com": 0.8}, default_weight=0.2),
+    ]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_score_many_matches_per_url_scores(seed):
+    rng = random.Random(seed)
+    urls = [_random_url(rng) for _ in range(2000)]
+    parsed = ParsedURLs(urls)
+
+    for scorer, reference in zip(_scorers(), _scorers()):
+        batch = scorer.score_many(parsed)
+        assert isinstance(batch, np.ndarray)
+        assert batch.tolist() == [reference.score(url) for url in urls], type(scorer).__name__
+        assert scorer.stats._urls_scored == len(urls)
+        assert scorer.stats.get_average() == pytest.approx(reference.stats.get_average())
+
+    composite = CompositeScorer(_scorers(), normalize=True)
+    assert composite.score_many(urls).tolist() == [CompositeScorer(_scorers()).score(url) for url in urls]
+
+
+def test_score_many_honours_subclassed_per_url_scoring():
+    class ShallowFirst(PathDepthScorer):
+        def _calculate_score(self, url: str) -> float:
+            return 2.0 if url.count("/") < 4 else 0.0
+
+    class Shouting(KeywordRelevanceScorer):
+        def score(self, url: str) -> float:
+            return 10.0
+
+    urls = ["https://a.test/x", "https://a.test/x/y/z"]
+    assert ShallowFirst(weight=0.5).score_many(urls).tolist() == [1.0, 0.0]
+    assert Shouting(["x"]).score_many(urls).tolist() == [10.0, 10.0]
+    assert KeywordRelevanceScorer(["x"]).score_many([]).shape == (0,)
@@ -0,0 +1,57 @@
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import SemaphoreDispatcher
+from crawl4ai.deep_crawling import BestFirstCrawlingStrategy, KeywordRelevanceScorer
+
+ROOT = "https://site.test/"
+
+
+def _site(fake_crawler, delay=0.0):
+    """Every page links to /hot/<n> and /cold/<n> children; /old/ pages redirect."""
+
+    def page(url, config):
+        base = url.rstrip("/")
+        links = [f"{base}/cold/{i}" for i in range(2)] + [f"{base}/hot/0"]
+        if url == ROOT:
+            links.append(f"{base}/old/page")
+        return fake_crawler.result(url.replace("/old/", "/new/"), links)
+
+    return fake_crawler(page=page, delay=delay)
+
+
+def _strategy(**kwargs):
+    return BestFirstCrawlingStrategy(
+        url_scorer=KeywordRelevanceScorer(keywords=["hot", "page"]),
+        dispatcher=SemaphoreDispatcher(semaphore_count=4),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_best_first_order_and_metadata_survive_redirects(fake_crawler):
+    crawler = _site(fake_crawler)
+    results = await _strategy(max_depth=2, max_concurrency=1).arun(ROOT, crawler, CrawlerRunConfig())
+
+    # With one slot every pop sees the links of all pages crawled so far
+    assert crawler.crawled[:3] == [ROOT, "https://site.test/hot/0", "https://site.test/old/page"]
+    # Links of the page just crawled compete immediately: "hot" + "page" beats "hot"
+    assert crawler.crawled[3] == "https://site.test/old/page/hot/0"
+    redirected = next(r for r in results if r.url == "https://site.test/new/page")
+    assert redirected.metadata["depth"] == 1
+    assert redirected.metadata["parent_url"] == ROOT
+    assert redirected.metadata["score"] == 0.5
+    assert len(results) == len(crawler.crawled) == 1 + 4 + 3 * 4
+
+
+@pytest.mark.asyncio
+async def test_best_first_keeps_slots_full_and_stops_at_max_pages(fake_crawler):
+    crawler = _site(fake_crawler, delay=0.01)
+    gen = await _strategy(max_depth=5, max_pages=12, max_concurrency=3).arun(
+        ROOT, crawler, CrawlerRunConfig(stream=True)
+    )
+    results = [r async for r in gen]
+
+    assert len(results) == 12
+    assert len(crawler.crawled) == 12
+    assert crawler.peak == 3
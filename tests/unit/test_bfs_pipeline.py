@@ -0,0 +1,58 @@
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher, SemaphoreDispatcher
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
+
+ROOT = "https://site.test/"
+
+
+def _tree(fake_crawler, fanout, slow=()):
+    """Tree site; `slow` pages take longer than the rest."""
+    return fake_crawler(fanout=fanout, delay=lambda url: 0.2 if url in slow else 0.01)
+
+
+def _dispatcher():
+    return MemoryAdaptiveDispatcher(memory_threshold_percent=101.0, critical_threshold_percent=101.0)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_crawls_every_level_with_depth_and_parent(fake_crawler):
+    crawler = _tree(fake_crawler, 3)
+    strategy = BFSDeepCrawlStrategy(max_depth=2, dispatcher=_dispatcher(), max_concurrency=4)
+    results = await strategy.arun(ROOT, crawler, CrawlerRunConfig())
+
+    assert len(results) == 1 + 3 + 9
+    by_url = {r.url: r for r in results}
+    assert by_url[ROOT].metadata == {"depth": 0, "parent_url": None}
+    assert by_url["https://site.test/1"].metadata["parent_url"] == ROOT
+    assert by_url["https://site.test/1/2"].metadata["depth"] == 2
+    assert by_url["https://site.test/1/2"].metadata["parent_url"] == "https://site.test/1"
+    assert crawler.peak <= 4
+    assert strategy.scheduler_stats["dispatched"] == 13
+
+
+@pytest.mark.asyncio
+async def test_pipeline_does_not_wait_for_slow_page_of_previous_level(fake_crawler):
+    slow = "https://site.test/0"
+    crawler = _tree(fake_crawler, 2, slow=[slow])
+    strategy = BFSDeepCrawlStrategy(max_depth=2, dispatcher=_dispatcher(), max_concurrency=4)
+    await strategy.arun(ROOT, crawler, CrawlerRunConfig())
+
+    slow_end = crawler.events.index(("end", slow))
+    # A grandchild of the fast sibling started while its uncle was still loading
+    assert crawler.events.index(("start", "https://site.test/1/0")) < slow_end
+
+
+@pytest.mark.asyncio
+async def test_pipeline_max_pages_is_exact_in_stream_mode(fake_crawler):
+    crawler = _tree(fake_crawler, 5)
+    strategy = BFSDeepCrawlStrategy(
+        max_depth=3, max_pages=7, dispatcher=SemaphoreDispatcher(semaphore_count=3), max_concurrency=3
+    )
+    gen = await strategy.arun(ROOT, crawler, CrawlerRunConfig(stream=True))
+    results = [r async for r in gen]
+
+    assert len(results) == 7
+    assert sum(1 for e in crawler.events if e[0] == "start") == 7
+    assert [r.metadata["depth"] for r in results][:1] == [0]
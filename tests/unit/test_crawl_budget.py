@@ -0,0 +1,92 @@
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import SemaphoreDispatcher
+from crawl4ai.deep_crawling import BestFirstCrawlingStrategy, CrawlBudget, KeywordRelevanceScorer, MemoryFrontier
+from crawl4ai.models import MarkdownGenerationResult
+
+ROOT = "https://portal.test/"
+RICH = " ".join(f"word{i}" for i in range(300))
+
+
+def _portal(fake_crawler, sites):
+    """
+    The portal links to three sites. spam.test has endless thin listing pages with
+    many links each; docs.test and blog.test have fewer links but full articles.
+    On docs.test only /guide/ pages have content, /tags/ pages are empty.
+    """
+
+    def page(url, config):
+        host = url.split("/")[2]
+        n = len(crawler.crawled)
+        if url == ROOT:
+            text = RICH
+            links = [f"https://{site}/start" for site in sites]
+        elif host == "spam.test":
+            text = "Nothing here"
+            links = [f"https://spam.test/list/{n}-{i}" for i in range(12)]
+        elif host == "docs.test":
+            is_tag = "/tags/" in url
+            text = "" if is_tag else RICH
+            links = [f"https://docs.test/tags/{n}-{i}" for i in range(3)] + [f"https://docs.test/guide/{n}"]
+        else:
+            text = RICH
+            links = [f"https://blog.test/post/{n}-{i}" for i in range(2)]
+        markdown = MarkdownGenerationResult(raw_markdown=text, markdown_with_citations=text, references_markdown="")
+        return fake_crawler.result(url, links, markdown=markdown)
+
+    crawler = fake_crawler(page=page)
+    return crawler
+
+
+async def _crawl(fake_crawler, budget, max_pages=60, sites=("spam.test", "docs.test", "blog.test"), **kwargs):
+    crawler = _portal(fake_crawler, sites)
+    strategy = BestFirstCrawlingStrategy(
+        max_depth=30,
+        max_pages=max_pages,
+        budget=budget,
+        dispatcher=SemaphoreDispatcher(semaphore_count=2),
+        max_concurrency=2,
+        **kwargs,
+    )
+    results = await strategy.arun(ROOT, crawler, CrawlerRunConfig())
+    useful = sum(1 for r in results if r.markdown and len(r.markdown.raw_markdown.split()) >= 200)
+    return useful, crawler, results
+
+
+@pytest.mark.asyncio
+async def test_budget_moves_pages_to_productive_sites_and_prefixes(fake_crawler):
+    baseline, baseline_crawler, _ = await _crawl(fake_crawler, None)
+    budget = CrawlBudget()
+    useful, crawler, results = await _crawl(fake_crawler, budget)
+
+    # Discovery order alone lets the prolific thin site eat the budget
+    assert sum("spam.test" in url for url in baseline_crawler.crawled) > 30
+    assert sum("spam.test" in url for url in crawler.crawled) < 10
+    assert useful >= 2 * baseline
+    allocation = budget.allocation()
+    assert allocation["spam.test"]["mean_reward"] < 0.05
+    assert allocation["docs.test"]["pages"] + allocation["blog.test"]["pages"] > 45
+    assert len(results) == 60
+
+    # Within a site, the empty /tags/ prefix loses its pages to /guide/
+    _, baseline_crawler, _ = await _crawl(fake_crawler, None, max_pages=30, sites=("docs.test",))
+    _, crawler, _ = await _crawl(fake_crawler, CrawlBudget(), max_pages=30, sites=("docs.test",))
+    assert sum("/guide/" in url for url in baseline_crawler.crawled) < 10
+    assert sum("/guide/" in url for url in crawler.crawled) > 2 * sum("/tags/" in url for url in crawler.crawled)
+
+
+@pytest.mark.asyncio
+async def test_budget_keeps_scorer_scores_and_checkpoints_its_state(tmp_path, fake_crawler):
+    scorer = KeywordRelevanceScorer(["guide"])
+    frontier = MemoryFrontier(checkpoint_path=tmp_path / "crawl.ckpt", checkpoint_every=5)
+    budget = CrawlBudget(exploration=0.2)
+    _, _, results = await _crawl(fake_crawler, budget, max_pages=20, url_scorer=scorer, frontier=frontier)
+    assert {r.metadata["score"] for r in results} <= {0.0, 1.0}
+    assert any(r.metadata["score"] == 1.0 for r in results)
+
+    state = frontier.meta["budget"]
+    restored = CrawlBudget(exploration=0.2)
+    restored.load(state)
+    assert restored.allocation() == budget.allocation()
+    assert restored.index("https://spam.test/x") == pytest.approx(budget.index("https://spam.test/x"))
@@ -0,0 +1,99 @@
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import SemaphoreDispatcher
+from crawl4ai.deep_crawling import (
+    BestFirstCrawlingStrategy,
+    BFSDeepCrawlStrategy,
+    CrawlSeed,
+    DFSDeepCrawlStrategy,
+)
+from crawl4ai.deep_crawling.frontier import MemoryFrontier
+from crawl4ai.models import CrawlResult
+
+SITES = ["https://a.test/", "https://b.test/", "https://c.test/"]
+
+
+def _sites_page(url, config):
+    """Every page links to three children; c.test pages also link to a.test/shared; /bad/ pages fail."""
+    if "/bad/" in url:
+        return CrawlResult(url=url, html="", success=False, error_message="boom")
+    base = url.rstrip("/")
+    links = [{"href": f"{base}/{i}"} for i in range(3)]
+    if "c.test" in url:
+        links.append({"href": "https://a.test/shared"})
+    if url == "https://b.test/":
+        links = [{"href": f"{base}/bad/0"}] + links
+    return CrawlResult(url=url, html="", success=True, links={"internal": links, "external": links})
+
+
+@pytest.fixture
+def sites_crawler(fake_crawler):
+    return lambda delay=0.005: fake_crawler(page=_sites_page, delay=delay)
+
+
+def _strategy(cls, **kwargs):
+    return cls(max_depth=2, max_pages=6, dispatcher=SemaphoreDispatcher(semaphore_count=4), max_concurrency=4, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cls", [BFSDeepCrawlStrategy, DFSDeepCrawlStrategy, BestFirstCrawlingStrategy])
+async def test_seeds_share_slots_and_keep_their_own_limits(cls, sites_crawler):
+    crawler = sites_crawler()
+    seeds = [SITES[0], CrawlSeed(SITES[1], max_pages=4), CrawlSeed(SITES[2], max_depth=1, max_pages=20)]
+    results = await _strategy(cls).deep_crawl_many(seeds, crawler, CrawlerRunConfig())
+
+    by_seed = {site: [r for r in results if r.metadata["seed"] == site] for site in SITES}
+    successes = {site: sum(r.success for r in rs) for site, rs in by_seed.items()}
+    assert successes == {SITES[0]: 6, SITES[1]: 4, SITES[2]: 1 + 4}
+    assert max(r.metadata["depth"] for r in by_seed[SITES[2]]) == 1
+    # Failed pages of b.test do not use up its budget
+    assert any(not r.success for r in by_seed[SITES[1]])
+    # Pages reached from several seeds are crawled once
+    assert len(crawler.crawled) == len(set(crawler.crawled)) == len(results)
+    assert crawler.crawled.count("https://a.test/shared") <= 1
+    # Every site's pages competed for the same slots
+    assert crawler.peak == 4
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_tagged_results_and_skips_repeated_seeds(sites_crawler):
+    crawler = sites_crawler()
+    config = CrawlerRunConfig(stream=True)
+    strategy = _strategy(BFSDeepCrawlStrategy, include_external=True)
+    stream = await strategy.deep_crawl_many(SITES + ["https://A.test"], crawler, config)
+    results = [result async for result in stream]
+
+    assert sorted(r.url for r in results if r.metadata["depth"] == 0) == SITES
+    assert all(r.metadata["seed"] in SITES for r in results)
+    assert strategy.scheduler_stats["dispatched"] == len(results)
+
+
+@pytest.mark.asyncio
+async def test_seed_at_its_limit_does_not_hold_back_the_queue(sites_crawler):
+    crawler = sites_crawler(delay=0.05)
+    seeds = [CrawlSeed(SITES[0], max_pages=1), SITES[1]]
+    strategy = _strategy(BFSDeepCrawlStrategy)
+    strategy.frontier = frontier = MemoryFrontier()
+    results = await strategy.deep_crawl_many(seeds, crawler, CrawlerRunConfig())
+
+    assert [r.url for r in results if r.metadata["seed"] == SITES[0]] == [SITES[0]]
+    assert sum(r.success for r in results if r.metadata["seed"] == SITES[1]) == 6
+    assert frontier.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_deep_crawl_many_needs_a_frontier_strategy(sites_crawler):
+    class LevelStrategy(BFSDeepCrawlStrategy):
+        frontier_crawl = False
+
+    with pytest.raises(NotImplementedError):
+        await LevelStrategy(max_depth=1).deep_crawl_many(SITES, sites_crawler(), CrawlerRunConfig())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cls", [BFSDeepCrawlStrategy, DFSDeepCrawlStrategy, BestFirstCrawlingStrategy])
+async def test_seed_limits_may_be_floats(cls, sites_crawler):
+    seeds = [CrawlSeed(SITES[0], max_pages=5.0)]
+    results = await cls(max_depth=2).deep_crawl_many(seeds, sites_crawler(), CrawlerRunConfig())
+    assert len(results) == 5
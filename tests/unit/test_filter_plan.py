@@ -0,0 +1,105 @@
+import random
+import re
+
+import pytest
+
+from crawl4ai.deep_crawling import ContentTypeFilter, DomainFilter, FilterChain, URLFilter, URLPatternFilter
+from crawl4ai.deep_crawling.filters import CompiledFilterPlan
+
+WORDS = ["docs", "blog", "api", "v2", "shop", "cart", "news", "guide", "apiv2", "private", "img"]
+HOSTS = ["a.test", "www.a.test", "cdn.b.test", "b.test", "evil.c.test", "c.test", "d.test:8080", "A.Test"]
+EXTENSIONS = ["", ".html", ".pdf", ".png", ".php", ".json", ".tar.gz", ".PDF"]
+
+
+def _random_url(rng):
+    path = "/".join(rng.choice(WORDS) for _ in range(rng.randint(0, 4)))
+    url = f"https://{rng.choice(HOSTS)}/{path}{rng.choice(EXTENSIONS)}"
+    if rng.random() < 0.3:
+        url += f"?q={rng.choice(WORDS)}"
+    if rng.random() < 0.1:
+        url += "#top"
+    return url
+
+
+def _patterns(rng):
+    patterns = [f"*/{rng.choice(WORDS)}/{rng.choice(WORDS)}*" for _ in range(40)]
+    patterns += [f"*{rng.choice(WORDS)}*{rng.choice(WORDS)}.html" for _ in range(10)]
+    patterns += [f"https://{rng.choice(HOSTS)}/{rng.choice(WORDS)}/*" for _ in range(10)]
+    patterns += ["*.pdf", "*.png", "*/[ab]pi/*", "*/**/news/*", "*/{shop,cart}/*", "/*"]
+    patterns += [r"^https://b\.test/\w+$", r"/v\d/", re.compile(r"PRIVATE", re.I)]
+    return patterns
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_compiled_plan_agrees_with_filters(seed, monkeypatch):
+    monkeypatch.setattr(CompiledFilterPlan, "REORDER_INTERVAL", 50)
+    rng = random.Random(seed)
+    filters = [
+        URLPatternFilter(_patterns(rng), reverse=True),
+        URLPatternFilter(["*/docs/*", "*/guide/*", "*.json"]),
+        DomainFilter(allowed_domains=["a.test", "b.test", "d.test:8080"], blocked_domains=["cdn.b.test"]),
+        ContentTypeFilter(["text/html", "application/json"]),
+    ]
+    plan = FilterChain(filters).compile()
+
+    urls = [_random_url(rng) for _ in range(3000)]
+    expected = [all(f.apply(url) for f in filters) for url in urls]
+    assert [plan.check(url) for url in urls] == expected
+    assert 0 < sum(expected) < len(urls)
+
+
+class CountingFilter(URLFilter):
+    def __init__(self, reject):
+        super().__init__()
+        self.reject = reject
+        self.calls = 0
+
+    def apply(self, url: str) -> bool:
+        self.calls += 1
+        return self.reject not in url
+
+
+def test_plan_runs_the_most_rejecting_step_first(monkeypatch):
+    monkeypatch.setattr(CompiledFilterPlan, "REORDER_INTERVAL", 100)
+    rare, common = CountingFilter("/rare/"), CountingFilter("/common/")
+    chain = FilterChain([rare, DomainFilter(blocked_domains=["b.test"])])
+    chain.add_filter(common)
+    plan = chain.compile()
+    urls = [f"https://a.test/{'common' if i % 2 else 'page'}/{i}" for i in range(1000)]
+
+    assert [plan.check(url) for url in urls] == [i % 2 == 0 for i in range(1000)]
+    assert plan.steps[0].filter is common
+    # After the first interval the rare filter only sees what the common one lets through
+    assert rare.calls < 100 + 1000 // 2
+
+    # Adding a filter invalidates the compiled plan
+    chain.add_filter(DomainFilter(blocked_domains=["a.test"]))
+    assert chain.compile() is not plan
+    assert not chain.compile().check("https://a.test/page/0")
+
+
+class WrappedAsyncFilter(URLFilter):
+    """A sync apply() that hands back a coroutine."""
+
+    def __init__(self, reject):
+        super().__init__()
+        self.reject = reject
+
+    async def _judge(self, url: str) -> bool:
+        return self.reject not in url
+
+    def apply(self, url: str):
+        return self._judge(url)
+
+
+@pytest.mark.asyncio
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+async def test_sync_filter_returning_awaitable_is_awaited():
+    chain = FilterChain([DomainFilter(blocked_domains=["b.test"]), WrappedAsyncFilter("/private/")])
+
+    assert await chain.apply("https://a.test/private/x") is False
+    assert await chain.apply("https://a.test/public/x") is True
+    assert await chain.apply_many(
+        ["https://a.test/private/y", "https://a.test/ok", "https://b.test/ok"]
+    ) == [False, True, False]
+    assert [type(f) for f in chain.compile().async_filters] == [WrappedAsyncFilter]
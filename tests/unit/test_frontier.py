@@ -0,0 +1,167 @@
+import heapq
+import random
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import SemaphoreDispatcher
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
+from crawl4ai.deep_crawling.frontier import BloomFilter, FingerprintSet, MemoryFrontier, SQLiteFrontier
+
+
+def test_fingerprint_set_grows_and_answers_membership():
+    fps = FingerprintSet(capacity=16)
+    urls = [f"https://a.test/p/{i}" for i in range(5000)]
+    for url in urls:
+        fps.add(url)
+    fps.add(urls[0])
+
+    assert len(fps) == 5000
+    assert all(url in fps for url in urls)
+    assert "https://a.test/p/5000" not in fps
+    assert fps.nbytes <= 32 * 5000
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"https://a.test/{i}")
+    assert all(f"https://a.test/{i}" in bloom for i in range(1000))
+    false_positives = sum(f"https://b.test/{i}" in bloom for i in range(1000))
+    assert false_positives < 50
+
+
+def test_sqlite_frontier_spills_and_pops_in_priority_order(tmp_path):
+    frontier = SQLiteFrontier(tmp_path / "f.db", heap_size=8, bloom_capacity=100)
+    rng = random.Random(1)
+    expected = []
+    for i in range(200):
+        priority = rng.randint(0, 20)
+        frontier.push(f"https://a.test/{i}", None, 1, priority=priority)
+        heapq.heappush(expected, (priority, i))
+    assert len(frontier) == 200
+    assert len(frontier._heap) <= 8
+
+    popped = []
+    while (item := frontier.pop()) is not None:
+        popped.append(item.url)
+        frontier.done(item.url)
+    assert popped == [f"https://a.test/{heapq.heappop(expected)[1]}" for _ in range(200)]
+    assert "https://a.test/7" in frontier.seen
+    assert "https://a.test/200" not in frontier.seen
+    frontier.close()
+
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite"])
+def test_checkpoint_resume_requeues_in_flight_items(tmp_path, kind):
+    def make(resume):
+        if kind == "memory":
+            return MemoryFrontier(checkpoint_path=tmp_path / "f.ckpt", resume=resume)
+        return SQLiteFrontier(tmp_path / "f.db", heap_size=4, resume=resume)
+
+    frontier = make(False)
+    for i in range(10):
+        frontier.push(f"https://a.test/{i}", "https://a.test/", 1, priority=i)
+    first, second = frontier.pop(), frontier.pop()
+    frontier.done(first.url)
+    frontier.meta["pages_crawled"] = 1
+    frontier.checkpoint()
+    # Work after the checkpoint is lost on a crash
+    frontier.push("https://a.test/lost", None, 1)
+    del frontier
+
+    resumed = make(True)
+    assert resumed.resumed
+    assert resumed.meta == {"pages_crawled": 1}
+    assert "https://a.test/0" in resumed.seen
+    urls = []
+    while (item := resumed.pop()) is not None:
+        urls.append(item.url)
+    assert urls == [f"https://a.test/{i}" for i in range(1, 10)]
+    assert second.url == urls[0]
+
+
+def test_memory_checkpoint_is_not_a_pickle(tmp_path):
+    path = tmp_path / "f.ckpt"
+    frontier = MemoryFrontier(bloom_capacity=100, checkpoint_path=path)
+    for i in range(20):
+        frontier.push(f"https://a.test/{i}", None, 1, priority=i)
+    frontier.checkpoint()
+    assert path.read_bytes().startswith(b"{")
+
+    resumed = MemoryFrontier(bloom_capacity=100, checkpoint_path=path, resume=True)
+    assert len(resumed) == 20 and len(resumed.seen) == 20
+    assert "https://a.test/19" in resumed.seen and "https://a.test/20" not in resumed.seen
+    assert resumed.pop().url == "https://a.test/0"
+
+
+def test_sqlite_checkpoint_writes_only_changes(tmp_path):
+    frontier = SQLiteFrontier(tmp_path / "f.db", heap_size=1000, bloom_capacity=100)
+    for i in range(500):
+        frontier.push(f"https://a.test/{i}", None, 1, priority=i)
+    frontier.checkpoint()
+    # The heap stays in memory: nothing has to be read back from disk
+    assert len(frontier._heap) == 500
+
+    item = frontier.pop()
+    frontier.push("https://a.test/new", None, 1, priority=0.5)
+    before = frontier._conn.total_changes
+    frontier.checkpoint()
+    # One heap row out, one in, the in-flight row and the state
+    assert frontier._conn.total_changes - before < 10
+    del frontier
+
+    resumed = SQLiteFrontier(tmp_path / "f.db", heap_size=1000, resume=True)
+    assert len(resumed) == 501
+    assert [resumed.pop().url for _ in range(2)] == [item.url, "https://a.test/new"]
+    resumed.close()
+
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite"])
+def test_rescore_cycles_through_queue_and_lifts_improved_entries(tmp_path, kind):
+    if kind == "memory":
+        frontier = MemoryFrontier()
+    else:
+        frontier = SQLiteFrontier(tmp_path / "f.db", heap_size=8, bloom_capacity=100)
+    for i in range(100):
+        frontier.push(f"https://a.test/{i}", None, 1, priority=i)
+    # The worst entry is now the best; entries that got worse keep their priority
+    lifted = {"https://a.test/99": -1.0, "https://a.test/0": 50.0}
+
+    def priority(url):
+        return lifted.get(url, float(url.rsplit("/", 1)[1]))
+
+    moved = sum(frontier.rescore(priority, 10) for _ in range(20))
+    assert moved == 1
+    assert len(frontier) == 100
+    urls = []
+    while (item := frontier.pop()) is not None:
+        urls.append(item.url)
+    assert urls[:2] == ["https://a.test/99", "https://a.test/0"]
+    assert len(set(urls)) == 100
+
+
+@pytest.mark.asyncio
+async def test_bfs_resumes_interrupted_crawl_from_sqlite_checkpoint(tmp_path, fake_crawler):
+    root = "https://site.test/"
+
+    def strategy(resume):
+        return BFSDeepCrawlStrategy(
+            max_depth=2,
+            dispatcher=SemaphoreDispatcher(semaphore_count=2),
+            max_concurrency=2,
+            frontier=SQLiteFrontier(tmp_path / "crawl.db", checkpoint_every=1, resume=resume),
+        )
+
+    first = []
+    gen = await strategy(False).arun(root, fake_crawler(), CrawlerRunConfig(stream=True))
+    async for result in gen:
+        first.append(result.url)
+        if len(first) == 5:
+            break
+    await gen.aclose()
+
+    second = [r.url for r in await strategy(True).arun(root, fake_crawler(), CrawlerRunConfig())]
+
+    assert not set(first) & set(second)
+    assert len(first) + len(second) == 1 + 3 + 9
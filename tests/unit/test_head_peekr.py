@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai.deep_crawling.filters import ContentRelevanceFilter, SEOFilter
+from crawl4ai.utils import HeadPeekr
+
+HEAD = (
+    '<html><HEAD><title>Async crawling guide</title>'
+    '<meta name="description" content="How to crawl pages asynchronously">'
+    '<meta property="og:type" content="article"></HEAD>'
+)
+
+
+@pytest_asyncio.fixture
+async def server():
+    state = {"hits": 0, "ranges": []}
+
+    async def page(request):
+        state["hits"] += 1
+        state["ranges"].append(request.headers.get("Range"))
+        await asyncio.sleep(0.05)
+        response = web.StreamResponse(headers={"Content-Type": "text/html"})
+        await response.prepare(request)
+        # The closing tag is split across chunks
+        await response.write(HEAD[:-4].encode())
+        await response.write(HEAD[-4:].encode() + b"<body>" + b"x" * 100_000)
+        return response
+
+    app = web.Application()
+    app.router.add_get("/{name}", page)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    HeadPeekr.clear_cache()
+    yield f"http://127.0.0.1:{port}", state
+    HeadPeekr.clear_cache()
+    await HeadPeekr.aclose()
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_head_is_cut_at_closing_tag(server):
+    base, state = server
+    head = await HeadPeekr.fetch_head_section(f"{base}/a", timeout=2)
+    assert head == HEAD[: -len("</HEAD>")].encode() + b"</head>"
+    assert state["ranges"] == [f"bytes=0-{HeadPeekr.MAX_BYTES - 1}"]
+
+
+@pytest.mark.asyncio
+async def test_filters_share_one_fetch_per_url(server):
+    base, state = server
+    url = f"{base}/guide"
+    relevance = ContentRelevanceFilter(query="async crawling", threshold=0.1)
+    seo = SEOFilter(threshold=0.0)
+
+    results = await asyncio.gather(relevance.apply(url), seo.apply(url), relevance.apply(url))
+    assert results == [True, True, True]
+    assert state["hits"] == 1
+
+    info = await HeadPeekr.peek(url)
+    assert info["title"] == "Async crawling guide"
+    assert info["meta"]["og:type"] == "article"
+    assert state["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unreachable_url_returns_none():
+    HeadPeekr.clear_cache()
+    assert await HeadPeekr.peek_html("http://127.0.0.1:9/nothing") is None
+    await HeadPeekr.aclose()
+
+
+@pytest.mark.asyncio
+async def test_last_user_closes_shared_client(server):
+    base, _ = server
+    HeadPeekr.acquire()
+    HeadPeekr.acquire()
+    await HeadPeekr.peek(f"{base}/a")
+    client = HeadPeekr._client
+
+    await HeadPeekr.release()
+    assert not client.is_closed
+    await HeadPeekr.release()
+    assert client.is_closed and HeadPeekr._client is None
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai.async_configs import CrawlerRunConfig, HTTPCrawlerConfig
+from crawl4ai.async_crawler_strategy import (
+    AsyncHTTPCrawlerStrategy,
+    ConnectionTimeoutError,
+    ResponseTooLargeError,
+    UnsupportedContentTypeError,
+)
+
+
+LATIN1_PAGE = '<html><head><meta charset="iso-8859-1"></head><body>café</body></html>'.encode("latin-1")
+
+
+async def _serve(handler):
+    app = web.Application()
+    app.router.add_get("/{name}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def _handler(request):
+    name = request.match_info["name"]
+    if name == "latin1":
+        return web.Response(body=LATIN1_PAGE, headers={"Content-Type": "text/html"})
+    if name == "utf8":
+        return web.Response(body="<p>naïve</p>".encode(), headers={"Content-Type": "text/html"})
+    if name == "image":
+        return web.Response(body=b"\x89PNG" * 10, content_type="image/png")
+    if name == "big":
+        # Chunked response without Content-Length
+        response = web.StreamResponse(headers={"Content-Type": "text/html"})
+        await response.prepare(request)
+        for _ in range(20):
+            await response.write(b"x" * 1024)
+        await response.write_eof()
+        return response
+    if name == "slow":
+        await asyncio.sleep(1.5)
+        return web.Response(text="late", content_type="text/html")
+    raise web.HTTPNotFound()
+
+
+@pytest_asyncio.fixture
+async def server():
+    runner, base = await _serve(_handler)
+    yield base
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["aiohttp", "httpx"])
+async def test_meta_charset_and_transfer_stats(server, transport):
+    async with AsyncHTTPCrawlerStrategy(transport=transport) as crawler:
+        response = await crawler.crawl(f"{server}/latin1", CrawlerRunConfig())
+        assert "café" in response.html
+        stats = response.transfer_stats
+        assert stats["encoding"] == "iso8859-1" and stats["encoding_source"] == "meta"
+        assert stats["bytes"] == len(LATIN1_PAGE)
+
+        response = await crawler.crawl(f"{server}/utf8", CrawlerRunConfig())
+        assert response.html == "<p>naïve</p>"
+        assert response.transfer_stats["encoding_source"] == "utf-8"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["aiohttp", "httpx"])
+async def test_non_html_and_oversized_bodies_are_aborted(server, transport):
+    config = HTTPCrawlerConfig(max_body_size=4096)
+    async with AsyncHTTPCrawlerStrategy(config, transport=transport) as crawler:
+        with pytest.raises(UnsupportedContentTypeError):
+            await crawler.crawl(f"{server}/image", CrawlerRunConfig())
+        with pytest.raises(ResponseTooLargeError):
+            await crawler.crawl(f"{server}/big", CrawlerRunConfig())
+
+    config = HTTPCrawlerConfig(max_body_size=None, allowed_content_types=None)
+    async with AsyncHTTPCrawlerStrategy(config, transport=transport) as crawler:
+        assert (await crawler.crawl(f"{server}/image", CrawlerRunConfig())).status_code == 200
+        response = await crawler.crawl(f"{server}/big", CrawlerRunConfig())
+        assert response.transfer_stats["bytes"] == 20 * 1024
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["aiohttp", "httpx"])
+async def test_page_timeout_applies_to_both_transports(server, transport):
+    async with AsyncHTTPCrawlerStrategy(transport=transport) as crawler:
+        started = asyncio.get_running_loop().time()
+        with pytest.raises(ConnectionTimeoutError):
+            await crawler.crawl(f"{server}/slow", CrawlerRunConfig(page_timeout=300))
+        assert asyncio.get_running_loop().time() - started < 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", ["aiohttp", "httpx"])
+async def test_connection_reuse_stats(server, transport):
+    async with AsyncHTTPCrawlerStrategy(transport=transport, limit_per_host=2) as crawler:
+        for _ in range(5):
+            await crawler.crawl(f"{server}/utf8", CrawlerRunConfig())
+        stats = crawler.get_connection_stats()
+    assert stats["transport"] == transport
+    assert stats["requests"] == 5
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == 4
+
+
+def test_unknown_transport_is_rejected():
+    with pytest.raises(ValueError):
+        AsyncHTTPCrawlerStrategy(transport="curl")
@@ -0,0 +1,132 @@
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import (
+    AsyncHybridCrawlerStrategy,
+    DefaultEscalationHeuristic,
+    HTTPStatusError,
+)
+from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
+from crawl4ai.models import AsyncCrawlResponse
+from crawl4ai.ssl_certificate import SSLCertificate
+
+ARTICLE = "<html><body><article>" + "<p>Server rendered text.</p>" * 20 + "</article></body></html>"
+SPA = '<html><body><div id="root"></div><script src="/app.js"></script></body></html>'
+
+
+def _response(html):
+    return AsyncCrawlResponse(html=html, response_headers={}, status_code=200)
+
+
+class FakeTier:
+    def __init__(self, pages=None, error=None):
+        self.pages = pages or {}
+        self.error = error
+        self.urls = []
+        self.entered = 0
+
+    async def __aenter__(self):
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def crawl(self, url, config=None, **kwargs):
+        self.urls.append(url)
+        if self.error:
+            raise self.error
+        return _response(self.pages.get(url, "<html><body>browser</body></html>"))
+
+
+def _hybrid(http, browser, **kwargs):
+    return AsyncHybridCrawlerStrategy(http_strategy=http, browser_strategy=browser, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "html, reason",
+    [
+        (ARTICLE, None),
+        (SPA, "spa_root"),
+        ("<html><body><noscript>Please enable JavaScript to continue.</noscript>" + ARTICLE, "noscript"),
+        ("<html><body><p>Loading...</p></body></html>", "short_text"),
+    ],
+)
+def test_default_heuristic(html, reason):
+    assert DefaultEscalationHeuristic().needs_browser("https://a.com", _response(html), CrawlerRunConfig()) == reason
+
+
+def test_default_heuristic_checks_extraction_selectors():
+    extraction = JsonCssExtractionStrategy({"baseSelector": "div.product", "fields": []})
+    config = CrawlerRunConfig(extraction_strategy=extraction)
+    heuristic = DefaultEscalationHeuristic()
+    assert heuristic.needs_browser("https://a.com", _response(ARTICLE), config) == "selector_miss"
+    html = ARTICLE.replace("<article>", '<article><div class="product">x</div>')
+    assert heuristic.needs_browser("https://a.com", _response(html), config) is None
+
+
+@pytest.mark.asyncio
+async def test_http_first_and_lazy_browser():
+    http = FakeTier({"https://a.com/1": ARTICLE, "https://a.com/spa": SPA})
+    browser = FakeTier()
+    async with _hybrid(http, browser) as crawler:
+        response = await crawler.crawl("https://a.com/1", CrawlerRunConfig())
+        assert response.transfer_stats["fetch_tier"] == "http"
+        assert browser.entered == 0
+
+        response = await crawler.crawl("https://a.com/spa", CrawlerRunConfig())
+        assert response.transfer_stats == {"fetch_tier": "browser", "escalation_reason": "spa_root"}
+
+        response = await crawler.crawl("https://a.com/1", CrawlerRunConfig(screenshot=True))
+        assert response.transfer_stats["escalation_reason"] == "config:screenshot"
+    assert browser.entered == 1
+    assert crawler.stats["http"] == 1 and crawler.stats["escalated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_domain_cache_goes_straight_to_browser_and_reprobes():
+    http = FakeTier({f"https://spa.com/{i}": SPA for i in range(20)})
+    browser = FakeTier()
+    crawler = _hybrid(http, browser, min_samples=3, reprobe_every=5)
+    for i in range(3):
+        await crawler.crawl(f"https://spa.com/{i}", CrawlerRunConfig())
+    assert crawler.domain_decision("https://spa.com/x") == "browser"
+    assert crawler.domain_decision("https://other.com/x") == "http"
+
+    for i in range(3, 8):
+        await crawler.crawl(f"https://spa.com/{i}", CrawlerRunConfig())
+    # Four browser-direct requests, then one HTTP re-probe
+    assert crawler.stats["browser_direct"] == 4
+    assert len(http.urls) == 4
+
+
+@pytest.mark.asyncio
+async def test_http_errors_escalate_except_not_found():
+    browser = FakeTier()
+    crawler = _hybrid(FakeTier(error=ConnectionError("reset")), browser)
+    response = await crawler.crawl("https://a.com/", CrawlerRunConfig())
+    assert response.transfer_stats["escalation_reason"] == "http_error:ConnectionError"
+
+    crawler = _hybrid(FakeTier(error=HTTPStatusError(404, "missing")), browser)
+    with pytest.raises(HTTPStatusError):
+        await crawler.crawl("https://a.com/missing", CrawlerRunConfig())
+
+
+@pytest.mark.asyncio
+async def test_http_tier_fills_ssl_certificate(monkeypatch):
+    cert = SSLCertificate({"subject": {}})
+    fetched = []
+
+    async def from_url_async(url, **kwargs):
+        fetched.append(url)
+        return cert
+
+    monkeypatch.setattr(SSLCertificate, "from_url_async", staticmethod(from_url_async))
+    http = FakeTier({"https://a.com/1": ARTICLE})
+    browser = FakeTier()
+    async with _hybrid(http, browser) as crawler:
+        response = await crawler.crawl("https://a.com/1", CrawlerRunConfig(fetch_ssl_certificate=True))
+        assert response.transfer_stats["fetch_tier"] == "http"
+        assert response.ssl_certificate is cert
+        assert (await crawler.crawl("https://a.com/1", CrawlerRunConfig())).ssl_certificate is None
+    assert fetched == ["https://a.com/1"] and browser.urls == []
@@ -0,0 +1,76 @@
+import asyncio
+import time
+
+import pytest
+
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy, FilterChain, URLFilter, URLPatternFilter
+from crawl4ai.deep_crawling.scorers import KeywordRelevanceScorer
+from crawl4ai.models import CrawlResult
+
+
+class SlowAsyncFilter(URLFilter):
+    """Stands in for ContentRelevanceFilter/SEOFilter: one network round trip per URL."""
+
+    def __init__(self, delay=0.05, reject=()):
+        super().__init__()
+        self.delay = delay
+        self.reject = set(reject)
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def apply(self, url: str) -> bool:
+        self.calls.append(url)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return url not in self.reject
+
+
+@pytest.mark.asyncio
+async def test_apply_many_runs_sync_first_then_bounded_concurrent_async():
+    slow = SlowAsyncFilter(delay=0.02, reject={"https://a.test/docs/3"})
+    chain = FilterChain([URLPatternFilter(patterns=["*/docs/*"]), slow])
+    urls = [f"https://a.test/docs/{i}" for i in range(20)] + ["https://a.test/blog/1", "https://a.test/docs/0"]
+
+    verdicts = await chain.apply_many(urls, concurrency=5)
+
+    assert verdicts == [i != 3 for i in range(20)] + [False, True]
+    # Sync rejections and in-batch duplicates never reach the async filter
+    assert sorted(slow.calls) == sorted(set(urls[:20]))
+    assert slow.peak == 5
+
+    # Async verdicts are cached per URL
+    assert await chain.apply_many(["https://a.test/docs/3", "https://a.test/docs/4"]) == [False, True]
+    assert len(slow.calls) == 20
+
+
+@pytest.mark.asyncio
+async def test_link_discovery_admits_a_page_of_links_concurrently():
+    slow = SlowAsyncFilter(delay=0.05)
+    strategy = BFSDeepCrawlStrategy(
+        max_depth=2,
+        filter_chain=FilterChain([slow]),
+        url_scorer=KeywordRelevanceScorer(keywords=["guide"]),
+        score_threshold=0.5,
+    )
+    links = [{"href": f"https://site.test/guide/{i}"} for i in range(100)]
+    links += [{"href": "https://site.test/guide/0#intro"}, {"href": "https://site.test/about"}]
+    result = CrawlResult(url="https://site.test/", html="", success=True, links={"internal": links})
+
+    next_level, depths, visited = [], {}, {"https://site.test/"}
+    start = time.perf_counter()
+    await strategy.link_discovery(result, "https://site.test/", 0, visited, next_level, depths)
+    elapsed = time.perf_counter() - start
+
+    # 101 sequential lookups would take ~5s
+    assert elapsed < 1.0
+    assert len(slow.calls) == 101
+    assert [url for url, _ in next_level] == [f"https://site.test/guide/{i}" for i in range(100)]
+    assert all(parent == "https://site.test/" for _, parent in next_level)
+    assert set(depths.values()) == {1}
+    assert "https://site.test/about" not in visited
+    assert strategy.stats.urls_skipped == 1
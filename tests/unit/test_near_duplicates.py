@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from crawl4ai import NearDuplicateDetector
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import SemaphoreDispatcher
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+
+ROOT = "https://shop.test/"
+VOCAB = [f"word{i}" for i in range(3000)]
+
+
+def _text(seed, words=400):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(VOCAB) for _ in range(words))
+
+
+def _result(url, text):
+    markdown = MarkdownGenerationResult(raw_markdown=text, markdown_with_citations=text, references_markdown="")
+    return CrawlResult(url=url, html="", success=True, markdown=markdown)
+
+
+def test_check_marks_near_duplicates():
+    detector = NearDuplicateDetector()
+    text = _text(0)
+    assert detector.check(_result("https://a.test/list", text)) is None
+
+    # Different link targets and one changed word still make a duplicate
+    near = _result("https://a.test/list?sort=price", text.replace("word", "term", 1) + " [next](/list?sid=42)")
+    assert detector.check(near) == "https://a.test/list"
+    assert near.metadata["duplicate_of"] == "https://a.test/list"
+
+    other = _result("https://a.test/other", _text(1))
+    assert detector.check(other) is None and not other.metadata
+    # Recrawling a page, or a page too short to judge, is never a duplicate
+    assert detector.check(_result("https://A.test/list/", text)) is None
+    assert detector.check(_result("https://a.test/empty", "Not found")) is None
+    assert (detector.pages_checked, detector.duplicates_found) == (4, 1)
+
+
+def test_pattern_verdict_keeps_exploring_and_follows_recent_pages():
+    assert not NearDuplicateDetector().learn_patterns
+    detector = NearDuplicateDetector(learn_patterns=True, min_pattern_samples=4, pattern_window=8, pattern_explore_ratio=0.25)
+    text = _text(0)
+    detector.check(_result("https://a.test/base", text))
+    for i in range(8):
+        assert detector.check(_result(f"https://a.test/p/{i}", text)) == "https://a.test/base"
+    assert detector.duplicate_patterns == ["a.test/p/{n}"]
+
+    # One URL in four of the pruned pattern is still let through
+    verdicts = [detector.is_likely_duplicate(f"https://a.test/p/{i}") for i in range(100, 108)]
+    assert verdicts == [True, True, True, False] * 2
+
+    # The pattern starts serving new pages; older duplicates stop counting
+    assert detector.check(_result("https://a.test/p/200", _text(200))) is None
+    assert detector.duplicate_patterns == []
+    assert not detector.is_likely_duplicate("https://a.test/p/201")
+
+
+@pytest.mark.parametrize("threshold", [0, 3, 6])
+def test_lsh_index_finds_every_fingerprint_within_threshold(threshold):
+    rng = random.Random(threshold)
+    detector = NearDuplicateDetector(threshold=threshold)
+    stored = [rng.getrandbits(64) for _ in range(2000)]
+    for i, fingerprint in enumerate(stored):
+        detector.add(f"https://a.test/{i}", fingerprint)
+
+    for i in rng.sample(range(len(stored)), 200):
+        probe = stored[i]
+        for bit in rng.sample(range(64), threshold):
+            probe ^= 1 << bit
+        expected = min(j for j, fp in enumerate(stored) if bin(fp ^ probe).count("1") <= threshold)
+        assert detector.find(probe) == f"https://a.test/{expected}"
+
+
+def _faceted_page(url, config):
+    """Category tree; every category page links to sort orders that repeat its listing."""
+    path = url.partition("?")[0]
+    category = 0 if path == ROOT else int(path.rsplit("/", 1)[-1]) if "/c/" in path else None
+    if category is None:
+        text, links = _text(url), []
+    else:
+        text = _text(category)
+        links = [{"href": f"{path}?sort={order}"} for order in ("price", "name", "new")]
+        links += [{"href": f"{ROOT}product/{category}-{i}"} for i in range(2)]
+        if category <= 3:
+            links += [{"href": f"{ROOT}c/{category * 3 + i}"} for i in range(1, 4)]
+    result = _result(url, text)
+    result.links = {"internal": links}
+    # AsyncWebCrawler.arun runs the detector on every result
+    config.duplicate_detector.check(result)
+    return result
+
+
+@pytest.mark.asyncio
+async def test_deep_crawl_skips_duplicates_and_learns_their_pattern(fake_crawler):
+    detector = NearDuplicateDetector(learn_patterns=True, min_pattern_samples=3, pattern_explore_ratio=0)
+    crawler = fake_crawler(page=_faceted_page)
+    strategy = BFSDeepCrawlStrategy(max_depth=3, dispatcher=SemaphoreDispatcher(semaphore_count=1), max_concurrency=1)
+    results = await strategy.arun(ROOT, crawler, CrawlerRunConfig(duplicate_detector=detector))
+
+    duplicates = {r.url: r.metadata["duplicate_of"] for r in results if r.metadata.get("duplicate_of")}
+    assert duplicates and all(url.partition("?")[0] == original for url, original in duplicates.items())
+    # Duplicates are never expanded
+    assert not any("sort=" in (r.metadata["parent_url"] or "") for r in results)
+    assert detector.duplicate_patterns == ["shop.test/?sort", "shop.test/c/{n}?sort"]
+    # Once learned, sort links of deeper categories are not even queued
+    assert not any("sort=" in url and int(url.split("/c/")[1].partition("?")[0]) >= 4 for url in duplicates if "/c/" in url)
+    assert len(duplicates) == 3 + 3 * 3
+    # Every category and product page is still crawled
+    assert sum("/c/" in url and "?" not in url for url in crawler.crawled) == 12
+    assert sum("/product/" in url for url in crawler.crawled) == 2 * 13
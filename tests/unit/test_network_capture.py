@@ -0,0 +1,128 @@
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig, NetworkCaptureConfig
+from crawl4ai.network_capture import NetworkCapture
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="document", method="GET"):
+        self.url = url
+        self.method = method
+        self.headers = {"accept": "*/*"}
+        self.post_data_buffer = None
+        self.resource_type = resource_type
+        self.timing = {"startTime": 0}
+        self.failure = None
+
+    def is_navigation_request(self):
+        return self.resource_type == "document"
+
+
+class FakeResponse:
+    def __init__(self, url, body, content_type="text/html", status=200, resource_type="document"):
+        self.url = url
+        self.status = status
+        self.status_text = "OK"
+        self.headers = {"content-type": content_type, "content-length": str(len(body))}
+        self.from_service_worker = False
+        self.request = FakeRequest(url, resource_type)
+        self._body = body
+        self.body_calls = 0
+
+    async def body(self):
+        self.body_calls += 1
+        return self._body
+
+
+def _responses(events):
+    return [e for e in events if e["event_type"] == "response"]
+
+
+@pytest.mark.asyncio
+async def test_text_policy_skips_binary_and_oversized_bodies():
+    capture = NetworkCapture(NetworkCaptureConfig(body_policy="text", max_body_size=16))
+    html = FakeResponse("https://example.com/", b"<html>hi</html>")
+    image = FakeResponse("https://example.com/a.png", b"\x89PNG" * 10, content_type="image/png", resource_type="image")
+    big = FakeResponse("https://example.com/app.js", b"x" * 100, content_type="application/javascript")
+    for r in (html, image, big):
+        capture.on_request(r.request)
+        capture.on_response(r)
+
+    await capture.finalize()
+    responses = {e["url"]: e for e in _responses(capture.to_list())}
+
+    assert responses["https://example.com/"]["body"]["text"] == "<html>hi</html>"
+    assert responses["https://example.com/a.png"]["body"] is None
+    assert responses["https://example.com/app.js"]["body"] == {"size": 100, "skipped": "too_large"}
+    # Neither the image nor the oversized script body is ever read
+    assert image.body_calls == 0 and big.body_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_hash_and_none_policies():
+    response = FakeResponse("https://example.com/", b"payload")
+
+    capture = NetworkCapture(NetworkCaptureConfig(body_policy="hash"))
+    capture.on_response(response)
+    await capture.finalize()
+    body = _responses(capture.to_list())[0]["body"]
+    assert body["size"] == 7 and "text" not in body and body["xxhash"]
+
+    capture = NetworkCapture(NetworkCaptureConfig(body_policy="none", capture_headers=False))
+    capture.on_response(response)
+    await capture.finalize()
+    event = _responses(capture.to_list())[0]
+    assert event["body"] is None and event["headers"] is None
+
+
+@pytest.mark.asyncio
+async def test_hash_policy_hashes_text_unless_resource_types_are_given():
+    page = FakeResponse("https://example.com/", b"<html></html>")
+    image = FakeResponse("https://example.com/a.png", b"\x89PNG", content_type="image/png", resource_type="image")
+
+    capture = NetworkCapture(NetworkCaptureConfig(body_policy="hash"))
+    for r in (page, image):
+        capture.on_response(r)
+    await capture.finalize()
+    assert [e["body"] is not None for e in _responses(capture.to_list())] == [True, False]
+    assert image.body_calls == 0
+
+    capture = NetworkCapture(NetworkCaptureConfig(body_policy="hash", resource_types=["image"]))
+    for r in (page, image):
+        capture.on_response(r)
+    await capture.finalize()
+    assert [e["body"] is not None for e in _responses(capture.to_list())] == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_bodies_of_evicted_responses_are_never_fetched():
+    capture = NetworkCapture(NetworkCaptureConfig(max_events=3))
+    responses = [FakeResponse(f"https://example.com/{i}", b"<p>x</p>") for i in range(10)]
+    for r in responses:
+        capture.on_request(r.request)
+        capture.on_response(r)
+    assert len(capture._pending) <= 3
+
+    await capture.finalize()
+    # The buffer ends with response 8, request 9 and response 9
+    assert [r.body_calls for r in responses] == [0] * 8 + [1, 1]
+    assert [e["body"]["text"] for e in _responses(capture.to_list())] == ["<p>x</p>"] * 2
+
+
+def test_ring_buffer_drops_oldest_events():
+    capture = NetworkCapture(NetworkCaptureConfig(max_events=3))
+    for i in range(5):
+        capture.on_request(FakeRequest(f"https://example.com/{i}"))
+
+    events = capture.to_list()
+    assert [e["url"] for e in events[:-1]] == [f"https://example.com/{i}" for i in (2, 3, 4)]
+    assert events[-1] == {"event_type": "capture_overflow", "dropped": 2, "timestamp": events[-1]["timestamp"]}
+
+
+def test_crawler_run_config_accepts_dict_and_clones():
+    config = CrawlerRunConfig(capture_network_requests=True, network_capture_config={"body_policy": "hash"})
+    assert isinstance(config.network_capture_config, NetworkCaptureConfig)
+    assert config.clone().network_capture_config.body_policy == "hash"
+
+    with pytest.raises(ValueError):
+        NetworkCaptureConfig(body_policy="everything")
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+from crawl4ai.async_configs import PageReadyConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+from crawl4ai.network_capture import InflightRequests
+
+
+class FakePage:
+    """Runs no JavaScript: the probe reports the DOM as settled at once."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.probes = []
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.handlers[event].remove(handler)
+
+    def emit(self, event, request):
+        for handler in list(self.handlers.get(event, ())):
+            handler(request)
+
+    async def evaluate(self, script, opts):
+        self.probes.append(opts)
+        return {"ready": True, "elapsed_ms": 0, "visible": True, "images_loaded": True,
+                "lcp_seen": True, "width": 800, "height": 600}
+
+
+@pytest.fixture
+def strategy():
+    return AsyncPlaywrightCrawlerStrategy()
+
+
+def _tracked_page():
+    page = FakePage()
+    requests = InflightRequests()
+    requests.attach(page)
+    return page, requests
+
+
+@pytest.mark.asyncio
+async def test_probe_waits_for_pending_requests_to_finish(strategy):
+    page, requests = _tracked_page()
+    page.emit("request", "xhr")
+    page.emit("request", "img")
+    page.emit("requestfailed", "img")
+    assert requests.pending == 1
+    asyncio.get_running_loop().call_later(0.2, page.emit, "requestfinished", "xhr")
+
+    config = PageReadyConfig(network_idle_ms=100, timeout_ms=3000, poll_interval_ms=10)
+    readiness = await strategy.wait_for_page_ready(page, config, requests=requests)
+
+    assert readiness["ready"] and requests.pending == 0
+    assert readiness["elapsed_ms"] >= 300
+    # The DOM is probed again once the late response has settled
+    assert len(page.probes) == 2
+    assert page.probes[0]["networkIdleMs"] == 0
+    requests.detach(page)
+    assert not any(page.handlers.values())
+
+
+@pytest.mark.asyncio
+async def test_probe_times_out_while_a_request_is_pending(strategy):
+    page, requests = _tracked_page()
+    page.emit("request", "long-poll")
+
+    config = PageReadyConfig(network_idle_ms=100, timeout_ms=300, poll_interval_ms=10)
+    readiness = await strategy.wait_for_page_ready(page, config, requests=requests)
+
+    assert not readiness["ready"]
+    assert 300 <= readiness["elapsed_ms"] < 1000
+    assert len(page.probes) == 1
+
+
+@pytest.mark.asyncio
+async def test_probe_uses_resource_timing_without_a_tracker(strategy):
+    page = FakePage()
+    config = PageReadyConfig(network_idle_ms=250)
+    readiness = await strategy.wait_for_page_ready(page, config)
+    assert readiness["ready"]
+    assert [probe["networkIdleMs"] for probe in page.probes] == [250]
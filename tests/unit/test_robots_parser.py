@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from crawl4ai.async_dispatcher import RateLimiter
+from crawl4ai.utils import RobotsParser
+
+ROBOTS = """User-agent: SlowBot
+Crawl-delay: 5
+
+User-agent: *
+Crawl-delay: 0.5
+Disallow: /private/
+"""
+
+
+@pytest_asyncio.fixture
+async def server():
+    hits = {"robots": 0}
+
+    async def robots(request):
+        hits["robots"] += 1
+        await asyncio.sleep(0.05)
+        return web.Response(text=ROBOTS)
+
+    app = web.Application()
+    app.router.add_get("/robots.txt", robots)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", hits
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checks_share_one_fetch(server, tmp_path):
+    base, hits = server
+    parser = RobotsParser(cache_dir=str(tmp_path))
+    try:
+        results = await asyncio.gather(
+            *(parser.can_fetch(f"{base}/{'private' if i % 2 else 'public'}/{i}", "bot") for i in range(200))
+        )
+        assert hits["robots"] == 1
+        assert results == [i % 2 == 0 for i in range(200)]
+
+        # A new parser reuses the SQLite cache instead of fetching again
+        other = RobotsParser(cache_dir=str(tmp_path))
+        assert not await other.can_fetch(f"{base}/private/x", "bot")
+        assert hits["robots"] == 1
+    finally:
+        await parser.close()
+
+
+@pytest.mark.asyncio
+async def test_crawl_delay_per_agent(server, tmp_path):
+    base, _ = server
+    parser = RobotsParser(cache_dir=str(tmp_path))
+    try:
+        assert await parser.get_crawl_delay(f"{base}/a", "Mozilla/5.0") == 0.5
+        assert await parser.get_crawl_delay(f"{base}/a", "SlowBot/2.1") == 5.0
+        assert await parser.get_crawl_delay("not_a_url") is None
+    finally:
+        await parser.close()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_host_is_allowed(tmp_path):
+    parser = RobotsParser(cache_dir=str(tmp_path))
+    try:
+        assert await parser.can_fetch("http://127.0.0.1:9/page", "bot")
+        assert await parser.get_crawl_delay("http://127.0.0.1:9/page") is None
+    finally:
+        await parser.close()
+
+
+def test_parse_crawl_delays_groups():
+    delays = RobotsParser._parse_crawl_delays(ROBOTS.splitlines())
+    assert delays == {"slowbot": 5.0, "*": 0.5}
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_honours_crawl_delay():
+    limiter = RateLimiter(base_delay=(0.0, 0.0))
+    limiter.set_crawl_delay("https://a.com/x", 0.2)
+    await limiter.wait_if_needed("https://a.com/x")
+    start = time.monotonic()
+    await limiter.wait_if_needed("https://a.com/y")
+    assert time.monotonic() - start >= 0.15
@@ -0,0 +1,117 @@
+import base64
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy, _stitch_segments
+from crawl4ai.async_configs import CrawlerRunConfig
+
+
+def _png(width, height, color):
+    buffered = BytesIO()
+    Image.new("RGB", (width, height), color=color).save(buffered, format="PNG")
+    return buffered.getvalue()
+
+
+class FakePage:
+    def __init__(self, height, viewport=100, width=50):
+        self.height = height
+        self.viewport = viewport
+        self.width = width
+        self.calls = []
+
+    async def evaluate(self, script, *args):
+        # page_need_scroll / get_page_dimensions
+        if "viewportHeight" in script:
+            return self.height > self.viewport
+        return {"width": self.width, "height": self.height}
+
+    async def screenshot(self, full_page=False, clip=None, type="png", quality=None):
+        self.calls.append({"full_page": full_page, "clip": clip, "type": type})
+        height = clip["height"] if clip else (self.height if full_page else self.viewport)
+        return _png(self.width, int(height), "white")
+
+
+@pytest.fixture
+def strategy():
+    return AsyncPlaywrightCrawlerStrategy()
+
+
+def test_stitch_segments_stacks_vertically():
+    data = _stitch_segments([_png(10, 5, "red"), _png(10, 7, "blue")], "png", 85)
+    img = Image.open(BytesIO(data))
+    assert img.size == (10, 12)
+    assert img.getpixel((0, 0)) == (255, 0, 0)
+    assert img.getpixel((0, 11)) == (0, 0, 255)
+
+
+@pytest.mark.asyncio
+async def test_take_screenshot_output_modes(strategy, tmp_path):
+    page = FakePage(height=300)
+
+    raw = await strategy.take_screenshot(page, screenshot_output="bytes", screenshot_height_threshold=1000)
+    assert raw.startswith(b"\x89PNG")
+    assert page.calls[-1]["full_page"] is True and page.calls[-1]["clip"] is None
+
+    encoded = await strategy.take_screenshot(page, screenshot_height_threshold=1000)
+    assert base64.b64decode(encoded) == raw
+
+    path = await strategy.take_screenshot(
+        page, screenshot_output="file", screenshot_path=str(tmp_path), screenshot_format="webp"
+    )
+    assert path.endswith(".webp")
+    assert Image.open(path).format == "WEBP"
+
+
+@pytest.mark.asyncio
+async def test_take_screenshot_segments_tall_pages(strategy):
+    page = FakePage(height=250)
+    raw = await strategy.take_screenshot(
+        page, screenshot_output="bytes", screenshot_height_threshold=100, screenshot_format="jpeg"
+    )
+    assert [c["clip"]["height"] for c in page.calls] == [100, 100, 50]
+    assert Image.open(BytesIO(raw)).size == (50, 250)
+
+
+def test_screenshot_config_validation():
+    with pytest.raises(ValueError):
+        CrawlerRunConfig(screenshot_format="gif")
+    with pytest.raises(ValueError):
+        CrawlerRunConfig(screenshot_output="clipboard")
+
+
+@pytest.mark.asyncio
+async def test_cache_stores_raw_bytes_whatever_the_output_mode(tmp_path):
+    from crawl4ai.async_database import AsyncDatabaseManager
+    from crawl4ai.utils import format_screenshot
+
+    manager = AsyncDatabaseManager()
+    manager.content_paths = {"screenshots": str(tmp_path)}
+    raw = _png(8, 8, "green")
+
+    for output in ("file", "base64", "bytes"):
+        screenshot = await format_screenshot(raw, output, str(tmp_path / output))
+        content_hash = await manager._store_content(screenshot, "screenshots")
+        # A file-mode result is stored as the image, never as its path
+        assert (tmp_path / content_hash).read_bytes() == raw
+        assert await manager._load_content(content_hash, "screenshots") == raw
+
+    # A later cache hit is shaped by that run's config, not the first run's
+    assert base64.b64decode(await format_screenshot(raw)) == raw
+    path = await format_screenshot(raw, "file", str(tmp_path / "hit"))
+    assert path.endswith(".png") and open(path, "rb").read() == raw
+
+
+@pytest.mark.asyncio
+async def test_cache_reads_legacy_base64_screenshots(tmp_path):
+    from crawl4ai.async_database import AsyncDatabaseManager
+
+    manager = AsyncDatabaseManager()
+    manager.content_paths = {"screenshots": str(tmp_path)}
+    raw = _png(4, 4, "red")
+    (tmp_path / "legacy").write_text(base64.b64encode(raw).decode())
+    (tmp_path / "path").write_text(str(tmp_path / "legacy"))
+
+    assert await manager._load_content("legacy", "screenshots") == raw
+    assert await manager._load_content("path", "screenshots") is None
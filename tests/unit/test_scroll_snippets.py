@@ -0,0 +1,135 @@
+"""
+Runs the page-side scroll snippets under Node against a minimal fake DOM:
+just the properties and MutationObserver behaviour the snippets rely on.
+"""
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from crawl4ai.js_snippet import load_js_script
+
+NODE = shutil.which("node")
+pytestmark = pytest.mark.skipif(NODE is None, reason="node is not installed")
+
+FAKE_DOM = """
+const observers = new Set();
+globalThis.Node = { ELEMENT_NODE: 1 };
+globalThis.MutationObserver = class {
+    constructor(callback) { this.callback = callback; }
+    observe() { observers.add(this); }
+    disconnect() { observers.delete(this); }
+};
+const mutate = (records) => queueMicrotask(() => {
+    for (const observer of [...observers]) observer.callback(records);
+});
+globalThis.window = { innerHeight: 1000, scrollY: 0 };
+globalThis.document = {};
+"""
+
+FEED_PAGE = """
+// Document of 3000px; reaching the bottom loads 1000px more, `loads` times
+const root = { scrollHeight: 3000 };
+let loads = PAGE.loads;
+document.scrollingElement = root;
+document.body = {};
+window.scrollTo = (x, y) => {
+    if (PAGE.frozen) return;
+    window.scrollY = Math.max(0, Math.min(y, root.scrollHeight - window.innerHeight));
+    if (window.scrollY >= root.scrollHeight - window.innerHeight && loads > 0) {
+        loads--;
+        setTimeout(() => { root.scrollHeight += 1000; mutate([{ addedNodes: [{}] }]); }, 10);
+    }
+};
+"""
+
+VIRTUAL_FEED = """
+// Container of `total` 100px rows that only keeps the rows in view in the DOM
+const container = { offsetHeight: 500, clientHeight: 500, scrollHeight: FEED.total * 100, children: [] };
+const row = (i) => ({
+    nodeType: 1, parentNode: container, innerText: `Post ${i}: ` + "text ".repeat(3),
+    outerHTML: `<div class="post">Post ${i}</div>`,
+});
+const render = () => {
+    const first = Math.floor(container._top / 100);
+    const rows = [];
+    for (let i = first; i < Math.min(first + 5, FEED.total); i++) rows.push(row(FEED.recycle ? i : i % 5));
+    container.children = rows;
+    mutate([{ target: container, addedNodes: rows }]);
+};
+container._top = 0;
+Object.defineProperty(container, "scrollTop", {
+    get() { return container._top; },
+    set(value) {
+        container._top = Math.max(0, Math.min(value, container.scrollHeight - container.clientHeight));
+        render();
+    },
+});
+Object.defineProperty(container, "innerHTML", { set(html) { container.restored = html; } });
+container.children = [0, 1, 2, 3, 4].map(row);
+document.querySelector = () => container;
+"""
+
+
+def _run(setup, snippet, arg, **globals_):
+    script = FAKE_DOM
+    for name, value in globals_.items():
+        script += f"const {name} = {json.dumps(value)};\n"
+    script += setup + f"""
+const snippet = ({load_js_script(snippet)});
+snippet({json.dumps(arg)}).then((result) => {{
+    if (typeof container !== "undefined") result.restored = container.restored || null;
+    console.log(JSON.stringify(result));
+}});
+"""
+    out = subprocess.run([NODE, "-e", script], capture_output=True, text=True, timeout=30, check=True)
+    return json.loads(out.stdout)
+
+
+def _scan(**opts):
+    return {"scrollDelay": 100, "dwell": 0, "maxSteps": None, "idleRounds": 2,
+            "timeout": 10000, "viewportHeight": 1000, **opts}
+
+
+def test_full_page_scan_follows_loaded_content_to_the_end():
+    stats = _run(FEED_PAGE, "full_page_scan", _scan(), PAGE={"loads": 2})
+    assert stats["reached_end"]
+    assert stats["height"] == 5000
+    assert stats["added_nodes"] == 2
+    # One viewport per step down to 4000, the final bottom
+    assert stats["steps"] == 4
+
+
+def test_full_page_scan_respects_max_steps_and_static_documents():
+    stats = _run(FEED_PAGE, "full_page_scan", _scan(maxSteps=1), PAGE={"loads": 2})
+    assert (stats["steps"], stats["reached_end"], stats["height"]) == (1, False, 3000)
+
+    # Content scrolls in an inner container: the window does not move
+    stats = _run(FEED_PAGE, "full_page_scan", _scan(), PAGE={"loads": 0, "frozen": True})
+    assert (stats["steps"], stats["reached_end"]) == (1, False)
+
+
+def _collect(**config):
+    return {"container_selector": "#feed", "scroll_count": 20, "scroll_by": "container_height",
+            "wait_after_scroll": 0.05, "max_idle_scrolls": None, **config}
+
+
+def test_virtual_scroll_collects_recycled_rows_once():
+    result = _run(VIRTUAL_FEED, "virtual_scroll_collector", _collect(), FEED={"total": 30, "recycle": True})
+    assert result["uniqueCount"] == 30
+    assert result["replaced"]
+    restored = result["restored"].split("\n")
+    assert restored == [f'<div class="post">Post {i}</div>' for i in range(30)]
+    # Stops at the end of the container, well before scroll_count
+    assert result["scrollCount"] < 20
+
+
+def test_virtual_scroll_idle_limit_is_opt_in():
+    feed = {"total": 30, "recycle": False}
+    result = _run(VIRTUAL_FEED, "virtual_scroll_collector", _collect(), FEED=feed)
+    assert (result["uniqueCount"], result["replaced"]) == (5, False)
+    assert result["scrollCount"] == 6
+
+    result = _run(VIRTUAL_FEED, "virtual_scroll_collector", _collect(max_idle_scrolls=2), FEED=feed)
+    assert result["scrollCount"] == 2
@@ -0,0 +1,77 @@
+import sqlite3
+import sys
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+sys.modules.setdefault("rank_bm25", SimpleNamespace(BM25Okapi=object))
+
+from crawl4ai.async_url_seeder import AsyncUrlSeeder
+from crawl4ai.seeder_cache import SeederCache
+
+
+def test_entries_batch_roundtrip_and_ttl(tmp_path):
+    store = SeederCache(tmp_path / "seeder.db", ttl=60)
+    store.set_many("head", [(f"https://e.test/{i}", {"status": "valid", "i": i}) for i in range(1200)])
+
+    found = store.get_many("head", [f"https://e.test/{i}" for i in range(0, 1300, 100)])
+    assert len(found) == 12
+    assert found["https://e.test/500"] == {"status": "valid", "i": 500}
+    assert store.get("live", "https://e.test/1") is None
+
+    # Stored compressed
+    blob = store._conn.execute("SELECT value FROM entries LIMIT 1").fetchone()[0]
+    assert not blob.startswith(b"{")
+
+    store.ttl = 0.01
+    time.sleep(0.02)
+    assert store.get("head", "https://e.test/1") is None
+    assert store.purge_expired() == 1200
+
+
+def test_listing_only_served_when_complete(tmp_path):
+    store = SeederCache(tmp_path / "seeder.db", ttl=60)
+    partial = store.begin_listing("sitemap", "e.test")
+    store.append_listing(partial, 0, [("https://e.test/a", None)])
+    assert store.find_listing("sitemap", "e.test") is None
+
+    full = store.begin_listing("sitemap", "e.test")
+    store.append_listing(full, 0, [("https://e.test/a", {"lastmod": "2024-01-01"}), ("https://e.test/b", None)])
+    store.finish_listing(full, 2)
+    assert store.find_listing("sitemap", "e.test") == full
+    assert store.read_listing(full) == [
+        (0, "https://e.test/a", {"lastmod": "2024-01-01"}),
+        (1, "https://e.test/b", None),
+    ]
+    # The superseded partial listing is gone
+    assert store._conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0] == 1
+
+
+@pytest.mark.asyncio
+async def test_sitemap_listing_is_reused_across_patterns(tmp_path, fake_http_client):
+    sitemap = "<urlset>" + "".join(
+        f"<url><loc>https://example.com/{section}/{i}</loc><lastmod>2024-0{i + 1}-01</lastmod></url>"
+        for section in ("blog", "docs") for i in range(3)
+    ) + "</urlset>"
+    client = fake_http_client({"https://example.com/sitemap.xml": sitemap})
+    seeder = AsyncUrlSeeder(ttl=timedelta(days=1), client=client, base_directory=tmp_path)
+
+    first = [e async for e in seeder._from_sitemaps("example.com", "*/blog/*")]
+    assert [e["url"] for e in first] == [f"https://example.com/blog/{i}" for i in range(3)]
+    assert client.fetches == 1
+
+    # A different pattern is served from the same cached listing, metadata included
+    second = [e async for e in seeder._from_sitemaps("example.com", "*/docs/*")]
+    assert [e["url"] for e in second] == [f"https://example.com/docs/{i}" for i in range(3)]
+    assert second[0]["lastmod"] == "2024-01-01"
+    assert client.fetches == 1
+
+    await seeder._cache_set("head", "https://example.com/blog/0", {"status": "valid"})
+    await seeder.close()
+    # The seeder's own connection is closed with it
+    with pytest.raises(sqlite3.ProgrammingError):
+        seeder._store.get("head", "https://example.com/blog/0")
+    assert SeederCache(tmp_path / ".crawl4ai" / "seeder_cache" / "seeder.db", 60).get(
+        "head", "https://example.com/blog/0") == {"status": "valid"}
@@ -0,0 +1,50 @@
+import sys
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+sys.modules.setdefault("rank_bm25", SimpleNamespace(BM25Okapi=object))
+
+from crawl4ai.async_configs import SeedingConfig
+from crawl4ai.async_url_seeder import AsyncUrlSeeder, _to_timestamp
+
+
+SITEMAP = "https://example.com/sitemap.xml"
+
+
+def _sitemap(pages):
+    return "<urlset>" + "".join(
+        f"<url><loc>https://example.com/{p}</loc><lastmod>{lastmod}</lastmod></url>" for p, lastmod in pages
+    ) + "</urlset>"
+
+
+async def _seed(seeder, **kwargs):
+    config = SeedingConfig(source="sitemap", hits_per_sec=None, force=True, filter_nonsense_urls=False, **kwargs)
+    results = await seeder.urls("example.com", config)
+    return {r["url"].rsplit("/", 1)[-1]: r.get("change") for r in results}
+
+
+def test_to_timestamp_accepts_sitemap_dates():
+    assert _to_timestamp("2024-05-01") == datetime(2024, 5, 1, tzinfo=timezone.utc).timestamp()
+    assert _to_timestamp("2024-05-01T10:00:00Z") == datetime(2024, 5, 1, 10, tzinfo=timezone.utc).timestamp()
+    assert _to_timestamp("not a date") is None
+
+
+@pytest.mark.asyncio
+async def test_changed_only_and_since_use_persisted_state(tmp_path, fake_http_client):
+    client = fake_http_client({SITEMAP: _sitemap([("a", "2024-01-01"), ("b", "2024-01-01")])})
+    seeder = AsyncUrlSeeder(client=client, base_directory=tmp_path)
+    seeder.index_id = "CC-TEST"
+
+    assert await _seed(seeder, changed_only=True) == {"a": "new", "b": "new"}
+    # Nothing changed since the last run
+    assert await _seed(seeder, changed_only=True) == {}
+
+    client.responses[SITEMAP] = _sitemap([("a", "2024-01-01"), ("b", "2024-03-01"), ("c", "2024-03-02")])
+    assert await _seed(seeder, changed_only=True) == {"b": "modified", "c": "new"}
+
+    # Plain runs still return everything, annotated
+    assert await _seed(seeder) == {"a": "unchanged", "b": "unchanged", "c": "unchanged"}
+
+    assert set(await _seed(seeder, since="2024-02-15")) == {"b", "c"}
@@ -0,0 +1,92 @@
+import asyncio
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+sys.modules.setdefault("rank_bm25", SimpleNamespace(BM25Okapi=object))
+
+from crawl4ai.async_configs import SeedingConfig
+from crawl4ai.async_url_seeder import AsyncTokenBucket, AsyncUrlSeeder, SeederRateLimiter
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests():
+    bucket = AsyncTokenBucket(rate=50)
+    start = time.perf_counter()
+    await asyncio.gather(*(bucket.acquire() for _ in range(11)))
+    elapsed = time.perf_counter() - start
+    # First token is free, the other ten arrive every 20ms
+    assert 0.18 <= elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_per_host_concurrency_and_stats():
+    limiter = SeederRateLimiter(per_host_concurrency=2)
+    active = {"a.test": 0, "b.test": 0}
+    peak = {"a.test": 0, "b.test": 0}
+
+    async def request(host):
+        async with limiter.slot(f"https://{host}/x"):
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+
+    await asyncio.gather(*(request(h) for h in ("a.test", "b.test") for _ in range(6)))
+
+    assert peak == {"a.test": 2, "b.test": 2}
+    stats = limiter.stats()
+    assert stats["requests"] == 12
+    assert stats["max_in_flight"] == 4
+    assert stats["hosts"] == {"a.test": 6, "b.test": 6}
+
+
+@pytest.mark.asyncio
+async def test_sub_sitemap_fan_out_is_bounded(tmp_path, fake_http_client):
+    children = [f"https://example.com/child-{i}.xml" for i in range(10)]
+    responses = {
+        "https://example.com/index.xml": "<sitemapindex>"
+        + "".join(f"<sitemap><loc>{c}</loc></sitemap>" for c in children)
+        + "</sitemapindex>",
+    }
+    for i, c in enumerate(children):
+        responses[c] = f"<urlset><url><loc>https://example.com/p{i}</loc></url></urlset>"
+
+    client = fake_http_client(responses, delay=0.01)
+    seeder = AsyncUrlSeeder(client=client, base_directory=tmp_path, cache_root=tmp_path / "cache")
+    seeder._configure_rate_limit(SeedingConfig(hits_per_sec=None, per_host_concurrency=8, max_sitemap_concurrency=3))
+
+    urls = [u async for u in seeder._iter_sitemap("https://example.com/index.xml")]
+
+    assert sorted(urls) == sorted(f"https://example.com/p{i}" for i in range(10))
+    assert client.peak == 3
+    assert seeder.get_rate_limit_stats()["requests"] == 11
+
+
+@pytest.mark.asyncio
+async def test_sitemap_stream_does_not_hold_host_slot(tmp_path):
+    httpx = pytest.importorskip("httpx")
+    pages = [f"https://example.com/p{i}" for i in range(3000)]
+    sitemap = "<urlset>" + "".join(f"<url><loc>{u}</loc></url>" for u in pages) + "</urlset>"
+
+    def handler(request):
+        if request.url.path == "/sitemap.xml" and request.method == "GET":
+            return httpx.Response(200, content=sitemap.encode())
+        return httpx.Response(200)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    seeder = AsyncUrlSeeder(client=client, base_directory=tmp_path, cache_root=tmp_path / "cache")
+    seeder.index_id = "CC-TEST"
+    config = SeedingConfig(
+        source="sitemap", hits_per_sec=None, per_host_concurrency=1, live_check=True,
+        concurrency=4, force=True, filter_nonsense_urls=False,
+    )
+
+    # Validation HEADs share the sitemap's host slot with the sitemap download
+    results = await asyncio.wait_for(seeder.urls("example.com", config), 30)
+
+    assert len(results) == 3000
+    assert seeder.get_rate_limit_stats()["max_in_flight"] == 1
+    await client.aclose()
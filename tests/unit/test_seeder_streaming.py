@@ -0,0 +1,169 @@
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.modules.setdefault("rank_bm25", SimpleNamespace(BM25Okapi=object))
+
+from crawl4ai.async_configs import CrawlerRunConfig, SeedingConfig
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher
+from crawl4ai.async_url_seeder import AsyncUrlSeeder
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.models import CrawlResult
+
+SITEMAP = "https://example.com/sitemap.xml"
+
+
+def _seeder(fake_http_client, tmp_path, pages):
+    """The sitemap lists `pages` (URL -> title); every page is a tiny HTML document."""
+    responses = {url: f"<html><head><title>{title}</title></head><body></body></html>" for url, title in pages.items()}
+    responses[SITEMAP] = "<urlset>" + "".join(f"<url><loc>{u}</loc></url>" for u in pages) + "</urlset>"
+    seeder = AsyncUrlSeeder(client=fake_http_client(responses), base_directory=tmp_path)
+    seeder.index_id = "CC-TEST"
+    return seeder
+
+
+def _page_heads(seeder):
+    return sum(1 for method, url in seeder.client.requests if method == "HEAD" and url != SITEMAP)
+
+
+def _config(**kwargs):
+    return SeedingConfig(source="sitemap", hits_per_sec=None, force=True, filter_nonsense_urls=False, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_aiter_urls_applies_backpressure(tmp_path, fake_http_client):
+    pages = {f"https://example.com/p{i}": f"page {i}" for i in range(200)}
+    seeder = _seeder(fake_http_client, tmp_path, pages)
+
+    stream = seeder.aiter_urls("example.com", _config(live_check=True, concurrency=2), buffer_size=4)
+    first = await stream.__anext__()
+    assert first["status"] == "valid"
+    await asyncio.sleep(0.05)
+    # Validation stalls once the small output buffer is full
+    assert _page_heads(seeder) < 20
+
+    rest = [r async for r in stream]
+    assert len(rest) == 199
+    assert _page_heads(seeder) == 200
+
+
+@pytest.mark.asyncio
+async def test_aiter_urls_top_k_ranks_by_query(tmp_path, fake_http_client):
+    pages = {f"https://example.com/p{i}": f"generic page number {i}" for i in range(30)}
+    pages["https://example.com/p7"] = "python asyncio tutorial"
+    pages["https://example.com/p21"] = "python tutorial"
+    seeder = _seeder(fake_http_client, tmp_path, pages)
+
+    config = _config(extract_head=True, query="python tutorial", concurrency=4)
+    top = [r async for r in seeder.aiter_urls("example.com", config, top_k=2)]
+
+    assert [r["url"] for r in top] == ["https://example.com/p21", "https://example.com/p7"]
+    assert 0 < top[1]["relevance_score"] < top[0]["relevance_score"] <= 1
+
+
+@pytest.mark.asyncio
+async def test_arun_many_feeds_async_sources_continuously():
+    slow = "https://example.com/0"
+    started = []
+
+    async def records():
+        for i in range(40):
+            yield {"url": f"https://example.com/{i}", "status": "valid"}
+            await asyncio.sleep(0)
+
+    async def arun(url, config=None, **kwargs):
+        started.append(url)
+        await asyncio.sleep(0.5 if url == slow else 0.01)
+        return CrawlResult(url=url, html="", success=True)
+
+    crawler = AsyncWebCrawler()
+    crawler.arun = arun
+    dispatcher = MemoryAdaptiveDispatcher(
+        memory_threshold_percent=101.0, critical_threshold_percent=101.0, max_session_permit=4
+    )
+    stream = await crawler.arun_many(records(), config=CrawlerRunConfig(stream=True), dispatcher=dispatcher)
+    results = [r.url async for r in stream]
+
+    assert sorted(results) == sorted(f"https://example.com/{i}" for i in range(40))
+    # The slow page held one slot; the other three kept crawling the rest of the source
+    assert results[-1] == slow
+    assert len(started) == 40
+
+
+@pytest.mark.asyncio
+async def test_arun_many_early_close_with_full_read_ahead_does_not_block():
+    async def endless():
+        i = 0
+        while True:
+            yield f"https://example.com/{i}"
+            i += 1
+
+    async def arun(url, config=None, **kwargs):
+        await asyncio.sleep(0.01)
+        return CrawlResult(url=url, html="", success=True)
+
+    crawler = AsyncWebCrawler()
+    crawler.arun = arun
+    dispatcher = MemoryAdaptiveDispatcher(
+        memory_threshold_percent=101.0, critical_threshold_percent=101.0, max_session_permit=2
+    )
+    stream = await crawler.arun_many(
+        endless(), config=CrawlerRunConfig(stream=True), dispatcher=dispatcher, read_ahead=4)
+    results = []
+    async for result in stream:
+        results.append(result.url)
+        if len(results) == 3:
+            break
+    # The source keeps the read-ahead buffer full while the consumer leaves
+    await asyncio.wait_for(stream.aclose(), 5)
+
+
+@pytest.mark.asyncio
+async def test_aiter_urls_early_exit_with_full_queue_does_not_block(tmp_path, fake_http_client):
+    pages = {f"https://example.com/p{i}": f"page {i}" for i in range(3000)}
+    seeder = _seeder(fake_http_client, tmp_path, pages)
+
+    stream = seeder.aiter_urls("example.com", _config(live_check=True, concurrency=1), buffer_size=1)
+    await stream.__anext__()
+    await asyncio.sleep(0.05)  # discovery fills the validation queue and blocks on it
+
+    await asyncio.wait_for(stream.aclose(), 5)
+
+
+@pytest.mark.asyncio
+async def test_sitemap_index_early_exit_with_full_queue_does_not_block(tmp_path, fake_http_client):
+    # Each sub-sitemap lists more URLs than the result queue holds
+    subs = [f"https://example.com/sub{i}.xml" for i in range(2)]
+    responses = {SITEMAP: "<sitemapindex>" + "".join(f"<sitemap><loc>{s}</loc></sitemap>" for s in subs) + "</sitemapindex>"}
+    for sub in subs:
+        responses[sub] = "<urlset>" + "".join(f"<url><loc>{sub}#{i}</loc></url>" for i in range(3000)) + "</urlset>"
+    seeder = AsyncUrlSeeder(client=fake_http_client(responses), base_directory=tmp_path)
+    entries = seeder._iter_sitemap_entries(SITEMAP)
+    await entries.__anext__()
+    await asyncio.sleep(0.05)  # both sub-sitemaps fill the result queue and block on it
+
+    await asyncio.wait_for(entries.aclose(), 5)
+
+
+def test_stdlib_parser_frees_parsed_entries(monkeypatch):
+    import xml.etree.ElementTree as ET
+
+    from crawl4ai import async_url_seeder
+
+    monkeypatch.setattr(async_url_seeder, "LXML", False)
+    parser = ET.XMLPullParser(events=("start", "end"))
+    open_elements, sub_sitemaps, urls = [], [], []
+    root = None
+    body = "<urlset>" + "".join(f"<url><loc>/p{i}</loc></url>" for i in range(50)) + "</urlset>"
+    for start in range(0, len(body), 64):
+        parser.feed(body[start:start + 64])
+        for entry in AsyncUrlSeeder._drain_sitemap_events(parser, "https://example.com/", sub_sitemaps, open_elements):
+            urls.append(entry["url"])
+        # Only the <url> still being parsed stays attached to the document
+        root = open_elements[0] if open_elements else root
+        assert len(root) <= 1
+
+    assert len(root) == 0
+    assert urls == [f"https://example.com/p{i}" for i in range(50)]
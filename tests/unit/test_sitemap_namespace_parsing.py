@@ -1,4 +1,6 @@
+import gzip
 import sys
+from contextlib import asynccontextmanager
 from types import SimpleNamespace
 
 import pytest
@@ -19,9 +21,9 @@ from crawl4ai.async_url_seeder import AsyncUrlSeeder
 
 
 class DummyResponse:
-    def __init__(self, request_url: str, text: str):
+    def __init__(self, request_url: str, text):
         self.status_code = 200
-        self._content = text.encode("utf-8")
+        self._content = text if isinstance(text, bytes) else text.encode("utf-8")
         self.url = request_url
 
     def raise_for_status(self):
@@ -35,6 +37,11 @@ class DummyResponse:
     def text(self):
         return self._content.decode("utf-8")
 
+    async def aiter_bytes(self, chunk_size: int = 7):
+        # Small chunks so elements straddle chunk boundaries
+        for i in range(0, len(self._content), chunk_size):
+            yield self._content[i:i + chunk_size]
+
 
 class DummyAsyncClient:
     def __init__(self, response_map):
@@ -46,6 +53,10 @@ class DummyAsyncClient:
             payload = payload()
         return DummyResponse(url, payload)
 
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        yield await self.get(url, **kwargs)
+
 
 @pytest.mark.asyncio
 async def test_iter_sitemap_handles_namespace_less_sitemaps():
@@ -132,3 +143,27 @@ async def test_iter_sitemap_normalizes_relative_locations():
         "https://example.com/relative-path",
         "https://example.com/absolute",
     ]
+
+
+@pytest.mark.asyncio
+async def test_iter_sitemap_entries_streams_gzip_and_captures_metadata():
+    xml = """<?xml version="1.0"?>
+    <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+        <url>
+            <loc>https://example.com/a</loc>
+            <lastmod>2024-05-01</lastmod>
+            <changefreq>daily</changefreq>
+            <priority>0.8</priority>
+        </url>
+        <url><loc>https://example.com/b</loc></url>
+    </urlset>
+    """
+    payload = gzip.compress(xml.encode("utf-8"))
+    seeder = AsyncUrlSeeder(client=DummyAsyncClient({"https://example.com/sitemap.xml.gz": payload}))
+
+    entries = [e async for e in seeder._iter_sitemap_entries("https://example.com/sitemap.xml.gz")]
+
+    assert entries == [
+        {"url": "https://example.com/a", "lastmod": "2024-05-01", "changefreq": "daily", "priority": "0.8"},
+        {"url": "https://example.com/b", "lastmod": None, "changefreq": None, "priority": None},
+    ]
@@ -0,0 +1,111 @@
+import asyncio
+import base64
+import datetime
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from crawl4ai import ssl_certificate
+from crawl4ai.ssl_certificate import SSLCertificate
+
+
+def _self_signed_der(cn: str = "example.com") -> bytes:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, cn)])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(1234)
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .sign(key, hashes.SHA256())
+    )
+    return cert.public_bytes(serialization.Encoding.DER)
+
+
+class FakeCDPSession:
+    def __init__(self, der: bytes):
+        self.der = der
+        self.calls = 0
+
+    async def send(self, method, params):
+        assert method == "Network.getCertificate"
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {"tableNames": [base64.b64encode(self.der).decode()]}
+
+    async def detach(self):
+        pass
+
+
+class FakePage:
+    def __init__(self, session):
+        self.context = self
+        self.session = session
+
+    async def new_cdp_session(self, page):
+        return self.session
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    ssl_certificate._cert_cache.clear()
+    yield
+    ssl_certificate._cert_cache.clear()
+
+
+def test_from_der_parses_certificate():
+    der = _self_signed_der("unit.test")
+    cert = SSLCertificate.from_der(der)
+    assert cert.subject["CN"] == "unit.test"
+    assert cert["serial_number"] == hex(1234)
+    assert cert.to_der() == der
+
+
+@pytest.mark.asyncio
+async def test_from_url_async_uses_cdp_and_caches_per_host():
+    session = FakeCDPSession(_self_signed_der("cdp.test"))
+    page = FakePage(session)
+
+    certs = await asyncio.gather(
+        *(SSLCertificate.from_url_async(f"https://cdp.test/page/{i}", page=page) for i in range(5))
+    )
+    assert all(c.subject["CN"] == "cdp.test" for c in certs)
+    # Concurrent lookups share one fetch and later ones hit the cache
+    assert session.calls == 1
+    await SSLCertificate.from_url_async("https://cdp.test/other", page=page)
+    assert session.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_from_url_async_falls_back_to_handshake(monkeypatch):
+    calls = []
+
+    async def fake_handshake(hostname, port, timeout):
+        calls.append((hostname, port))
+        return SSLCertificate.from_der(_self_signed_der(hostname))
+
+    monkeypatch.setattr(SSLCertificate, "_from_handshake", staticmethod(fake_handshake))
+    cert = await SSLCertificate.from_url_async("https://fallback.test:8443/x", page=None)
+    assert cert.subject["CN"] == "fallback.test"
+    assert calls == [("fallback.test", 8443)]
+
+
+@pytest.mark.asyncio
+async def test_handshake_failures_are_logged(monkeypatch, caplog, capsys):
+    import socket
+
+    async def unresolvable(*args, **kwargs):
+        raise socket.gaierror("no such host")
+
+    monkeypatch.setattr(asyncio, "open_connection", unresolvable)
+    with caplog.at_level("WARNING", logger="crawl4ai.ssl_certificate"):
+        assert await SSLCertificate._from_handshake("missing.test", 443, 1) is None
+    assert "Could not resolve hostname: missing.test" in caplog.text
+    assert capsys.readouterr().out == ""
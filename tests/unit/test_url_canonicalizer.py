@@ -0,0 +1,89 @@
+import pytest
+
+from crawl4ai import URLCanonicalizer
+from crawl4ai.url_canonicalizer import DEFAULT_CANONICALIZER, canonicalize_links, canonicalize_url
+from crawl4ai.utils import normalize_url, normalize_url_for_deep_crawl
+
+BASE = "https://Example.com:443/a/b/page.html?x=1#top"
+
+
+@pytest.mark.parametrize(
+    "href, expected",
+    [
+        ("../c/./d/", "https://example.com/a/c/d"),
+        ("/", "https://example.com/"),
+        ("?b=2&a=1&utm_source=x", "https://example.com/a/b/page.html?a=1&b=2"),
+        ("#section", "https://example.com/a/b/page.html?x=1"),
+        ("//CDN.example.com:443/x", "https://cdn.example.com/x"),
+        ("HTTP://Example.COM:80", "http://example.com/"),
+        ("http://bücher.de/straße?q=ä", "http://xn--bcher-kva.de/stra%C3%9Fe?q=%C3%A4"),
+        ("/%7euser/a%2fb/%c3%a4", "https://example.com/~user/a%2Fb/%C3%A4"),
+        ("/path with space/", "https://example.com/path%20with%20space"),
+        ("mailto:me@example.com", "mailto:me@example.com"),
+        ("javascript:void(0)", "javascript:void(0)"),
+    ],
+)
+def test_canonical_forms(href, expected):
+    canonical = canonicalize_url(href, BASE)
+    assert canonical == expected
+    assert canonicalize_url(canonical) == canonical
+
+
+def test_options_and_shared_form():
+    assert canonicalize_url(None, BASE) is None
+    assert normalize_url("/x?fbclid=1&b=1", BASE) == "https://example.com/x?b=1"
+    assert normalize_url("/x?b=2&a=1#f", BASE, sort_query=False, keep_fragment=True) == "https://example.com/x?b=2&a=1#f"
+    assert normalize_url("/x?sid=1&b=1", BASE, extra_drop_params=["SID"]) == "https://example.com/x?b=1"
+    assert normalize_url("/x?utm_term=1", BASE, drop_query_tracking=False) == "https://example.com/x?utm_term=1"
+    assert normalize_url_for_deep_crawl("x/", BASE) == canonicalize_url("x", BASE)
+
+    # https is only kept for same-host links of pages fetched over https
+    page = "https://example.com/a"
+    upgraded = normalize_url("http://example.com/b", page, preserve_https=True, original_scheme="https")
+    assert upgraded == "https://example.com/b"
+    assert normalize_url("http://other.com/b", page, preserve_https=True, original_scheme="https") == "http://other.com/b"
+    assert normalize_url("http://example.com/b", page, preserve_https=True, original_scheme="http") == "http://example.com/b"
+
+    custom = URLCanonicalizer(tracking_params=(), strip_trailing_slash=False)
+    assert custom.resolve("/docs/?ref=x", BASE) == "https://example.com/docs/?ref=x"
+
+
+# Where normalize_url() and normalize_url_for_deep_crawl() now differ from their
+# pre-canonicalizer outputs (listed in CHANGELOG.md); both return the new form
+@pytest.mark.parametrize(
+    "href, legacy, canonical",
+    [
+        ("?Q=1", "https://example.com/a?q=1", "https://example.com/a?Q=1"),
+        ("https://example.com?a=1", "https://example.com?a=1", "https://example.com/?a=1"),
+        ("http://example.com:80/x", "http://example.com:80/x", "http://example.com/x"),
+        ("https://example.com:443/x", "https://example.com:443/x", "https://example.com/x"),
+        ("http://bücher.de/", "http://bücher.de/", "http://xn--bcher-kva.de/"),
+        ("/%7Ex", "https://example.com/%7Ex", "https://example.com/~x"),
+        ("/x y", "https://example.com/x y", "https://example.com/x%20y"),
+        ("/x?q=a%20b", "https://example.com/x?q=a+b", "https://example.com/x?q=a%20b"),
+    ],
+)
+def test_normalize_url_changes_from_legacy_form(href, legacy, canonical):
+    base = "https://example.com/a/"
+    assert normalize_url(href, base) == canonical != legacy
+    assert normalize_url_for_deep_crawl(href, base) == canonical
+
+
+def test_deep_crawl_normalizer_uses_the_full_canonical_form():
+    base = "https://example.com/"
+    # Query sorted, blank values kept, the same tracking parameters as normalize_url()
+    assert normalize_url_for_deep_crawl("/x?b=&a=1", base) == "https://example.com/x?a=1&b="
+    assert normalize_url_for_deep_crawl("/x?gclid=2&utm_term=3&utm_content=4&ref_src=5&k=1", base) == (
+        "https://example.com/x?k=1"
+    )
+
+
+def test_bulk_resolution_matches_per_link_normalization():
+    hrefs = [f"/docs/section-{i % 50}/page-{i}.html?utm_source=nav&id={i}" for i in range(1500)]
+    hrefs += [f"https://other{i % 20}.example.org/{i}/" for i in range(400)]
+    hrefs += ["#top", "", None, "../up", "mailto:a@b.c"] * 20
+    expected = [normalize_url(href, BASE) if href else None for href in hrefs]
+
+    # Timings are in tests/benchmarks/bench_url_canonicalizer.py
+    assert URLCanonicalizer().resolve_many(hrefs, BASE) == expected
+    assert canonicalize_links(hrefs, DEFAULT_CANONICALIZER.base(BASE)) == expected